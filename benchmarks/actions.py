@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Time the player actions and whole orders that the solver simulates on the bigtest.py board.
+Run this from anywhere, e.g. python3 benchmarks/actions.py. Use --help to see the options."""
+import argparse, itertools, time
+from scenarios import *
+
+def timeActions(game, repeat):
+    """Make every move and shot that each of the player's units can make from game, repeat times over.
+    returns a tuple of (number of actions made, seconds taken)."""
+    actions = 0
+    start = time.perf_counter()
+    for i in range(repeat):
+        for unit in sorted(game.playerunits, key=lambda unit: unit.square):
+            for actioniter in Player_Action_Iter_Shoot(game, unit), Player_Action_Iter_Move(game, unit, unit.moves):
+                for g in actioniter:
+                    actions += 1
+    return actions, time.perf_counter() - start
+
+def timeOrders(game, count):
+    """Simulate the first count orders of game with a shared table and cache.
+    returns a tuple of (number of simulations run, seconds taken)."""
+    table = TranspositionTable()
+    endturncache = EndTurnCache()
+    sims = 0
+    start = time.perf_counter()
+    for order in itertools.islice(OrderGenerator(game), count):
+        if not order: # the empty order isn't simulated
+            continue
+        try:
+            sims += OrderSimulator(game, order, table, endturncache).run()[0]
+        except SimulationFinished: # no valid actions in this order
+            pass
+    return sims, time.perf_counter() - start
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200, help='how many times to make every action. default: %(default)s')
+    parser.add_argument('--orders', type=int, default=20, help='how many orders to simulate. default: %(default)s')
+    args = parser.parse_args()
+    actions, seconds = timeActions(makeBigtestGame(), args.repeat)
+    print('{0} actions in {1:.2f}s: {2:.1f} microseconds per action'.format(actions, seconds, seconds / actions * 1e6))
+    sims, seconds = timeOrders(makeBigtestGame(), args.orders)
+    print('{0} simulations of {1} orders in {2:.2f}s: {3:.1f} microseconds per simulation'.format(sims, args.orders, seconds, seconds / sims * 1e6))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Measure how soon solve() finds its best solution in each of the scenarios in scenarios.py when it only has a few seconds.
+Every scenario is solved in its own process once for each orderer, and the times at which the best score went up are written as JSON.
+Run this from anywhere, e.g. python3 benchmarks/anytime.py bigtest --timeout 40. Use --help to see the other options."""
+import argparse, json, multiprocessing, platform, time
+from scenarios import *
+
+ORDERERS = {'plain': ActionOrderer,
+            'heuristic': HeuristicOrderer} # {name: the ActionOrderer class to pass to solve()}
+
+class TimedScoreKeeper(TopKScoreKeeper):
+    "A TopKScoreKeeper that remembers when the best score went up."
+    def __init__(self, k=1):
+        super().__init__(k)
+        self.start = time.perf_counter()
+        self.improvements = [] # (seconds since start, score) for each time the best score went up
+    def submit(self, score, log, actionlog):
+        kept = super().submit(score, log, actionlog)
+        if kept and (not self.improvements or score > self.improvements[-1][1]):
+            self.improvements.append((time.perf_counter() - self.start, score))
+        return kept
+
+def runScenario(name, orderername, timeout):
+    """Solve the scenario called name with the orderer called orderername for timeout seconds.
+    This is run in a new process so every solve starts with empty caches.
+    returns a dict of the results."""
+    game = SCENARIOS[name]()
+    solutions = TimedScoreKeeper()
+    sims, best, finished = solve(game, timeout, orderer=ORDERERS[orderername](), solutions=solutions)
+    seconds = time.perf_counter() - solutions.start
+    return {'simulations': sims,
+            'seconds': seconds,
+            'finished': finished,
+            'best_score': best.score,
+            'time_to_best': solutions.improvements[-1][0] if solutions.improvements else None, # seconds until the best solution was found
+            'improvements': solutions.improvements}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scenarios', nargs='*', help='the scenarios to run, any of {0}. default: all of them'.format(', '.join(SCENARIOS)))
+    parser.add_argument('--timeout', type=float, default=10, help='the seconds that each solve gets. default: %(default)s')
+    parser.add_argument('--orderers', nargs='+', choices=ORDERERS, default=list(ORDERERS), help='the orderers to compare. default: all of them')
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'anytime.json'), help='where to write the JSON results. default: %(default)s')
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error('unknown scenario: {0}'.format(name))
+    results = {'python': platform.python_version(),
+               'timeout': args.timeout,
+               'scenarios': {}}
+    for name in args.scenarios or SCENARIOS:
+        results['scenarios'][name] = {}
+        for orderername in args.orderers:
+            with multiprocessing.get_context('spawn').Pool(1) as pool: # spawn instead of fork so the new process doesn't start with this one's memory
+                result = results['scenarios'][name][orderername] = pool.apply(runScenario, (name, orderername, args.timeout))
+            if result['time_to_best'] is None:
+                found = 'no solution'
+            else:
+                found = 'best score {0} after {1:.2f}s'.format(result['best_score'], result['time_to_best'])
+            print('{0} {1}: {2}, {3} simulations in {4:.2f}s{5}'.format(name, orderername, found, result['simulations'], result['seconds'],
+                                                                      ', finished' if result['finished'] else ''))
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=4)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Measure how fast the solver gets through each of the scenarios in scenarios.py.
+Every scenario is solved in its own process, one order at a time with a shared TranspositionTable and EndTurnCache, and the results are written as JSON.
+Pass --baseline with the JSON from an earlier run to see how much each number changed. Use --help to see the other options."""
+import argparse, itertools, json, multiprocessing, platform, resource, time
+from scenarios import *
+
+def runScenario(name, maxorders, profile=False):
+    """Solve the scenario called name, giving up after maxorders orders if it's not 0.
+    If profile is True, the solve is timed with a Profiler, which slows it down, and its report is included in the results.
+    This is run in a new process so peak_rss only counts this scenario.
+    returns a dict of the results."""
+    profiler = Profiler()
+    if profile:
+        profiler.enable()
+    game = SCENARIOS[name]()
+    table = TranspositionTable()
+    endturncache = EndTurnCache()
+    orders = sims = 0
+    best = ScoreKeeper()
+    timetobest = 0.0
+    start = time.perf_counter()
+    for order in itertools.islice(OrderGenerator(game), maxorders or None):
+        orders += 1
+        if not order: # the empty order isn't simulated
+            continue
+        try:
+            ordersims, score = OrderSimulator(game, order, table, endturncache).run()
+        except SimulationFinished: # there were no valid actions to take in this order
+            continue
+        sims += ordersims
+        if score > best:
+            best = score
+            timetobest = time.perf_counter() - start
+    seconds = time.perf_counter() - start
+    if profile:
+        profiler.disable()
+    return {'orders': orders,
+            'simulations': sims,
+            'seconds': seconds,
+            'orders_per_sec': orders / seconds,
+            'sims_per_sec': sims / seconds,
+            'time_to_best': timetobest, # seconds until the best solution was found
+            'best_score': best.score,
+            'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'profile': profiler.getReport()} # empty unless profile is True
+
+def compare(results, baseline):
+    "Print how much each number in results changed from baseline. Both are dicts in the format that this script writes as JSON. returns nothing."
+    for name, scenario in results['scenarios'].items():
+        try:
+            old = baseline['scenarios'][name]
+        except KeyError: # this scenario wasn't in the baseline
+            print('{0}: not in the baseline'.format(name))
+            continue
+        if old['orders'] != scenario['orders']:
+            print('{0}: warning, the baseline ran {1} orders instead of {2}'.format(name, old['orders'], scenario['orders']))
+        for key in 'orders_per_sec', 'sims_per_sec', 'time_to_best', 'peak_rss_kb':
+            change = (scenario[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            print('{0}: {1} {2:.4g} -> {3:.4g} ({4:+.1f}%)'.format(name, key, old[key], scenario[key], change))
+        if old['best_score'] != scenario['best_score']:
+            print('{0}: the best score changed from {1} to {2}'.format(name, old['best_score'], scenario['best_score']))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scenarios', nargs='*', help='the scenarios to run, any of {0}. default: all of them'.format(', '.join(SCENARIOS)))
+    parser.add_argument('--orders', type=int, default=60, help='the most orders to simulate in each scenario, 0 for all of them. default: %(default)s')
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results.json'), help='where to write the JSON results. default: %(default)s')
+    parser.add_argument('--profile', action='store_true', help='time the phases of each solve with a Profiler and print its report. This makes the solves slower')
+    parser.add_argument('--baseline', help='the JSON results of an earlier run to compare against')
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error('unknown scenario: {0}'.format(name))
+    results = {'python': platform.python_version(),
+               'max_orders': args.orders,
+               'scenarios': {}}
+    for name in args.scenarios or SCENARIOS:
+        with multiprocessing.get_context('spawn').Pool(1) as pool: # spawn instead of fork so the new process doesn't start with this one's memory
+            scenario = results['scenarios'][name] = pool.apply(runScenario, (name, args.orders, args.profile))
+        print('{0}: {1} orders, {2} simulations in {3:.2f}s. {4:.1f} orders/sec, {5:.0f} sims/sec, best score {6} after {7:.2f}s, peak RSS {8} KB'.format(
+            name, scenario['orders'], scenario['simulations'], scenario['seconds'], scenario['orders_per_sec'], scenario['sims_per_sec'],
+            scenario['best_score'], scenario['time_to_best'], scenario['peak_rss_kb']))
+        if args.profile:
+            for phase, calls, seconds in scenario['profile']:
+                print('    {0:<40} {1:>10} calls {2:>10.3f}s'.format(phase, calls, seconds))
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=4)
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(results, json.load(f))
@@ -0,0 +1,69 @@
+"""The fixed board setups that the benchmarks are run on. These are the same boards that smalltest.py, bigtest.py and reddittest.py set up.
+Those scripts pass the game as the first argument of some weapons, which powers their first upgrade, so power1=True is used here instead."""
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from itbsolver import *
+
+def makeSmalltestGame():
+    "return the game that smalltest.py sets up: a single mech boxed in by mountains next to a scorpion."
+    g = Game()
+    for x in range(1, 9):
+        for y in range(1, 9):
+            g.board[(x, y)].createUnitHere(Unit_Mountain(g))
+    g.board[(1, 1)].createUnitHere(Unit_Nano_Mech(g, weapon1=Weapon_AcidProjector(power1=True)))
+    g.board[(1, 2)].unit = None
+    g.board[(2, 1)].unit = None
+    g.board[(2, 2)].createUnitHere(Unit_Scorpion(g, qshot=(Direction.LEFT,)))
+    return g
+
+def makeBigtestGame():
+    "return the game that bigtest.py sets up: 3 mechs and an objective unit against 4 vek with fire, water and forests."
+    g = Game()
+    for sq in (3, 8), (3, 4), (3, 6), (5, 8), (8, 8), (8, 6):
+        g.board[sq].replaceTile(Tile_Forest(g))
+    for sq in (1, 6), (1, 2), (1, 1), (2, 1), (3, 1), (4, 1):
+        g.board[sq].replaceTile(Tile_Water(g))
+    for sq in (4, 7), (6, 7), (7, 7):
+        g.board[sq].createUnitHere(Unit_Building(g, hp=1, maxhp=1))
+    for sq in (2, 4), (2, 5), (7, 4), (7, 5):
+        g.board[sq].createUnitHere(Unit_Building(g, hp=2, maxhp=2))
+    g.board[(1, 5)].createUnitHere(Unit_Mountain(g))
+    g.board[(1, 4)].createUnitHere(Unit_Mountain_Damaged(g))
+    for sq in (3, 4), (4, 6):
+        g.board[sq].applyFire()
+    g.vekemerge.squares = [(4, 2), (5, 1)]
+    g.board[(5, 6)].createUnitHere(Unit_OldArtillery(g))
+    g.board[(4, 4)].createUnitHere(Unit_Artillery_Mech(g, weapon1=Weapon_ArtemisArtillery(power1=True)))
+    g.board[(4, 3)].createUnitHere(Unit_Nano_Mech(g, weapon1=Weapon_AcidProjector(power1=True)))
+    g.board[(7, 8)].createUnitHere(Unit_Leap_Mech(g, hp=7, maxhp=8, weapon1=Weapon_HydraulicLegs(), attributes={Attributes.IMMUNEFIRE, Attributes.MASSIVE}))
+    g.board[(2, 2)].createUnitHere(Unit_Firefly(g, hp=2, qshot=(Direction.UP,)))
+    g.board[(3, 2)].createUnitHere(Unit_BlastPsion(g))
+    g.board[(5, 3)].createUnitHere(Unit_Hornet(g, qshot=(Direction.LEFT,)))
+    g.board[(4, 6)].createUnitHere(Unit_AlphaScarab(g, hp=1, qshot=(Direction.DOWN, 3), effects={Effects.FIRE}))
+    return g
+
+def makeReddittestGame():
+    "return the game that reddittest.py sets up: 3 mechs with the storm generator against 2 hornets and a blast psion."
+    g = Game()
+    g.board[(2, 6)].replaceTile(Tile_Sand(g))
+    for sq in (1, 1), (1, 2), (1, 3), (1, 4), (2, 1), (3, 6), (7, 3), (7, 4), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8):
+        g.board[sq].createUnitHere(Unit_Mountain(g))
+    for sq in (3, 8), (4, 8), (5, 8), (7, 6):
+        g.board[sq].createUnitHere(Unit_Building(g, hp=1, maxhp=1))
+    for sq in (3, 5), (4, 5), (7, 5):
+        g.board[sq].createUnitHere(Unit_Building(g, hp=2, maxhp=2))
+    g.board[(4, 6)].createUnitHere(Unit_Building_Objective(g, hp=1, maxhp=1))
+    for sq in (2, 4), (4, 3):
+        g.board[sq].createUnitHere(Unit_PrototypeRenfieldBomb(g))
+    g.vekemerge.squares = [(6, 2), (6, 3)]
+    g.board[(2, 5)].createUnitHere(Unit_Rocket_Mech(g, weapon1=Weapon_RocketArtillery(power1=True), weapon2=Weapon_StormGenerator(power1=True), moves=3))
+    g.board[(5, 5)].createUnitHere(Unit_Jet_Mech(g, weapon1=Weapon_AerialBombs(power1=True), moves=5))
+    g.board[(6, 5)].createUnitHere(Unit_Pulse_Mech(g, weapon1=Weapon_Repulse(power1=True), moves=4))
+    g.board[(2, 3)].createUnitHere(Unit_AlphaHornet(g, qshot=(Direction.UP,)))
+    g.board[(3, 4)].createUnitHere(Unit_Hornet(g, qshot=(Direction.LEFT,)))
+    g.board[(4, 2)].createUnitHere(Unit_BlastPsion(g))
+    return g
+
+SCENARIOS = {'smalltest': makeSmalltestGame,
+             'bigtest': makeBigtestGame,
+             'reddittest': makeReddittestGame} # {name: function that returns a new game set up for that scenario}
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 # This script brute forces the best possible single turn in Into The Breach
 ############ IMPORTS ######################
-from itertools import permutations
-from copy import deepcopy
+from itertools import permutations, combinations
+from collections import OrderedDict
+from heapq import heappush, heapreplace
+from functools import lru_cache, wraps
+from multiprocessing import Pool
+from array import array
+from time import perf_counter
+from types import MethodType, FunctionType, BuiltinFunctionType
 ############### GLOBALS ###################
 # this generator and class are out of place and separate from the others, sue me
 def numGen():
@@ -13,6 +19,14 @@ def numGen():
         yield num
 thegen = numGen()
 
+def bitGen(start):
+    "A generator that counts up in powers of 2 from start so the constants made from it can be combined into bitmasks."
+    bit = start
+    while True:
+        yield bit
+        bit <<= 1
+thebitgen = bitGen(32) # 32 is past the numbers that numGen gives every other constant, so effects and attributes never clash with them
+
 class Constant():
     "An object for building global constants."
     def __init__(self, numgen, names):
@@ -26,6 +40,18 @@ class Constant():
         "return a list of iter converted to readable names."
         return [self.value2name[x] for x in iter]
 
+class BitmaskConst(Constant):
+    "Constants that are powers of 2 so that a set of them can be kept in an int bitmask. Use this with bitGen()."
+    def getMask(self, iter):
+        "return an int bitmask of the constants in iter. iter can be None for no constants."
+        mask = 0
+        for x in iter or ():
+            mask |= x
+        return mask
+    def pprint(self, mask):
+        "return a list of the constants in the int bitmask mask converted to readable names."
+        return [name for value, name in self.value2name.items() if mask & value]
+
 class DirectionConst(Constant):
     "This is the up/down/left/right directions with a couple other methods. THIS SET OF CONSTANTS MUST BE FIRST SO IT GETS THE FIRST 4 NUMBERS!"
     def opposite(self, dir):
@@ -81,7 +107,7 @@ assert Direction.DOWN == 3
 assert Direction.LEFT == 4
 
 # These are effects that can be applied to tiles and units.
-Effects = Constant(thegen,
+Effects = BitmaskConst(thebitgen,
     # These effects can be applied to both tiles and units:
     ('FIRE',
     'ICE', # sometimes does nothing to tile
@@ -99,7 +125,7 @@ Effects = Constant(thegen,
 
 # These are attributes that are applied to units.
 # Attributes typically don't change, the only exception being ARMORED which can be removed from a psion dying.
-Attributes = Constant(thegen, (
+Attributes = BitmaskConst(thebitgen, (
     'MASSIVE', # prevents drowning in water
     'STABLE', # prevents units from being pushed
     'FLYING', # prevents drowning in water and allows movement through other units
@@ -120,6 +146,7 @@ Passives = Constant(thegen, ( # This isn't all passives, just ones that need to
     'STABILIZERS',
     'KICKOFFBOOSTERS',
     'FORCEAMP',
+    'PSIONICRECEIVER',
     ))
 
 Actions = Constant(thegen, ( # These are the actions that a player can take with a unit they control.
@@ -131,11 +158,300 @@ Actions = Constant(thegen, ( # These are the actions that a player can take with
 
 # don't need these anymore
 del Constant
+del BitmaskConst
 del numGen
 del thegen
+del bitGen
+del thebitgen
 del DirectionConst
 
 ############### FUNCTIONS #################
+# These types are immutable and are shared between copies of a game instead of being cloned.
+# frozensets hold squares and other plain values.
+SHAREDTYPES = frozenset((int, str, bool, float, frozenset, type(None), type, FunctionType, BuiltinFunctionType))
+CONTAINERTYPES = frozenset((set, list, dict, array)) # the mutable containers that UndoJournal saves the contents of
+WEAPONSLOTS = frozenset(('weapon1', 'weapon2', 'repweapon')) # the attributes of a unit that hold its weapons
+SIGNATURETYPES = SHAREDTYPES | {tuple} # the types of values that stateSignature() keeps as they are
+
+SQUARES = tuple((x, y) for x in range(1, 9) for y in range(1, 9)) # every square on the board in the order that Game fills a new board. Each square's index here is its bit in a bitboard.
+SQUAREINDEX = {square: index for index, square in enumerate(SQUARES)} # {square: index in SQUARES}
+
+def _buildRays():
+    "return the RAYS table. This is run once when this module is imported."
+    offsets = {Direction.UP: (0, 1), Direction.RIGHT: (1, 0), Direction.DOWN: (0, -1), Direction.LEFT: (-1, 0)}
+    rays = {}
+    for square in SQUARES:
+        rays[square] = {}
+        for direction, (dx, dy) in offsets.items():
+            ray = [square]
+            x, y = square[0] + dx, square[1] + dy
+            while 1 <= x <= 8 and 1 <= y <= 8:
+                ray.append((x, y))
+                x, y = x + dx, y + dy
+            rays[square][direction] = tuple(ray)
+    return rays
+RAYS = _buildRays() # {square: {direction: (square, the next square in direction, ..., the square at the edge of the board)}}. The square distance squares away in direction is at index distance.
+NEIGHBORS = {square: tuple((direction, ray[1]) for direction, ray in RAYS[square].items() if len(ray) > 1) for square in SQUARES} # {square: ((direction, square next to it in direction), ...)} for the neighbors that are on the board
+del _buildRays
+
+# Bitboards are ints with bit SQUAREINDEX[square] set for each square in them. Game.occupied is the bitboard of the squares with units on them.
+SQUAREBITS = {square: 1 << index for index, square in enumerate(SQUARES)} # {square: the bit for that square}
+COLUMNMASKS = {x: sum(SQUAREBITS[(x, y)] for y in range(1, 9)) for x in range(1, 9)} # {x: bitboard of every square in that column}
+ROWMASKS = {y: sum(SQUAREBITS[(x, y)] for x in range(1, 9)) for y in range(1, 9)} # {y: bitboard of every square in that row}
+def _buildRayMasks():
+    "return the RAYMASKS table. This is run once when this module is imported."
+    raymasks = {}
+    for square, bit in SQUAREBITS.items():
+        below = bit - 1 # every square with a lower index than square
+        above = ~(below | bit) # every square with a higher index than square
+        raymasks[square] = {Direction.UP: COLUMNMASKS[square[0]] & above, Direction.DOWN: COLUMNMASKS[square[0]] & below,
+                            Direction.RIGHT: ROWMASKS[square[1]] & above, Direction.LEFT: ROWMASKS[square[1]] & below}
+    return raymasks
+RAYMASKS = _buildRayMasks() # {square: {direction: bitboard of RAYS[square][direction] without square itself}}
+del _buildRayMasks
+
+def getRelSquare(square, direction, distance=1):
+    """return the square that is distance squares away from square in direction, or False if that square would be off the board.
+    direction is a Direction.UP type global constant and distance is a positive int.
+    raises KeyError if square isn't on the board, such as when it's False from an earlier call."""
+    rays = RAYS[square]
+    try:
+        ray = rays[direction]
+    except KeyError:
+        raise InvalidDirection(direction)
+    if distance < len(ray):
+        return ray[distance]
+    return False # off the board
+
+UNSET = object() # stands in for a slot that was never set in the tuples from getSlotValues()
+SLOTS = {} # {class: what getSlots() returned for it}
+
+def getSlots(cls):
+    """Tiles, units and weapons keep their state in __slots__ spread across their base classes instead of a __dict__.
+    return a tuple of (names, getter, setter, signer) for instances of cls. names is a tuple of the names of every slot, the slots of its bases first,
+    getter(obj) returns a tuple of all of their values and setter(obj, values) sets all of them from such a tuple. signer(obj) is stateSignature(obj).
+    All 4 are None if instances of cls have a __dict__."""
+    try:
+        return SLOTS[cls]
+    except KeyError:
+        pass
+    if cls.__dictoffset__:
+        slots = None, None, None, None
+    else:
+        names = tuple(name for base in reversed(cls.__mro__) for name in base.__dict__.get('__slots__', ()))
+        slots = (names, *_makeSlotAccessors(cls, names))
+    SLOTS[cls] = slots
+    return slots
+
+def _makeSlotAccessors(cls, names):
+    """return a tuple of (getter, setter, signer) functions for the slots of cls called names. They're compiled with the names written out
+    so that python can specialize each attribute access, which makes them much faster than attrgetter(), a loop of setattr() or the loop in stateSignature()."""
+    attrs = ''.join('obj.{0}, '.format(name) for name in names)
+    signature = []
+    for name in names: # this must give the same tuple as the loop in stateSignature()
+        if name[0] == '_':
+            signature.append('frozenset(v) if (t := type(v := obj.{0})) is set else tuple(v) if t is list else UNSET, '.format(name))
+        elif name in WEAPONSLOTS:
+            signature.append('v if (t := type(v := obj.{0})) in SIGNATURETYPES else frozenset(v) if t is set else tuple(v) if t is list '
+                             'else UNSET if v is UNSET else stateSignature(v), '.format(name))
+        else:
+            signature.append('v if (t := type(v := obj.{0})) in SIGNATURETYPES else frozenset(v) if t is set else tuple(v) if t is list else UNSET, '.format(name))
+    namespace = {'cls': cls}
+    exec('def getter(obj):\n    return ({0})\ndef setter(obj, values):\n    ({0}) = values\ndef signer(obj, cls=cls):\n    return (cls, {1})\n'.format(attrs, ''.join(signature)),
+         globals(), namespace)
+    return namespace['getter'], namespace['setter'], namespace['signer']
+
+def getSlotValues(obj):
+    "return a tuple of the values of every slot of obj in the order of the names from getSlots(). UNSET is given for slots that were never set."
+    names, getter, setter, signer = getSlots(type(obj))
+    try:
+        return getter(obj)
+    except AttributeError: # some slots were never set
+        return tuple([getattr(obj, name, UNSET) for name in names])
+
+def cloneValue(value, clones):
+    """Return a copy of value for use in a copy of a game. This is what Game.getCopy() uses instead of deepcopy.
+    value can be anything held by a game object: immutable values are returned as-is, containers are copied with their contents cloned,
+    bound methods (such as game.psionPassiveTurn or a weapon's shoot method) are bound to the copy of their object and everything else is cloned with cloneObject().
+    clones is a dict of {id(original): copy} of every object already cloned during this copy."""
+    valtype = type(value)
+    if valtype in SHAREDTYPES:
+        return value
+    if valtype is tuple: # squares and shots are tuples of ints, don't bother copying them
+        for v in value:
+            if type(v) not in SHAREDTYPES:
+                return tuple([cloneValue(v, clones) for v in value])
+        return value
+    if valtype is set: # sets of plain ints are copied as-is, sets of units need their units cloned
+        for v in value:
+            if type(v) not in SHAREDTYPES:
+                return {cloneValue(v, clones) for v in value}
+        return set(value)
+    if valtype is list:
+        for v in value:
+            if type(v) not in SHAREDTYPES:
+                return [cloneValue(v, clones) for v in value]
+        return list(value)
+    if valtype is array: # score logs
+        return value[:]
+    if valtype is dict:
+        return {k: cloneValue(v, clones) for k, v in value.items()}
+    if valtype is MethodType:
+        return MethodType(value.__func__, cloneValue(value.__self__, clones))
+    try:
+        return clones[id(value)]
+    except KeyError:
+        return cloneObject(value, clones)
+
+def cloneObject(obj, clones):
+    """Return a copy of obj, an object that belongs to a game such as a tile, unit, weapon or environmental effect.
+    The copy is made without running the constructor, each attribute in its __dict__ or __slots__ is copied with cloneValue(). Slots that were never set are left unset.
+    Objects with neither are assumed to be immutable and are returned as-is.
+    clones is a dict of {id(original): copy} that this new copy is added to so that objects referenced from more than one place
+    (units on a tile and in game.nonplayerunits for example) are only cloned once."""
+    objtype = type(obj)
+    names, getter, setter, signer = getSlots(objtype)
+    if names is None:
+        newobj = object.__new__(objtype)
+        clones[id(obj)] = newobj
+        newobj.__dict__ = {k: v if type(v) in SHAREDTYPES else cloneValue(v, clones) for k, v in obj.__dict__.items()}
+        return newobj
+    if not names:
+        return obj
+    newobj = object.__new__(objtype)
+    clones[id(obj)] = newobj
+    try:
+        values = getter(obj)
+    except AttributeError: # some slots were never set
+        for name, value in zip(names, getSlotValues(obj)):
+            if type(value) in SHAREDTYPES:
+                setattr(newobj, name, value)
+            elif value is not UNSET:
+                setattr(newobj, name, cloneValue(value, clones))
+    else:
+        setter(newobj, [value if type(value) in SHAREDTYPES else cloneValue(value, clones) for value in values])
+    return newobj
+
+def stateSignature(obj):
+    """Return a hashable tuple of the state held by obj, an object that belongs to a game such as a tile, unit or environmental effect.
+    This includes plain values such as hp, effects and squares and the state of the weapons that a unit holds.
+    References to other objects such as the game or the unit on a tile are left out, as are private attributes starting with _.
+    The values are listed in the order of the object's attributes with UNSET standing in for the ones that are left out.
+    Two objects of the same type with the same signature will behave the same way."""
+    names, getter, setter, signer = SLOTS.get(type(obj)) or getSlots(type(obj))
+    if names is None:
+        attrs = obj.__dict__
+        names = tuple(attrs)
+        values = attrs.values()
+        signature = [type(obj), names] # objects with a __dict__ can have different attributes, so the names are part of the signature
+    else:
+        try:
+            return signer(obj)
+        except AttributeError: # some slots were never set
+            values = getSlotValues(obj)
+            signature = [type(obj)]
+    for name, value in zip(names, values):
+        valtype = type(value)
+        if valtype in SIGNATURETYPES:
+            signature.append(UNSET if name[0] == '_' else value)
+        elif valtype is set:
+            signature.append(frozenset(value))
+        elif valtype is list:
+            signature.append(tuple(value))
+        elif name in WEAPONSLOTS and value is not UNSET:
+            signature.append(stateSignature(value))
+        else:
+            signature.append(UNSET)
+    return tuple(signature)
+
+def getArea(squares, distance):
+    "return a set of every square on the board that is distance or less squares away from any of squares."
+    area = set()
+    for square in squares:
+        area.update(_getSquareArea(square, distance))
+    return area
+
+@lru_cache(maxsize=None)
+def _getSquareArea(square, distance):
+    "return a frozenset of every square on the board that is distance or less squares away from square."
+    x, y = square
+    area = set()
+    for dx in range(-distance, distance + 1):
+        for dy in range(abs(dx) - distance, distance - abs(dx) + 1):
+            if 1 <= x + dx <= 8 and 1 <= y + dy <= 8:
+                area.add((x + dx, y + dy))
+    return frozenset(area)
+
+def getLines(squares, distance=7):
+    """return a set of every square on the board that is in the same row or column as any of squares.
+    distance limits it to the squares that are that many squares away or less, the default reaches across the whole board."""
+    lines = set()
+    for square in squares:
+        lines.update(_getSquareLines(square, distance))
+    return lines
+
+@lru_cache(maxsize=None)
+def _getSquareLines(square, distance):
+    "return a frozenset of every square on the board that is in the same row or column as square and distance or less squares away from it."
+    x, y = square
+    return frozenset([(x, y2) for y2 in range(max(1, y - distance), min(8, y + distance) + 1)] +
+                     [(x2, y) for x2 in range(max(1, x - distance), min(8, x + distance) + 1)])
+
+@lru_cache(maxsize=100000)
+def getReachableSquares(start, moves, blockers):
+    """return a frozenset of the squares that can be reached from start in moves steps or less without passing through a blocked square. start isn't included.
+    blockers is an int bitmask of the squares that block movement, bit 1 << SQUAREINDEX[square] is set for each one. Only the squares within moves of start matter.
+    Results are cached, so units that move from the same square around the same blockers share them."""
+    reached = {start}
+    frontier = [start]
+    for step in range(moves): # breadth first, so each square is only visited once
+        nextfrontier = []
+        for square in frontier:
+            for direction, neighbor in NEIGHBORS[square]:
+                if neighbor not in reached and not blockers >> SQUAREINDEX[neighbor] & 1:
+                    reached.add(neighbor)
+                    nextfrontier.append(neighbor)
+        frontier = nextfrontier
+    reached.discard(start)
+    return frozenset(reached)
+
+@lru_cache(maxsize=None)
+def getRay(square, direction):
+    "return a frozenset of square and every square on the board past it in direction."
+    return frozenset(RAYS[square][direction])
+
+@lru_cache(maxsize=None)
+def getEffectScoreBound(on, off, has, got, lost, gainable=True):
+    """return the most that a unit's score events for a single effect could add to the score from now until the end of the turn.
+    on and off are the unit's scores for getting and losing the effect, None if the unit can't get or lose it.
+    has is True if the unit has the effect now. got and lost are the unit's flags for getting and losing the effect this turn.
+    gainable is False if nothing can give the unit the effect from now on, it can only lose it.
+    returns a tuple of the bound if the unit survives and the bound if it dies, or None if there's no limit."""
+    if gainable and on is not None and off is not None and on + off > 0: # the unit would score more every time the effect was added and removed
+        return None
+    on, off = on or 0, off or 0
+    # Adding and removing the effect alternate and each pair of them scores 0 or less, so the most it can score is from the fewest events that reach the final state.
+    if has:
+        alive = max(0, off)
+    elif gainable:
+        alive = max(0, on)
+    else:
+        alive = 0
+    dead = None
+    for final in False, True:
+        for newgot in {got, True}:
+            for newlost in {lost, True}:
+                gained, removed = int(newgot and not got), int(newlost and not lost) # the flags can only be set by adding or removing the effect
+                if gained - removed > final - has:
+                    removed = gained - (final - has)
+                else:
+                    gained = removed + (final - has)
+                if gained and not (newgot and gainable): # adding the effect always sets the flag
+                    continue
+                effectscore = on * gained + off * removed - on * newgot - off * newlost # dying undoes the effect scores once for each flag
+                if dead is None or effectscore > dead:
+                    dead = effectscore
+    return alive, dead
 
 ############### CLASSES #################
 # Exceptions
@@ -163,9 +479,6 @@ class CantHappenInGame(Exception):
     """This is raised when something happens that's not permitted in game.
     For example, if the Terraformer's shot goes off the board. The in-game Terraformer will never be placed to allow this."""
 
-class FakeException(Exception):
-    "This is raised to do some more efficient try/except if/else statements"
-
 class GameOver(Exception):
     "This is raised when your powergrid health is depleted, causing the end of the current simulation."
 
@@ -190,6 +503,10 @@ class Powergrid():
             raise GameOver
         self.game.score.submit(-50, 'powergrid_hurt', damage)
 
+    def flushHurt(self):
+        "Signal that buildings are done taking damage. Only Powergrid_CriticalShields needs to know this."
+        pass
+
 class Powergrid_CriticalShields(Powergrid):
     "This is your powergrid hp when you have the CriticalShields passive in play."
     def __init__(self, game, hp=7):
@@ -202,19 +519,15 @@ class Powergrid_CriticalShields(Powergrid):
         "This is run when the CriticalShields passive is in play. It goes through the board and builds a set of every building."
         self.buildings = set()
         for sq in self.game.board:
-            try:
-                if self.game.board[sq].unit.isBuilding():
-                    self.buildings.add(sq)
-            except AttributeError: # None.isbuilding()
-                pass
+            unit = self.game.board[sq].unit
+            if unit is not None and unit.isBuilding():
+                self.buildings.add(sq)
     def _shieldBuildings(self):
         "Shield all your buildings, return nothing."
         for sq in self.buildings:
-            try:
-                if self.game.board[sq].unit.isBuilding(): # we have to check again because it's possible a building was destroyed and now another unit is standing in it's place.
-                    self.game.board[sq].unit.applyShield()
-            except AttributeError:
-                continue
+            unit = self.game.board[sq].unit
+            if unit is not None and unit.isBuilding(): # we have to check again because it's possible a building was destroyed and now another unit is standing in it's place.
+                unit.applyShield()
     def flushHurt(self):
         """Call this to signal that buildings are done taking damage.
         If we don't do this it'll be possible in the sim to shoot something that hits 2 buildings, and damaging the first one
@@ -228,6 +541,66 @@ class Powergrid_CriticalShields(Powergrid):
             self.qdamage = 0
 
 
+class UndoJournal():
+    """This records the state of game objects right before they are changed so that a game can be rolled back to an earlier checkpoint instead of being copied.
+    Use Game.checkpoint() and Game.rollback() rather than using this object directly."""
+    __slots__ = ('entries', 'checkpoints')
+    def __init__(self):
+        self.entries = [] # a list of (object, saved __dict__ or values of the slots, ((container, saved contents), ...), getSlots() of its class) tuples in the order that the objects were touched
+        self.checkpoints = [] # a list of (index of the first entry, set of ids of touched objects) tuples, one for each checkpoint that hasn't been rolled back yet
+    def checkpoint(self):
+        "Start a new checkpoint. return the int to pass to rollback() to undo everything touched from now on."
+        self.checkpoints.append((len(self.entries), set()))
+        return len(self.checkpoints) - 1
+    def touch(self, obj):
+        """Record the current state of obj if it hasn't already been recorded since the last checkpoint. This must be done BEFORE obj is changed.
+        The sets, lists, dicts and arrays that obj holds are saved too so they can be restored in place. returns nothing."""
+        touched = self.checkpoints[-1][1]
+        if id(obj) in touched:
+            return
+        slots = SLOTS.get(type(obj)) or getSlots(type(obj))
+        names, getter, setter, signer = slots
+        if names is None:
+            state = obj.__dict__.copy()
+            values = state.values()
+        else:
+            try:
+                state = values = getter(obj)
+            except AttributeError: # some slots were never set, a list tells rollback() to look out for UNSET
+                state = values = list(getSlotValues(obj))
+        touched.add(id(obj))
+        if CONTAINERTYPES.isdisjoint(map(type, values)): # most tiles and weapons don't hold any containers
+            containers = ()
+        else:
+            containers = [(value, value[:] if type(value) is array else value.copy()) for value in values if type(value) in CONTAINERTYPES]
+        self.entries.append((obj, state, containers, slots))
+    def rollback(self, checkpoint):
+        """Restore every object touched since checkpoint to the state it was in when it was first touched and forget about checkpoint and all checkpoints after it.
+        Objects and their containers are restored in place so any references to them are still good. returns nothing."""
+        start = self.checkpoints[checkpoint][0]
+        for obj, state, containers, (names, getter, setter, signer) in reversed(self.entries[start:]):
+            if names is None:
+                objattrs = obj.__dict__
+                objattrs.clear()
+                objattrs.update(state)
+            elif type(state) is tuple: # every slot was set
+                if containers or getter(obj) != state: # objects that weren't changed are left alone. A container that was swapped for an equal one still has to be put back
+                    setter(obj, state)
+            else:
+                for name, value in zip(names, state):
+                    if value is not UNSET:
+                        setattr(obj, name, value)
+                    elif hasattr(obj, name): # the slot was set after obj was touched
+                        delattr(obj, name)
+            for container, contents in containers:
+                if type(container) is list or type(container) is array:
+                    container[:] = contents
+                else:
+                    container.clear()
+                    container.update(contents)
+        del self.entries[start:]
+        del self.checkpoints[checkpoint:]
+
 ############# THE MAIN GAME BOARD!
 class Game():
     "This represents the a single instance of a game. This is the highest level of the game."
@@ -245,6 +618,7 @@ class Game():
             for letter in range(1, 9):
                 for num in range(1, 9):
                     self.board[(letter, num)] = Tile_Ground(self, square=(letter, num))
+        self._setOccupied()
         self.powergrid = Powergrid(self, powergrid_hp)
         try:
             environeffect.game = self
@@ -271,12 +645,16 @@ class Game():
                                 #  If we don't do this, a goo will replace the unit it killed on the board, and then that unit will erase the goo when it's deaths replaces the square with None.
         self.psionPassiveTurn = None # This will be replaced by a method provided by the Regeneration and Hive Targeting (tentacle) psion effects that take a turn to do their effect.
         self.stormGeneratorTurn = None # This will be replaced by a method provided by the StormGenerator passive weapon
+        self.stormtiles = None # a set of squares of tiles with smoke on them when the StormGenerator is in play. This is None when it isn't.
         self.visceraheal = 0 # The amount to heal a mech that killed a vek. Each vek that is killed grants this amount of hp healing
         self.otherpassives = set() # misc passives that only need to be checked for presence and nothing else.
         self.score = ScoreKeeper()
         self.actionlog = [] # a log of each action the player has taken in this particular game
         self.idcount = 0 # this is used to count unique numbers assigned to player-controlled units.
                         # this is needed so we can later find the corresponding unit in different game instances, after it has moved
+        self.journal = None # an UndoJournal that records changes to this game after checkpoint() is called. This is None when the game isn't journaling.
+        self.zobrist = None # the XOR of the hashes of every tile on the board, kept up to date by getHash(). This is None until getHash() is first called.
+        self.dirtysquares = set() # a set of squares whose tiles have changed since zobrist was last updated. Their old hashes have already been XORed out of zobrist.
     def flushHurt(self):
         "resolve the effects of hurt units, returns the number of enemies killed (for use with viscera nanobots). Tiles are damaged first, then Psions are killed, then your mechs can explode, then vek/bots can die"
         # print("hurtenemies:", self.hurtenemies)
@@ -291,16 +669,11 @@ class Game():
             hurtenemies = self.hurtenemies
             self.hurtplayerunits = []
             self.hurtenemies = []
-            try:  # signal to the powergrid to damage multiple buildings at once if we're using Powergrid_CriticalShields
-                self.powergrid.flushHurt()
-            except AttributeError:
-                pass
-            try:
+            self.powergrid.flushHurt() # signal to the powergrid to damage multiple buildings at once if we're using Powergrid_CriticalShields
+            if self.hurtpsion is not None:
                 if self.hurtpsion._allowDeath():
                     killedenemies += 1
                 self.hurtpsion = None
-            except AttributeError:
-                pass
             for hpu in hurtplayerunits:
                 hpu.explode()
             for he in hurtenemies:
@@ -312,33 +685,23 @@ class Game():
                 return killedenemies
     def start(self):
         "Initialize the simulation. Run this after all units have been placed on the board."
-        psionicreceiver = False
+        self._setOccupied() # setup code can take units off the board by setting tile.unit directly, which doesn't update occupied
         for unit in self.playerunits:
             for weap in 'weapon1', 'weapon2':
-                try:
-                    getattr(unit, weap).enable()
-                except AttributeError: # unit.None.enable(), or enable() doesn't exist
-                    pass
-                except FakeException: # This is raised by the psionic receiver
-                    psionicreceiver = True
+                enable = getattr(getattr(unit, weap, None), 'enable', None) # None if the unit has no weapon here or it doesn't need enabling
+                if enable is not None:
+                    enable()
         for unit in self.nonplayerunits:
-            if psionicreceiver:
-                try:
-                    unit.weapon1._enableMechs()
-                except AttributeError:
-                    continue
-            try:
-                unit.weapon1.enable()
-            except AttributeError:
-                pass
-            try: # validate all enemy qshots
-                unit.weapon1.validate()
-            except AttributeError:
-                pass
-            try: # set companion tiles for multi-tile units
+            weapon = getattr(unit, 'weapon1', None)
+            if weapon is not None:
+                if Passives.PSIONICRECEIVER in self.otherpassives and hasattr(weapon, '_enableMechs'):
+                    weapon._enableMechs()
+                if hasattr(weapon, 'enable'):
+                    weapon.enable()
+                if hasattr(weapon, 'validate'): # validate all enemy qshots
+                    weapon.validate()
+            if hasattr(unit, '_setCompanion'): # set companion tiles for multi-tile units
                 unit._setCompanion()
-            except AttributeError: # not a multi-tile unit
-                pass
     def endPlayerTurn(self):
         """Simulate the outcome of this single turn, as if the player clicked the 'end turn' button in the game. Let the vek take their turn now.
         Order of turn operations:
@@ -350,41 +713,53 @@ class Game():
            NPC actions
            Enemies emerge
         """
-        # Do the fire turn:
+        self._fireTurn()
+        self._stormTurn()
+        self._psionTurn()
+        self._environTurn()
+        self._enemyTurn()
+        self._npcTurn()
+        self._emergeTurn()
+    def _fireTurn(self):
+        "Units on fire take 1 damage. returns nothing."
         for unit in self.playerunits: # copypasta instead of converting playerunits to a list
-            if Effects.FIRE in unit.effects:
+            if unit.effects & Effects.FIRE:
                 unit.takeDamage(1, ignorearmor=True, ignoreacid=True)
         for unit in self.nonplayerunits: # fire damage seems to happen to vek in the order of their turn
-            if Effects.FIRE in unit.effects:
+            if unit.effects & Effects.FIRE:
                 unit.takeDamage(1, ignorearmor=True, ignoreacid=True)
         self.flushHurt()
-        try: # Do the storm generator turn:
+    def _stormTurn(self):
+        "Do the storm generator turn. returns nothing."
+        if self.stormGeneratorTurn is not None:
             self.stormGeneratorTurn()
-        except TypeError: # self.None()
-            pass
-        try: # Do the psion healing / regeneration turn
+    def _psionTurn(self):
+        "Do the psion healing / regeneration turn. returns nothing."
+        if self.psionPassiveTurn is not None:
             self.psionPassiveTurn()
-        except TypeError: # self.None()
-            pass
-        try: # run the environmental turn
+    def _environTurn(self):
+        "run the environmental turn. returns nothing."
+        if self.environeffect is not None:
             self.environeffect.run()
-        except AttributeError: # self.None.run()
-            pass
-        # Now run the enemy's turn:
+    def _enemyTurn(self):
+        "Now run the enemy's turn. returns nothing."
         for unit in self.nonplayerunits:
             if unit.alliance == Alliance.ENEMY:
-                try:
-                    unit.weapon1.shoot()
-                except AttributeError: # unit.None.shoot()
-                    pass
-        # Now do NPC actions:
+                self._shootNonPlayerUnit(unit)
+    def _npcTurn(self):
+        "Now do NPC actions. returns nothing."
         for unit in self.nonplayerunits:
             if unit.alliance != Alliance.ENEMY:
-                try:
-                    unit.weapon1.shoot()
-                except AttributeError: # unit.None.shoot()
-                    pass
+                self._shootNonPlayerUnit(unit)
+    def _emergeTurn(self):
+        "Enemies emerge. returns nothing."
         self.vekemerge.run()
+    def _shootNonPlayerUnit(self, unit):
+        "Have a vek or NPC unit shoot its weapon during endPlayerTurn() if it has one that can be shot. returns nothing."
+        shoot = getattr(getattr(unit, 'weapon1', None), 'shoot', None) # None if the unit has no weapon or it's a passive
+        if shoot is not None:
+            unit._touch()
+            shoot()
     def killMech(self, unit):
         """Run this to process a mech dying.
         unit is the mech unit in self.playerunits
@@ -399,49 +774,192 @@ class Game():
         self.idcount += 1
         return self.idcount
     def getCopy(self):
-        "return a copy of this game object and copies of all the objects it contains."
-        try:
-            environeffect = type(self.environeffect)(list(self.environeffect.squares)) # make a new environeffect object
-        except (TypeError, AttributeError): # AttributeError: 'NoneType' object has no attribute 'squares'
-            environeffect = None # set it to be none when passed in
-        # create the new game object.
-        newgame = Game({}, self.powergrid.hp, environeffect, Environ_VekEmerge(list(self.vekemerge.squares)))
-        # Now go through each square and copy the properties of each to the new game object
-        for letter in range(1, 9):
-            for num in range(1, 9):
-                newgame.board[(letter, num)] = self.board[(letter, num)].getCopy(newgame)
-                try:
-                    newgame.board[(letter, num)].createUnitHere(self.board[(letter, num)].unit.getCopy(newgame))
-                except AttributeError: # None._addUnitToGame()
-                    pass # there was no unit on this tile
-        newgame.start()
-        return newgame
+        """return a copy of this game object and copies of all the objects it contains.
+        Every tile, unit, weapon and environmental effect is copied along with all of their current state, so the copy can be simulated independently of this game.
+        Don't run start() on the copy, it was already started if this game was. The copy doesn't get this game's undo journal."""
+        return cloneObject(self, {id(self.journal): None})
+    def checkpoint(self):
+        """Start journaling changes made to this game so they can be undone with rollback(). Checkpoints can be nested.
+        This is much cheaper than getCopy() when you want to try an action and then go back to how things were.
+        returns an int to pass to rollback()."""
+        if self.journal is None:
+            self.journal = UndoJournal()
+        checkpoint = self.journal.checkpoint()
+        # these objects are changed by almost every action, so record them now instead of everywhere they're changed
+        for obj in self, self.score, self.powergrid, self.vekemerge:
+            self.journal.touch(obj)
+        if self.environeffect:
+            self.journal.touch(self.environeffect)
+        return checkpoint
+    def rollback(self, checkpoint):
+        """Undo every change made to this game since checkpoint() returned checkpoint. This also undoes any checkpoints made after it.
+        All objects are restored in place, so references to units and tiles in this game are still good afterwards. returns nothing."""
+        self.journal.rollback(checkpoint)
+        if not self.journal.checkpoints:
+            self.journal = None
+    def getHash(self):
+        """return a 64-bit hash of the current state of this game. Two games that are in the same state have the same hash, no matter which actions got them there.
+        The score isn't part of the hash. Only the tiles that changed since the last call are rehashed."""
+        board = self.board
+        if self.zobrist is None: # nothing has been hashed yet
+            self.zobrist = 0
+            self.dirtysquares.update(board)
+        for square in self.dirtysquares:
+            tile = board[square]
+            if self.journal is not None: # the tile's old hash has to come back if it's rolled back
+                self.journal.touch(tile)
+            tile._zobrist = tile._getHash()
+            self.zobrist ^= tile._zobrist
+        self.dirtysquares.clear()
+        if self.environeffect is None:
+            environeffect = None
+        else:
+            environeffect = stateSignature(self.environeffect)
+        return self.zobrist ^ hash((stateSignature(self.powergrid), stateSignature(self.vekemerge), environeffect,
+                                    frozenset(id(unit) for unit in self.playerunits), tuple(id(unit) for unit in self.nonplayerunits)))
+    def hasGlobalEffects(self):
+        """return True if something on the board lets an action affect squares far away from where it happened, False if not.
+        Teleporters move units across the board, critical shields change every building when one is hurt, multi-tile units
+        replicate damage to their other half and some psions change the score of units anywhere when they die.
+        Explosions only spread to the squares around them, use getBlastReach() for those."""
+        if isinstance(self.powergrid, Powergrid_CriticalShields):
+            return True
+        for tile in self.board.values():
+            if isinstance(tile, Tile_Teleporter):
+                return True
+            unit = tile.unit
+            if unit is not None and (isinstance(unit, Unit_MultiTile_Base) or unit.isPsion() and unit.weapon1.hasGlobalEffects()):
+                return True
+        return False
+    def getBlastReach(self, squares):
+        """return a set of squares that explosive units could hurt when they die if the units in squares could be moved anywhere in squares first.
+        Explosions that kill other explosive units are followed too. The set is empty if there are no explosive units in squares."""
+        for square in squares:
+            unit = self.board[square].unit
+            if unit is not None and unit.effects & Effects.EXPLOSIVE:
+                break
+        else:
+            return set()
+        blasts = getArea(squares, 1)
+        new = blasts.difference(squares) # the units on these squares can't be moved, they can only be hurt by an explosion next to them
+        while new:
+            chained = set()
+            for square in new:
+                unit = self.board[square].unit
+                if unit is not None and unit.effects & Effects.EXPLOSIVE:
+                    chained.update(_getSquareArea(square, 1))
+            new = chained - blasts
+            blasts |= new
+        return blasts
+    def getScoreBound(self, reach, repairs, limit=None):
+        """return the most that the score could go up by from now until the end of the turn if the player's actions can only touch the squares in reach.
+        This assumes the best possible outcome for the player, so the real score change is never higher.
+        repairs is an int of how many shots the player has left that could repair a unit.
+        limit is the bound that's already too high to be useful. Once the bound gets to it, it's returned without adding up the rest, so it could be lower than the true bound.
+        The units in reach are added up first, that's often enough to get to limit without working out what the enemy's turn could touch.
+        This doesn't hold when hasGlobalEffects() is True, check that first.
+        returns None if there's no limit, such as when reach is None or the environment could affect any square."""
+        if reach is None or self.environeffect is not None:
+            return None
+        bound = 12 * len(self.vekemerge.squares) # every emerging vek could be blocked
+        for square, tile in self.board.items():
+            if tile.effects & Effects.TIMEPOD:
+                bound += 2
+            if tile.unit is not None and square in reach:
+                unitbound = tile.unit.getScoreBound(repairs)
+                if unitbound is None:
+                    return None
+                bound += unitbound
+        if limit is not None and bound >= limit:
+            return bound
+        danger = self._getEnemyTurnReach(reach)
+        if danger is None:
+            return None
+        touched = reach | danger
+        for square, tile in self.board.items():
+            if tile.unit is not None and tile.unit.effects & Effects.FIRE: # burning units are hurt at the end of the turn wherever they are
+                touched.add(square)
+        touched |= self.getBlastReach(touched)
+        for square in touched - reach: # only mechs that the player's actions reach can be repaired
+            unit = self.board[square].unit
+            if unit is None:
+                continue
+            unitbound = unit.getScoreBound(0, reached=False)
+            if unitbound is None:
+                return None
+            bound += unitbound
+        return bound
+    def _getEnemyTurnReach(self, reach):
+        """return a set of squares that the enemy's turn could touch, not counting the squares in reach that the player could change.
+        A unit in reach that attacks on the enemy's turn could be moved anywhere in reach or have its attack flipped, so anything its weapon can hit from there counts.
+        returns None if one of them could then attack anywhere."""
+        danger = set(self.vekemerge.squares)
+        if self.stormtiles is not None:
+            danger.update(self.stormtiles)
+        for unit in self.nonplayerunits:
+            weapon = getattr(unit, 'weapon1', None)
+            if not hasattr(weapon, 'getReach'): # this unit doesn't attack or its weapon is a passive
+                continue
+            qshot = getattr(weapon, 'qshot', ()) # weapons that the enemy doesn't queue shots for could be shot anywhere they reach
+            if qshot is None: # this unit's attack was cancelled or it never had one
+                continue
+            if unit.square in reach:
+                attack = weapon.getReach(reach)
+            elif qshot:
+                attack = weapon.getQueuedReach()
+            else:
+                attack = weapon.getReach((unit.square,))
+            if attack is None:
+                return None
+            danger.update(getArea(attack, 2)) # units next to where the attack lands can be hurt or pushed into others
+        return danger
+    def _dirtySquare(self, square):
+        "Take the hash of the tile on square out of zobrist so getHash() rehashes it. This must be called before the tile or the unit on it is changed. returns nothing."
+        if self.zobrist is not None and square not in self.dirtysquares:
+            self.zobrist ^= self.board[square]._zobrist
+            self.dirtysquares.add(square)
+    def _setOccupied(self):
+        "Set occupied from the units on the board. Tiles and units keep it up to date after this whenever they add or remove a unit. returns nothing."
+        self.occupied = 0 # a bitboard of the squares that have a unit on them
+        for square, tile in self.board.items():
+            if tile.unit:
+                self.occupied |= SQUAREBITS[square]
+    def getFirstUnitSquare(self, square, direction):
+        "return the square of the first unit found going from square in direction, not counting a unit on square itself. returns None if there are no units that way."
+        hits = self.occupied & RAYMASKS[square][direction]
+        if not hits:
+            return None
+        if direction in (Direction.UP, Direction.RIGHT): # these go toward higher square indexes, so the nearest unit is the lowest bit
+            return SQUARES[(hits & -hits).bit_length() - 1]
+        return SQUARES[hits.bit_length() - 1]
 
 ##############################################################################
 ######################################## TILES ###############################
 ##############################################################################
 class TileUnit_Base():
     "This is the base object that forms both Tiles and Units."
+    __slots__ = ('effects', 'game', 'square', 'type')
+    _blocksmove = False # set to True by tiles and units that block mech movement
     def __init__(self, game, square=None, type=None, effects=None):
         self.game = game  # this is a link back to the game board instance so tiles and units can change it
         self.square = square # This is the (x, y) coordinate of the Tile or Unit. This is required for Tiles, but not for Units which have their square set when they are placed on a square.
         self.type = type # the name of the unit or tile
-        if not effects:
-            self.effects = set()
-        else:
-            self.effects = set(effects) # Current effect(s) on the tile. Effects are on top of the tile. Some can be removed by having your mech repair while on the tile.
+        # effects (and the attributes of units) are int bitmasks of the Effects that are on it. Check for one with self.effects & Effects.FIRE, add it with self.effects |= Effects.FIRE
+        # and remove it with self.effects &= ~Effects.FIRE. effects can be passed in as an iter of Effects.
+        self.effects = Effects.getMask(effects) # Current effect(s) on the tile. Effects are on top of the tile. Some can be removed by having your mech repair while on the tile.
     def isMoveBlocker(self):
         "return True if the unit blocks mech movement, False if it doesn't. Chasm tiles block movement, as well as all enemies and some other units."
-        try:
-            return self._blocksmove
-        except AttributeError:
-            return False
+        return self._blocksmove
 
 class Tile_Base(TileUnit_Base):
     """The base class for all Tiles, all other tiles are based on this. Mountains and buildings are considered units since they have HP and block movement on a tile, thus they go on top of the tile."""
+    __slots__ = ('_zobrist', 'unit')
+    _swallow = False # set to True by tiles that kill non-massive non-flying units
+    _grassland = False # set to True by grassland tiles
     def __init__(self, game, square=None, type=None, effects=None, unit=None): # TODO: this unit argument is unreachable
         super().__init__(game, square, type, effects=effects)
-        self.unit = unit # This is the unit on the tile. If it's None, there is no unit on it.
+        self.unit = unit # This is the unit on the tile. If it's None, there is no unit on it. This tile isn't on the board yet so game.occupied is left alone.
+        self._zobrist = 0 # the hash of this tile that's in the game's zobrist, set by Game.getHash()
     def takeDamage(self, damage=1, ignorearmor=False, ignoreacid=False):
         """Process the tile taking damage and the unit (if any) on this tile taking damage. Damage is usually done to the tile, the tile will then pass it onto the unit.
         There are a few exceptions when takeDamage() will be called on the unit but not the tile, such as the Psion Tyrant damaging all player mechs which never has an effect on the tile.
@@ -449,106 +967,103 @@ class Tile_Base(TileUnit_Base):
         ignorearmor and ignoreacid have no effect on the tile and are passed onto the unit's takeDamage method.
         returns nothing.
         """
-        try:
-            if (Effects.SHIELD not in self.unit.effects) and (Effects.ICE not in self.unit.effects): # if the unit on this tile was NOT shielded...
-                raise FakeException
-        except AttributeError: # raised from Effects.SHIELD in self.None.effects meaning there was no unit to check for shields/ice
+        self._touch()
+        if self.unit is None: # there was no unit to check for shields/ice
             self._tileTakeDamage()
             return
-        except FakeException: # there was an unshielded unit present
+        if (not self.unit.effects & Effects.SHIELD) and (not self.unit.effects & Effects.ICE): # if the unit on this tile was NOT shielded...
             self._tileTakeDamage()
         self.game.board[self.square].unit.takeDamage(damage, ignorearmor=ignorearmor, ignoreacid=ignoreacid) # then the unit takes damage. If the unit was shielded, then only the unit took damage and not the tile
     def hasShieldedUnit(self):
         "If there is a unit on this tile that is shielded, return True, return False otherwise."
-        try:
-            return Effects.SHIELD in self.unit.effects
-        except AttributeError:
-            return False
+        return self.unit is not None and bool(self.unit.effects & Effects.SHIELD)
     def applyFire(self):
         "set the current tile on fire"
-        self.effects.add(Effects.FIRE)
+        self._touch()
+        self.effects |= Effects.FIRE
         self._removeSmokeStormGen()
         for e in Effects.SMOKE, Effects.ACID:
-            self.effects.discard(e) # Fire removes smoke and acid
-        try:
+            self.effects &= ~e # Fire removes smoke and acid
+        if self.unit is not None:
             self.unit.applyFire()
-        except AttributeError:
-            return
     def applySmoke(self):
         "make a smoke cloud on the current tile"
-        self.effects.discard(Effects.FIRE) # smoke removes fire
-        self.effects.add(Effects.SMOKE)
-        self._addSmokeStormGen(self.square)
-        try:
-            self.unit.effects.discard(Effects.FIRE) # a unit moving into smoke removes fire.
-        except AttributeError: # self.None.effects.discard
-            pass # no unit which is fine
-        else:
-            if Attributes.IMMUNESMOKE not in self.unit.attributes:
-                try: # invalidate qshots of enemies that get smoked
-                    self.unit.weapon1.qshot = None
-                except AttributeError: # either there was no unit or the unit had no weapon
-                    pass
-                else:
-                    if self.unit.alliance == Alliance.ENEMY: # if this was an enemy that was smoked, let's also break all its webs:
-                        self.unit._breakAllWebs()
+        self._touch()
+        self.effects &= ~Effects.FIRE # smoke removes fire
+        self.effects |= Effects.SMOKE
+        self._addSmokeStormGen()
+        if self.unit is None:
+            return # no unit which is fine
+        self.unit.effects &= ~Effects.FIRE # a unit moving into smoke removes fire.
+        if not self.unit.attributes & Attributes.IMMUNESMOKE:
+            weapon = getattr(self.unit, 'weapon1', None)
+            if isinstance(weapon, Weapon_NPC_Base): # invalidate qshots of enemies that get smoked
+                weapon.qshot = None
+                if self.unit.alliance == Alliance.ENEMY: # if this was an enemy that was smoked, let's also break all its webs:
+                    self.unit._breakAllWebs()
     def applyIce(self):
         "apply ice to the tile and unit."
+        self._touch()
         if not self.hasShieldedUnit():
-            self.effects.discard(Effects.FIRE) # remove fire from the tile
-            try:
+            self.effects &= ~Effects.FIRE # remove fire from the tile
+            if self.unit is not None:
                 self.unit.applyIce() # give the unit ice
-            except AttributeError: # None.applyIce()
-                pass
     def applyAcid(self):
-        try:
-            self.unit.applyAcid()
-        except (AttributeError, DontGiveUnitAcid): # the tile doesn't get acid if a unit is present to take it instead
-            self.effects.add(Effects.ACID)
-            self.effects.discard(Effects.FIRE)
+        self._touch()
+        if self.unit is not None:
+            try:
+                self.unit.applyAcid()
+            except DontGiveUnitAcid: # the unit can't take acid so the tile gets it
+                pass
+            else:
+                return # the tile doesn't get acid if a unit is present to take it instead
+        self.effects |= Effects.ACID
+        self.effects &= ~Effects.FIRE
     def applyShield(self):
         "Try to give a shield to a unit present. return True if a unit was shielded, False if there was no unit."
-        try: # Tiles can't be shielded, only units
-            self.unit.applyShield()
-            return True
-        except AttributeError:
+        if self.unit is None: # Tiles can't be shielded, only units
             return False
+        self.unit.applyShield()
+        return True
     def repair(self, hp):
         "Repair this tile and any mech on it. hp is the amount of hp to repair on the present unit. This method should only be used for mechs and not vek as they can be healed but they never repair the tile."
-        self.effects.discard(Effects.FIRE)
-        try:
+        self._touch()
+        self.effects &= ~Effects.FIRE
+        if self.unit is not None:
             self.unit.repair(hp)
-        except AttributeError:
-            return
     def die(self):
         "Instakill whatever unit is on the tile and damage the tile."
+        self._touch()
         self._tileTakeDamage()
         if self.unit:
             self.unit.die()
     def _spreadEffects(self):
         "Spread effects from the tile to a unit that newly landed here. This also executes other things the tile can do to the unit when it lands there, such as dying if it falls into a chasm."
-        if not Effects.SHIELD in self.unit.effects: # If the unit is not shielded...
-            if Effects.FIRE in self.effects: # and the tile is on fire...
+        self._touch()
+        if not self.unit.effects & Effects.SHIELD: # If the unit is not shielded...
+            if self.effects & Effects.FIRE: # and the tile is on fire...
                 self.unit.applyFire() # spread fire to it.
-            if Effects.ACID in self.effects: # same with acid, but also remove it from the tile.
+            if self.effects & Effects.ACID: # same with acid, but also remove it from the tile.
                 self.unit.applyAcid()
-                self.effects.discard(Effects.ACID)
+                self.effects &= ~Effects.ACID
     def _tileTakeDamage(self):
         "Process the effects of the tile taking damage. returns nothing."
         pass
     def _putUnitHere(self, unit):
         """Run this method whenever a unit lands on this tile whether from the player moving or a unit getting pushed. unit can be None to get rid of a unit.
         If there's a unit already on the tile, it's overwritten but not properly deleted. returns nothing."""
+        self._touch()
         self.unit = unit
-        try:
-            self.unit.square = self.square
-        except AttributeError: # raised by None.square
+        if unit is None:
+            self.game.occupied &= ~SQUAREBITS[self.square]
             return  # bail, the unit has been replaced by nothing which is ok.
+        self.game.occupied |= SQUAREBITS[self.square]
+        unit._touch()
+        unit.square = self.square
         self._spreadEffects()
-        try:
-            self.unit.weapon1.validate()
-        except AttributeError: # None.weapon1, _spreadEffects killed the unit or unit.None.validate(), unit didn't have a weapon1
-            pass
+        validate = getattr(getattr(self.unit, 'weapon1', None), 'validate', None) # None if _spreadEffects killed the unit or it has no weapon1 to validate
+        if validate is not None:
+            validate()
     def createUnitHere(self, unit):
         "Run this method when putting a unit on the board for the first time. This ensures that the unit is sorted into the proper set in the game."
         unit._addUnitToGame()
@@ -557,110 +1072,87 @@ class Tile_Base(TileUnit_Base):
         """replace this tile with newtile. If keepeffects is True, add them to newtile without calling their apply methods.
         Warning: effects are given to the new tile even if it can't support them! For example, this will happily give a chasm fire or acid.
         Avoid this by manually removing these effects after the tile is replaced or setting keepeffects False and then manually keep only the effects you want."""
+        self._touch()
         unit = self.unit
         if keepeffects:
-            newtile.effects.update(self.effects)
+            newtile.effects |= self.effects
         newtile.square = self.square
         self.game.board[self.square] = newtile
         self.game.board[self.square]._putUnitHere(unit)
     def moveUnit(self, destsquare):
         "Move a unit from this square to destsquare, keeping the effects. This overwrites whatever is on destsquare! returns nothing."
-        # assert Attributes.STABLE not in self.unit.attributes # the train is a stable unit that moves
+        self._touch()
+        # assert not self.unit.attributes & Attributes.STABLE # the train is a stable unit that moves
         if destsquare == self.square:
             return # tried to move a unit to the same square it's already one. This had the unintended consequence of leaving the square blank!
         #print("moveUnit from", self.square, destsquare) # DEBUG
         self.unit._breakAllWebs()
         self.game.board[destsquare]._putUnitHere(self.unit)
         self.unit = None
+        self.game.occupied &= ~SQUAREBITS[self.square]
     def push(self, direction):
         """push unit on this tile in direction.
         direction is a Direction.UP type direction
         This method should only be used when there is NO possibility of a unit being pushed to a square that also needs to be pushed during the same action e.g. conveyor belts or wind torrent
         returns True if a unit was pushed or took bump damage, False if nothing happened."""
-        try:
-            if Attributes.STABLE in self.unit.attributes:
-                return False # stable units can't be pushed
-        except AttributeError:
+        if self.unit is None:
             return False # There was no unit to push
-        else: # push the unit
-            destinationsquare = self.getRelSquare(direction, 1)
-            try:
-                self.game.board[destinationsquare].unit.takeBumpDamage() # try to have the destination unit take bump damage
-            except AttributeError: # raised from None.takeBumpDamage, there is no unit there to bump into
-                self.moveUnit(destinationsquare) # move the unit from this tile to destination square
-            except KeyError:
-                #raise # DEBUG
-                return False # raised by self.board[None], attempted to push unit off the board, no action is taken
-            else:
-                self.unit.takeBumpDamage() # The destination took bump damage, now the unit that got pushed also takes damage
-            return True
-    def getRelSquare(self, direction, distance):
-        """return the coordinates of the tile that starts at this tile and goes direction direction a certain distance. return False if that tile would be off the board.
-        direction is a Direction.UP type global constant
-        distance is an int
-        """
-        if direction == Direction.UP:
-            destinationsquare = (self.square[0], self.square[1] + distance)
-        elif direction == Direction.RIGHT:
-            destinationsquare = (self.square[0] + distance, self.square[1])
-        elif direction == Direction.DOWN:
-            destinationsquare = (self.square[0], self.square[1] - distance)
-        elif direction == Direction.LEFT:
-            destinationsquare = (self.square[0] - distance, self.square[1])
+        if self.unit.attributes & Attributes.STABLE:
+            return False # stable units can't be pushed
+        destinationsquare = getRelSquare(self.square, direction, 1)
+        if not destinationsquare:
+            return False # attempted to push unit off the board, no action is taken
+        destinationunit = self.game.board[destinationsquare].unit
+        if destinationunit is None: # there is no unit there to bump into
+            self.moveUnit(destinationsquare) # move the unit from this tile to destination square
         else:
-            raise InvalidDirection(direction)
-        try:
-            self.game.board[destinationsquare]
-        except KeyError:
-            return False
-        return destinationsquare
+            destinationunit.takeBumpDamage() # have the destination unit take bump damage
+            self.unit.takeBumpDamage() # The destination took bump damage, now the unit that got pushed also takes damage
+        return True
     def teleport(self, destsquare):
         "Teleport from this tile to destsquare, swapping units if there is one on destsquare. This method does NOT make sure the unit is not stable!"
-        assert Attributes.STABLE not in self.unit.attributes
+        assert not self.unit.attributes & Attributes.STABLE
         unitfromdest = self.game.board[destsquare].unit # grab the unit that's about to be overwritten on the destination
         self.moveUnit(destsquare) # move unit from this square to destination
         self._putUnitHere(unitfromdest)
     def getEdgeSquare(self, direction):
         "return a tuple of the square at the edge of the board in direction from this tile."
-        if direction == Direction.UP:
-            return (self.square[0], 8)
-        if direction == Direction.RIGHT:
-            return (8, self.square[1])
-        if direction == Direction.DOWN:
-            return (self.square[0], 1)
-        if direction == Direction.LEFT:
-            return (1, self.square[1])
-        raise InvalidDirection(direction)
+        try:
+            return RAYS[self.square][direction][-1]
+        except KeyError:
+            raise InvalidDirection(direction)
     def isSwallow(self):
         "return True if this tile kills non-massive non-flying units like water and chasm"
-        try:
-            return self._swallow
-        except AttributeError:
-            return False
+        return self._swallow
     def isGrassland(self):
-        try:
-            return self._grassland
-        except AttributeError:
-            return False
-    def _addSmokeStormGen(self, square):
-        "This method is replaced by Weapon_StormGenerator when it is in play."
-        pass
+        return self._grassland
+    def _addSmokeStormGen(self):
+        "Add this tile to the game's storm tiles when smoke is put on it. Nothing happens if the StormGenerator isn't in play."
+        if self.game.stormtiles is not None:
+            self.game.stormtiles.add(self.square)
     def _removeSmokeStormGen(self):
-        "This method is replaced by Weapon_StormGenerator when it is in play."
-        pass
-    def _pass(self, fakearg=None):
-        "This is only here to replace the above 2 stormgem methods when destructing it."
-        pass
-    def getCopy(self, newgame):
-        """return a copy of this tile for inclusion in a new copy of a game object
-        newgame is the newgame object to be set.
-        """
-        return type(self)(newgame, self.square, effects=set(self.effects))
+        "Remove this tile from the game's storm tiles when its smoke is removed. Nothing happens if the StormGenerator isn't in play."
+        if self.game.stormtiles is not None:
+            self.game.stormtiles.discard(self.square)
+    def _touch(self):
+        """Record this tile and the unit on it in the game's undo journal before they're changed and let the game know that this tile needs to be rehashed.
+        Nothing is recorded if the game isn't journaling."""
+        self.game._dirtySquare(self.square)
+        if self.game.journal is not None:
+            self.game.journal.touch(self)
+            if self.unit:
+                self.unit._touch()
+    def _getHash(self):
+        "return a hash of the state of this tile and the unit on it for Game.getHash()."
+        if self.unit is None:
+            return hash(stateSignature(self))
+        return hash((stateSignature(self), stateSignature(self.unit)))
     def __str__(self):
         return "%s at %s. Effects: %s Unit: %s" % (self.type, self.square, set(Effects.pprint(self.effects)), self.unit)
 
 class Tile_Ground(Tile_Base):
     "This is a normal ground tile."
+    __slots__ = ()
     def __init__(self, game, square=None, type='ground', effects=None):
         super().__init__(game, square, type, effects=effects)
     def applyAcid(self):
@@ -668,47 +1160,52 @@ class Tile_Ground(Tile_Base):
         if not self.unit:
             self._tileTakeDamage()
     def applyFire(self):
+        self._touch()
         self._tileTakeDamage() # fire removes timepods and mines just like damage does
         super().applyFire()
     def _spreadEffects(self):
         "Ground tiles can have mines on them, but many other tile types can't."
         super()._spreadEffects()
-        if Effects.MINE in self.effects:
+        if self.effects & Effects.MINE:
             self.unit.die()
-            self.effects.discard(Effects.MINE)
+            self.effects &= ~Effects.MINE
             self.game.score.submit(-3, 'mine_die')
-        elif Effects.FREEZEMINE in self.effects:
-            self.effects.discard(Effects.FREEZEMINE)
+        elif self.effects & Effects.FREEZEMINE:
+            self.effects &= ~Effects.FREEZEMINE
             self.unit.applyIce()
             self.game.score.submit(-3, 'freezemine_die')
-        elif Effects.TIMEPOD in self.effects:
+        elif self.effects & Effects.TIMEPOD:
             if self.unit.alliance == Alliance.FRIENDLY:
                 self.game.score.submit(2, 'timepod_pickup')
             else:
                 self.game.score.submit(-30, 'timepod_die')
     def _tileTakeDamage(self):
+        self._touch()
         for (effect, event) in (Effects.TIMEPOD, 'timepod'), (Effects.MINE, 'mine'), (Effects.FREEZEMINE, 'freezemine'):
-            try:
-                self.effects.remove(effect)
-            except KeyError:  # there was no effect on the tile
-                pass
-            else:
+            if self.effects & effect:
+                self.effects &= ~effect
                 getattr(self, '_{0}DieScore'.format(event))()
 
 class Tile_Forest_Sand_Base(Tile_Base):
     "This is the base class for both Forest and Sand Tiles since they both share the same applyAcid mechanics."
+    __slots__ = ()
     def __init__(self, game, square=None, type=None, effects=None):
         super().__init__(game, square, type, effects=effects)
     def applyAcid(self):
-        try:
-            self.unit.applyAcid() # give the unit acid if present
-        except (AttributeError, DontGiveUnitAcid): # no unit present, so the tile gets acid
-            self.effects.discard(Effects.FIRE) # fire is put out by acid.
-            self.replaceTile(Tile_Ground(self.game, effects=(Effects.ACID,)), keepeffects=True) # Acid removes the forest/sand and makes it no longer flammable/smokable
-        # The tile doesn't get acid effects if the unit takes it instead.
+        self._touch()
+        if self.unit is not None:
+            try:
+                self.unit.applyAcid() # give the unit acid if present
+            except DontGiveUnitAcid: # the unit can't take acid so the tile gets it
+                pass
+            else:
+                return # The tile doesn't get acid effects if the unit takes it instead.
+        self.effects &= ~Effects.FIRE # fire is put out by acid.
+        self.replaceTile(Tile_Ground(self.game, effects=(Effects.ACID,)), keepeffects=True) # Acid removes the forest/sand and makes it no longer flammable/smokable
 
 class Tile_Forest(Tile_Forest_Sand_Base):
     "If damaged, lights on fire."
+    __slots__ = ()
     def __init__(self, game, square=None, type='forest', effects=None):
         super().__init__(game, square, type, effects=effects)
     def _tileTakeDamage(self):
@@ -716,14 +1213,16 @@ class Tile_Forest(Tile_Forest_Sand_Base):
         self.applyFire()
     def _spreadEffects(self):
         "Spread effects from the tile to a unit that newly landed here. Units that are on fire spread fire to a forest."
-        if Effects.FIRE in self.unit.effects: # if the unit is on fire...
+        self._touch()
+        if self.unit.effects & Effects.FIRE: # if the unit is on fire...
             self.applyFire() # the forest catches fire, removing smoke if there is any
-        elif not Effects.SHIELD in self.unit.effects: # If the unit is not on fire and not shielded...
-            if Effects.FIRE in self.effects: # and the tile is on fire...
+        elif not self.unit.effects & Effects.SHIELD: # If the unit is not on fire and not shielded...
+            if self.effects & Effects.FIRE: # and the tile is on fire...
                 self.unit.applyFire() # spread fire to the unit.
 
 class Tile_Sand(Tile_Forest_Sand_Base):
     "If damaged, turns into Smoke. Units in Smoke cannot attack or repair."
+    __slots__ = ()
     def __init__(self, game, square=None, type='sand', effects=None):
         super().__init__(game, square, type, effects=effects)
     def applyFire(self):
@@ -735,85 +1234,83 @@ class Tile_Sand(Tile_Forest_Sand_Base):
 
 class Tile_Water_Ice_Damaged_Base(Tile_Base):
     "This is the base unit for Water tiles, Ice tiles, and Ice_Damaged tiles."
+    __slots__ = ()
     def __init__(self, game, square=None, type=None, effects=None):
         super().__init__(game, square, type, effects=effects)
     def applyIce(self):
         "replace the tile with ice and give ice to the unit if present."
+        self._touch()
         if not self.hasShieldedUnit():
-            self.effects.discard(Effects.SUBMERGED)  # Remove the submerged effect from the newly spawned ice tile in case we just froze water.
+            self.effects &= ~Effects.SUBMERGED  # Remove the submerged effect from the newly spawned ice tile in case we just froze water.
             self.replaceTile(Tile_Ice(self.game))
-        try:
+        if self.unit is not None:
             self.unit.applyIce()
-        except AttributeError:
-            return
     def applyFire(self):
         "Fire always removes smoke except over water and it removes acid from frozen acid tiles"
+        self._touch()
         for e in Effects.SMOKE, Effects.ACID:
-            self.effects.discard(e)
+            self.effects &= ~e
         self._removeSmokeStormGen()
-        try: # it's important that we set the unit on fire first. Otherwise the tile will be changed to water, then the unit will be set on fire in water. whoops.
+        if self.unit is not None: # it's important that we set the unit on fire first. Otherwise the tile will be changed to water, then the unit will be set on fire in water. whoops.
             self.unit.applyFire()
-        except AttributeError:
-            pass
         self.replaceTile(Tile_Water(self.game))
     def _spreadEffects(self):
         "there are no effects to spread from ice or damaged ice to a unit. These tiles can't be on fire and any acid on these tiles is frozen and inert, even if added after freezing."
         pass
     def repair(self, hp):
         "acid cannot be removed from water or ice by repairing it. There can't be any fire to repair either."
-        try:
+        if self.unit is not None:
             self.unit.repair(hp)
-        except AttributeError:
-            return
 
 class Tile_Water(Tile_Water_Ice_Damaged_Base):
     "Non-huge land units die when pushed into water. Water cannot be set on fire."
+    __slots__ = ()
+    _swallow = True
     def __init__(self, game, square=None, type='water', effects=None):
         super().__init__(game, square, type, effects=effects)
-        self.effects.add(Effects.SUBMERGED)
-        self._swallow = True
+        self.effects |= Effects.SUBMERGED
     def applyFire(self):
         "Water can't be set on fire"
-        try: # spread the fire to the unit
-            self.unit.applyFire()
-        except AttributeError:
-            return # but not the tile. Fire does NOT remove smoke from a water tile!
+        if self.unit is not None: # spread the fire to the unit
+            self.unit.applyFire() # but not the tile. Fire does NOT remove smoke from a water tile!
     def applyAcid(self):
-        try:
-            self.unit.applyAcid()
-        except (AttributeError, DontGiveUnitAcid):
-            pass
-        self.effects.add(Effects.ACID) # water gets acid regardless of a unit being there or not
+        self._touch()
+        if self.unit is not None:
+            try:
+                self.unit.applyAcid()
+            except DontGiveUnitAcid:
+                pass
+        self.effects |= Effects.ACID # water gets acid regardless of a unit being there or not
     def _spreadEffects(self):
-        if (Attributes.MASSIVE not in self.unit.attributes) and (Attributes.FLYING not in self.unit.attributes): # kill non-massive non-flying units that went into the water.
+        self._touch()
+        if (not self.unit.attributes & Attributes.MASSIVE) and (not self.unit.attributes & Attributes.FLYING): # kill non-massive non-flying units that went into the water.
             self.unit.die()
         else: # the unit lived
-            if Attributes.FLYING not in self.unit.attributes:
-                self.unit.effects.discard(Effects.FIRE) # water puts out the fire, but if you're flying you remain on fire
-                if Effects.ACID in self.effects: # spread acid from tile to unit but don't remove it from the tile
+            if not self.unit.attributes & Attributes.FLYING:
+                self.unit.effects &= ~Effects.FIRE # water puts out the fire, but if you're flying you remain on fire
+                if self.effects & Effects.ACID: # spread acid from tile to unit but don't remove it from the tile
                     self.unit.applyAcid()
-                if Effects.ACID in self.unit.effects: # if the unit has acid and is massive but not flying, spread acid from unit to tile
-                    self.effects.add(Effects.ACID) # don't call self.applyAcid() here or it'll give it to the unit and not the tile.
-                try: # if this was a massive vek boss that fell in the water...
-                    self.unit.weapon1.qshot = None # invalidate his shot
-                except AttributeError: # this has the side effect of giving mechs a qshot, but that shouldn't effect anything
-                    pass
-            self.unit.effects.discard(Effects.ICE) # water breaks you out of the ice no matter what
+                if self.unit.effects & Effects.ACID: # if the unit has acid and is massive but not flying, spread acid from unit to tile
+                    self.effects |= Effects.ACID # don't call self.applyAcid() here or it'll give it to the unit and not the tile.
+                weapon = getattr(self.unit, 'weapon1', None)
+                if isinstance(weapon, Weapon_NPC_Base): # if this was a massive vek boss that fell in the water...
+                    weapon.qshot = None # invalidate his shot
+            self.unit.effects &= ~Effects.ICE # water breaks you out of the ice no matter what
 
 class Tile_Ice(Tile_Water_Ice_Damaged_Base):
     "Turns into Water when destroyed. Must be hit twice. (Turns into Ice_Damaged.)"
+    __slots__ = ()
     def __init__(self, game, square=None, type='ice', effects=None):
         super().__init__(game, square, type, effects=effects)
     def applyIce(self):
         "Nothing happens when ice is frozen again"
-        try:
+        if self.unit is not None:
             self.unit.applyIce()
-        except AttributeError:
-            return
     def _tileTakeDamage(self):
         self.replaceTile(Tile_Ice_Damaged(self.game))
 
 class Tile_Ice_Damaged(Tile_Water_Ice_Damaged_Base):
+    __slots__ = ()
     def __init__(self, game, square=None, type='ice_damaged', effects=None):
         super().__init__(game, square, type, effects=effects)
     def _tileTakeDamage(self):
@@ -821,85 +1318,78 @@ class Tile_Ice_Damaged(Tile_Water_Ice_Damaged_Base):
 
 class Tile_Chasm(Tile_Base):
     "Non-flying units die when pushed into a chasm. Chasm tiles cannot have acid or fire, but can have smoke."
+    __slots__ = ()
     _blocksmove = True
+    _swallow = True
     def __init__(self, game, square=None, type='chasm', effects=None):
         super().__init__(game, square, type, effects=effects)
-        self._swallow = True
     def applyFire(self):
-        try:
-            self.unit.applyFire()
-        except AttributeError:
-            return # fire does not remove smoke on a chasm. Seems like it only does this on solid surfaces which include ice but not water.
+        if self.unit is not None:
+            self.unit.applyFire() # fire does not remove smoke on a chasm. Seems like it only does this on solid surfaces which include ice but not water.
     def applyIce(self):
-        try:
+        if self.unit is not None:
             self.unit.applyIce()
-        except AttributeError:
-            return
     def applyAcid(self):
-        try:
-            self.unit.applyAcid
-        except AttributeError: # there is no unit that can't take acid here
-            return
+        if self.unit is not None: # there is no unit that can't take acid here
+            self.unit.applyAcid()
     def _spreadEffects(self):
-        if (Attributes.FLYING in self.unit.attributes) and (Effects.ICE not in self.unit.effects): # if the unit can fly and is not frozen...
+        self._touch()
+        if (self.unit.attributes & Attributes.FLYING) and (not self.unit.effects & Effects.ICE): # if the unit can fly and is not frozen...
             pass # congratulations, you live!
         else:
             self.unit.die()
-            try:
-                self.unit._realDeath() # try permanently killing a mech corpse
-            except AttributeError:
-                pass
+            realdeath = getattr(self.unit, '_realDeath', None) # only mech corpses have this
+            if realdeath is not None:
+                realdeath() # permanently kill the mech corpse
             self.unit = None # set the unit to None even though most units do this. Mech corpses are invincible units that can only be killed by being pushed into a chasm.
+            self.game.occupied &= ~SQUAREBITS[self.square]
         # no need to super()._spreadEffects() here since the only effects a chasm tile can have is smoke and that never spreads to the unit itself.
     def repair(self, hp):
         "There can't be any fire to repair"
-        try:
+        if self.unit is not None:
             self.unit.repair(hp)
-        except AttributeError:
-            return
 
 class Tile_Lava(Tile_Water):
+    __slots__ = ()
     def __init__(self, game, square=None, type='lava', effects=None):
         super().__init__(game, square, type, effects=effects)
-        self.effects.add(Effects.FIRE)
+        self.effects |= Effects.FIRE
     def repair(self, hp):
         "No effects can be removed from lava from repairing on it."
-        try:
+        if self.unit is not None:
             self.unit.repair(hp)
-        except AttributeError:
-            return
     def applyIce(self):
         return # Ice does nothing
     def applyFire(self):
-        try: # spread the fire to the unit
-            self.unit.applyFire()
-        except AttributeError:
-            return  # but not the tile, it's always on fire
+        if self.unit is not None: # spread the fire to the unit
+            self.unit.applyFire() # but not the tile, it's always on fire
     def applyAcid(self):
-        try: # spread the fire to the unit
-            self.unit.applyAcid()
-        except AttributeError:
-            return # but not the tile
+        if self.unit is not None: # spread the acid to the unit
+            self.unit.applyAcid() # but not the tile
     def applySmoke(self):
         "Smoke doesn't remove fire from the lava."
-        self.effects.add(Effects.SMOKE) # we don't break webs here since only flying units can be on lava and no flying units can web
-        self._addSmokeStormGen(self.square)
+        self._touch()
+        self.effects |= Effects.SMOKE # we don't break webs here since only flying units can be on lava and no flying units can web
+        self._addSmokeStormGen()
     def _spreadEffects(self):
-        if (Attributes.MASSIVE not in self.unit.attributes) and (Attributes.FLYING not in self.unit.attributes): # kill non-massive non-flying units that went into the water.
+        self._touch()
+        if (not self.unit.attributes & Attributes.MASSIVE) and (not self.unit.attributes & Attributes.FLYING): # kill non-massive non-flying units that went into the water.
             self.unit.die()
         else: # the unit lived
-            if Attributes.FLYING not in self.unit.attributes:
+            if not self.unit.attributes & Attributes.FLYING:
                 self.unit.applyFire() # lava is always on fire, now you are too!
-            self.unit.effects.discard(Effects.ICE) # water and lava breaks you out of the ice no matter what
+            self.unit.effects &= ~Effects.ICE # water and lava breaks you out of the ice no matter what
 
 class Tile_Grassland(Tile_Base):
     "Your bonus objective is to terraform Grassland tiles into Sand. This is mostly just a regular ground tile."
+    __slots__ = ()
+    _grassland = True
     def __init__(self, game, square=None, type='grassland', effects=None):
         super().__init__(game, square, type, effects=effects)
-        self._grassland = True
 
 class Tile_Teleporter(Tile_Base):
     "End movement here to warp to the matching pad. Swap with any present unit."
+    __slots__ = ('companion', 'suppressteleport')
     def __init__(self, game, square=None, type='teleporter', effects=None, companion=None):
         "companion is the square of the other tile linked to this one."
         # teleporters can have smoke, fire and acid just like a normal ground tile.
@@ -908,25 +1398,30 @@ class Tile_Teleporter(Tile_Base):
         self.suppressteleport = False # this is set true when in the process of teleporting so we don't then teleport the unit back and fourth in an infinite loop.
     def _spreadEffects(self):
         "Spread effects like normal but teleport the unit to the companion tile afterward."
+        self._touch()
         super()._spreadEffects()
         if not self.suppressteleport:
-            try:
-                if self.unit.suppressteleport:
-                    return # no teleporting for you!
-            except AttributeError: # unit didn't have suppressteleport attribute, only corpses do.
-                self.suppressteleport = True # suppress further teleports here until this finishes
-                try:
-                    self.game.board[self.companion].suppressteleport = True # suppress teleport on the companion too
-                except KeyError:
-                    raise MissingCompanionTile(self.type, self.square)
-                self.teleport(self.companion)
+            if getattr(self.unit, 'suppressteleport', False): # only corpses have suppressteleport
+                return # no teleporting for you!
+            if self.companion not in self.game.board:
+                raise MissingCompanionTile(self.type, self.square)
+            self.suppressteleport = True # suppress further teleports here until this finishes
+            self.game.board[self.companion]._touch()
+            self.game.board[self.companion].suppressteleport = True # suppress teleport on the companion too
+            self.teleport(self.companion)
         self.suppressteleport = False
 
 ##############################################################################
 ######################################## UNITS ###############################
 ##############################################################################
+class ScoreTable(dict):
+    """A unit's dict of {score event name: score}. It's filled in when the unit is made and never changes while the solver runs,
+    so copies of a game share it and UndoJournal doesn't save it like it would a plain dict."""
+    __slots__ = ()
+
 class Unit_Base(TileUnit_Base):
     "The base class of all units. A unit is anything that occupies a square and stops other ground units from moving through it."
+    __slots__ = ('_scorebound', 'attributes', 'damage_taken', 'gotacid', 'gotfire', 'gotice', 'gotshield', 'hp', 'lostacid', 'lostfire', 'lostice', 'lostshield', 'maxhp', 'score', 'web')
     def __init__(self, game, type, hp, maxhp, effects=None, attributes=None, web=None):
         """
         game is the Game instance
@@ -940,10 +1435,7 @@ class Unit_Base(TileUnit_Base):
         super().__init__(game=game, type=type, effects=effects)
         self.hp = hp
         self.maxhp = maxhp
-        if not attributes:
-            self.attributes = set()
-        else:
-            self.attributes = set(attributes)
+        self.attributes = Attributes.getMask(attributes)
         self.damage_taken = 0 # This is a running count of how much damage this unit has taken during this turn.
             # This is done so that points awarded to a solution can be removed on a unit's death. We don't want solutions to be more valuable if an enemy is damaged before it's killed. We don't care how much damage was dealt to it if it dies.
         if not web:
@@ -953,74 +1445,101 @@ class Unit_Base(TileUnit_Base):
         self.gotfire = self.gotacid = self.gotice = self.gotshield = False # These flags are set to true when this unit gets fire, acid, or ice applied to it.
         # This is done so we can avoid scoring a unit catching on fire and then dying from damage being more valuable than just killing the unit.
         self.lostfire = self.lostacid = self.lostice = self.lostshield = False # these flags are set to true when this unit loses fire, acid, or ice.
+        self._scorebound = None # ((repairs, reached), bound) from the last time getScoreBound() worked out the bound, None if the unit changed since then
         self._initScore()
+        score = getattr(self, 'score', None)
+        if score is not None: # some units are never scored
+            self.score = ScoreTable(score)
+    # These flags are set to True by the units that they apply to.
+    _building = False
+    _mountain = False
+    _getspsionbonus = False
+    _psion = False
+    _renfieldbomb = False
+    def _touch(self):
+        """Record this unit and its weapons in the game's undo journal before they're changed and let the game know that this unit's tile needs to be rehashed.
+        Nothing is recorded if the game isn't journaling."""
+        if self.square:
+            self.game._dirtySquare(self.square)
+        self._scorebound = None # the unit is about to change, so getScoreBound() has to work it out again
+        journal = self.game.journal
+        if journal is not None:
+            journal.touch(self)
+            for weapon in 'weapon1', 'weapon2', 'repweapon':
+                weapon = getattr(self, weapon, None) # None if this unit doesn't have this weapon
+                if weapon is not None:
+                    journal.touch(weapon)
     def _applyEffectUnshielded(self, effect):
         "A helper method to check for the presence of a shield before applying an effect. return True if the effect was added, False if not."
-        if Effects.SHIELD not in self.effects:
-            self.effects.add(effect)
+        if not self.effects & Effects.SHIELD:
+            self.effects |= effect
             return True
         return False
     def applyFire(self):
-        if Effects.FIRE not in self.effects: # if we don't already have fire
+        self._touch()
+        if not self.effects & Effects.FIRE: # if we don't already have fire
             self._removeIce()
-            if not Attributes.IMMUNEFIRE in self.attributes:
+            if not self.attributes & Attributes.IMMUNEFIRE:
                 if self._applyEffectUnshielded(Effects.FIRE): # no need to try to remove a timepod from a unit (from super())
                     self.gotfire = True
-                    self.game.score.submit(self.score['fire_on'], '{0}_fire_on'.format(self.type))
+                    self.game.score.submit(self.score['fire_on'], 'fire_on', type=self.type)
     def applyIce(self):
-        if Effects.ICE not in self.effects:
+        self._touch()
+        if not self.effects & Effects.ICE:
             if self._applyEffectUnshielded(Effects.ICE): # If a unit has a shield and someone tries to freeze it, NOTHING HAPPENS!
                 self._removeFire()
-                try:
-                    self.weapon1.qshot = None # invalidate the unit's queued shot
-                except AttributeError:  # self.None.qshot
-                    pass
+                weapon = getattr(self, 'weapon1', None)
+                if isinstance(weapon, Weapon_NPC_Base):
+                    weapon.qshot = None # invalidate the unit's queued shot
                 self.gotice = True
-                self.game.score.submit(self.score['ice_on'], '{0}_ice_on'.format(self.type))
+                self.game.score.submit(self.score['ice_on'], 'ice_on', type=self.type)
                 self.game.board[self.square]._spreadEffects() # spread effects after freezing because flying units frozen over chasms need to die
     def applyAcid(self, ignoreprotection=False):
         "give the unit acid. If ignoreprotection is True, don't check if the unit is protected by a shield or ice first (this is used by acid weapons). returns nothing."
-        if Effects.ACID not in self.effects:
+        self._touch()
+        if not self.effects & Effects.ACID:
             if ignoreprotection:
-                self.effects.add(Effects.ACID)
+                self.effects |= Effects.ACID
                 self._applyAcidScore()
             elif self._applyEffectUnshielded(Effects.ACID): # you only get acid if you don't have a shield.
                 self._applyAcidScore()
     def _applyAcidScore(self):
         "A helper method to score the unit getting acid."
         self.gotacid = True
-        self.game.score.submit(self.score['acid_on'], '{0}_acid_on'.format(self.type))
+        self.game.score.submit(self.score['acid_on'], 'acid_on', type=self.type)
     def applyWeb(self):
-        self.effects.add(Effects.WEB)
+        self._touch()
+        self.effects |= Effects.WEB
     def applyShield(self):
-        if Effects.SHIELD not in self.effects:
-            self.effects.add(Effects.SHIELD)
+        self._touch()
+        if not self.effects & Effects.SHIELD:
+            self.effects |= Effects.SHIELD
             self.gotshield = True
-            self.game.score.submit(self.score['shield_on'], '{0}_shield_on'.format(self.type))
+            self.game.score.submit(self.score['shield_on'], 'shield_on', type=self.type)
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         """Process this unit taking damage. All effects are considered unless the ignore* flags are set in the arguments.
         Units will not die after reaching 0 hp here, run _allowDeath() to allow them to die. This is needed for vek units that can be killed and then pushed to do bump damage or spread effects.
         return False if ice or a shield blocked the damage, True otherwise."""
+        self._touch()
         if self._takeDamageProtected():
-            if Attributes.ARMORED in self.attributes and Effects.ACID in self.effects: # if you have both armor and acid...
+            if self.attributes & Attributes.ARMORED and self.effects & Effects.ACID: # if you have both armor and acid...
                 pass # acid cancels out armored
-            elif not ignorearmor and Attributes.ARMORED in self.attributes: # if we aren't ignoring armor and you're armored...
+            elif not ignorearmor and self.attributes & Attributes.ARMORED: # if we aren't ignoring armor and you're armored...
                 damage -= 1 # damage reduced by 1
-            elif not ignoreacid and Effects.ACID in self.effects: # if we're not ignoring acid and the unit has acid
+            elif not ignoreacid and self.effects & Effects.ACID: # if we're not ignoring acid and the unit has acid
                 damage *= 2
             self.hp -= damage # the unit takes the damage
             self.damage_taken += damage
-            self.game.score.submit(self.score['hurt'], '{0}_hurt'.format(self.type), damage)
+            self.game.score.submit(self.score['hurt'], 'hurt', damage, type=self.type)
             return True
     def _takeDamageProtected(self):
         "Check if there is a shield or ice on the unit before it takes damage. return True if there was no shield or ice, False if the damage was blocked by one of them."
+        self._touch()
         for effect, effname in (Effects.SHIELD, 'shield'), (Effects.ICE, 'ice'): # let the shield and then ice take the damage instead if present. Frozen units can have a shield over the ice, but not the other way around.
-            try:
-                self.effects.remove(effect)
-            except KeyError:
-                pass
-            else:
-                self.game.score.submit(self.score['{0}_off'.format(effname)], '{0}_{1}_off'.format(self.type, effname)) # score the shield or ice being lost
+            if self.effects & effect:
+                self.effects &= ~effect
+                event = '{0}_off'.format(effname)
+                self.game.score.submit(self.score[event], event, type=self.type) # score the shield or ice being lost
                 self.game.board[self.square]._spreadEffects() # spread effects now that they lost a shield or ice
                 return False # and then stop processing things, the shield or ice took the damage.
         return True
@@ -1032,135 +1551,109 @@ class Unit_Base(TileUnit_Base):
         self.takeBumpDamage()
     def _allowDeath(self):
         "Check if this unit was killed but had it's death suppressed. Kill it now if it has 0 or less hp."
+        self._touch()
         if self.hp <= 0:  # if the unit has no more HP and is allowed to die
             self.damage_taken += self.hp  # hp is now negative or 0. Adjust damage_taken to ignore overkill. If the unit had 4 hp and it took 7 damage, we consider the unit as only taking 4 damage because overkill is useless. Dead is dead.
             self.die()
             return True
     def die(self):
         "Make the unit die. This method is not ok for mechs to use as they never leave acid where they die. They leave corpses which are also units."
+        self.game.board[self.square]._touch()
         self.game.board[self.square].unit = None # it's dead, replace it with nothing
+        self.game.occupied &= ~SQUAREBITS[self.square]
         self._removeUnitFromGame()
-        if Effects.ACID in self.effects: # units that have acid leave acid on the tile when they die:
+        if self.effects & Effects.ACID: # units that have acid leave acid on the tile when they die:
             self.game.board[self.square].applyAcid()
         self._breakAllWebs()
         self.explode()
         self._dieScore()
     def explode(self):
         "Make the unit explode only if it is explosive (to be used after death). Explosion damage ignores acid and armor."
-        if Effects.EXPLOSIVE in self.effects:
+        if self.effects & Effects.EXPLOSIVE:
             self.game.board[self.square].takeDamage(1, ignorearmor=True, ignoreacid=True) # take an additional damage on the square of the unit
             for d in Direction.gen(): # as well as around it
-                try:
-                    self.game.board[self.game.board[self.square].getRelSquare(d, 1)].takeDamage(1, ignorearmor=True, ignoreacid=True)
-                except KeyError: # board[False]
-                    pass
+                sq = getRelSquare(self.square, d, 1)
+                if sq:
+                    self.game.board[sq].takeDamage(1, ignorearmor=True, ignoreacid=True)
     def isBuilding(self):
         "Return True if unit is a building or objectivebuilding, False if it is not."
-        try:
-            return self._building
-        except AttributeError:  # unit was missing the attribute
-            return False
+        return self._building
     def isMountain(self):
         "Return True if unit is a mountain, mountaindamaged, or volcano. False if it is not."
-        try:
-            return self._mountain
-        except AttributeError:  # unit was missing the attribute
-            return False
+        return self._mountain
     def isMech(self):
         "return True if unit is a mech, False if it's not."
         return hasattr(self, 'repweapon') # only mechs have a repweapon slot
     def isNormalVek(self):
         "Return True if the unit is a vek THAT RECEIVES PSION BONUSES, false if it doesn't get buffs from a psion."
-        try:
-            return self._getspsionbonus
-        except AttributeError:
-            return False
+        return self._getspsionbonus
     def isPsion(self):
         "return True if the unit is a psion, False if it isn't."
-        try:
-            return self._psion
-        except AttributeError:
-            return False
+        return self._psion
     def isRenfieldBomb(self):
         "return True if the unit is a renfield bomb (not prototype), False if it isn't."
-        try:
-            return self._renfieldbomb
-        except AttributeError:
-            return False
+        return self._renfieldbomb
     def _makeWeb(self, compsquare, prop=True):
         """Make a web binding this unit to a unit on another square.
         compsquare is a tuple of the companion square that is also webbed with this unit.
         when prop is True, propagate this webbing to the companion.
         returns nothing
         """
+        self._touch()
         self.web.add(compsquare)
         if prop:
             self.game.board[compsquare].unit._makeWeb(self.square, prop=False)
     def _breakWeb(self, compsquare, prop=True):
         "Same as MakeWeb except we remove the web."
+        self._touch()
         self.web.remove(compsquare)
         if prop:
             self.game.board[compsquare].unit._breakWeb(self.square, prop=False)
     def _breakAllWebs(self):
         "same as breakWeb except we remove all webs that this unit has. This method doesn't use arguments and propagates by default"
+        self._touch()
         for sq in self.web:
             self.game.board[sq].unit._breakWeb(self.square, prop=False)
         self.web = set()
     def _dieScore(self):
         "submit the score event for this unit dying and undo scoring of damage and effects to the unit. returns nothing"
         if self.damage_taken:
-            self.game.score.undo(self.score['hurt'], '{0}_hurt'.format(self.type), self.damage_taken) # undo the damage that this unit took.
+            self.game.score.undo(self.score['hurt'], 'hurt', self.damage_taken, type=self.type) # undo the damage that this unit took.
         # we want to avoid the situation of damaging something for 5 hp to kill it is more valuable than just pushing it into water.
         for onoff in ('got', 'on'), ('lost', 'off'):
             for effectname in 'fire', 'acid', 'ice', 'shield':
                 if getattr(self, '{0}{1}'.format(onoff[0], effectname)):
                     event = '{0}_{1}'.format(effectname, onoff[1])
-                    self.game.score.undo(self.score[event], '{0}_{1}'.format(self.type, event))
-        self.game.score.submit(self.score['die'], '{0}_die'.format(self.type)) # score the actual death now.
+                    self.game.score.undo(self.score[event], event, type=self.type)
+        self.game.score.submit(self.score['die'], 'die', type=self.type) # score the actual death now.
     def _removeFire(self):
         "Remove fire from the unit and do scoring based on it."
-        try:
-            self.effects.remove(Effects.FIRE)
-        except KeyError:
-            pass
-        else:
-            self.game.score.submit(self.score['fire_off'], '{0}_fire_off'.format(self.type))
+        self._touch()
+        if self.effects & Effects.FIRE:
+            self.effects &= ~Effects.FIRE
+            self.game.score.submit(self.score['fire_off'], 'fire_off', type=self.type)
             self.lostfire = True
     def _removeIce(self):
         "Remove ice from the unit and do scoring based on it"
-        try:
-            self.effects.remove(Effects.ICE)
-        except KeyError:
-            pass
-        else:
-            self.game.score.submit(self.score['ice_off'], '{0}_ice_off'.format(self.type))
+        self._touch()
+        if self.effects & Effects.ICE:
+            self.effects &= ~Effects.ICE
+            self.game.score.submit(self.score['ice_off'], 'ice_off', type=self.type)
             self.lostice = True
     def _removeAcid(self):
         "Remove acid from the unit and do scoring."
-        try:
-            self.effects.remove(Effects.ACID)
-        except KeyError:
-            pass
-        else:
-            self.game.score.submit(self.score['acid_off'], '{0}_acid_off'.format(self.type))
+        self._touch()
+        if self.effects & Effects.ACID:
+            self.effects &= ~Effects.ACID
+            self.game.score.submit(self.score['acid_off'], 'acid_off', type=self.type)
             self.lostacid = True
     def _removeShield(self):
         "Remove the shield and do scoring."
-        try:
-            self.effects.remove(Effects.Shield)
-        except KeyError:
-            pass
-        else:
-            self.game.score.submit(self.score['shield_off'], '{0}_shield_off'.format(self.type))
+        self._touch()
+        if self.effects & Effects.Shield:
+            self.effects &= ~Effects.Shield
+            self.game.score.submit(self.score['shield_off'], 'shield_off', type=self.type)
             self.lostshield = True
-    def getCopy(self, newgame):
-        "return a copy of this unit object. newgame is the new game instance to assign to this newly created unit."
-        newunit = type(self)(newgame, hp=self.hp, maxhp=self.maxhp, effects=set(self.effects), attributes=set(self.attributes))
-        try:
-            newunit.web = set(self.web)
-        except NameError: # unit has no web because webs don't matter for this type of unit
-            pass
-        return newunit
     def _initScore(self):
         "This method is overridden by children to set up their score dicts. This one is a dummy."
         print("DEBUG: No _initScore() for unit {0}".format(self.type))
@@ -1175,11 +1668,78 @@ class Unit_Base(TileUnit_Base):
                       'hurt': 0,
                       'die': 0,
                       'heal': 0}
+    def getShotReach(self, squares):
+        """return a set of squares that this unit's weapons could hit when they're shot from any of squares.
+        returns None if a weapon can reach any square."""
+        reach = set()
+        for weapon in 'repweapon', 'weapon1', 'weapon2':
+            weapon = getattr(self, weapon, None)
+            if not hasattr(weapon, 'genShots'): # no weapon or a passive weapon
+                continue
+            if not hasattr(weapon, 'getReach'): # a weapon that doesn't know its reach could hit anything
+                return None
+            weaponreach = weapon.getReach(squares)
+            if weaponreach is None:
+                return None
+            reach.update(weaponreach)
+        return reach
+    def getScoreBound(self, repairs, reached=True):
+        """return the most that this unit's score events could add to the score from now until the end of the turn.
+        This assumes the best possible outcome for the player, so the real score change is never higher.
+        repairs is an int of how many shots the player has left that could repair a unit.
+        reached is False if none of the player's actions can touch the unit. Then only the enemy's turn, fire and explosions can change it,
+        and none of them can shield or freeze it.
+        returns None if there's no limit to how much this unit could score."""
+        key = (repairs, reached)
+        if self._scorebound is not None and self._scorebound[0] == key: # it was already worked out since the unit last changed
+            return self._scorebound[1]
+        bound = self._getScoreBound(repairs, reached)
+        self._scorebound = (key, bound)
+        return bound
+    def _getScoreBound(self, repairs, reached):
+        "Work out getScoreBound() for this unit. This is overridden by units that score in other ways."
+        try:
+            score = self.score
+        except AttributeError: # this unit is never scored
+            return 0
+        alive = self._getHPBound(repairs) + max(0, score.get('fire_on', 0)) # smoke puts out fire without scoring it, so it could be scored going on again
+        dead = score.get('die', 0) - score.get('hurt', 0) * self.damage_taken + max(0, score.get('heal', 0)) * self._getHealBound(repairs) # dying undoes all the damage taken, but not the healing
+        for effect, effectname in (Effects.FIRE, 'fire'), (Effects.ICE, 'ice'), (Effects.ACID, 'acid'), (Effects.SHIELD, 'shield'):
+            try:
+                effectalive, effectdead = getEffectScoreBound(score.get(effectname + '_on'), score.get(effectname + '_off'), bool(self.effects & effect),
+                                                              getattr(self, 'got' + effectname), getattr(self, 'lost' + effectname),
+                                                              reached or effect in (Effects.FIRE, Effects.ACID))
+            except TypeError: # cannot unpack None, there's no limit
+                return None
+            alive += effectalive
+            dead += effectdead
+        return max(alive, dead)
+    def _getHPBound(self, repairs):
+        "return the most that this unit being hurt and healed could add to the score if it survives the turn."
+        hurt, heal = self.score.get('hurt', 0), self.score.get('heal', 0)
+        heals = self._getHealBound(repairs)
+        best = None
+        # The score is linear in the number of heals and the final hp, so the best is at a corner of what's possible.
+        for healed in {0, heals, min(heals, max(0, self.maxhp - self.hp))}:
+            for finalhp in {1, min(self.maxhp, self.hp + healed)}:
+                damage = self.hp + healed - finalhp
+                if damage < 0 or finalhp < 1:
+                    continue
+                hpscore = hurt * damage + heal * healed
+                if best is None or hpscore > best:
+                    best = hpscore
+        if best is None: # this unit can't survive
+            return float('-inf')
+        return best
+    def _getHealBound(self, repairs):
+        "return the most hp that this unit could be healed by this turn. This is overridden by units that can be healed."
+        return 0
     def __str__(self):
         return "%s %s/%s HP. Effects: %s, Attributes: %s Webs: %s" % (self.type, self.hp, self.maxhp, set(Effects.pprint(self.effects)), set(Attributes.pprint(self.attributes)), self.web)
 
 class Unit_Fighting_Base(Unit_Base):
     "The base class of all units that have at least 1 weapon."
+    __slots__ = ('weapon1',)
     def __init__(self, game, type, hp, maxhp, effects=None, weapon1=None, attributes=None):
         super().__init__(game=game, type=type, hp=hp, maxhp=maxhp, effects=effects, attributes=attributes)
         try: # try to set the wielding unit of this weapon
@@ -1192,20 +1752,23 @@ class Unit_Fighting_Base(Unit_Base):
 
 class Unit_Repairable_Base(Unit_Fighting_Base):
     "The base class of all mechs and vek."
+    __slots__ = ()
     def __init__(self, game, type, hp, maxhp, effects=None, weapon1=None, attributes=None):
         super().__init__(game=game, type=type, hp=hp, maxhp=maxhp, effects=effects, weapon1=weapon1, attributes=attributes)
     def repairHP(self, amount=1):
         "Repair hp amount of hp. Does not take you higher than the max. Does not remove any effects."
+        self._touch()
         self.hp += amount
         if self.hp > self.maxhp:
             amount -= self.hp - self.maxhp
             self.hp = self.maxhp
-        self.game.score.submit(self.score['heal'], '{0}_heal', amount)
+        self.game.score.submit(self.score['heal'], 'heal', amount, type=self.type)
 
 class Unit_Unwebbable_Base():
     """A base class that provide blank web methods for units that aren't effected by webs.
     (NPC units and stable units)
     """
+    __slots__ = ()
     def applyWeb(self):
         pass
     def _breakAllWebs(self):
@@ -1217,6 +1780,7 @@ class Unit_Unwebbable_Base():
 
 class Unit_NoDelayedDeath_Base(Unit_Base, Unit_Unwebbable_Base):
     "A base class for units that get to bypass the hurt queues such as buildings and other neutral units."
+    __slots__ = ()
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         res = super().takeDamage(damage, ignorearmor=ignorearmor, ignoreacid=ignoreacid)
         super()._allowDeath()
@@ -1224,15 +1788,19 @@ class Unit_NoDelayedDeath_Base(Unit_Base, Unit_Unwebbable_Base):
 
 class Unit_PlayerControlled_Base():
     "A base class that provides methods to add and remove units that the player controls to the game objects set. This is done on creation and death. Also allows movement."
+    __slots__ = ()
     def _addUnitToGame(self):
         self.game.playerunits.add(self)
         self.id = self.game.getNextUnitID()
     def _removeUnitFromGame(self):
         self.game.playerunits.remove(self)
+    def getKwanMove(self):
+        ":return This is set to True when HenryKwan allows the mech to move through enemy units. Units that can't have a pilot never have it."
+        return getattr(self, 'kwanmove', False)
     def getMoves(self, moves):
         """Find out where this unit can move to in the current state of the gameboard and return it as a set of coordinate tuples.
         moves is the number of moves this unit has (int).
-        returns a set-like dict_keys of squares of where this unit can travel to.
+        returns a frozenset of squares of where this unit can travel to.
         It's important to note that that this list includes squares that are occupied by other units that you can pass through!
         Another part of the code must check if the square is occupied before actually moving you there.
         The square where the unit starts is not included.
@@ -1266,41 +1834,28 @@ class Unit_PlayerControlled_Base():
         Mine Bot (Technically an enemy)
         
         Flying lets you pass through anything."""
-        if self.web or Effects.ICE in self.effects: # if you're webbed or frozen...
-            return set() # you can't move
-        self.positions = {}
-        self._getMovesBranch(self.square, moves+1)
-        del self.positions[self.square] # Don't include the starting position
-        answer = self.positions.keys()
-        del self.positions # positions is no longer needed, delete it to keep the size of the game obj down since it will be deepcopied many times.
-        return answer
-    def _getMovesBranch(self, position, moves):
-        "recursive method used by getMoves() to build self.positions. returns nothing."
-        if moves == 0:
-            return
-        self.positions[position] = moves
-        for direction in Direction.gen():
-            newsquare = self.game.board[position].getRelSquare(direction, 1)
-            if not newsquare: # if the new square is off the board, move on
-                continue
-            if not self._isMoveObstruction(newsquare) and self.positions.get(newsquare, 0) < moves:
-                self._getMovesBranch(newsquare, moves-1)
+        if self.web or self.effects & Effects.ICE: # if you're webbed or frozen...
+            return frozenset() # you can't move
+        if self.attributes & Attributes.FLYING: # flying units can pass through any unit and tile
+            return getReachableSquares(self.square, moves, 0)
+        blockers = 0
+        for square in _getSquareArea(self.square, moves):
+            if square != self.square and self._isMoveObstruction(square):
+                blockers |= 1 << SQUAREINDEX[square]
+        return getReachableSquares(self.square, moves, blockers)
     def _isMoveObstruction(self, square):
-        "pass in a square tuple and return True if the tile/unit obstructs movement, False if it doesn't."
-        if Attributes.FLYING in self.attributes: # flying units can pass through any unit and tile
-            return False
-        try:
-            if self.game.board[square].unit.isMoveBlocker(): # if the unit blocks movement:
-                if self.getKwanMove() and self.game.board[square].unit.alliance == Alliance.ENEMY: # if the Kwan pilot is allowing this unit to move through enemies...
-                    pass
-                else:
-                    return True # the unit blocks movement
-        except AttributeError: # no unit on tile
-            pass
-        return self.game.board[square].isMoveBlocker() # if the tile blocks movement
+        "pass in a square tuple and return True if the tile/unit obstructs movement, False if it doesn't. Flying isn't checked here."
+        tile = self.game.board[square]
+        if tile.unit is not None and tile.unit.isMoveBlocker(): # if the unit blocks movement:
+            if self.getKwanMove() and tile.unit.alliance == Alliance.ENEMY: # if the Kwan pilot is allowing this unit to move through enemies...
+                pass
+            else:
+                return True # the unit blocks movement
+        return tile.isMoveBlocker() # if the tile blocks movement
 
 class Unit_NonPlayerControlled_Base():
     "A base class that provides methods to add and remove units that the player doesn't control to the game objects set. This is done on creation and death."
+    __slots__ = ()
     def _addUnitToGame(self):
         self.game.nonplayerunits.append(self)
     def _removeUnitFromGame(self):
@@ -1312,6 +1867,7 @@ class Unit_NonPlayerControlled_Base():
 
 class Unit_NonPlayerControlledIgnore_Base():
     "A base class that provides methods to skip the adding and removal of units that the player doesn't control. These units skip the lists and don't take turns and can't take fire damage."
+    __slots__ = ()
     def _addUnitToGame(self):
         pass
     def _removeUnitFromGame(self):
@@ -1322,11 +1878,12 @@ class Unit_NonPlayerControlledIgnore_Base():
 ##############################################################################
 class Unit_Mountain_Building_Base(Unit_NoDelayedDeath_Base, Unit_NonPlayerControlledIgnore_Base):
     "The base class for mountains and buildings. They have special properties when it comes to fire and acid."
+    __slots__ = ()
     blocksbeamshot = True  # this unit blocks beam shots that penetrate almost all other units.
     _blocksmove = True # Buildings and mountains block movement
     def __init__(self, game, type, hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.attributes.update((Attributes.STABLE, Attributes.IMMUNEFIRE))
+        self.attributes |= Attributes.STABLE | Attributes.IMMUNEFIRE
     def applyFire(self):
         "mountains and buildingscan't be set on fire, but the tile they're on can!"
         pass
@@ -1334,10 +1891,11 @@ class Unit_Mountain_Building_Base(Unit_NoDelayedDeath_Base, Unit_NonPlayerContro
         raise DontGiveUnitAcid # buildings and mountains can't gain acid, but the tile they're on can!. Raise this so the tile that tried to give acid to the present unit gets it instead.
 
 class Unit_Mountain(Unit_Mountain_Building_Base):
+    __slots__ = ()
+    alliance = Alliance.NEUTRAL
+    _mountain = True
     def __init__(self, game, type='mountain', attributes=None, effects=None):
         super().__init__(game, type=type, hp=1, maxhp=1, attributes=attributes, effects=effects)
-        self.alliance = Alliance.NEUTRAL
-        self._mountain = True
     def _initScore(self):
         self.score = {#'fire_on': 0,
                       #'fire_off': 0,
@@ -1357,13 +1915,13 @@ class Unit_Mountain(Unit_Mountain_Building_Base):
         "This takeDamage ignores the amount of damage dealt to the mountain and flattens it to 1."
         if self._takeDamageProtected():
             self.damage_taken += 1
-            self.game.score.submit(self.score['hurt'], '{0}_hurt'.format(self.type), damage)
+            self.game.score.submit(self.score['hurt'], 'hurt', damage, type=self.type)
             self.game.board[self.square]._putUnitHere(Unit_Mountain_Damaged(self.game))
 
 class Unit_Mountain_Damaged(Unit_Mountain):
+    __slots__ = ()
     def __init__(self, game, type='mountaindamaged', effects=None):
         super().__init__(game, type=type, effects=effects)
-        self.alliance = Alliance.NEUTRAL
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         "any damage to the mountain will kill it in it's damaged state."
         if self._takeDamageProtected():
@@ -1373,9 +1931,9 @@ class Unit_Mountain_Damaged(Unit_Mountain):
 
 class Unit_Volcano(Unit_Mountain):
     "Indestructible volcano that blocks movement and projectiles."
+    __slots__ = ()
     def __init__(self, game, type='volcano', effects=None):
         super().__init__(game, type=type, effects=effects)
-        self.alliance = Alliance.NEUTRAL
     def _initScore(self):
         "we can get away with not scoring anything to do with volcanos since you can't really interact with them"
         return
@@ -1392,10 +1950,11 @@ class Unit_Volcano(Unit_Mountain):
         return
 
 class Unit_Building(Unit_Mountain_Building_Base):
+    __slots__ = ()
+    alliance = Alliance.NEUTRAL
+    _building = True # a flag to indicate this is a building rather than do string comparisons
     def __init__(self, game, type='building', hp=1, maxhp=1, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.alliance = Alliance.NEUTRAL
-        self._building = True # a flag to indicate this is a building rather than do string comparisons
     def _initScore(self):
         self.score = {#'fire_on': 0,
                       #'fire_off': 0,
@@ -1423,6 +1982,7 @@ class Unit_Building(Unit_Mountain_Building_Base):
                 self.game.powergrid.takeDamage(damage)
 
 class Unit_Building_Objective(Unit_Building):
+    __slots__ = ()
     alliance = Alliance.NEUTRAL
     _building = True
     def __init__(self, game, type='buildingobjective', hp=1, maxhp=1, effects=None):
@@ -1442,6 +2002,7 @@ class Unit_Building_Objective(Unit_Building):
                     }
 
 class Unit_Acid_Vat(Unit_NoDelayedDeath_Base, Unit_Unwebbable_Base, Unit_NonPlayerControlled_Base):
+    __slots__ = ()
     alliance = Alliance.NEUTRAL
     _blocksmove = True
     def __init__(self, game, type='acidvat', hp=2, maxhp=2, effects=None):
@@ -1466,9 +2027,10 @@ class Unit_Acid_Vat(Unit_NoDelayedDeath_Base, Unit_Unwebbable_Base, Unit_NonPlay
         self._removeUnitFromGame()
         self.game.board[self.square].replaceTile(Tile_Water(self.game, effects=(Effects.ACID,)), keepeffects=True) # replace the tile with a water tile that has an acid effect and keep the old effects
         self.game.vekemerge.remove(self.square) # don't let vek emerge from this newly created acid water tile
-        self.game.board[self.square].effects.discard(Effects.FIRE) # don't keep fire, this tile can't be on fire.
+        self.game.board[self.square].effects &= ~Effects.FIRE # don't keep fire, this tile can't be on fire.
 
 class Unit_Rock(Unit_NoDelayedDeath_Base, Unit_NonPlayerControlled_Base):
+    __slots__ = ()
     alliance = Alliance.NEUTRAL
     _blocksmove = True
     def __init__(self, game, type='rock', hp=1, maxhp=1, attributes=None, effects=None):
@@ -1492,11 +2054,12 @@ class Unit_Rock(Unit_NoDelayedDeath_Base, Unit_NonPlayerControlled_Base):
 ############################################################################################################################
 class Sub_Unit_Base(Unit_Fighting_Base, Unit_PlayerControlled_Base):
     "The base unit for smaller sub-units that the player controls as well as objective units that the player controls.."
+    __slots__ = ('id', 'moves')
     _repairdrop = True # indicates that this unit is healed by repairdrop
+    alliance = Alliance.FRIENDLY
     def __init__(self, game, type, hp, maxhp, moves, weapon1=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, effects=effects, attributes=attributes)
         self.moves = moves
-        self.alliance = Alliance.FRIENDLY
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         self.game.hurtplayerunits.append(self)
         return super().takeDamage(damage, ignorearmor=ignorearmor, ignoreacid=ignoreacid)
@@ -1505,6 +2068,7 @@ class Sub_Unit_Base(Unit_Fighting_Base, Unit_PlayerControlled_Base):
 
 class Deployable_Tank_Base(Sub_Unit_Base):
     "A base unit for deployable tanks that only provides scoring."
+    __slots__ = ()
     def _initScore(self):
         self.score = {'fire_on': -6,
                       'fire_off': 6,
@@ -1520,30 +2084,37 @@ class Deployable_Tank_Base(Sub_Unit_Base):
                       }
 
 class Unit_AcidTank(Deployable_Tank_Base):
+    __slots__ = ()
     def __init__(self, game, type='acidtank', hp=1, maxhp=1, weapon1=None, moves=3, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, moves=moves, effects=effects, attributes=attributes)
 
 class Unit_FreezeTank(Deployable_Tank_Base):
+    __slots__ = ()
     def __init__(self, game, type='freezetank', hp=1, maxhp=1, weapon1=None, moves=4, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, moves=moves, effects=effects, attributes=attributes)
 
 class Unit_ArchiveTank(Deployable_Tank_Base):
+    __slots__ = ()
     def __init__(self, game, type='archivetank', hp=1, maxhp=1, weapon1=None, moves=4, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, moves=moves, effects=effects, attributes=attributes)
 
 class Unit_OldArtillery(Deployable_Tank_Base):
+    __slots__ = ()
     def __init__(self, game, type='oldartillery', hp=2, maxhp=2, moves=1, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_OldEarthArtillery(), moves=moves, effects=effects, attributes=attributes)
 
 class Unit_ShieldTank(Deployable_Tank_Base):
+    __slots__ = ()
     def __init__(self, game, type='shieldtank', hp=1, maxhp=1, weapon1=None, moves=3, effects=None, attributes=None): # shield tanks can optionally have 3 hp with a power upgrade
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, moves=moves, effects=effects, attributes=attributes)
 
 class Unit_LightTank(Deployable_Tank_Base):
+    __slots__ = ()
     def __init__(self, game, type='lighttank', hp=1, maxhp=1, weapon1=None, moves=3, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, moves=moves, effects=effects, attributes=attributes)
 
 class Unit_PullTank(Deployable_Tank_Base):
+    __slots__ = ()
     def __init__(self, game, type='pulltank', hp=1, maxhp=1, weapon1=None, moves=3, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, moves=moves, effects=effects, attributes=attributes)
 
@@ -1552,22 +2123,25 @@ class Unit_PullTank(Deployable_Tank_Base):
 ##############################################################################
 class Unit_MultiTile_Base(Unit_Base, Unit_Unwebbable_Base, Unit_NonPlayerControlled_Base):
     "This is the base class for multi-tile units such as the Dam and Train. Effects and damage to one unit also happens to the other."
+    __slots__ = ('companion', 'deadfromdamage', 'replicate')
     alliance = Alliance.NEUTRAL
     def __init__(self, game, type, hp, maxhp, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.attributes.update((Attributes.STABLE, Attributes.IMMUNEFIRE, Attributes.IMMUNESMOKE)) # these attributes are shared by the dam and train
+        self.attributes |= Attributes.STABLE | Attributes.IMMUNEFIRE | Attributes.IMMUNESMOKE # these attributes are shared by the dam and train
         self.replicate = True # When this is true, we replicate actions to the other companion unit and we don't when False to avoid an infinite loop.
         self.deadfromdamage = False # Set this true when the unit has died from damage. If we don't, takeDamage() can happen to both tiles, triggering die() which would then replicate to the other causing it to die twice.
     def _replicate(self, meth, **kwargs):
         "Replicate an action from this unit to the other. meth is a string of the method to run. Returns nothing."
         if self.replicate:
             comptile = self.game.board[self.companion]
-            comptile.unit.replicate = False
-            try: # try running the companion's method as takeDamage() with keyword arguments
-                getattr(comptile.unit, meth)(damage=kwargs['damage'], ignorearmor=kwargs['ignorearmor'], ignoreacid=kwargs['ignoreacid'])
-            except KeyError: # else it's an applySomething() method with no args
+            comptile._touch()
+            compunit = comptile.unit # the companion can be replaced by whatever it leaves behind, so hold onto it to turn replicate back on
+            compunit.replicate = False
+            if kwargs: # run the companion's method as takeDamage() with keyword arguments
+                getattr(compunit, meth)(damage=kwargs['damage'], ignorearmor=kwargs['ignorearmor'], ignoreacid=kwargs['ignoreacid'])
+            else: # it's an applySomething() method with no args
                 getattr(comptile, meth)()
-            comptile.unit.replicate = True
+            compunit.replicate = True
     def applyIce(self):
         super().applyIce()
         self._replicate('applyIce')
@@ -1580,11 +2154,11 @@ class Unit_MultiTile_Base(Unit_Base, Unit_Unwebbable_Base, Unit_NonPlayerControl
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         "Process this unit taking damage. All effects are considered unless set to True in the arguments. Yes this is copypasta from the base, but we don't need to check for armored here."
         if self._takeDamageProtected():
-            if not ignoreacid and Effects.ACID in self.effects: # if we're not ignoring acid and the unit has acid
+            if not ignoreacid and self.effects & Effects.ACID: # if we're not ignoring acid and the unit has acid
                 damage *= 2
             self.hp -= damage # the unit takes the damage
             self.damage_taken += damage
-            self.game.score.submit(self.score['hurt'], '{0}_hurt'.format(self.type), damage)
+            self.game.score.submit(self.score['hurt'], 'hurt', damage, type=self.type)
             if self.hp <= 0:  # if the unit has no more HP
                 self.damage_taken += self.hp  # hp is now negative or 0. Adjust damage_taken to ignore overkill. If the unit had 4 hp and it took 7 damage, we consider the unit as only taking 4 damage because overkill is useless. Dead is dead.
                 self.deadfromdamage = True
@@ -1598,9 +2172,10 @@ class Unit_MultiTile_Base(Unit_Base, Unit_Unwebbable_Base, Unit_NonPlayerControl
 
 class Unit_Dam(Unit_MultiTile_Base):
     "When the Dam dies, it floods the middle of the map. Dam is not effected by RepairDrop."
+    __slots__ = ()
     def __init__(self, game, type='dam', hp=2, maxhp=2, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.attributes.add(Attributes.MASSIVE)
+        self.attributes |= Attributes.MASSIVE
     def _initScore(self):
         "These score events are done twice, once per each tile"
         self.score = {#'fire_on': -6,
@@ -1636,10 +2211,11 @@ class Unit_Dam(Unit_MultiTile_Base):
 
 class Unit_Train_Base(Unit_MultiTile_Base):
     "Base class for the undamaged train"
+    __slots__ = ()
     _beamally = True
     def __init__(self, game, type=None, hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.attributes.update({Attributes.IMMUNEFIRE, Attributes.IMMUNESMOKE, Attributes.STABLE})
+        self.attributes |= Attributes.IMMUNEFIRE | Attributes.IMMUNESMOKE | Attributes.STABLE
     def _initScore(self):
         "These score events are done twice, once per each tile"
         self.score = {#'fire_on': -6,
@@ -1665,13 +2241,14 @@ class Unit_Train_Base(Unit_MultiTile_Base):
         pass
 
 class Unit_Train(Unit_Train_Base):
+    __slots__ = ('weapon1',)
     def __init__(self, game, type='train', hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
         self.weapon1 = Weapon_ChooChoo()
         # close to copypasta from Unit_Fighting_Base
         self.weapon1.wieldingunit = self
         self.weapon1.game = self.game
-        if Effects.ICE in self.effects: # Make qshot active if unit isn't frozen, nothing else will stop it from moving.
+        if self.effects & Effects.ICE: # Make qshot active if unit isn't frozen, nothing else will stop it from moving.
             self.weapon1.qshot = None
         else:
             self.weapon1.qshot = ()
@@ -1684,6 +2261,7 @@ class Unit_Train(Unit_Train_Base):
         self.game.board[self.square].unit._setCompanion()
 
 class Unit_TrainCaboose(Unit_Train_Base):
+    __slots__ = ()
     def __init__(self, game, type='traincaboose', hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
     def _setCompanion(self):
@@ -1694,20 +2272,24 @@ class Unit_TrainCaboose(Unit_Train_Base):
         self.game.board[self.square].unit._setCompanion()
 
 class Unit_TrainDamaged_Base(Unit_Train):
+    __slots__ = ()
     def __init__(self, game, type=None, hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
     def _deathAction(self):
         self.game.board[self.square]._putUnitHere(Unit_TrainCorpse(self.game))
 
 class Unit_TrainDamaged(Unit_TrainDamaged_Base):
+    __slots__ = ()
     def __init__(self, game, type='traindamaged', hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
 
 class Unit_TrainDamagedCaboose(Unit_TrainDamaged_Base):
+    __slots__ = ()
     def __init__(self, game, type='traindamagedcaboose', hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
 
 class Unit_TrainCorpse(Unit_TrainCaboose):
+    __slots__ = ()
     def __init__(self, game, type='traincorpse', hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
@@ -1716,9 +2298,10 @@ class Unit_TrainCorpse(Unit_TrainCaboose):
         return # invincible
 
 class Unit_Terraformer(Sub_Unit_Base, Unit_Unwebbable_Base):
+    __slots__ = ()
     def __init__(self, game, type='terraformer', hp=2, maxhp=2, moves=0, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, weapon1=Weapon_Terraformer(), attributes=attributes, effects=effects)
-        self.attributes.add(Attributes.STABLE)
+        self.attributes |= Attributes.STABLE
     def _initScore(self):
         self.score = {'fire_on': -8,
                       'fire_off': 8,
@@ -1734,9 +2317,10 @@ class Unit_Terraformer(Sub_Unit_Base, Unit_Unwebbable_Base):
                     }
 
 class Unit_AcidLauncher(Sub_Unit_Base, Unit_Unwebbable_Base):
+    __slots__ = ()
     def __init__(self, game, type='acidlauncher', hp=2, maxhp=2, moves=0, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, weapon1=Weapon_Disintegrator(), attributes=attributes, effects=effects)
-        self.attributes.add(Attributes.STABLE)
+        self.attributes |= Attributes.STABLE
     def _initScore(self):
         self.score = {'fire_on': -8,
                       'fire_off': 8,
@@ -1752,12 +2336,13 @@ class Unit_AcidLauncher(Sub_Unit_Base, Unit_Unwebbable_Base):
                     }
 
 class Unit_SatelliteRocket(Unit_Fighting_Base, Unit_NoDelayedDeath_Base, Unit_NonPlayerControlled_Base):
+    __slots__ = ('moves',)
     alliance = Alliance.NEUTRAL
     # is not a beamally
     def __init__(self, game, type='satelliterocket', hp=2, maxhp=2, moves=0, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SatelliteLaunch(), attributes=attributes, effects=effects)
         self.moves = moves
-        self.attributes.add(Attributes.STABLE)
+        self.attributes |= Attributes.STABLE
     def _initScore(self):
         self.score = {'fire_on': -8,
                       'fire_off': 8,
@@ -1776,10 +2361,11 @@ class Unit_SatelliteRocket(Unit_Fighting_Base, Unit_NoDelayedDeath_Base, Unit_No
         self.game.board[self.square]._putUnitHere(Unit_SatelliteRocketCorpse(self.game))
 
 class Unit_SatelliteRocketCorpse(Unit_Fighting_Base, Unit_Unwebbable_Base):
+    __slots__ = ()
     alliance = Alliance.NEUTRAL
     def __init__(self, game, type='satelliterocketcorpse', hp=1, maxhp=1, moves=0, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.attributes.add(Attributes.STABLE)
+        self.attributes |= Attributes.STABLE
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         return # invincible
     def die(self):
@@ -1800,11 +2386,12 @@ class Unit_SatelliteRocketCorpse(Unit_Fighting_Base, Unit_Unwebbable_Base):
 
 class Unit_EarthMover(Sub_Unit_Base, Unit_Unwebbable_Base):
     "This unit doesn't get a weapon because its effect doesn't matter for a single turn."
+    __slots__ = ()
     _beamally = True
     alliance = Alliance.NEUTRAL
     def __init__(self, game, type='earthmover', hp=2, maxhp=2, moves=0, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, attributes=attributes, effects=effects)
-        self.attributes.add(Attributes.STABLE)
+        self.attributes |= Attributes.STABLE
     def _initScore(self):
         self.score = {'fire_on': -8,
                       'fire_off': 8,
@@ -1823,16 +2410,18 @@ class Unit_EarthMover(Sub_Unit_Base, Unit_Unwebbable_Base):
         self.game.board[self.square]._putUnitHere(Unit_EarthMoveCorpse(self.game))
 
 class Unit_EarthMoveCorpse(Unit_SatelliteRocketCorpse):
+    __slots__ = ()
     def __init__(self, game, type='earthmovercorpse', hp=1, maxhp=1, moves=0, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
 
 class Unit_PrototypeRenfieldBomb(Unit_Base, Unit_Unwebbable_Base, Unit_NonPlayerControlledIgnore_Base):
+    __slots__ = ()
     alliance = Alliance.NEUTRAL
     _beamally = True
     def __init__(self, game, type='prototypebomb', hp=1, maxhp=1, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.effects.add(Effects.EXPLOSIVE)
-        self.attributes.add(Attributes.IMMUNEFIRE)
+        self.effects |= Effects.EXPLOSIVE
+        self.attributes |= Attributes.IMMUNEFIRE
     def _initScore(self):
         self.score = {#'fire_on': -8, immune to fire
                       #'fire_off': 8,
@@ -1848,12 +2437,13 @@ class Unit_PrototypeRenfieldBomb(Unit_Base, Unit_Unwebbable_Base, Unit_NonPlayer
                     }
 
 class Unit_RenfieldBomb(Unit_Base, Unit_Unwebbable_Base, Unit_NonPlayerControlledIgnore_Base):
+    __slots__ = ()
     alliance = Alliance.NEUTRAL
     _beamally = True
     _renfieldbomb = True
     def __init__(self, game, type='renfieldbomb', hp=4, maxhp=4, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, attributes=attributes, effects=effects)
-        self.attributes.add(Attributes.IMMUNEFIRE)
+        self.attributes |= Attributes.IMMUNEFIRE
     def _initScore(self):
         self.score = {'fire_on': -8,
                       'fire_off': 8,
@@ -1873,6 +2463,7 @@ class Unit_RenfieldBomb(Unit_Base, Unit_Unwebbable_Base, Unit_NonPlayerControlle
 ############################################################################################################################
 class Unit_Enemy_Base(Unit_Repairable_Base, Unit_Unwebbable_Base, Unit_NonPlayerControlled_Base):
     "A base class for almost all enemies."
+    __slots__ = ()
     alliance = Alliance.ENEMY
     _blocksmove = True
     def __init__(self, game, type, hp, maxhp, weapon1=None, effects=None, attributes=None):
@@ -1893,6 +2484,7 @@ class Unit_Enemy_Base(Unit_Repairable_Base, Unit_Unwebbable_Base, Unit_NonPlayer
 
 class Unit_Vek_Base():
     "A base class for all vek, including psions but excluding bots and minions."
+    __slots__ = ()
     def takeBumpDamage(self):
         "Veks take extra bump damage when ForceAmp is in play."
         if Passives.FORCEAMP in self.game.otherpassives:
@@ -1902,6 +2494,7 @@ class Unit_Vek_Base():
 
 class Unit_EnemyNonPsion_Base(Unit_Enemy_Base):
     "This is the base unit of all enemies that are not psions. Enemies have 1 weapon."
+    __slots__ = ()
     def __init__(self, game, type, hp, maxhp, weapon1=None, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, effects=effects, attributes=attributes)
         try:
@@ -1916,20 +2509,23 @@ class Unit_EnemyNonPsion_Base(Unit_Enemy_Base):
 
 class Unit_NormalVek_Base(Unit_Vek_Base, Unit_EnemyNonPsion_Base):
     "A base class for all vek who benefit from psions. Not bots, psions, bosses, or minions."
+    __slots__ = ()
     _getspsionbonus = True
 
 class Unit_NormalVekFlying_Base(Unit_EnemyNonPsion_Base):
     "A simple base unit for flying vek."
+    __slots__ = ()
     def __init__(self, game, type, hp, maxhp, weapon1=None, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, qshot=qshot, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.FLYING)
+        self.attributes |= Attributes.FLYING
 
 class Unit_Psion_Base(Unit_Vek_Base, Unit_EnemyNonPsion_Base):
     "Base unit for vek psions. When psions are hurt, their deaths are resolved first before your mechs or other vek/bots."
+    __slots__ = ()
     _psion = True
     def __init__(self, game, type, hp, maxhp, weapon1=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.FLYING)
+        self.attributes |= Attributes.FLYING
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         "Psions die before units so they go to a special place when damaged."
         self.game.hurtpsion = self
@@ -1941,238 +2537,294 @@ class Unit_Psion_Base(Unit_Vek_Base, Unit_EnemyNonPsion_Base):
 
 class Unit_EnemyBurrower_Base(Unit_NormalVek_Base):
     "A simple base class for the only 2 burrowers in the game."
+    __slots__ = ()
     def __init__(self, game, type, hp, maxhp, weapon1=None, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, qshot=qshot, effects=effects, attributes=attributes)
-        self.attributes.update((Attributes.BURROWER, Attributes.STABLE))
+        self.attributes |= Attributes.BURROWER | Attributes.STABLE
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
         super().takeDamage(damage, ignorearmor=ignorearmor, ignoreacid=ignoreacid)
         if self.hp > 0: # if burrower didn't die...
             self._burrow()
     def _burrow(self):
         "Burrow the unit underground, removing fire if present."
+        self.game.board[self.square]._touch()
         self.game.board[self.square].unit = None # The unit is gone from the board, but still present otherwise.
+        self.game.occupied &= ~SQUAREBITS[self.square]
         self.weapon1.qshot = None # cancel the unit's attack.
         self._removeFire()
 
 class Unit_EnemyLeader_Base(Unit_NormalVek_Base):
     "A simple base class for Massive bosses."
+    __slots__ = ()
     def __init__(self, game, type, hp, maxhp, weapon1=None, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, qshot=qshot, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.MASSIVE)
+        self.attributes |= Attributes.MASSIVE
         self.score['die'] = 12 * self.maxhp
 
 class Unit_Blobber(Unit_NormalVek_Base):
     "The Blobber doesn't have a direct attack."
+    __slots__ = ()
     def __init__(self, game, type='blobber', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_UnstableGrowths(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaBlobber(Unit_NormalVek_Base):
     "Also has no direct attack."
+    __slots__ = ()
     def __init__(self, game, type='alphablobber', hp=4, maxhp=4, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_UnstableGuts(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Scorpion(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='scorpion', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_StingingSpinneret(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_VolatileVek(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='volatilevek', hp=4, maxhp=4, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_StingingSpinneret(), qshot=qshot, effects=effects, attributes=attributes)
-        self.effects.add(Effects.EXPLOSIVE)
+        self.effects |= Effects.EXPLOSIVE
 
 class Unit_AlphaScorpion(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphascorpion', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_GoringSpinneret(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Firefly(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='firefly', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_AcceleratingThorax(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaFirefly(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphascorpion', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_EnhancedThorax(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Leaper(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='leaper', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Fangs(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaLeaper(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphaleaper', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SharpenedFangs(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Beetle(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='beetle', hp=4, maxhp=4, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Pincers(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaBeetle(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphabeetle', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SharpenedPincers(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Scarab(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='scarab', hp=2, maxhp=2, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SpittingGlands(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaScarab(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphascarab', hp=4, maxhp=4, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_AlphaSpittingGlands(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Crab(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='crab', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_ExplosiveExpulsions(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaCrab(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphacrab', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_AlphaExplosiveExpulsions(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Centipede(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='centipede', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_AcidicVomit(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaCentipede(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphacentipede', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_CorrosiveVomit(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Digger(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='digger', hp=2, maxhp=2, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_DiggingTusks(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaDigger(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphadigger', hp=4, maxhp=4, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_AlphaDiggingTusks(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Hornet(Unit_NormalVekFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='hornet', hp=2, maxhp=2, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Stinger(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaHornet(Unit_NormalVekFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphahornet', hp=4, maxhp=4, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_LaunchingStinger(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_SoldierPsion(Unit_Psion_Base):
+    __slots__ = ()
     def __init__(self, game, type='soldierpsion', hp=2, maxhp=2, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_InvigoratingSpores(), effects=effects, attributes=attributes)
 
 class Unit_ShellPsion(Unit_Psion_Base):
+    __slots__ = ()
     def __init__(self, game, type='shellpsion', hp=2, maxhp=2, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_HardenedCarapace(), effects=effects, attributes=attributes)
 
 class Unit_BloodPsion(Unit_Psion_Base):
+    __slots__ = ()
     def __init__(self, game, type='bloodpsion', hp=2, maxhp=2, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Regeneration(), effects=effects, attributes=attributes)
 
 class Unit_BlastPsion(Unit_Psion_Base):
+    __slots__ = ()
     def __init__(self, game, type='blastpsion', hp=2, maxhp=2, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_ExplosiveDecay(), effects=effects, attributes=attributes)
 
 class Unit_PsionTyrant(Unit_Psion_Base):
+    __slots__ = ()
     def __init__(self, game, type='psiontyrant', hp=2, maxhp=2, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_HiveTargeting(), effects=effects, attributes=attributes)
 
 class Unit_Spider(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='spider', hp=2, maxhp=2, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_TinyOffspring(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaSpider(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphaspider', hp=4, maxhp=4, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_LargeOffspring(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Burrower(Unit_EnemyBurrower_Base):
+    __slots__ = ()
     def __init__(self, game, type='burrower', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SpikedCarapace(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaBurrower(Unit_EnemyBurrower_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphaburrower', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_BladedCarapace(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_BeetleLeader(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='beetleleader', hp=6, maxhp=6, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_FlamingAbdomen(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_LargeGoo(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='largegoo', hp=3, maxhp=3, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_GooAttack(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_MediumGoo(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='mediumgoo', hp=2, maxhp=2, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_GooAttack(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_SmallGoo(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='smallgoo', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_GooAttack(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_HornetLeader(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='hornetleader', hp=6, maxhp=6, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SuperStinger(), qshot=qshot, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.FLYING)
+        self.attributes |= Attributes.FLYING
 
 class Unit_PsionAbomination(Unit_Psion_Base):
+    __slots__ = ()
     def __init__(self, game, type='psionabomination', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Overpowered(), effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.MASSIVE)
+        self.attributes |= Attributes.MASSIVE
 
 class Unit_ScorpionLeader(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='scorpionleader', hp=7, maxhp=7, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_MassiveSpinneret(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_FireflyLeader(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='fireflyleader', hp=6, maxhp=6, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_BurningThorax(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_SpiderLeader(Unit_EnemyLeader_Base):
+    __slots__ = ()
     def __init__(self, game, type='spiderleader', hp=6, maxhp=6, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_PlentifulOffspring(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaBlob(Unit_EnemyNonPsion_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphablob', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_VolatileGuts(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Blob(Unit_EnemyNonPsion_Base):
+    __slots__ = ()
     def __init__(self, game, type='blob', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_UnstableGuts(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_SpiderlingEgg(Unit_EnemyNonPsion_Base):
     "Spiderling eggs are not considered normal vek, they don't get effects from psions"
+    __slots__ = ()
     def __init__(self, game, type='spiderlingegg', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SpiderlingEgg(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_Spiderling(Unit_NormalVek_Base):
     "Spiderlings themselves do get psion passives however."
+    __slots__ = ()
     def __init__(self, game, type='spiderling', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_TinyMandibles(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_AlphaSpiderling(Unit_NormalVek_Base):
+    __slots__ = ()
     def __init__(self, game, type='alphaspiderling', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_TinyMandiblesAlpha(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_EnemyBot_Base(Unit_EnemyNonPsion_Base):
+    __slots__ = ()
     def __init__(self, game, type, hp=1, maxhp=1, weapon1=None, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_CannonBot(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='cannonbot', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Cannon8RMarkI(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_CannonMech(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='cannonmech', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Cannon8RMarkII(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_ArtilleryBot(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='artillerybot', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Vk8RocketsMarkI(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_ArtilleryMech(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='artillerymech', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Vk8RocketsMarkII(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_LaserBot(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='laserbot', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_BKRBeamMarkI(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_LaserMech(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='lasermech', hp=1, maxhp=1, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_BKRBeamMarkII(), qshot=qshot, effects=effects, attributes=attributes)
 
 class Unit_MineBot(Unit_EnemyBot_Base):
+    __slots__ = ()
     _blocksmove = False # the minebot actually does not block movement even though it's an enemy. I guess because it's an enemy you need to protect.
     def __init__(self, game, type='minebot', hp=1, maxhp=1, qshot=None, effects=None, attributes=None): # this unit doesn't get a weapon.
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=None, qshot=qshot, effects=effects, attributes=attributes)
@@ -2191,27 +2843,37 @@ class Unit_MineBot(Unit_EnemyBot_Base):
                     }
 
 class Unit_BotLeader_Attacking(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='botleaderattacking', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_Vk8RocketsMarkIII(), qshot=qshot, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.MASSIVE)
+        self.attributes |= Attributes.MASSIVE
         self.score['die'] = 12 * self.maxhp
 
 class Unit_BotLeader_Healing(Unit_EnemyBot_Base):
+    __slots__ = ()
     def __init__(self, game, type='botleaderhealing', hp=5, maxhp=5, qshot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=Weapon_SelfRepair(), qshot=qshot, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.MASSIVE)
+        self.attributes |= Attributes.MASSIVE
         self.score['die'] = 12 * self.maxhp
+    def _getScoreBound(self, repairs, reached):
+        "return None since this unit heals itself and puts out its fire without it being scored."
+        return None
 
 ############################################################################################################################
 ##################################################### FRIENDLY MECHS #######################################################
 ############################################################################################################################
 class Unit_Mech_Base(Unit_Repairable_Base, Unit_PlayerControlled_Base):
     "This is the base unit of Mechs."
+    __slots__ = ('doubleshot', 'id', 'kwanmove', 'moves', 'repweapon', 'secondarymoves', 'weapon2')
     alliance = Alliance.FRIENDLY  # and friendly, duh
     def __init__(self, game, type, hp, maxhp, moves, repweapon=None, weapon1=None, weapon2=None, pilot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, weapon1=weapon1, effects=effects, attributes=attributes)
         self.moves = moves # how many moves the mech has
-        self.attributes.add(Attributes.MASSIVE) # all mechs are massive
+        self.attributes |= Attributes.MASSIVE # all mechs are massive
+        self.kwanmove = False # these three are only changed by pilots
+        self.doubleshot = False
+        self.secondarymoves = 0
+        self.weapon2 = None
 
         try: # see if there's a pilot that provides something
             pilot.mech = self
@@ -2242,29 +2904,29 @@ class Unit_Mech_Base(Unit_Repairable_Base, Unit_PlayerControlled_Base):
             self.weapon2.game = self.game
     def die(self):
         "Make the mech die."
+        self.game.board[self.square]._touch()
         self.hp = 0
-        if self.game.board[self.square].isSwallow() and Effects.SUBMERGED not in self.game.board[self.square].effects: # if tile is a chasm
+        if self.game.board[self.square].isSwallow() and not self.game.board[self.square].effects & Effects.SUBMERGED: # if tile is a chasm
             pass # the unit is really dead, don't bother creating a mech corpse since it too will die
         else: # make a mech corpse
             self.game.board[self.square]._putUnitHere(Unit_Mech_Corpse(self.game, oldunit=self)) # it's dead, replace it with a mech corpse
-            if Effects.EXPLOSIVE in self.effects: # if the mech that died was explosive, the corpse needs to be explosive and explode
-                self.game.board[self.square].unit.effects.add(Effects.EXPLOSIVE)
+            if self.effects & Effects.EXPLOSIVE: # if the mech that died was explosive, the corpse needs to be explosive and explode
+                self.game.board[self.square].unit.effects |= Effects.EXPLOSIVE
         self.game.killMech(self)
         self._dieScore()
     def repair(self, hp, ignorerepairfield=False):
         "Repair the unit healing hp and removing bad effects. ignorerepairfield is set to True by _repairField() to make sure we don't get stuck in a loop."
+        self._touch()
         if ignorerepairfield or not self._repairField():
             self.repairHP(hp)
             for effect, effectname in (Effects.FIRE, 'fire'), (Effects.ACID, 'acid'), (Effects.ICE, 'ice'):
-                try: # try removing bad effects
-                    self.effects.remove(effect)
-                except KeyError:
-                    pass
-                else:
+                if self.effects & effect: # try removing bad effects
+                    self.effects &= ~effect
                     if getattr(self, 'got{0}'.format(effectname)): # if we got the effect during this turn, undo getting it
                         event = '{0}_on'.format(effectname)
-                        self.game.score.undo(self.score[event], '{0}_{1}'.format(self.type, event))
-                    self.game.score.submit(self.score['{0}_off'.format(effectname)], '{0}_{1}_off'.format(self.type, effectname)) # score getting rid of the bad effect
+                        self.game.score.undo(self.score[event], event, type=self.type)
+                    event = '{0}_off'.format(effectname)
+                    self.game.score.submit(self.score[event], event, type=self.type) # score getting rid of the bad effect
     def _repairField(self):
         "Repair all your mechs if the repairfield passive is in play. Returns True if it was and the healing was done, False if the passive wasn't active."
         if Passives.REPAIRFIELD in self.game.otherpassives:
@@ -2299,36 +2961,36 @@ class Unit_Mech_Base(Unit_Repairable_Base, Unit_PlayerControlled_Base):
                     } # TODO: score pilot deaths?
     def canDoubleShot(self):
         "return True if this unit can shoot twice due to Silica's doubleshot, False if not."
-        try:
-            return self.doubleshot
-        except AttributeError:
-            return False
+        return self.doubleshot
     def getSecondaryMoves(self):
         ":return These are moves that you make after shooting, only pilots can enable this"
+        return self.secondarymoves
+    def _getScoreBound(self, repairs, reached):
+        "Repairing a mech undoes getting a bad effect on top of scoring its removal, so each repair could score that once more."
+        bound = super()._getScoreBound(repairs, reached)
         try:
-            return self.secondarymoves
-        except AttributeError:
-            return 0
-    def getKwanMove(self):
-        ":return This is set to True when HenryKwan allows the mech to move through enemy units"
-        try:
-            return self.kwanmove
-        except AttributeError:
-            return False
+            return bound + repairs * sum(max(0, -self.score['{0}_on'.format(effectname)]) for effectname in ('fire', 'acid', 'ice'))
+        except TypeError: # None + int
+            return None
+    def _getHealBound(self, repairs):
+        "Mechs are healed 1 hp by each repair."
+        return repairs
 
 class Unit_MechFlying_Base(Unit_Mech_Base):
     "The base class for flying mechs. Flying mechs typically have 2 hp and 4 moves."
+    __slots__ = ()
     def __init__(self, game, type, hp=2, maxhp=2, moves=4, repweapon=None, weapon1=None, weapon2=None, pilot=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, pilot=pilot, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.FLYING)
+        self.attributes |= Attributes.FLYING
 
 class Unit_Mech_Corpse(Unit_Mech_Base):
     "This is a player mech after it dies. It's invincible but can be pushed around. It can be repaired back to an alive mech. It has no weapons."
+    __slots__ = ('oldunit',)
+    suppressteleport = True # Mech corpses can never be teleported through a teleporter. They can be teleported by the teleport mech/weapon however
     def __init__(self, game, type='mechcorpse', hp=1, maxhp=1, moves=0, oldunit=None, attributes=None, effects=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, attributes=attributes, effects=effects)
         self.oldunit = oldunit # This is the unit that died to create this corpse. You can repair mech corpses to get your mech back.
-        self.attributes.add(Attributes.MASSIVE)
-        self.suppressteleport = True # Mech corpses can never be teleported through a teleporter. They can be teleported by the teleport mech/weapon however
+        self.attributes |= Attributes.MASSIVE
         self.game.hurtplayerunits.append(self) # this is done so the mech corpse can explode if needed
         self.game.playerunits.add(self)
     def takeDamage(self, damage, ignorearmor=False, ignoreacid=False):
@@ -2344,14 +3006,17 @@ class Unit_Mech_Corpse(Unit_Mech_Base):
         "repair the mech corpse back to unit it was. ignorerepairfield is ironically ignored itself."
         self.oldunit.repairHP(hp)
         self._revive()
+    def _getScoreBound(self, repairs, reached):
+        "return None if the corpse could be repaired since the revived mech's score isn't limited by the corpse's."
+        if repairs:
+            return None
+        return super()._getScoreBound(repairs, reached)
     def _revive(self):
         "Revive the corpse into a mech. returns nothing"
-        try:
-            self.oldunit.effects.remove(Effects.FIRE)  # fire is removed revived mechs. They get fire again if they're revived on a fire tile.
-        except KeyError:
-            pass
-        else:
-            self.game.score.submit(self.score['fire_off'], '{0}_fire_off'.format(self.type)) # score getting rid of fire
+        self.oldunit._touch()
+        if self.oldunit.effects & Effects.FIRE:
+            self.oldunit.effects &= ~Effects.FIRE  # fire is removed revived mechs. They get fire again if they're revived on a fire tile.
+            self.game.score.submit(self.score['fire_off'], 'fire_off', type=self.type) # score getting rid of fire
         self.game.board[self.square].createUnitHere(self.oldunit)
     def _realDeath(self):
         "This method removes the mech corpse from the game. This kind of death can only be achieved by pushing a mech corpse into a chasm tile (or a flying mech dying over a chasm). returns nothing"
@@ -2361,112 +3026,139 @@ class Unit_Mech_Corpse(Unit_Mech_Base):
         return False
 
 class Unit_Combat_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='combat', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Laser_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='laser', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Lightning_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='lightning', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Judo_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='judo', hp=3, maxhp=3, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.ARMORED)
+        self.attributes |= Attributes.ARMORED
 
 class Unit_Flame_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='flame', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Aegis_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='aegis', hp=3, maxhp=3, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Leap_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='leap', hp=3, maxhp=3, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Cannon_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='cannon', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Jet_Mech(Unit_MechFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='jet', hp=2, maxhp=2, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Charge_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='charge', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Hook_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='hook', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
-        self.attributes.add(Attributes.ARMORED)
+        self.attributes |= Attributes.ARMORED
 
 class Unit_Mirror_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='mirror', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Unstable_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='unstable', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Artillery_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='artillery', hp=2, maxhp=2, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Rocket_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='rocket', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Boulder_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='boulder', hp=2, maxhp=2, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Siege_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='siege', hp=2, maxhp=2, moves=2, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Meteor_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='meteor', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Ice_Mech(Unit_MechFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='ice', hp=2, maxhp=2, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Pulse_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='pulse', hp=3, maxhp=3, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Defense_Mech(Unit_MechFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='defense', hp=2, maxhp=2, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Gravity_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='gravity', hp=3, maxhp=3, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Swap_Mech(Unit_MechFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='swap', hp=2, maxhp=2, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_Nano_Mech(Unit_MechFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='nano', hp=2, maxhp=2, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_TechnoBeetle_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='technobeetle', hp=3, maxhp=3, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_TechnoHornet_Mech(Unit_MechFlying_Base):
+    __slots__ = ()
     def __init__(self, game, type='technohornet', hp=2, maxhp=2, moves=4, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
 class Unit_TechnoScarab_Mech(Unit_Mech_Base):
+    __slots__ = ()
     def __init__(self, game, type='technoscarab', hp=2, maxhp=2, moves=3, pilot=None, repweapon=None, weapon1=None, weapon2=None, effects=None, attributes=None):
         super().__init__(game, type=type, hp=hp, maxhp=maxhp, moves=moves, pilot=pilot, repweapon=repweapon, weapon1=weapon1, weapon2=weapon2, effects=effects, attributes=attributes)
 
@@ -2527,7 +3219,7 @@ class Environ_Cataclysm(Environ_Base):
         super().run()
         for square in self.squares:
             for e in Effects.FIRE, Effects.ACID: # remove fire and acid from the newly created chasm tiles as they can't have these effects.
-                self.game.board[square].effects.discard(e)
+                self.game.board[square].effects &= ~e
 
 class Environ_FallingRock(Environ_Base):
     def __init__(self, squares):
@@ -2567,7 +3259,7 @@ class Environ_ConveyorBelts():
         solution = []
         while self.squaresdirs:
             for c in self.squaresdirs:
-                if self.game.board[c].getRelSquare(self.squaresdirs[c], 1) not in self.squaresdirs: # if this square does NOT push to another square that needs to be pushed...
+                if getRelSquare(c, self.squaresdirs[c], 1) not in self.squaresdirs: # if this square does NOT push to another square that needs to be pushed...
                     solution.append((c, self.squaresdirs.pop(c)))
                     break # start a new iter of squaresdirs since we can't iterate over something that changes
         self.squaresdirs = solution
@@ -2590,14 +3282,13 @@ class Environ_VekEmerge():
     def run(self):
         for square in self.squares:
             tile = self.game.board[square]
-            try:
-                tile.unit.takeEmergeDamage()
-            except AttributeError: # there was no unit
-                if (Effects.FIRE in tile.effects) or (Effects.ACID in tile.effects):
+            if tile.unit is None: # there was no unit
+                if (tile.effects & Effects.FIRE) or (tile.effects & Effects.ACID):
                     self.game.score.submit(7, 'vek_emerge_fire_or_acid')
                 else:
                     self.game.score.submit(-2, 'vek_emerge')
             else:
+                tile.unit.takeEmergeDamage()
                 self.game.flushHurt() # let the unit that took this bump damage die
     def remove(self, square):
         "remove square from self.squares, ignoring if it wasn't there in the first place. returns nothing."
@@ -2624,23 +3315,33 @@ class Environ_VekEmerge():
 # self.game will be set by the unit that owns the weapon.
 # self.wieldingunit is the unit that owns the weapon. It will be set by the unit that owns the weapon.
 # All mech weapons are assumed to be enabled whether they require power or not. If your mech has an unpowered weapon, it's totally useless to us here.
-# All weapons must have a getCopy() method that returns a copy of the object.
+# Weapons don't need a getCopy() method, Game.getCopy() copies every attribute of a weapon. Bound methods stored as attributes (like self.shoot = self.shoot_punch) are rebound to the copy.
 
-#class Weapon_Base(): XXX TODO
-#    "Weapon base object"
-#    def getCopy(self):
-#        "By default, return a new obj of the same type WITHOUT copying any of the weapon's attributes"
-#        return type(self)
+class Weapon_Base():
+    "The base class of every weapon, the base classes below are mixed in on top of it."
+    __slots__ = ('game', 'wieldingunit')
 
 # Generator base classes:
-class Weapon_DirectionalGen_Base():
+class Weapon_DirectionalGen_Base(Weapon_Base):
     "The base class for weapons that only need a direction to be shot, like projectiles."
+    __slots__ = ()
     def genShots(self):
         for d in Direction.gen():
             yield (d,)
-
-class Weapon_ArtilleryGen_Base():
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares."
+        return getLines(squares)
+    def getShotSquares(self, shot):
+        "return a tuple of the squares that shot from genShots() is aimed at, nearest the wielder first."
+        return RAYS[self.wieldingunit.square][shot[0]][1:]
+    def canShoot(self, direction):
+        """return False if shooting in direction is sure to raise NullWeaponShot, True if it might not. This never changes the game.
+        Directional weapons can't shoot off the edge of the board. Weapons that can, or that have other ways of being invalid, override this."""
+        return len(RAYS[self.wieldingunit.square][direction]) > 1
+
+class Weapon_ArtilleryGen_Base(Weapon_Base):
     "The generator for artillery weapons."
+    __slots__ = ()
     def genShots(self, minimumdistance=2):
         """Generate every possible shot that the weapon wielder can take from their position with an artillery weapon.
         Yields a tuple of ((x, y), direction). x, y are the coordinates where the weapon should strike and direction is the direction the weapon is being fired.
@@ -2650,151 +3351,211 @@ class Weapon_ArtilleryGen_Base():
         for direction in Direction.gen():
             relativedistance = minimumdistance  # artillery weapons can't shoot the tile next to them, they start at one tile past that.
             while True:
-                targetsquare = self.game.board[self.wieldingunit.square].getRelSquare(direction, relativedistance)
+                targetsquare = getRelSquare(self.wieldingunit.square, direction, relativedistance)
                 if targetsquare:
                     yield (targetsquare, direction)
                     relativedistance += 1
                 else:  # square was false, we went off the board
                     break  # move onto the next direction
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares."
+        return getLines(squares)
+    def getShotSquares(self, shot):
+        "return a tuple of the squares that shot from genShots() is aimed at."
+        return (shot[0],)
+    def canShoot(self, targetsquare, direction):
+        "return False if this shot is sure to raise NullWeaponShot, True if it might not. Every shot from genShots() is on the board, so this is True unless a weapon overrides it."
+        return True
 
-class Weapon_NoChoiceGen_Base():
+class Weapon_NoChoiceGen_Base(Weapon_Base):
     "A generator for weapons that give you no options of how you can fire it, e.g. Repulse, Self-destruct"
+    __slots__ = ()
     def genShots(self):
         yield ()
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. These weapons only hit the wielder's square."
+        return set(squares)
+    def getShotSquares(self, shot):
+        "return a tuple of the squares that shot from genShots() is aimed at, which is only the wielder's."
+        return (self.wieldingunit.square,)
+    def canShoot(self):
+        "return False if the shot is sure to raise NullWeaponShot, True if it might not. There's only one shot, so this is True unless a weapon overrides it."
+        return True
 
 class Weapon_RangedGen_Base(Weapon_DirectionalGen_Base):
     "A generator for weapons with a limited range. The weapon must use self.range and check to make sure the destination square exists."
+    __slots__ = ()
     def genShots(self):
         for d in super().genShots():
             for r in range(1, self.range+1):
                 yield (d[0], r)
-
-class Weapon_MirrorGen_Base():
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. It can't hit anything further away than self.range."
+        return getLines(squares, self.range)
+    def getShotSquares(self, shot):
+        "return a tuple of the squares that shot from genShots() is aimed at. It's empty if the shot lands off the board."
+        ray = RAYS[self.wieldingunit.square][shot[0]]
+        if shot[1] < len(ray):
+            return (ray[shot[1]],)
+        return ()
+    def canShoot(self, direction, distance):
+        "return False if this shot is sure to raise NullWeaponShot, True if it might not. This never changes the game. Ranged weapons can't shoot past the edge of the board."
+        return distance < len(RAYS[self.wieldingunit.square][direction])
+
+class Weapon_MirrorGen_Base(Weapon_Base):
     "A base class for weapons that shoot out of both sides of the wielder"
+    __slots__ = ()
     def genShots(self):
         "There are only 2 possible shots here since it shoots out of both sides at once. Being in a corner can't invalidate a shot."
         yield (Direction.UP,)
         yield (Direction.RIGHT,)
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares."
+        return getLines(squares)
+    def getShotSquares(self, shot):
+        "return a tuple of the squares that shot from genShots() is aimed at on both sides of the wielder, nearest the wielder first."
+        rays = RAYS[self.wieldingunit.square]
+        return rays[shot[0]][1:] + rays[Direction.opposite(shot[0])][1:]
+    def canShoot(self, direction):
+        "return False if shooting out of both sides of the wielder is sure to raise NullWeaponShot, True if it might not. This is True unless a weapon overrides it."
+        return True
 
-class Weapon_AnyTileGen_Base():
+class Weapon_AnyTileGen_Base(Weapon_Base):
+    __slots__ = ()
     def genShots(self):
         "A generator that can target any square on the board."
         for x in range(1, 9):
             for y in range(1, 9):
                 yield (x, y)
+    def getReach(self, squares):
+        "return None since this weapon can hit any square."
+        return None
+    def getShotSquares(self, shot):
+        "return a tuple of the squares that shot from genShots() is aimed at. The shot is the square itself."
+        return (shot,)
+    def canShoot(self, x, y):
+        "return False if this shot is sure to raise NullWeaponShot, True if it might not. This is True unless a weapon overrides it."
+        return True
 
 # Low-level shared weapon functionality:
-class Weapon_hurtAndPush_Base():
+class Weapon_hurtAndPush_Base(Weapon_Base):
     "A base class for weapons that need to hurt and push a unit."
+    __slots__ = ()
     def _hurtAndPush(self, square, direction, damage):
         """have a tile takeDamage() from damage and get pushed.
         It's important to use this when you have to push and attack a unit at the same time, otherwise a unit could gain effects from the damaged tile it was pushed off of.
         This will raise NullWeaponShot if square is not on the board.
         This base should not be used by a weapon directly, but only by the 2 others below.
         returns nothing."""
-        try: # damage the unit directly, not the tile
-            if self.game.board[square].unit.takeDamage(damage):
-                raise AttributeError
-        except AttributeError: # there was no unit or there was an unshielded unit
-            dmgtile = True
-        except KeyError: # game.board[False]
+        if square not in self.game.board: # square is False
             raise NullWeaponShot # invalid shot detected
-        else: # The unit had a shield or ice and protected the tile
-            dmgtile = False
+        unit = self.game.board[square].unit
+        if unit is None: # there was no unit
+            dmgtile = True
+        else: # damage the unit directly, not the tile
+            dmgtile = unit.takeDamage(damage) # the unit returns False if it had a shield or ice and protected the tile
         self.game.board[square].push(direction) # now push it
         if dmgtile:
             self.game.board[square]._tileTakeDamage() # now the tile is directly hurt after the unit's been pushed so it doesn't pick up bad effects.
 
 class Weapon_hurtAndPushEnemy_Base(Weapon_hurtAndPush_Base):
+    __slots__ = ()
     def _hurtAndPushEnemy(self, square, direction):
         "Hurt and push an enemy dealing self.damage damage to them."
         super()._hurtAndPush(square, direction, self.damage)
 
 class Weapon_hurtAndPushSelf_Base(Weapon_hurtAndPush_Base):
     "A base class for weapons that need to hurt and push themselves."
+    __slots__ = ()
     def _hurtAndPushSelf(self, square, direction):
-        "have a tile takeDamage() from self.damage and get pushed. This will raise KeyError if square is not on the board."
+        "have a tile takeDamage() from self.damage and get pushed. This will raise NullWeaponShot if square is not on the board."
         super()._hurtAndPush(square, direction, self.selfdamage)
 
-class Weapon_getSquareOfUnitInDirection_Base():
+class Weapon_getSquareOfUnitInDirection_Base(Weapon_Base):
+    __slots__ = ()
     def _getSquareOfUnitInDirection(self, direction, edgeok=False, startrel=1):
         """Travel from the weapon wielder's tile in direction, returning the square of the first unit we find.
         If none is found, return False.
         If none is found and edgeok is True, return the square on the edge of the board.
         startrel is which relative tile to start on by default. Most weapons use 1, but the grappling hook can't grab a unit that's already next to it."""
-        targetsquare = self.game.board[self.wieldingunit.square].getRelSquare(direction, startrel)  # start the projectile at square in direction from the unit that used the weapon...
-        if not targetsquare:
+        ray = RAYS[self.wieldingunit.square][direction]
+        if startrel >= len(ray):
             raise NullWeaponShot # the first square we tried to get was off the board, this is an invalid shot.
-        while True:
-            try:
-                if self.game.board[targetsquare].unit:
-                    return targetsquare  # found the unit
-            except KeyError:  # raised from if game.board[False].unit: targetsquare being false means we never found a unit and went off the board
-                if edgeok:
-                    return lasttargetsquare
-                return False
-            lasttargetsquare = targetsquare
-            targetsquare = self.game.board[targetsquare].getRelSquare(direction, 1)  # the next tile in direction of the last square
+        targetsquare = self.game.getFirstUnitSquare(ray[startrel - 1], direction) # start the projectile at square in direction from the unit that used the weapon...
+        if targetsquare:
+            return targetsquare # found the unit
+        if edgeok:
+            return ray[-1]
+        return False
+    def _hasUnitInDirection(self, direction, startrel=1):
+        "return True if _getSquareOfUnitInDirection() would find a unit, False if it wouldn't or would raise NullWeaponShot. This never changes the game."
+        ray = RAYS[self.wieldingunit.square][direction]
+        return startrel < len(ray) and bool(self.game.getFirstUnitSquare(ray[startrel - 1], direction))
 
-class Weapon_getRelSquare_Base():
+class Weapon_getRelSquare_Base(Weapon_Base):
     "A base class that provides a helper method to get the relative square from the weaponwielder"
+    __slots__ = ()
     def _getRelSquare(self, direction, distance):
         "return the target square in direction and distance of wieldingunit. returns false if it's off the board."
-        return self.game.board[self.wieldingunit.square].getRelSquare(direction, distance)
+        return getRelSquare(self.wieldingunit.square, direction, distance)
 
-class Weapon_IncreaseDamageWithPowerInit_Base():
+class Weapon_IncreaseDamageWithPowerInit_Base(Weapon_Base):
     "A base class that increases self.damage by 1 for each power that present. self.damage must be set by the child class first."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False):
         for p in power1, power2:
             if p:
                 self.damage += 1
 
-class Weapon_PushAdjacent_Base():
+class Weapon_PushAdjacent_Base(Weapon_Base):
     "A base class that provides a method to push all tiles around a target."
+    __slots__ = ()
     def _pushAdjacent(self, targetsquare):
         for d in Direction.gen(): # push all the tiles around targetsquare
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(d, 1)].push(d)
-            except KeyError: # game.board[False]
-                pass
+            sq = getRelSquare(targetsquare, d, 1)
+            if sq:
+                self.game.board[sq].push(d)
 
 class Weapon_hurtPushAdjacent_Base(Weapon_hurtAndPushEnemy_Base):
     "A base class that provides a method to hurt and push all tiles around a target."
+    __slots__ = ()
     def _hurtPushAdjacent(self, targetsquare):
         for d in Direction.gen(): # push all the tiles around targetsquare
-            try:
-                self._hurtAndPushEnemy(square=self.game.board[targetsquare].getRelSquare(d, 1), direction=d)
-            except (KeyError, NullWeaponShot): # raised from game.board[False] trying to hurt and push off the board or the relative square being False inside of _hurtAndPush(), just ignore it and continue
-                pass
+            sq = getRelSquare(targetsquare, d, 1)
+            if sq: # don't hurt and push off the board
+                self._hurtAndPushEnemy(square=sq, direction=d)
 
 class Weapon_FartSmoke_Base(Weapon_getRelSquare_Base):
+    __slots__ = ()
     def _fartSmoke(self, shotdirection):
         "smoke the tile behind the weapon wielder. Ignore errors if that would be off-board"
-        try:
-            self.game.board[self._getRelSquare(Direction.opposite(shotdirection), 1)].applySmoke()
-        except KeyError: # self.game.board[False].applySmoke()
-            pass # totally fine, if your butt is against the wall you just don't fart out any smoke
+        sq = self._getRelSquare(Direction.opposite(shotdirection), 1)
+        if sq: # if your butt is against the wall you just don't fart out any smoke
+            self.game.board[sq].applySmoke()
 
-class Weapon_NoUpgradesInit_Base():
+class Weapon_NoUpgradesInit_Base(Weapon_Base):
     "an init that ignores power upgrades passed to it for use with weapons lacking upgrade options."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False):
         pass
 
-class Weapon_NoUpgradesLimitedInit_Base():
+class Weapon_NoUpgradesLimitedInit_Base(Weapon_Base):
     "an init that ignores power upgrades passed to it for use with weapons lacking upgrade options and have a limited amount of uses."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
 
-class Weapon_PushProjectile_Base():
+class Weapon_PushProjectile_Base(Weapon_Base):
+    __slots__ = ()
     def _pushProjectile(self, direction, targetsquare):
         "Push targetsquare all directions except for the one the shot came from."
         for d in list(Direction.genPerp(direction)) + [direction]:  # push all BUT ONE of the tiles around targetsquare. The excluded tile is the one opposite the direction of fire
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(d, 1)].push(d)
-            except KeyError:  # game.board[False]
-                pass
+            sq = getRelSquare(targetsquare, d, 1)
+            if sq:
+                self.game.board[sq].push(d)
 
-class Weapon_LimitedUnlimitedInit_Base():
+class Weapon_LimitedUnlimitedInit_Base(Weapon_Base):
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         "an init where power1 provides infinite uses and power2 does nothing."
         if power1:
@@ -2802,8 +3563,9 @@ class Weapon_LimitedUnlimitedInit_Base():
         else:
             self.ammo = ammo
 
-class Weapon_SpendAmmo_Base():
+class Weapon_SpendAmmo_Base(Weapon_Base):
     "Provides a method to spend limited ammo."
+    __slots__ = ()
     def _spendAmmo(self):
         "Spend ammo if we have it, raise OutOfAmmo if we don't."
         if self.ammo == 0:
@@ -2811,36 +3573,35 @@ class Weapon_SpendAmmo_Base():
         self.ammo -= 1
 
 class Weapon_DeploySelfEffectLimitedSmall_Base(Weapon_SpendAmmo_Base):
+    __slots__ = ()
     def shoot(self, methname):
         "A shared shoot method for weapons that deploy an effect on themselves and to tiles around the weapon wielder. methname is a string of the effect method to call like 'applySmoke'"
         self._spendAmmo()
         getattr(self.game.board[self.wieldingunit.square], methname)() # do the effect on yourself
         for dir in Direction.gen():
-            try:
-                getattr(self.game.board[self._getRelSquare(dir, 1)], methname)()
-            except KeyError: # board[False]
-                pass
+            sq = self._getRelSquare(dir, 1)
+            if sq:
+                getattr(self.game.board[sq], methname)()
 
 class Weapon_DeploySelfEffectLimitedLarge_Base(Weapon_SpendAmmo_Base):
+    __slots__ = ()
     def shoot_big(self, methname):
         "A shared shoot method for weapons that deploy an effect on themselves and to a larger area of tiles around the weapon wielder. methname is a string of the effect method to call like 'applySmoke'"
         self._spendAmmo()
         getattr(self.game.board[self.wieldingunit.square], methname)() # do it to yourself first
         for dir in Direction.gen():
             branchsq = self._getRelSquare(dir, 1)
-            try:
-                getattr(self.game.board[branchsq], methname)()
-            except KeyError:  # board[False]
+            if not branchsq:
                 continue  # if the branch square was off the board, no point in try ones further than it and next to it, continue in the next direction
-            else:  # branch was valid, so now we hit one tile in the same direction and one tile clockwise of it
-                for d in dir, Direction.getClockwise(dir):
-                    try:
-                        getattr(self.game.board[self.game.board[branchsq].getRelSquare(d, 1)], methname)()
-                    except KeyError:  # board[False]
-                        pass  # this is fine
-
-class Weapon_BlocksBeamShot_Base():
+            getattr(self.game.board[branchsq], methname)()
+            for d in dir, Direction.getClockwise(dir): # branch was valid, so now we hit one tile in the same direction and one tile clockwise of it
+                sq = getRelSquare(branchsq, d, 1)
+                if sq:
+                    getattr(self.game.board[sq], methname)()
+
+class Weapon_BlocksBeamShot_Base(Weapon_Base):
     "Provides a method shared by BurstBeam and BKRBeam used by bots"
+    __slots__ = ()
     def blocksBeamShot(self, unit):
         "Return True if unit will block a beam shot that usually penetrates, False if we can penetrate through it."
         try:
@@ -2851,6 +3612,7 @@ class Weapon_BlocksBeamShot_Base():
 # High level weapon bases:
 class Weapon_Charge_Base(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_Base, Weapon_getSquareOfUnitInDirection_Base):
     "The base class for charge weapons."
+    __slots__ = ()
     def shoot(self, direction):
         "return True if we hit a unit (in case wielder needs to take self-damage) False if there was no unit and the wielder only moved."
         victimtile = self._getSquareOfUnitInDirection(direction, edgeok=False)
@@ -2860,14 +3622,16 @@ class Weapon_Charge_Base(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_Bas
             self.game.board[self.wieldingunit.square].moveUnit(self.game.board[self.wieldingunit.square].getEdgeSquare(direction)) # move the wielder to victimtile which is the edge of the board
             return False
         else: # victimtile was actually a tile and we hurt and push the unit there
-            self.game.board[self.wieldingunit.square].moveUnit(self.game.board[victimtile].getRelSquare(Direction.opposite(direction), 1)) # move wielder to the square before the victimsquare
+            self.game.board[self.wieldingunit.square].moveUnit(getRelSquare(victimtile, Direction.opposite(direction), 1)) # move wielder to the square before the victimsquare
             return True
 
 class Weapon_Projectile_Base(Weapon_DirectionalGen_Base, Weapon_getSquareOfUnitInDirection_Base):
     "The base class for Projectile weapons."
+    __slots__ = ()
 
-class Weapon_HydraulicLegsUnstableInit_Base():
+class Weapon_HydraulicLegsUnstableInit_Base(Weapon_Base):
     "init shared by Hydraulic Legs and Unstable Cannon."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False):
         self.selfdamage = 1
         self.damage = 1
@@ -2877,13 +3641,15 @@ class Weapon_HydraulicLegsUnstableInit_Base():
         if power2:
             self.damage += 1
 
-class Weapon_Punch_Base():
+class Weapon_Punch_Base(Weapon_Base):
     "shoot_punch method shared by TitanFist, RocketFist, and MantisSlash"
+    __slots__ = ()
     def shoot_punch(self, direction):
-        self._hurtAndPushEnemy(self.game.board[self.wieldingunit.square].getRelSquare(direction, 1), direction)
+        self._hurtAndPushEnemy(getRelSquare(self.wieldingunit.square, direction, 1), direction)
 
 class Weapon_RangedAttack_Base(Weapon_RangedGen_Base, Weapon_hurtAndPushEnemy_Base, Weapon_getRelSquare_Base):
     "A base class for weapons that attack in a limited range and push the last square like NeedleShot and PrimeSpear. FlameThrower is too special to use this."
+    __slots__ = ()
     def shoot(self, direction, distance):
         "returns a tuple of (unit, square) where unit is the unit that was pushed from the last square, square is that square that was hit."
         hitsquares = []  # a list of squares to damage. Build the list first so we can determine if this is an invalid shot
@@ -2901,29 +3667,26 @@ class Weapon_RangedAttack_Base(Weapon_RangedGen_Base, Weapon_hurtAndPushEnemy_Ba
 
 class Weapon_TemperatureBeam_Base(Weapon_DirectionalGen_Base, Weapon_SpendAmmo_Base):
     "A base class for both the FireBeam and FrostBeam."
+    __slots__ = ('ammo', 'effectmeth')
     def __init__(self, power1=False, power2=False, ammo=1, effectmeth=None):
         "effectmeth must be a string of either applyFire or applyIce"
         self.ammo = ammo # power1 and 2 ignored for this weapon
         self.effectmeth = effectmeth
     def shoot(self, direction):
-        currenttarget = self.game.board[self.wieldingunit.square].getRelSquare(direction, 1)
+        currenttarget = getRelSquare(self.wieldingunit.square, direction, 1)
         if not currenttarget: # first square attacked was offboard and therefor
             raise NullWeaponShot
         self._spendAmmo()
-        while True:
-            try:
-                getattr(self.game.board[currenttarget], self.effectmeth)()
-            except KeyError: # board[False]
-                return # went off the board, we lit everything up
-            try:
-                if self.game.board[currenttarget].unit.isBuilding() or self.game.board[currenttarget].unit.isMountain():
-                    return # buildings and mountains end the shot
-            except AttributeError: # None.isBuilding()
-                pass # continue on
-            currenttarget = self.game.board[currenttarget].getRelSquare(direction, 1)
+        while currenttarget: # until it goes off the board, lighting everything up
+            getattr(self.game.board[currenttarget], self.effectmeth)()
+            unit = self.game.board[currenttarget].unit
+            if unit is not None and (unit.isBuilding() or unit.isMountain()):
+                return # buildings and mountains end the shot
+            currenttarget = getRelSquare(currenttarget, direction, 1)
 
 class Weapon_Deployable_Base(Weapon_ArtilleryGen_Base, Weapon_SpendAmmo_Base):
     "methods shared by weapons that deploy small tanks"
+    __slots__ = ('ammo', 'hp', 'power2')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.hp = 1 # the deployed tank's HP
@@ -2935,6 +3698,12 @@ class Weapon_Deployable_Base(Weapon_ArtilleryGen_Base, Weapon_SpendAmmo_Base):
         for i in super().genShots():
             if not self.game.board[i[0]].isSwallow():
                 yield i
+    def getReach(self, squares):
+        "return None since the deployed tank is a new unit that can be hurt anywhere its shot lands."
+        return None
+    def canShoot(self, targetsquare, direction):
+        "return False if targetsquare is occupied since a tank can't be deployed there, True if it isn't."
+        return self.game.board[targetsquare].unit is None
     def shoot(self, targetsquare, unit): # this should only ever be called by child objects so the non-standard arg should be fine
         if self.game.board[targetsquare].unit:
             raise NullWeaponShot # can't deploy a tank to an occupied square
@@ -2943,13 +3712,20 @@ class Weapon_Deployable_Base(Weapon_ArtilleryGen_Base, Weapon_SpendAmmo_Base):
 
 class Weapon_AcidGun_Base(Weapon_Projectile_Base):
     "Shared shoot method for AcidProjector and AcidShot"
+    __slots__ = ()
+    def canShoot(self, direction):
+        "return False if the shot would go off the board or hit a mountain, True if it wouldn't."
+        ray = RAYS[self.wieldingunit.square][direction]
+        if len(ray) == 1:
+            return False
+        targetsquare = self.game.getFirstUnitSquare(ray[0], direction)
+        return not targetsquare or not self.game.board[targetsquare].unit.isMountain()
     def shoot(self, direction, push=True):
         targetsquare = self._getSquareOfUnitInDirection(direction, edgeok=True)
-        try:
-            if self.game.board[targetsquare].unit.isMountain():
-                raise NullWeaponShot # Mountains can't get acid and don't leave any on the ground after being destroyed
-        except AttributeError: # there was no unit
+        if self.game.board[targetsquare].unit is None: # there was no unit
             self.game.board[targetsquare].applyAcid() # give it to the tile instead
+        elif self.game.board[targetsquare].unit.isMountain():
+            raise NullWeaponShot # Mountains can't get acid and don't leave any on the ground after being destroyed
         else: # unit needs to be hit with acid
             try:
                 self.game.board[targetsquare].unit.applyAcid(True) # directly give the unit acid, ice and shield won't prevent you from getting acid from the gun unlike when you move to an acid pool.
@@ -2962,17 +3738,28 @@ class Weapon_AcidGun_Base(Weapon_Projectile_Base):
 class Weapon_TitanFist(Weapon_Charge_Base, Weapon_Punch_Base):
     """Combat mech's default weapon.
     Dashing does not damage the edge tile if it doesn't come in contact with a unit like projectiles do."""
+    __slots__ = ('damage', 'shoot')
     def __init__(self, power1=False, power2=False):
         super().__init__()
-        if not power1: # Weapon_Charge_Base already has self.shoot set to the charge attack
+        if power1:
+            self.shoot = self.shoot_charge
+        else:
             self.shoot = self.shoot_punch
         if power2: # increase damage by 2
             self.damage = 4
         else: # it's 2 by default
             self.damage = 2
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. A punch only hits the square next to the wielder, a charge can go all the way across the board."
+        if self.shoot == self.shoot_punch:
+            return getArea(squares, 1)
+        return getLines(squares)
+    def shoot_charge(self, direction):
+        super().shoot(direction)
 
 class Weapon_TaurusCannon(Weapon_Projectile_Base, Weapon_hurtAndPushEnemy_Base, Weapon_IncreaseDamageWithPowerInit_Base):
     "Cannon Mech's default weapon."
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         super().__init__(power1, power2)
@@ -2981,6 +3768,7 @@ class Weapon_TaurusCannon(Weapon_Projectile_Base, Weapon_hurtAndPushEnemy_Base,
 
 class Weapon_ArtemisArtillery(Weapon_ArtilleryGen_Base, Weapon_PushAdjacent_Base):
     "Artillery Mech's default weapon."
+    __slots__ = ('_buildingsimmune', 'damage')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         if power1:
@@ -2991,12 +3779,8 @@ class Weapon_ArtemisArtillery(Weapon_ArtilleryGen_Base, Weapon_PushAdjacent_Base
             self.damage += 2
     def shoot(self, targetsquare, direction):
         "Shoot in direction distance number of tiles. Artillery can never shoot 1 tile away from the wielder."
-        try:
-            if self._buildingsimmune and self.game.board[targetsquare].unit.isBuilding(): # if buildings are immune and the target is a building..
-                pass # don't damage the target
-            else:
-                raise AttributeError
-        except AttributeError: # None.isBuilding(), there was no unit there or manually raised because buildings aren't immune or the unit there isn't a building
+        unit = self.game.board[targetsquare].unit
+        if not (self._buildingsimmune and unit is not None and unit.isBuilding()): # if buildings are immune and the target is a building, don't damage the target
             self.game.board[targetsquare].takeDamage(self.damage)
         self._pushAdjacent(targetsquare) # now push all the tiles around targetsquare regardless
 
@@ -3016,6 +3800,7 @@ class Weapon_BurstBeam(Weapon_DirectionalGen_Base, Weapon_BlocksBeamShot_Base):
         satellite rocket
         acid vat
         dam"""
+    __slots__ = ('allyimmune', 'damage')
     def __init__(self, power1=False, power2=False):
         self.damage = 3
         if power1:
@@ -3026,11 +3811,11 @@ class Weapon_BurstBeam(Weapon_DirectionalGen_Base, Weapon_BlocksBeamShot_Base):
             self.damage += 1
     def shoot(self, direction):
         currentdamage = self.damage # damage being dealt as the beam travels. This decreases the further we go until we reach 1
-        try:
-            targettile = self.game.board[self.game.board[self.wieldingunit.square].getRelSquare(direction, 1)]  # get the target tile, not square
-        except KeyError:  # self.game.board[False] means we went off the board
-            raise NullWeaponShot
-        while True:
+        ray = RAYS[self.wieldingunit.square][direction]
+        if len(ray) == 1:
+            raise NullWeaponShot # the wielder is on the edge of the board facing off of it
+        for square in ray[1:]: # every tile in the beam's way takes damage, so they can't be skipped with game.occupied
+            targettile = self.game.board[square]  # get the target tile, not square
             if self.allyimmune and self.is_beamally(targettile.unit):
                 pass # no damage
             else:
@@ -3039,10 +3824,6 @@ class Weapon_BurstBeam(Weapon_DirectionalGen_Base, Weapon_BlocksBeamShot_Base):
                 break
             if currentdamage != 1:
                 currentdamage -= 1
-            try:
-                targettile = self.game.board[self.game.board[targettile.square].getRelSquare(direction, 1)] # get the target tile, not square
-            except KeyError: # self.game.board[False] means we went off the board
-                break # no more pew pew
     def is_beamally(self, unit):
         "return True if unit is considered an ally to the beam weapon when it has the first upgrade powered."
         try:
@@ -3052,6 +3833,7 @@ class Weapon_BurstBeam(Weapon_DirectionalGen_Base, Weapon_BlocksBeamShot_Base):
 
 class Weapon_RammingEngines(Weapon_Charge_Base):
     "Charge Mech's default weapon."
+    __slots__ = ('damage', 'selfdamage')
     def __init__(self, power1=False, power2=False):
         self.selfdamage = 1
         self.damage = 2
@@ -3066,16 +3848,21 @@ class Weapon_RammingEngines(Weapon_Charge_Base):
 
 class Weapon_AttractionPulse(Weapon_DirectionalGen_Base, Weapon_getSquareOfUnitInDirection_Base):
     "Defense Mech's first default primary weapon."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False):
         pass # this weapon has no power upgrades
+    def canShoot(self, direction):
+        "return False if there's no unit in direction to pull, True if there is."
+        return self._hasUnitInDirection(direction)
     def shoot(self, direction):
-        try:
-            self.game.board[self._getSquareOfUnitInDirection(direction, edgeok=False)].push(Direction.opposite(direction))
-        except KeyError: # raised by self.game.board[False]...
+        targetsquare = self._getSquareOfUnitInDirection(direction, edgeok=False)
+        if not targetsquare: # there was no unit to pull
             raise NullWeaponShot
+        self.game.board[targetsquare].push(Direction.opposite(direction))
 
 class Weapon_ShieldProjector(Weapon_ArtilleryGen_Base, Weapon_getRelSquare_Base, Weapon_SpendAmmo_Base): # does not use the artillery base since we need the limited generator
     "The default second weapon for the Defense Mech."
+    __slots__ = ('ammo', 'bigarea')
     def __init__(self, power1=False, power2=False, ammo=2):
         self.ammo = ammo
         # power1 adds another use, but we ignore that here because this simulation could be in the middle of a map where ammo could be anything.
@@ -3090,18 +3877,17 @@ class Weapon_ShieldProjector(Weapon_ArtilleryGen_Base, Weapon_getRelSquare_Base,
         self.game.board[targetsquare].applyShield() # the target tile itself is shielded
         if self.bigarea:
             for d in Direction.gen(): # do all tiles around the target if we have the +3 area upgrade
-                try:
-                    self.game.board[self.game.board[targetsquare].getRelSquare(d, 1)].applyShield()
-                except KeyError:
-                    pass # tried to shield off the board
+                sq = getRelSquare(targetsquare, d, 1)
+                if sq: # don't try to shield off the board
+                    self.game.board[sq].applyShield()
         else:
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(direction, 1)].applyShield() # just shield one tile past the target in the same direction
-            except KeyError:
-                pass # tried to shield off the board
+            sq = getRelSquare(targetsquare, direction, 1)
+            if sq: # just shield one tile past the target in the same direction
+                self.game.board[sq].applyShield()
 
 class Weapon_ViceFist(Weapon_getRelSquare_Base, Weapon_DirectionalGen_Base):
     "The default weapon for the Judo mech"
+    __slots__ = ('allyimmune', 'damage')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         if power1:
@@ -3110,31 +3896,37 @@ class Weapon_ViceFist(Weapon_getRelSquare_Base, Weapon_DirectionalGen_Base):
             self.allyimmune = False
         if power2:
             self.damage += 2
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. It grabs a unit next to the wielder and tosses it to the square on the other side."
+        return getArea(squares, 1)
+    def canShoot(self, direction):
+        "return False if there's no unit to toss in direction, it's stable or the square it would be tossed to is off the board or occupied. True otherwise."
+        destsquare = self._getRelSquare(Direction.opposite(direction), 1)
+        targetsquare = self._getRelSquare(direction, 1)
+        if not destsquare or not targetsquare or self.game.board[destsquare].unit:
+            return False
+        targetunit = self.game.board[targetsquare].unit
+        return targetunit is not None and not targetunit.attributes & Attributes.STABLE
     def shoot(self, direction):
         destsquare = self._getRelSquare(Direction.opposite(direction), 1) # where the tossed unit lands
-        try:
-            if self.game.board[destsquare].unit: # can't toss a unit to an occupied tile
-                raise NullWeaponShot
-        except AttributeError: # False.unit, square was invalid
+        if not destsquare or self.game.board[destsquare].unit: # can't toss a unit off the board or to an occupied tile
             raise NullWeaponShot
         targetsquare = self._getRelSquare(direction, 1) # the tile where the victim is grabbed
-        try:
-            if Attributes.STABLE in self.game.board[targetsquare].unit.attributes: # if target unit is stable...
-                raise NullWeaponShot # we can't toss it
-        except (KeyError, AttributeError):  # either the target square was off the board or there was no unit
+        if not targetsquare or self.game.board[targetsquare].unit is None: # either the target square was off the board or there was no unit
             raise NullWeaponShot
+        if self.game.board[targetsquare].unit.attributes & Attributes.STABLE: # if target unit is stable...
+            raise NullWeaponShot # we can't toss it
         # now that we're here, we're sure we have a valid shot
         self.game.board[targetsquare].moveUnit(destsquare) # move the unit from the attack direction to the other side of the wielder
-        try:
-            if self.allyimmune and self.game.board[destsquare].unit.alliance == Alliance.FRIENDLY:
-                pass # no damage to friendlies if allies are immune
-            else:
-                self.game.board[destsquare].takeDamage(self.damage)
-        except AttributeError: # raised from None.alliance. This happens when you throw the unit into a chasm or such and it immediately dies
-            pass # unit died, no point in damaging the tile that killed it.
+        unit = self.game.board[destsquare].unit
+        if unit is None: # This happens when you throw the unit into a chasm or such and it immediately dies
+            return # unit died, no point in damaging the tile that killed it.
+        if not (self.allyimmune and unit.alliance == Alliance.FRIENDLY): # no damage to friendlies if allies are immune
+            self.game.board[destsquare].takeDamage(self.damage)
 
 class Weapon_ClusterArtillery(Weapon_ArtilleryGen_Base, Weapon_hurtAndPushEnemy_Base):
     "Default weapon for Siege Mech."
+    __slots__ = ('_buildingsimmune', 'damage')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         if power1:
@@ -3145,7 +3937,7 @@ class Weapon_ClusterArtillery(Weapon_ArtilleryGen_Base, Weapon_hurtAndPushEnemy_
             self.damage += 1
     def shoot(self, targetsquare, direction):
         for d in Direction.gen(): # targetsquare indicates where the shot landed. Nothing actually happens on this tile for this weapon, it's all around it instead.
-            currenttargetsquare = self.game.board[targetsquare].getRelSquare(d, 1) # set the square we're working on
+            currenttargetsquare = getRelSquare(targetsquare, d, 1) # set the square we're working on
             try:
                 if self._buildingsimmune and self.game.board[currenttargetsquare].unit.isBuilding(): # if buildings are immune and the unit taking damage is a building...
                     pass # don't damage it
@@ -3156,6 +3948,7 @@ class Weapon_ClusterArtillery(Weapon_ArtilleryGen_Base, Weapon_hurtAndPushEnemy_
 
 class Weapon_GravWell(Weapon_ArtilleryGen_Base):
     "Default first weapon for Gravity Mech"
+    __slots__ = ()
     def __init__(self, power1=False, power2=False):
         pass # grav well can't be upgraded at all
     def shoot(self, targetsquare, direction):
@@ -3163,6 +3956,7 @@ class Weapon_GravWell(Weapon_ArtilleryGen_Base):
 
 class Weapon_SpartanShield(Weapon_DirectionalGen_Base, Weapon_getRelSquare_Base):
     "Default weapon of the Aegis Mech"
+    __slots__ = ('damage', 'gainshield')
     def __init__(self, power1=False, power2=False):
         self.damage = 2
         if power1:
@@ -3171,30 +3965,37 @@ class Weapon_SpartanShield(Weapon_DirectionalGen_Base, Weapon_getRelSquare_Base)
             self.gainshield = False
         if power2:
             self.damage += 1
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. The shield only bashes the square next to the wielder."
+        return getArea(squares, 1)
     def shoot(self, direction):
         targetsquare = self._getRelSquare(direction, 1)
-        try:
-            self.game.board[targetsquare].takeDamage(self.damage)
-        except KeyError: # board[False]
+        if not targetsquare:
             raise NullWeaponShot
-        try:
-            self.game.board[targetsquare].unit.weapon1.flip()
-        except AttributeError: # None.weapon1 or weapon1.flip() where flip doesn't exist like a friendly
-            pass
+        self.game.board[targetsquare].takeDamage(self.damage)
+        flip = getattr(getattr(self.game.board[targetsquare].unit, 'weapon1', None), 'flip', None) # None if there's no unit or its weapon can't be flipped like a friendly
+        if flip is not None:
+            flip()
         if self.gainshield:
             self.wieldingunit.applyShield()
 
 class Weapon_JanusCannon(Weapon_getSquareOfUnitInDirection_Base, Weapon_hurtAndPushEnemy_Base, Weapon_IncreaseDamageWithPowerInit_Base, Weapon_MirrorGen_Base):
     "Default weapon for Mirror Mech"
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         super().__init__(power1, power2)
+    def canShoot(self, direction):
+        "return False if either side of the wielder is the edge of the board, True if neither is."
+        rays = RAYS[self.wieldingunit.square]
+        return len(rays[direction]) > 1 and len(rays[Direction.opposite(direction)]) > 1
     def shoot(self, direction):
         for d in direction, Direction.opposite(direction):
             self._hurtAndPushEnemy(self._getSquareOfUnitInDirection(d, edgeok=True), d)
 
 class Weapon_CryoLauncher(Weapon_ArtilleryGen_Base):
     "Default weapon for the Ice mech"
+    __slots__ = ()
     def __init__(self, power1=False, power2=False):
         pass # cryolauncher doesn't take power
     def shoot(self, targetsquare, direction):
@@ -3204,6 +4005,7 @@ class Weapon_CryoLauncher(Weapon_ArtilleryGen_Base):
 
 class Weapon_AerialBombs(Weapon_getRelSquare_Base, Weapon_RangedGen_Base):
     "Default weapon for the Jet mech."
+    __slots__ = ('damage', 'range')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         self.range = 1 # how many tiles you can jump over and damage. Unit lands on the tile after this distance.
@@ -3211,23 +4013,28 @@ class Weapon_AerialBombs(Weapon_getRelSquare_Base, Weapon_RangedGen_Base):
             self.damage += 1
         if power2:
             self.range += 1
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. The wielder lands one square past the range it bombs."
+        return getLines(squares, self.range + 1)
+    def canShoot(self, direction, distance):
+        "return False if the square to land on is off the board or occupied, True if it isn't."
+        ray = RAYS[self.wieldingunit.square][direction]
+        return distance + 1 < len(ray) and self.game.board[ray[distance + 1]].unit is None
     def shoot(self, direction, distance):
         "distance is the number of squares to jump over and damage. The wielder lands on one square past distance."
         destsquare = self._getRelSquare(direction, distance+1)
-        try:
-            if self.game.board[destsquare].unit:
-                raise NullWeaponShot # can't land on an occupied square
-        except KeyError: # landing spot was off the board
+        if not destsquare or self.game.board[destsquare].unit: # can't land off the board or on an occupied square
             raise NullWeaponShot
         targetsquare = self.wieldingunit.square # start where the unit is
         for r in range(distance):
-            targetsquare = self.game.board[targetsquare].getRelSquare(direction, 1)
+            targetsquare = getRelSquare(targetsquare, direction, 1)
             self.game.board[targetsquare].takeDamage(self.damage) # damage the target
             self.game.board[targetsquare].applySmoke() # smoke the target
-        self.game.board[self.wieldingunit.square].moveUnit(self.game.board[targetsquare].getRelSquare(direction, 1)) # move the unit to its landing position 1 square beyond the last attack
+        self.game.board[self.wieldingunit.square].moveUnit(getRelSquare(targetsquare, direction, 1)) # move the unit to its landing position 1 square beyond the last attack
 
 class Weapon_RocketArtillery(Weapon_ArtilleryGen_Base, Weapon_IncreaseDamageWithPowerInit_Base, Weapon_hurtAndPushEnemy_Base, Weapon_FartSmoke_Base):
     "Default weapon for the Rocket mech"
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
         self.damage = 2
         super().__init__(power1, power2)
@@ -3237,6 +4044,7 @@ class Weapon_RocketArtillery(Weapon_ArtilleryGen_Base, Weapon_IncreaseDamageWith
 
 class Weapon_Repulse(Weapon_NoChoiceGen_Base, Weapon_getRelSquare_Base):
     "Default weapon for Pulse mech"
+    __slots__ = ('shieldally', 'shieldself')
     def __init__(self, power1=False, power2=False):
         if power1:
             self.shieldself = True
@@ -3251,19 +4059,14 @@ class Weapon_Repulse(Weapon_NoChoiceGen_Base, Weapon_getRelSquare_Base):
             self.wieldingunit.applyShield()
         for d in Direction.gen():
             targetsquare = self._getRelSquare(d, 1)
-            try:
-                targetunit = self.game.board[targetsquare].unit
-            except KeyError: # self.game.board[False]
+            if not targetsquare:
                 continue # targetsquare was invalid, move on
-            else: # targetsquare is a valid square on the board
-                try:
-                    if self.shieldally and (targetunit.alliance == Alliance.FRIENDLY or targetunit.isBuilding()): # try to shield allies if needed
-                        raise FakeException
-                except AttributeError: # None.alliance, no unit
-                    continue
-                except FakeException:
-                    targetunit.applyShield() # shield first and push 2nd. The game shows that you'll lose hp from bumping, but instead you get a shield and then immediately lose it to the bump and take no direct damage
-                self.game.board[targetsquare].push(d)
+            targetunit = self.game.board[targetsquare].unit
+            if targetunit is None:
+                continue
+            if self.shieldally and (targetunit.alliance == Alliance.FRIENDLY or targetunit.isBuilding()): # try to shield allies if needed
+                targetunit.applyShield() # shield first and push 2nd. The game shows that you'll lose hp from bumping, but instead you get a shield and then immediately lose it to the bump and take no direct damage
+            self.game.board[targetsquare].push(d)
 
 class Weapon_ElectricWhip(Weapon_DirectionalGen_Base):
     """This is the lightning mech's default weapon.
@@ -3272,6 +4075,7 @@ class Weapon_ElectricWhip(Weapon_DirectionalGen_Base):
     Cannot attack mines on the ground.
     Reddit said you can attack a building if it's webbed, this is not true. Even if you attack the scorpion webbing the building, the building won't pass the attack through or take damage.
     You can never chain through yourself when you shoot!"""
+    __slots__ = ('_buildingchain', 'damage', 'hitsquares')
     def __init__(self, power1=False, power2=False):
         if power1:
             self._buildingchain = True
@@ -3281,27 +4085,31 @@ class Weapon_ElectricWhip(Weapon_DirectionalGen_Base):
             self.damage = 3
         else:
             self.damage = 2
+    def getReach(self, squares):
+        "return None since the chain can travel through units anywhere on the board."
+        return None
+    def canShoot(self, direction):
+        "return False if there isn't a unit that can be chained through next to the wielder in direction, True if there is."
+        ray = RAYS[self.wieldingunit.square][direction]
+        return len(ray) > 1 and self.unitIsChainable(self.game.board[ray[1]].unit)
     def shoot(self, direction):
+        if not self.canShoot(direction): # the chain has to start with a unit
+            raise NullWeaponShot
         self.hitsquares = [False, self.wieldingunit.square]  # squares that have already been hit so we don't travel back through them in circles.
         # False is included because getRelSquare will return False when you go off the board. We can use this in the branching logic to tell it that anything off the board has been visited.
         # we also include the unit that shot the weapon since you can NEVER chain through yourself!
-        self.branchChain(backwards=Direction.opposite(direction), targetsquare=self.game.board[self.wieldingunit.square].getRelSquare(direction, 1))
-        if len(self.hitsquares) == 2: # if histsquares never grew, that means that the first shot was invalid
-            raise NullWeaponShot
+        self.branchChain(backwards=Direction.opposite(direction), targetsquare=getRelSquare(self.wieldingunit.square, direction, 1))
         # done with the recursive method, now skip False and and the wielder's square and make all the units that need to take damage take damage
         for hs in self.hitsquares[2:]:
             if not self.game.board[hs].unit.isBuilding(): # don't damage buildings. If they're here they're already not effected.
                 self.game.board[hs].takeDamage(self.damage)
     def unitIsChainable(self, unit):
         "Pass a unit to this method and it will return true if you can chain through it, false if not or if there is no unit."
-        try:
-            if (self._buildingchain and unit.isBuilding()) or \
-                    (self._buildingchain and not unit.isMountain()) or \
-                     (not unit.isMountain() and not unit.isBuilding()):
-                return True
-        except AttributeError:
-            pass
-        return False
+        if unit is None:
+            return False
+        return (self._buildingchain and unit.isBuilding()) or \
+                (self._buildingchain and not unit.isMountain()) or \
+                 (not unit.isMountain() and not unit.isBuilding())
     def branchChain(self, backwards, targetsquare):
         """"A recursive method to facilitate the branching out of the electric whip shot.
         backwards is the direction that the shock came from to avoid doubling back.
@@ -3312,7 +4120,7 @@ class Weapon_ElectricWhip(Weapon_DirectionalGen_Base):
         for d in Direction.gen():
             if d == backwards:
                 continue
-            nextsquare = self.game.board[targetsquare].getRelSquare(d, 1)
+            nextsquare = getRelSquare(targetsquare, d, 1)
             if nextsquare in self.hitsquares:
                 continue
             if self.unitIsChainable(self.game.board[nextsquare].unit):
@@ -3320,31 +4128,35 @@ class Weapon_ElectricWhip(Weapon_DirectionalGen_Base):
 
 class Weapon_GrapplingHook(Weapon_getSquareOfUnitInDirection_Base, Weapon_DirectionalGen_Base):
     "Default weapon for Hook Mech"
+    __slots__ = ('shieldally',)
     def __init__(self, power1=False, power2=False):
         if power1:
             self.shieldally = True
         else:
             self.shieldally = False
         # power2 is unused
+    def canShoot(self, direction):
+        "return False if the square next to the wielder in direction is off the board or occupied or there's no unit past it to grapple, True otherwise."
+        ray = RAYS[self.wieldingunit.square][direction]
+        return len(ray) > 1 and self.game.board[ray[1]].unit is None and self._hasUnitInDirection(direction, startrel=2)
     def shoot(self, direction):
-        try: # first check for a unit right next to us
-            if self.game.board[self.game.board[self.wieldingunit.square].getRelSquare(direction, 1)].unit:
-                raise NullWeaponShot
-        except KeyError: #board[False], this square is off the board which is also a
+        nextsquare = getRelSquare(self.wieldingunit.square, direction, 1)
+        if not nextsquare or self.game.board[nextsquare].unit: # first check for a unit right next to us or the edge of the board
             raise NullWeaponShot
-        try:
-            targetunit = self.game.board[self._getSquareOfUnitInDirection(direction, startrel=2)].unit
-        except KeyError: # board[False], there was no unit to grapple
+        targetsquare = self._getSquareOfUnitInDirection(direction, startrel=2)
+        if not targetsquare: # there was no unit to grapple
             raise NullWeaponShot
-        if Attributes.STABLE in targetunit.attributes:
-            self.game.board[self.wieldingunit.square].moveUnit( self.game.board[targetunit.square].getRelSquare(Direction.opposite(direction), 1) ) # move the weapon wielder next to the stable unit it just grappled
+        targetunit = self.game.board[targetsquare].unit
+        if targetunit.attributes & Attributes.STABLE:
+            self.game.board[self.wieldingunit.square].moveUnit( getRelSquare(targetunit.square, Direction.opposite(direction), 1) ) # move the weapon wielder next to the stable unit it just grappled
         else: # unit is not stable
-            self.game.board[targetunit.square].moveUnit( self.game.board[self.wieldingunit.square].getRelSquare(direction, 1) ) # move the targetunit next to the wielder
+            self.game.board[targetunit.square].moveUnit( getRelSquare(self.wieldingunit.square, direction, 1) ) # move the targetunit next to the wielder
         if self.shieldally and (Alliance.FRIENDLY == targetunit.alliance or targetunit.isBuilding()):
             targetunit.applyShield()
 
 class Weapon_RockLauncher(Weapon_ArtilleryGen_Base, Weapon_IncreaseDamageWithPowerInit_Base):
     "Default weapon for Boulder Mech"
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
         self.damage = 2
         super().__init__(power1, power2)
@@ -3354,40 +4166,44 @@ class Weapon_RockLauncher(Weapon_ArtilleryGen_Base, Weapon_IncreaseDamageWithPow
         else: # otherwise we just place a rock there
             self.game.board[targetsquare]._putUnitHere(Unit_Rock(self.game))
         for d in Direction.genPerp(direction):
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(d, 1)].push(d)
-            except KeyError:
-                pass # tried to push off the board
+            sq = getRelSquare(targetsquare, d, 1)
+            if sq: # don't try to push off the board
+                self.game.board[sq].push(d)
 
 class Weapon_FlameThrower(Weapon_getRelSquare_Base, Weapon_RangedGen_Base):
     "Default weapon for Flame Mech"
+    __slots__ = ('damage', 'range')
     def __init__(self, power1=False, power2=False):
         self.damage = 2
         self.range = 1
         for p in power1, power2:
             if p:
                 self.range += 1
+    def canShoot(self, direction, distance):
+        "return False if the flames would go off the board or a mountain would stop them before they got as far as they could, True otherwise."
+        ray = RAYS[self.wieldingunit.square][direction]
+        if distance >= len(ray):
+            return False
+        for r in range(1, min(distance + 1, self.range)):
+            unit = self.game.board[ray[r]].unit
+            if unit is not None and unit.isMountain():
+                return False
+        return True
     def shoot(self, direction, distance):
         hotsquares = [] # a list of squares to damage. Build the list first so we can determine if this is an invalid shot
         for r in range(1, distance+1):
             targetsquare = self._getRelSquare(direction, r)
-            try:
-                if self.game.board[targetsquare].unit.isMountain() and r < self.range: # if the unit on the targetsquare is a mountain (which stops flamethrower from going through it) and there was range remaining...
-                    raise NullWeaponShot  # bail since this shot was already taken with less range
-            except KeyError: # board[False]
+            if not targetsquare:
                 raise NullWeaponShot
-            except AttributeError: # None.isMountain(), there was no unit
-                pass
+            unit = self.game.board[targetsquare].unit
+            if unit is not None and unit.isMountain() and r < self.range: # if the unit on the targetsquare is a mountain (which stops flamethrower from going through it) and there was range remaining...
+                raise NullWeaponShot  # bail since this shot was already taken with less range
             hotsquares.append(targetsquare)
         # Now we know this is a valid shot.
         for targetsquare in hotsquares:
-            try: # unit takes damage if it was already on fire
-                if Effects.FIRE in self.game.board[targetsquare].unit.effects:
-                    raise FakeException
-            except FakeException: # The unit was on fire
-                self.game.board[targetsquare].unit.takeDamage(self.damage) # damage the unit only, not the tile!
-            except AttributeError: # None.effects, there was no unit
-                pass
+            targetunit = self.game.board[targetsquare].unit
+            if targetunit is not None and targetunit.effects & Effects.FIRE: # unit takes damage if it was already on fire
+                targetunit.takeDamage(self.damage) # damage the unit only, not the tile!
             self.game.board[targetsquare].applyFire() # light it up
         self.game.board[targetsquare].push(direction) # and finally push the last tile
 
@@ -3395,6 +4211,7 @@ class Weapon_FlameThrower(Weapon_getRelSquare_Base, Weapon_RangedGen_Base):
 
 class Weapon_VulcanArtillery(Weapon_ArtilleryGen_Base, Weapon_PushAdjacent_Base, Weapon_getRelSquare_Base):
     "Default Weapon for Meteor Mech"
+    __slots__ = ('backburn', 'damage', 'shoot')
     def __init__(self, power1=False, power2=False):
         if power1:
             self.backburn = True
@@ -3413,34 +4230,43 @@ class Weapon_VulcanArtillery(Weapon_ArtilleryGen_Base, Weapon_PushAdjacent_Base,
         self.game.board[targetsquare].applyFire()
         self._pushAdjacent(targetsquare)
         if self.backburn:
-            try:
-                self.game.board[self._getRelSquare(Direction.opposite(direction), 1)].applyFire()
-            except KeyError:  # self.game.board[False].applyFire()
-                pass  # totally fine, if your butt is against the wall you just don't fart out any fire
+            sq = self._getRelSquare(Direction.opposite(direction), 1)
+            if sq: # if your butt is against the wall you just don't fart out any fire
+                self.game.board[sq].applyFire()
 
 class Weapon_Teleporter(Weapon_RangedGen_Base, Weapon_getRelSquare_Base):
     "Default weapon for Swap Mech"
+    __slots__ = ('range',)
     def __init__(self, power1=False, power2=False):
         self.range = 1
         if power1:
             self.range += 1
         if power2:
             self.range += 2
+    def canShoot(self, direction, distance):
+        "return False if the square to teleport to is off the board or has a stable unit on it, True otherwise."
+        ray = RAYS[self.wieldingunit.square][direction]
+        if distance >= len(ray):
+            return False
+        unit = self.game.board[ray[distance]].unit
+        return unit is None or not unit.attributes & Attributes.STABLE
     def shoot(self, direction, distance):
         targetsquare = self._getRelSquare(direction, distance)
-        try:
-            if Attributes.STABLE in self.game.board[targetsquare].unit.attributes: # can't teleport stable units
-                raise NullWeaponShot
-        except KeyError: # tried to teleport off the board
+        if not targetsquare: # tried to teleport off the board
+            raise NullWeaponShot
+        unit = self.game.board[targetsquare].unit
+        if unit is not None and unit.attributes & Attributes.STABLE: # can't teleport stable units
             raise NullWeaponShot
-        except AttributeError: # there was no unit to check for stability
-            pass
         self.game.board[self.wieldingunit.square].teleport(targetsquare)
 
 class Weapon_HydraulicLegs(Weapon_ArtilleryGen_Base, Weapon_HydraulicLegsUnstableInit_Base, Weapon_hurtPushAdjacent_Base):
     "The default weapon for Leap Mech"
+    __slots__ = ('damage', 'selfdamage')
     def genShots(self):
         return super().genShots(minimumdistance=1)
+    def canShoot(self, targetsquare, direction):
+        "return False if targetsquare is occupied since the wielder can't leap there, True if it isn't."
+        return self.game.board[targetsquare].unit is None
     def shoot(self, targetsquare, direction):
         if self.game.board[targetsquare].unit:
             raise NullWeaponShot # the tile you're leaping to must be clear of units
@@ -3450,32 +4276,43 @@ class Weapon_HydraulicLegs(Weapon_ArtilleryGen_Base, Weapon_HydraulicLegsUnstabl
 
 class Weapon_UnstableCannon(Weapon_HydraulicLegsUnstableInit_Base, Weapon_Projectile_Base, Weapon_hurtAndPushEnemy_Base, Weapon_hurtAndPushSelf_Base):
     "Default weapon for the Unstable Mech"
+    __slots__ = ('damage', 'selfdamage')
     def __init__(self, power1=False, power2=False):
         super().__init__(power1, power2)
         self.damage += 1 # unstable cannon does 1 more damage by default
+    def canShoot(self, direction):
+        "return True since the wielder is pushed away from the edge before it shoots."
+        return True
     def shoot(self, direction):
         self._hurtAndPushSelf(self.wieldingunit.square, Direction.opposite(direction)) # take self-damage first and push back
         self._hurtAndPushEnemy(self._getSquareOfUnitInDirection(direction, edgeok=True), direction)
 
 class Weapon_AcidProjector(Weapon_AcidGun_Base):
     "Default weapon for the Acid Mech"
+    __slots__ = ()
     def __init__(self, power1=False, power2=False):
         pass # this weapon can't be upgraded
 
 class Weapon_RammingSpeed(Weapon_Charge_Base, Weapon_FartSmoke_Base):
     "Default weapon for the TechnoBeetle"
+    __slots__ = ('damage', 'shoot')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         if power1:
             self.shoot = self.shoot_smoke
+        else:
+            self.shoot = self.shoot_charge
         if power2:
             self.damage += 2
+    def shoot_charge(self, direction):
+        super().shoot(direction)
     def shoot_smoke(self, direction):
         super().shoot(direction)
         self._fartSmoke(direction)
 
 class Weapon_NeedleShot(Weapon_RangedAttack_Base):
     "Default weapon for the TechnoHornet"
+    __slots__ = ('damage', 'range')
     def __init__(self, power1=False, power2=False):
         self.range = 1
         self.damage = 1
@@ -3486,38 +4323,40 @@ class Weapon_NeedleShot(Weapon_RangedAttack_Base):
 
 class Weapon_ExplosiveGoo(Weapon_ArtilleryGen_Base, Weapon_PushAdjacent_Base):
     "Default weapon for the TechnoScarab"
+    __slots__ = ('damage', 'shoot')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         if power1:
             self.shoot = self.shoot_2tiles
+        else:
+            self.shoot = self.shoot_1tile
         if power2:
             self.damage += 2
-    def shoot(self, targetsquare, direction):
+    def shoot_1tile(self, targetsquare, direction):
         "This is the ExplosiveGoo's shot when it only affects 1 tile, very simple."
         self.game.board[targetsquare].takeDamage(self.damage)
         self._pushAdjacent(targetsquare)  # now push all the tiles around targetsquare
     def shoot_2tiles(self, targetsquare, direction):
         self.game.board[targetsquare].takeDamage(self.damage)
-        extrasquare = self.game.board[targetsquare].getRelSquare(direction, 1) # set the 2nd square
-        try: # try to damage one tile past the target
-            self.game.board[extrasquare].takeDamage(self.damage)
-        except KeyError: # board[False]; the extra shot was wasted which is fine
+        extrasquare = getRelSquare(targetsquare, direction, 1) # set the 2nd square
+        if not extrasquare: # the extra shot was wasted which is fine
             self._pushAdjacent(targetsquare)  # just push all the tiles around targetsquare, one of them will be off board
-        else: # The tile exists and now we have to push all tiles around BOTH
-            for d in list(Direction.genPerp(direction)) + [Direction.opposite(direction)]: # push all BUT ONE of the tiles around targetsquare. The excluded tile is the one in the direction of fire
-                try:
-                    self.game.board[self.game.board[targetsquare].getRelSquare(d, 1)].push(d)
-                except KeyError:  # game.board[False]
-                    pass
-            for d in list(Direction.genPerp(direction)) + [direction]: # push all BUT ONE of the tiles around targetsquare. The excluded tile is the one opposite the direction of fire
-                try:
-                    self.game.board[self.game.board[extrasquare].getRelSquare(d, 1)].push(d)
-                except KeyError:  # game.board[False]
-                    pass
+            return
+        self.game.board[extrasquare].takeDamage(self.damage) # damage one tile past the target
+        # The tile exists and now we have to push all tiles around BOTH
+        for d in list(Direction.genPerp(direction)) + [Direction.opposite(direction)]: # push all BUT ONE of the tiles around targetsquare. The excluded tile is the one in the direction of fire
+            sq = getRelSquare(targetsquare, d, 1)
+            if sq:
+                self.game.board[sq].push(d)
+        for d in list(Direction.genPerp(direction)) + [direction]: # push all BUT ONE of the tiles around targetsquare. The excluded tile is the one opposite the direction of fire
+            sq = getRelSquare(extrasquare, d, 1)
+            if sq:
+                self.game.board[sq].push(d)
 
 ################ Non-default weapons
 class Weapon_SidewinderFist(Weapon_RangedGen_Base, Weapon_hurtAndPushEnemy_Base, Weapon_getRelSquare_Base, Weapon_IncreaseDamageWithPowerInit_Base):
     "Punch an adjacent tile, damaging and pushing it to the left."
+    __slots__ = ('damage', 'range')
     def __init__(self, power1=False, power2=False):
         self.damage = 2
         self.range = 1
@@ -3532,6 +4371,7 @@ class Weapon_SidewinderFist(Weapon_RangedGen_Base, Weapon_hurtAndPushEnemy_Base,
 
 class Weapon_RocketFist(Weapon_hurtAndPushEnemy_Base, Weapon_Projectile_Base, Weapon_Punch_Base):
     "Punch an adjacent tile. Upgrades to launch as a projectile"
+    __slots__ = ('damage', 'shoot')
     def __init__(self, power1=False, power2=False):
         self.damage = 2
         if power1:
@@ -3543,6 +4383,11 @@ class Weapon_RocketFist(Weapon_hurtAndPushEnemy_Base, Weapon_Projectile_Base, We
     def shoot_punch(self, direction): # the default shoot method for punching only
         super().shoot_punch(direction)
         self._pushSelfBackwards(direction)
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. A punch only hits the square next to the wielder, a launched fist flies across the board."
+        if self.shoot == self.shoot_punch:
+            return getArea(squares, 1)
+        return getLines(squares)
     def shoot_projectile(self, direction):
         self._hurtAndPushEnemy(self._getSquareOfUnitInDirection(direction, edgeok=True), direction)
         self._pushSelfBackwards(direction)
@@ -3552,6 +4397,7 @@ class Weapon_RocketFist(Weapon_hurtAndPushEnemy_Base, Weapon_Projectile_Base, We
 
 class Weapon_ExplosiveVents(Weapon_NoChoiceGen_Base, Weapon_IncreaseDamageWithPowerInit_Base, Weapon_hurtPushAdjacent_Base):
     "Blast all adjacent tiles."
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         super().__init__(power1, power2)
@@ -3560,6 +4406,7 @@ class Weapon_ExplosiveVents(Weapon_NoChoiceGen_Base, Weapon_IncreaseDamageWithPo
 
 class Weapon_PrimeSpear(Weapon_RangedAttack_Base):
     "Stab multiple tiles and push the furthest hit tile."
+    __slots__ = ('acidtip', 'damage', 'range')
     def __init__(self, power1=False, power2=False):
         self.range = 2
         self.damage = 2
@@ -3572,16 +4419,16 @@ class Weapon_PrimeSpear(Weapon_RangedAttack_Base):
     def shoot(self, direction, distance):
         pushedunit, targetsquare = super().shoot(direction, distance)
         if self.acidtip:
-            try:
-                pushedunit.applyAcid()
-            except AttributeError: # None.applyAcid()
+            if pushedunit is None:
                 self.game.board[targetsquare].applyAcid() # just the tile gets acid
-            else: # the pushed unit got acid
+            else: # the pushed unit gets acid
+                pushedunit.applyAcid()
                 if pushedunit.hp < 1: # if the unit that just got acid is going to die...
                     self.game.board[targetsquare].applyAcid() # then also give acid to the square it was pushed from. This seems like a bug in the game that if a unit that gets acid dies, the tile it was hit on also gets acid.
 
 class Weapon_VortexFist(Weapon_NoChoiceGen_Base, Weapon_hurtAndPushEnemy_Base):
     "Damage and push all adjacent tiles to the left."
+    __slots__ = ('damage', 'selfdamage')
     def __init__(self, power1=False, power2=False):
         self.damage = 2
         self.selfdamage = 2
@@ -3592,19 +4439,23 @@ class Weapon_VortexFist(Weapon_NoChoiceGen_Base, Weapon_hurtAndPushEnemy_Base):
     def shoot(self):
         for direction in Direction.gen():
             try:
-                self._hurtAndPushEnemy(self.game.board[self.wieldingunit.square].getRelSquare(direction, 1), Direction.getCounterClockwise(direction))
+                self._hurtAndPushEnemy(getRelSquare(self.wieldingunit.square, direction, 1), Direction.getCounterClockwise(direction))
             except NullWeaponShot: # raised from hurtAndPushEnemy going off-board
                 pass
         self.game.board[self.wieldingunit.square].takeDamage(self.selfdamage)
 
 class Weapon_TitaniteBlade(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_Base, Weapon_getRelSquare_Base, Weapon_SpendAmmo_Base):
     "Swing a massive sword to damage and push 3 tiles."
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 2
         # power1 adds another use, but we ignore that here because this simulation could be in the middle of a map where ammo could be anything.
         if power2:
             self.damage += 2
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. The sword hits the square next to the wielder and the 2 beside that one."
+        return getArea(squares, 2)
     def shoot(self, direction):
         targetsquare = self._getRelSquare(direction, 1)
         if not targetsquare:
@@ -3613,17 +4464,21 @@ class Weapon_TitaniteBlade(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_B
         self._hurtAndPushEnemy(targetsquare, direction)
         for perpdir in Direction.genPerp(direction):
             try:
-                self._hurtAndPushEnemy(self.game.board[targetsquare].getRelSquare(perpdir, 1), direction)
+                self._hurtAndPushEnemy(getRelSquare(targetsquare, perpdir, 1), direction)
             except NullWeaponShot: # it's ok if the 2 tiles next to the main target tile are off the board, the damage is just wasted
                 pass
 
 class Weapon_MercuryFist(Weapon_DirectionalGen_Base, Weapon_getRelSquare_Base, Weapon_SpendAmmo_Base):
     "Smash the ground, dealing huge damage and pushing adjacent tiles."
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 4
         if power2: # power1 gives another use and is ignored here
             self.damage += 1
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. It smashes the square next to the wielder and pushes the ones around that."
+        return getArea(squares, 1)
     def shoot(self, direction):
         targetsquare = self._getRelSquare(direction, 1)
         if not targetsquare: # target is off board and invalid
@@ -3631,13 +4486,13 @@ class Weapon_MercuryFist(Weapon_DirectionalGen_Base, Weapon_getRelSquare_Base, W
         self._spendAmmo()
         self.game.board[targetsquare].takeDamage(self.damage)
         for d in [direction] + list(Direction.genPerp(direction)):
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(d, 1)].push(d)
-            except KeyError: # board[False]
-                pass # ok that this went off board
+            sq = getRelSquare(targetsquare, d, 1)
+            if sq: # ok if this went off board
+                self.game.board[sq].push(d)
 
 class Weapon_PhaseCannon(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_Base):
     "Shoot a projectile that phases through objects."
+    __slots__ = ('damage', 'phaseshield')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         if power1:
@@ -3647,33 +4502,33 @@ class Weapon_PhaseCannon(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_Bas
         if power2:
             self.damage += 1
     def shoot(self, direction):
-        targetsquare = self.game.board[self.wieldingunit.square].getRelSquare(direction, 1) # start the projectile at square in direction from the unit that used the weapon...
+        targetsquare = getRelSquare(self.wieldingunit.square, direction, 1) # start the projectile at square in direction from the unit that used the weapon...
         if not targetsquare:
             raise NullWeaponShot # the first square we tried to get was off the board, this is an invalid shot.
         while True:
-            try:
-                if not self.game.board[targetsquare].unit.isBuilding():
-                    self._hurtAndPushEnemy(targetsquare, direction) # found the unit, hit it's tile
-                    return
-            except KeyError:  # raised from if game.board[False].unit: targetsquare being false means we never found a unit and went off the board
+            if not targetsquare: # we never found a unit and went off the board
                 self.game.board[oldtargetsquare].takeDamage(self.damage) # edge tile takes damage, no point in trying to push the edge
                 return
-            except AttributeError: # None.isBuilding()
-                pass # there was no unit, keep moving
-            else: # there was a building
-                if self.phaseshield:
+            unit = self.game.board[targetsquare].unit
+            if unit is not None: # if there was no unit, keep moving
+                if not unit.isBuilding():
+                    self._hurtAndPushEnemy(targetsquare, direction) # found the unit, hit it's tile
+                    return
+                if self.phaseshield: # there was a building
                     self.game.board[targetsquare].applyShield() # shield it if phase shield is powered
             oldtargetsquare = targetsquare
-            targetsquare = self.game.board[targetsquare].getRelSquare(direction, 1)  # the next square in the direction the shot
+            targetsquare = getRelSquare(targetsquare, direction, 1)  # the next square in the direction the shot
 
 class Weapon_DefShrapnel(Weapon_DirectionalGen_Base, Weapon_NoUpgradesInit_Base, Weapon_getSquareOfUnitInDirection_Base, Weapon_PushProjectile_Base):
     "Fire a non-damaging projectile that pushes tiles around the target."
+    __slots__ = ()
     def shoot(self, direction):
         targetsquare = self._getSquareOfUnitInDirection(direction, edgeok=True)
         self._pushProjectile(direction, targetsquare)
 
 class Weapon_RailCannon(Weapon_Projectile_Base, Weapon_hurtAndPushEnemy_Base):
     "Projectile that does more damage to targets that are further away."
+    __slots__ = ('damage', 'maxdamage')
     def __init__(self, power1=False, power2=False):
         self.maxdamage = 2
         for p in power1, power2:
@@ -3681,24 +4536,24 @@ class Weapon_RailCannon(Weapon_Projectile_Base, Weapon_hurtAndPushEnemy_Base):
                 self.maxdamage += 1
     def shoot(self, direction):
         self.damage = 0 # this will grow as the shot travels
-        targetsquare = self.game.board[self.wieldingunit.square].getRelSquare(direction, 1)  # start the projectile at square in direction from the unit that used the weapon...
+        targetsquare = getRelSquare(self.wieldingunit.square, direction, 1)  # start the projectile at square in direction from the unit that used the weapon...
         if not targetsquare:
             raise NullWeaponShot # the first square we tried to get was off the board, this is an invalid shot.
         while True:
-            try:
-                if self.game.board[targetsquare].unit: # found the unit
-                    self._hurtAndPushEnemy(targetsquare, direction)
-                    return
-            except KeyError:  # raised from if game.board[False].unit: targetsquare being false means we never found a unit and went off the board
+            if not targetsquare: # we never found a unit and went off the board
                 self.game.board[lasttargetsquare].takeDamage(self.damage)
                 return
+            if self.game.board[targetsquare].unit: # found the unit
+                self._hurtAndPushEnemy(targetsquare, direction)
+                return
             lasttargetsquare = targetsquare
-            targetsquare = self.game.board[targetsquare].getRelSquare(direction, 1)  # the next tile in direction of the last square
+            targetsquare = getRelSquare(targetsquare, direction, 1)  # the next tile in direction of the last square
             if self.damage < self.maxdamage:
                 self.damage += 1
 
 class Weapon_ShockCannon(Weapon_Projectile_Base, Weapon_IncreaseDamageWithPowerInit_Base, Weapon_hurtAndPushEnemy_Base):
     "Fire a projectile that hits 2 tiles, pushing them in opposite directions."
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         super().__init__(power1, power2)
@@ -3706,12 +4561,13 @@ class Weapon_ShockCannon(Weapon_Projectile_Base, Weapon_IncreaseDamageWithPowerI
         targetsquare = self._getSquareOfUnitInDirection(direction, edgeok=True)
         self._hurtAndPushEnemy(targetsquare, Direction.opposite(direction)) # hurt and push the unit towards the wielder
         try:
-            self._hurtAndPushEnemy(self.game.board[targetsquare].getRelSquare(direction, 1), direction)  # hurt and push the unit on the tile past the one we just hit away from the wielder
+            self._hurtAndPushEnemy(getRelSquare(targetsquare, direction, 1), direction)  # hurt and push the unit on the tile past the one we just hit away from the wielder
         except NullWeaponShot: # if you hit the edge, this action is ignored
             pass
 
 class Weapon_HeavyRocket(Weapon_DirectionalGen_Base, Weapon_getSquareOfUnitInDirection_Base, Weapon_PushProjectile_Base, Weapon_SpendAmmo_Base):
     "Fire a projectile that heavily damages a target and pushes adjacent tiles."
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 3
@@ -3725,6 +4581,7 @@ class Weapon_HeavyRocket(Weapon_DirectionalGen_Base, Weapon_getSquareOfUnitInDir
 
 class Weapon_ShrapnelCannon(Weapon_DirectionalGen_Base, Weapon_getSquareOfUnitInDirection_Base, Weapon_hurtAndPushEnemy_Base, Weapon_SpendAmmo_Base):
     "Shoot a projectile that damages and pushes the targeted tile and the tiles to its left and right."
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 2
@@ -3736,54 +4593,57 @@ class Weapon_ShrapnelCannon(Weapon_DirectionalGen_Base, Weapon_getSquareOfUnitIn
         self._hurtAndPushEnemy(targetsquare, direction) # hit the target
         for dir in Direction.genPerp(direction): # and then the 2 sides
             try:
-                self._hurtAndPushEnemy(self.game.board[targetsquare].getRelSquare(dir, 1), dir)
+                self._hurtAndPushEnemy(getRelSquare(targetsquare, dir, 1), dir)
             except NullWeaponShot:
                 pass # peripheral shots went off the board which is OK
 
 class Weapon_AstraBombs(Weapon_ArtilleryGen_Base, Weapon_getRelSquare_Base, Weapon_SpendAmmo_Base):
     "Leap over any distance dropping a bomb on each tile you pass."
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 1
         if power2:  # power1 for extra uses is ignored
             self.damage += 2
+    def canShoot(self, targetsquare, direction):
+        "return False if targetsquare is occupied since the wielder can't land there, True if it isn't."
+        return self.game.board[targetsquare].unit is None
     def shoot(self, targetsquare, direction):
         "distance is the number of squares to jump over and damage. The wielder lands on one square past distance."
         if self.game.board[targetsquare].unit:
             raise NullWeaponShot # can't land on an occupied square
         self._spendAmmo()
-        currenttargetsquare = self.game.board[self.wieldingunit.square].getRelSquare(direction, 1) # start one square in front of the unit
+        currenttargetsquare = getRelSquare(self.wieldingunit.square, direction, 1) # start one square in front of the unit
         while currenttargetsquare != targetsquare:
             self.game.board[currenttargetsquare].takeDamage(self.damage) # damage the target
-            currenttargetsquare = self.game.board[currenttargetsquare].getRelSquare(direction, 1) # move one square in direction
+            currenttargetsquare = getRelSquare(currenttargetsquare, direction, 1) # move one square in direction
         self.game.board[self.wieldingunit.square].moveUnit(targetsquare) # move the unit to its landing position 1 square beyond the last attack
 
 class Weapon_HermesEngines(Weapon_DirectionalGen_Base, Weapon_NoUpgradesInit_Base, Weapon_getRelSquare_Base):
     "Dash in a line, pushing adjacent tiles away."
+    __slots__ = ()
+    def canShoot(self, direction):
+        "return False if the square in front of the wielder is off the board or occupied, True if it isn't."
+        ray = RAYS[self.wieldingunit.square][direction]
+        return len(ray) > 1 and self.game.board[ray[1]].unit is None
     def shoot(self, direction):
         targetsquare = self._getRelSquare(direction, 1) # first check the square ahead fo validity
-        try:
-            if self.game.board[targetsquare].unit: # the first square we tried to target was off the board or has a unit blocking
-                raise NullWeaponShot
-        except KeyError:
+        if not targetsquare or self.game.board[targetsquare].unit: # the first square we tried to target was off the board or has a unit blocking
             raise NullWeaponShot
         targetsquare = self.wieldingunit.square # the tile that the mech shoots from is pushed as well
         while True:
             for dir in Direction.genPerp(direction): # do the pushing
-                try:
-                    self.game.board[self.game.board[targetsquare].getRelSquare(dir, 1)].push(dir)
-                except KeyError: # board[False], tried to push off board
-                    pass
+                sq = getRelSquare(targetsquare, dir, 1)
+                if sq: # don't push off board
+                    self.game.board[sq].push(dir)
             oldtargetsquare = targetsquare
-            targetsquare = self.game.board[targetsquare].getRelSquare(direction, 1)
-            try:
-                if self.game.board[targetsquare].unit: # if there's a unit on the next square..
-                    break
-            except KeyError: # or if we went off the board
+            targetsquare = getRelSquare(targetsquare, direction, 1)
+            if not targetsquare or self.game.board[targetsquare].unit: # if we went off the board or there's a unit on the next square..
                 break
         self.game.board[self.wieldingunit.square].moveUnit(oldtargetsquare) # move the wielder to the last good square
 
 class Weapon_MicroArtillery(Weapon_ArtilleryGen_Base, Weapon_hurtAndPushEnemy_Base):
+    __slots__ = ('damage', 'extratiles')
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         if power1:
@@ -3797,34 +4657,36 @@ class Weapon_MicroArtillery(Weapon_ArtilleryGen_Base, Weapon_hurtAndPushEnemy_Ba
         if self.extratiles:
             for dir in Direction.genPerp(direction): # and then the 2 sides
                 try:
-                    self._hurtAndPushEnemy(self.game.board[targetsquare].getRelSquare(dir, 1), direction) # push in same direction as shot
+                    self._hurtAndPushEnemy(getRelSquare(targetsquare, dir, 1), direction) # push in same direction as shot
                 except NullWeaponShot:
                     pass # peripheral shots went off the board which is OK
 
 class Weapon_AegonMortar(Weapon_ArtilleryGen_Base, Weapon_IncreaseDamageWithPowerInit_Base, Weapon_hurtAndPushEnemy_Base):
     "Deals damage to two tiles, pushing one forwards and one backwards."
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
         self.damage = 1
         super().__init__(power1, power2)
     def shoot(self, targetsquare, direction):
         self._hurtAndPushEnemy(targetsquare, Direction.opposite(direction)) # hurt and push the unit towards the wielder
         try:
-            self._hurtAndPushEnemy(self.game.board[targetsquare].getRelSquare(direction, 1), direction) # hurt and push the unit on the tile past the one we just hit away from the wielder
+            self._hurtAndPushEnemy(getRelSquare(targetsquare, direction, 1), direction) # hurt and push the unit on the tile past the one we just hit away from the wielder
         except NullWeaponShot: # if you hit the edge, this action is ignored
             pass
 
 class Weapon_SmokeMortar(Weapon_ArtilleryGen_Base, Weapon_NoUpgradesInit_Base):
     "Artillery shot that applies Smoke and pushes two adjacent tiles."
+    __slots__ = ()
     def shoot(self, targetsquare, direction):
         self.game.board[targetsquare].applySmoke()
         for dir in direction, Direction.opposite(direction):
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(dir, 1)].push(dir)
-            except KeyError:
-                pass # shot went off the board
+            sq = getRelSquare(targetsquare, dir, 1)
+            if sq: # the shot could go off the board
+                self.game.board[sq].push(dir)
 
 class Weapon_BurningMortar(Weapon_ArtilleryGen_Base):
     "Artillery attack that sets 5 tiles on Fire."
+    __slots__ = ('selfdamage',)
     def __init__(self, power1=False, power2=False): # power2 is ignored
         if power1:
             self.selfdamage = 0
@@ -3833,15 +4695,15 @@ class Weapon_BurningMortar(Weapon_ArtilleryGen_Base):
     def shoot(self, targetsquare, direction):
         self.game.board[targetsquare].applyFire() # first hit the dead center tile
         for dir in Direction.gen():
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(dir, 1)].applyFire()
-            except KeyError:
-                pass # extra tile was off board
+            sq = getRelSquare(targetsquare, dir, 1)
+            if sq: # the extra tile could be off board
+                self.game.board[sq].applyFire()
         if self.selfdamage: # take self damage if applicable
             self.game.board[self.wieldingunit.square].takeDamage(self.selfdamage)
 
 class Weapon_RainingDeath(Weapon_ArtilleryGen_Base):
     "A dangerous projectile that damages everything it passes."
+    __slots__ = ('_buildingsimmune', 'damage', 'selfdamage')
     def __init__(self, power1=False, power2=False):
         self.selfdamage = 1
         self.damage = 2 # the damage that the last shot does, all others do 1 less than this
@@ -3856,7 +4718,7 @@ class Weapon_RainingDeath(Weapon_ArtilleryGen_Base):
         self.game.board[self.wieldingunit.square].takeDamage(self.selfdamage) # first take self damage
         currentsquare = self.wieldingunit.square # the current square that we are hitting with less damage
         while True:
-            currentsquare = self.game.board[currentsquare].getRelSquare(direction, 1) # move to the next square
+            currentsquare = getRelSquare(currentsquare, direction, 1) # move to the next square
             if currentsquare == targetsquare: # if we're on the last square...
                 self.damageSquare(currentsquare, self.damage) # hit it with full power
                 return # and we're done
@@ -3870,6 +4732,7 @@ class Weapon_RainingDeath(Weapon_ArtilleryGen_Base):
 
 class Weapon_HeavyArtillery(Weapon_ArtilleryGen_Base, Weapon_SpendAmmo_Base):
     "Powerful attack that damages a large area."
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 2
@@ -3879,13 +4742,13 @@ class Weapon_HeavyArtillery(Weapon_ArtilleryGen_Base, Weapon_SpendAmmo_Base):
         self._spendAmmo()
         self.game.board[targetsquare].takeDamage(self.damage) # first hit the dead center tile
         for dir in Direction.gen():
-            try:
-                self.game.board[self.game.board[targetsquare].getRelSquare(dir, 1)].takeDamage(self.damage)
-            except KeyError:
-                pass # extra tile was off board
+            sq = getRelSquare(targetsquare, dir, 1)
+            if sq: # the extra tile could be off board
+                self.game.board[sq].takeDamage(self.damage)
 
 class Weapon_GeminiMissiles(Weapon_ArtilleryGen_Base, Weapon_hurtAndPushEnemy_Base, Weapon_SpendAmmo_Base):
     "Launch two missiles, damaging and pushing two targets"
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 3
@@ -3895,12 +4758,20 @@ class Weapon_GeminiMissiles(Weapon_ArtilleryGen_Base, Weapon_hurtAndPushEnemy_Ba
         self._spendAmmo()
         for dir in Direction.genPerp(direction):
             try:
-                self._hurtAndPushEnemy(self.game.board[targetsquare].getRelSquare(dir, 1), direction)
+                self._hurtAndPushEnemy(getRelSquare(targetsquare, dir, 1), direction)
             except NullWeaponShot: # one of the missiles was off board
                 pass # totally fine
 
 class Weapon_ConfuseShot(Weapon_Projectile_Base, Weapon_NoUpgradesInit_Base):
     "Fire a projectile that flips a target's attack direction."
+    __slots__ = ()
+    def canShoot(self, direction):
+        "return False if there's no unit in direction or its attack can't be flipped, True otherwise."
+        ray = RAYS[self.wieldingunit.square][direction]
+        if len(ray) == 1:
+            return False
+        targetsquare = self.game.getFirstUnitSquare(ray[0], direction)
+        return bool(targetsquare) and hasattr(getattr(self.game.board[targetsquare].unit, 'weapon1', None), 'flip')
     def shoot(self, direction):
         targetsquare = self._getSquareOfUnitInDirection(direction, edgeok=False)
         try:
@@ -3910,73 +4781,79 @@ class Weapon_ConfuseShot(Weapon_Projectile_Base, Weapon_NoUpgradesInit_Base):
 
 class Weapon_SmokePellets(Weapon_NoChoiceGen_Base, Weapon_getRelSquare_Base, Weapon_DeploySelfEffectLimitedSmall_Base):
     "Surround yourself with Smoke to defend against nearby enemies."
+    __slots__ = ('ammo', 'shoot')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         if power1: # power2 for extra use ignored
             self.shoot = self.shoot_allyimmune
-    def shoot(self):
+        else:
+            self.shoot = self.shoot_small
+    def shoot_small(self):
         super().shoot('applySmoke')
     def shoot_allyimmune(self):
         "a different shoot method for when allyimmune is powered"
         self._spendAmmo()
         for dir in Direction.gen():
-            try:
-                targettile = self.game.board[self._getRelSquare(dir, 1)]
-            except KeyError: # board[False]
+            sq = self._getRelSquare(dir, 1)
+            if not sq:
                 continue # targettile is offboard
-            try:
-                if targettile.unit.alliance == Alliance.FRIENDLY:
-                    continue
-            except AttributeError: # targettile.None.alliance, no unit there so we smoke it
-                pass
-            targettile.applySmoke()
+            targettile = self.game.board[sq]
+            if targettile.unit is not None and targettile.unit.alliance == Alliance.FRIENDLY:
+                continue
+            targettile.applySmoke() # there's no unit there or it isn't friendly so we smoke it
 
 class Weapon_FireBeam(Weapon_TemperatureBeam_Base):
     "Fire a beam that applies Fire in a line."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         super().__init__(None, None, ammo, 'applyFire')
 
 class Weapon_FrostBeam(Weapon_TemperatureBeam_Base):
     "Fire a beam that Freezes everything in a line."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         super().__init__(None, None, ammo, 'applyIce')
 
 class Weapon_ShieldArray(Weapon_NoChoiceGen_Base, Weapon_getRelSquare_Base, Weapon_DeploySelfEffectLimitedSmall_Base, Weapon_DeploySelfEffectLimitedLarge_Base):
     "Apply a Shield on nearby tiles."
+    __slots__ = ('ammo', 'shoot')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         if power1:
             self.shoot = self.shoot_big # power2 is ignored
-    def shoot(self):
+        else:
+            self.shoot = self.shoot_small
+    def shoot_small(self):
         super().shoot('applyShield')
     def shoot_big(self):
         super().shoot_big('applyShield')
 
 class Weapon_PushBeam(Weapon_DirectionalGen_Base, Weapon_LimitedUnlimitedInit_Base, Weapon_SpendAmmo_Base):
+    __slots__ = ('ammo',)
     def shoot(self, direction):
-        currenttarget = self.game.board[self.wieldingunit.square].getRelSquare(direction, 1)
+        currenttarget = getRelSquare(self.wieldingunit.square, direction, 1)
         if not currenttarget: # first square attacked was offboard and therefor
             raise NullWeaponShot
         self._spendAmmo()
         pushsquares = [] # build this into a list of squares we need to push
-        while True:
-            try:
-                if self.game.board[currenttarget].unit.isBuilding() or self.game.board[currenttarget].unit.isMountain():
+        while currenttarget: # until we go off the board without ever running into a building or mountain
+            unit = self.game.board[currenttarget].unit
+            if unit is not None: # No point in pushing a square without a unit
+                if unit.isBuilding() or unit.isMountain():
                     break # buildings and mountains end the shot
-            except AttributeError: # None.isBuilding()
-                pass # continue on. No point in pushing this since there is no unit anyway
-            except KeyError:
-                break # we went off the board without ever running into a building or mountain
-            else: # there is a unit that possibly needs pushing
-                pushsquares.insert(0, currenttarget)
-            currenttarget = self.game.board[currenttarget].getRelSquare(direction, 1)
+                pushsquares.insert(0, currenttarget) # there is a unit that possibly needs pushing
+            currenttarget = getRelSquare(currenttarget, direction, 1)
         for sq in pushsquares:
             self.game.board[sq].push(direction)
 
 class Weapon_Boosters(Weapon_ArtilleryGen_Base, Weapon_NoUpgradesInit_Base, Weapon_PushAdjacent_Base):
     "Jump forward and push adjacent tiles away."
+    __slots__ = ()
     def genShots(self):
         return super().genShots(minimumdistance=1)
+    def canShoot(self, targetsquare, direction):
+        "return False if targetsquare is occupied since the wielder can't leap there, True if it isn't."
+        return self.game.board[targetsquare].unit is None
     def shoot(self, targetsquare, direction):
         if self.game.board[targetsquare].unit:
             raise NullWeaponShot # the tile you're leaping to must be clear of units
@@ -3985,51 +4862,55 @@ class Weapon_Boosters(Weapon_ArtilleryGen_Base, Weapon_NoUpgradesInit_Base, Weap
 
 class Weapon_SmokeBombs(Weapon_getRelSquare_Base, Weapon_RangedGen_Base):
     "Fly over the targets while dropping Smoke."
+    __slots__ = ('range',)
     def __init__(self, power1=False, power2=False):
         self.range = 1  # how many tiles you can jump over and damage. Unit lands on the tile after this distance.
         for p in power1, power2:
             if p:
                 self.range += 1
+    canShoot = Weapon_AerialBombs.canShoot # it lands the same way
+    getReach = Weapon_AerialBombs.getReach
     def shoot(self, direction, distance): # this is the same shoot method from AerialBombs with the tile damaging removed. copypasta
         "distance is the number of squares to jump over and damage. The wielder lands on one square past distance."
         destsquare = self._getRelSquare(direction, distance+1)
-        try:
-            if self.game.board[destsquare].unit:
-                raise NullWeaponShot # can't land on an occupied square
-        except AttributeError: # landing spot was off the board
+        if not destsquare or self.game.board[destsquare].unit: # can't land off the board or on an occupied square
             raise NullWeaponShot
         targetsquare = self.wieldingunit.square # start where the unit is
         for r in range(distance):
-            targetsquare = self.game.board[targetsquare].getRelSquare(direction, 1)
+            targetsquare = getRelSquare(targetsquare, direction, 1)
             self.game.board[targetsquare].applySmoke() # smoke the target
-        self.game.board[self.wieldingunit.square].moveUnit(self.game.board[targetsquare].getRelSquare(direction, 1)) # move the unit to its landing position 1 square beyond the last attack
+        self.game.board[self.wieldingunit.square].moveUnit(getRelSquare(targetsquare, direction, 1)) # move the unit to its landing position 1 square beyond the last attack
 
 class Weapon_HeatConverter(Weapon_DirectionalGen_Base, Weapon_getRelSquare_Base, Weapon_SpendAmmo_Base):
     "Freeze the tile in front but light the tile behind on Fire in the process."
+    __slots__ = ('ammo',)
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo # power1 and 2 are ignored
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. It freezes the square in front of the wielder and burns the one behind it."
+        return getArea(squares, 1)
     def shoot(self, direction):
         targetsquare = self._getRelSquare(direction, 1)
         if not targetsquare:
             raise NullWeaponShot
         self._spendAmmo()
         self.game.board[targetsquare].applyIce()
-        try:
-            self.game.board[self._getRelSquare(Direction.opposite(direction), 1)].applyFire()
-        except KeyError: # board[False]
-            pass # this can be offboard
+        sq = self._getRelSquare(Direction.opposite(direction), 1)
+        if sq: # this can be offboard
+            self.game.board[sq].applyFire()
 
 class Weapon_SelfDestruct(Weapon_NoChoiceGen_Base, Weapon_NoUpgradesInit_Base, Weapon_getRelSquare_Base):
+    __slots__ = ()
     def shoot(self):
         for d in Direction.gen(): # all tiles around wielder must die
-            try:
-                self.game.board[self._getRelSquare(d, 1)].die()
-            except KeyError: # game.board[False]
-                pass
+            sq = self._getRelSquare(d, 1)
+            if sq:
+                self.game.board[sq].die()
         self.game.board[self.wieldingunit.square].die()
 
 class Weapon_TargetedStrike(Weapon_AnyTileGen_Base, Weapon_NoUpgradesLimitedInit_Base, Weapon_PushAdjacent_Base, Weapon_SpendAmmo_Base):
     "Call in an air strike on a single tile anywhere on the map."
+    __slots__ = ('ammo',)
     def shoot(self, x, y):
         self._spendAmmo()
         self.game.board[(x, y)].takeDamage(1) # this weapon can only do one damage so I'm breaking the convention of using self.damage so I can use that init base.
@@ -4037,17 +4918,18 @@ class Weapon_TargetedStrike(Weapon_AnyTileGen_Base, Weapon_NoUpgradesLimitedInit
 
 class Weapon_SmokeDrop(Weapon_AnyTileGen_Base, Weapon_NoUpgradesLimitedInit_Base, Weapon_SpendAmmo_Base):
     "Drops Smoke on 5 tiles anywhere on the map."
+    __slots__ = ('ammo',)
     def shoot(self, x, y):
         self._spendAmmo()
         self.game.board[(x, y)].applySmoke()
         for dir in Direction.gen():
-            try:
-                self.game.board[self.game.board[(x, y)].getRelSquare(dir, 1)].applySmoke()
-            except KeyError: # board[False]
-                pass
+            sq = getRelSquare((x, y), dir, 1)
+            if sq:
+                self.game.board[sq].applySmoke()
 
 class Weapon_RepairDrop(Weapon_NoChoiceGen_Base, Weapon_NoUpgradesLimitedInit_Base, Weapon_SpendAmmo_Base):
     "Heal all player units (including disabled Mechs)."
+    __slots__ = ('ammo',)
     # it repairs the train, but it has no effect since the 2 different stages only have 1 hp. Any of the 3 stages being repaired is inconsequential.
     # it repairs the earth mover which does matter because it has 2 hp! Same with acid launcher. And Satellite Rocket. And Terraformer.
         # These can all be repaired, but not from death.
@@ -4056,6 +4938,9 @@ class Weapon_RepairDrop(Weapon_NoChoiceGen_Base, Weapon_NoUpgradesLimitedInit_Ba
     # Sub units are repaired and fire is removed from them.
     # acid is NOT removed from units. If a mech has acid, dies and becomes a corpse, the corpse still has acid and the revived mech has acid.
         # You can't give acid to a mech corpse however. If you hit a mech corpse with acid, it doesn't get it. Then you revive it and it still doesn't have it.
+    def getReach(self, squares):
+        "return None since every player unit is healed."
+        return None
     def shoot(self):
         self._spendAmmo()
         for unit in self.game.playerunits.copy():
@@ -4070,6 +4955,7 @@ class Weapon_RepairDrop(Weapon_NoChoiceGen_Base, Weapon_NoUpgradesLimitedInit_Ba
             pass # unit was not a corpse
         else: # unit was revived, we need to now change unit to the revived unit
             unit = self.game.board[unit.square].unit
+        unit._touch()
         unit.hp = unit.maxhp # restore all health
         unit._removeFire() # put out fire on the unit
         unit._removeIce() # break the unit out of ice
@@ -4083,11 +4969,15 @@ class Weapon_RepairDrop(Weapon_NoChoiceGen_Base, Weapon_NoUpgradesLimitedInit_Ba
 
 class Weapon_MissileBarrage(Weapon_NoChoiceGen_Base, Weapon_SpendAmmo_Base):
     "Fires a missile barrage that hits every enemy on the map."
+    __slots__ = ('ammo', 'damage')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         self.damage = 1
         if power1:
             self.damage += 1 # power2 ignored
+    def getReach(self, squares):
+        "return None since every enemy is hit."
+        return None
     def shoot(self):
         self._spendAmmo()
         for e in self.game.nonplayerunits:
@@ -4096,6 +4986,13 @@ class Weapon_MissileBarrage(Weapon_NoChoiceGen_Base, Weapon_SpendAmmo_Base):
 
 class Weapon_WindTorrent(Weapon_DirectionalGen_Base, Weapon_LimitedUnlimitedInit_Base):
     "Push all units in a single direction."
+    __slots__ = ('ammo',)
+    def getReach(self, squares):
+        "return None since every unit is pushed."
+        return None
+    def canShoot(self, direction):
+        "return True since the wind can blow in any direction no matter where the wielder is."
+        return True
     def shoot(self, direction):
         # so here's the plan: set xrange and yrange based on the direction chosen.
         # we will omit the entire row or column at the edge of the board that the push direction is in since those tiles can't be pushed off board
@@ -4118,17 +5015,20 @@ class Weapon_WindTorrent(Weapon_DirectionalGen_Base, Weapon_LimitedUnlimitedInit
 
 class Weapon_IceGenerator(Weapon_NoChoiceGen_Base, Weapon_DeploySelfEffectLimitedSmall_Base, Weapon_DeploySelfEffectLimitedLarge_Base, Weapon_getRelSquare_Base):
     "Freeze yourself and nearby tiles."
+    __slots__ = ('ammo', 'positions', 'shoot')
     def __init__(self, power1=False, power2=False, ammo=1):
         self.ammo = ammo
         size = 1
         for p in power1, power2:
             if p:
                 size += 1
-        if size == 2:
+        if size == 1:
+            self.shoot = self.shoot_small
+        elif size == 2:
             self.shoot = self.shoot_big
-        elif size == 3:
-            self.shoot = self.shoot_huge # we use the default shoot if there was no power
-    def shoot(self):
+        else:
+            self.shoot = self.shoot_huge
+    def shoot_small(self):
         super().shoot('applyIce')
     def shoot_big(self):
         super().shoot_big('applyIce')
@@ -4150,6 +5050,7 @@ class Weapon_IceGenerator(Weapon_NoChoiceGen_Base, Weapon_DeploySelfEffectLimite
 ############################# Deployables ##################
 class Weapon_LightTank(Weapon_Deployable_Base):
     "Deploy a small tank to help in combat."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         super().__init__(power1, power2, ammo)
     def shoot(self, targetsquare, direction):
@@ -4157,6 +5058,7 @@ class Weapon_LightTank(Weapon_Deployable_Base):
 
 class Weapon_ShieldTank(Weapon_Deployable_Base):
     "Deploy a Shield-Tank that can give Shields to allies."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         super().__init__(power1, power2, ammo)
     def shoot(self, targetsquare, direction):
@@ -4164,6 +5066,7 @@ class Weapon_ShieldTank(Weapon_Deployable_Base):
 
 class Weapon_AcidTank(Weapon_Deployable_Base):
     "Deploy a Tank that can apply A.C.I.D. to targets."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         super().__init__(power1, power2, ammo)
     def shoot(self, targetsquare, direction):
@@ -4171,6 +5074,7 @@ class Weapon_AcidTank(Weapon_Deployable_Base):
 
 class Weapon_PullTank(Weapon_Deployable_Base):
     "Deploy a Pull-Tank that can pull targets with a projectile."
+    __slots__ = ()
     def __init__(self, power1=False, power2=False, ammo=1):
         super().__init__(power1, power2, ammo)
     def shoot(self, targetsquare, direction):
@@ -4183,42 +5087,67 @@ class Weapon_PullTank(Weapon_Deployable_Base):
 # Deployable weapons don't actually take power, but we still use it here because the weapons are modified based on the power of the weapon that actually deployed the tank
 class Weapon_StockCannon(Weapon_Projectile_Base, Weapon_hurtAndPushEnemy_Base):
     "This is the weapon for the Light Tank"
+    __slots__ = ('canShoot', 'damage', 'shoot')
     def __init__(self, power1=False, power2=False):
         "This weapon doesn't actually take power itself, power2 should be inherited from Weapon_LightTank to signal that this weapon should do damage."
         if power2:
             self.shoot = self.shoot_damage
+            self.canShoot = self.canShoot_damage
             self.damage = 2
-    def shoot(self, direction):
-        try:
-            self.game.board[self._getSquareOfUnitInDirection(direction, edgeok=False)].push(direction)
-        except KeyError: # board[False]
+        else:
+            self.shoot = self.shoot_push
+            self.canShoot = self.canShoot_push
+    def canShoot_push(self, direction):
+        "return False if there's no unit in direction to push, True if there is."
+        return self._hasUnitInDirection(direction)
+    def canShoot_damage(self, direction):
+        "return False if the wielder is facing the edge of the board, True if it isn't. The damaging shot hits the edge tile when it doesn't find a unit."
+        return super().canShoot(direction)
+    def shoot_push(self, direction):
+        targetsquare = self._getSquareOfUnitInDirection(direction, edgeok=False)
+        if not targetsquare:
             raise NullWeaponShot # pushing a square on the edge of the board in the direction of the void is pointless
+        self.game.board[targetsquare].push(direction)
     def shoot_damage(self, direction): # copypasta from TaurusCannon
         self._hurtAndPushEnemy(self._getSquareOfUnitInDirection(direction, edgeok=True), direction)
 
 class Weapon_ShieldShot(Weapon_DirectionalGen_Base, Weapon_getSquareOfUnitInDirection_Base):
     "ShieldTank weapon. Shields a single tile."
+    __slots__ = ('canShoot', 'shoot')
     def __init__(self, power1=False, power2=False):
         if power2:
             self.shoot = self.shoot_projectile
-    def shoot(self, direction):
-        try:
-            if not self.game.board[self.game.board[self.wieldingunit.square].getRelSquare(direction, 1)].applyShield(): # if a unit didn't get shielded
-                raise NullWeaponShot # useless shot
-        except KeyError: # board[False]
+            self.canShoot = self.canShoot_projectile
+        else:
+            self.shoot = self.shoot_adjacent
+            self.canShoot = self.canShoot_adjacent
+    def canShoot_adjacent(self, direction):
+        "return False if the wielder is facing the edge of the board, True if it isn't."
+        return super().canShoot(direction)
+    def canShoot_projectile(self, direction):
+        "return False if there's no unit in direction to shield, True if there is."
+        return self._hasUnitInDirection(direction)
+    def shoot_adjacent(self, direction):
+        targetsquare = getRelSquare(self.wieldingunit.square, direction, 1)
+        if not targetsquare:
             raise NullWeaponShot # shot went off the board
+        if not self.game.board[targetsquare].applyShield(): # if a unit didn't get shielded
+            raise NullWeaponShot # useless shot
     def shoot_projectile(self, direction):
-        try:
-            self.game.board[self._getSquareOfUnitInDirection(direction, edgeok=False)].applyShield()
-        except KeyError: # board[False]
+        targetsquare = self._getSquareOfUnitInDirection(direction, edgeok=False)
+        if not targetsquare:
             raise NullWeaponShot
+        self.game.board[targetsquare].applyShield()
 
 class Weapon_AcidShot(Weapon_AcidGun_Base):
     "AcidTank weapon. Fire a projectile that applies ACID to a single tile."
+    __slots__ = ('shoot',)
     def __init__(self, power1=False, power2=False):
         if power2:
             self.shoot = self.shoot_push
-    def shoot(self, direction):
+        else:
+            self.shoot = self.shoot_nopush
+    def shoot_nopush(self, direction):
         super().shoot(direction, False) # no push
     def shoot_push(self, direction):
         super().shoot(direction, True)  # yes push
@@ -4227,31 +5156,36 @@ Weapon_PullShot = Weapon_AttractionPulse # PullShot is literally the same weapon
 
 class Weapon_OldEarthArtillery(Weapon_ArtilleryGen_Base, Weapon_NoUpgradesInit_Base):
     "Underpowered compared to modern artillery, but still useful. OldArtillery"
+    __slots__ = ()
     damage = 2
     def shoot(self, targetsquare, direction):
         self.game.board[targetsquare].takeDamage(self.damage) # copypasta from Weapon_ExplosiveGoo
-        extrasquare = self.game.board[targetsquare].getRelSquare(direction, 1) # set the 2nd square
-        try: # try to damage one tile past the target
+        extrasquare = getRelSquare(targetsquare, direction, 1) # set the 2nd square
+        if extrasquare: # damage one tile past the target, the extra shot being wasted is fine
             self.game.board[extrasquare].takeDamage(self.damage)
-        except KeyError: # board[False]; the extra shot was wasted which is fine
-            pass
 
 ########################### Special Mech Weapons (repair) #########################
 class Weapon_Repair(Weapon_NoChoiceGen_Base, Weapon_NoUpgradesInit_Base):
     "The default repair action/weapon that every mech starts with."
+    __slots__ = ()
     def shoot(self):
         self.game.board[self.wieldingunit.square].repair(1)
 
 class Weapon_FrenziedRepair(Weapon_NoChoiceGen_Base, Weapon_NoUpgradesInit_Base, Weapon_PushAdjacent_Base):
     "The repair action/weapon that you get when you have Harold as the pilot."
+    __slots__ = ()
     def shoot(self):
         self.game.board[self.wieldingunit.square].repair(1)
         self._pushAdjacent(self.wieldingunit.square)
 
 class Weapon_MantisSlash(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_Base, Weapon_Punch_Base):
     "This is the weapon that replaces repair when Kazaakplethkilik is your pilot. Damage and push an adjacent tile. Escape from Ice."
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False): # power is ignored
         self.damage = 2
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's fired from any of squares. The slash only hits the square next to the wielder."
+        return getArea(squares, 1)
     def shoot(self, direction):
         super().shoot_punch(direction)
         self.wieldingunit._removeIce() # yes this breaks you out of ice and does the attack
@@ -4270,16 +5204,25 @@ class Weapon_MantisSlash(Weapon_DirectionalGen_Base, Weapon_hurtAndPushEnemy_Bas
 # Vek weapons will never raise NullWeaponShot
 
 # Vek weapon low-level base objects:
-class Weapon_NPC_Base():
+class Weapon_NPC_Base(Weapon_Base):
     "Base class for all nonplayer weapons."
+    __slots__ = ('qshot', 'targetsquare')
     def __init__(self, qshot=None):
         self.qshot = qshot
+    def getReach(self, squares):
+        """return a set of squares that this weapon can hit when it's shot in any direction from any of squares.
+        Most nonplayer weapons shoot along the wielder's row or column, the ones that can't reach that far override this."""
+        return getLines(squares)
+    def getQueuedReach(self):
+        "return a set of squares that the queued shot can hit from where the wielder is now. Shots with a direction only go that way."
+        reach = self.getReach((self.wieldingunit.square,))
+        if self.qshot:
+            reach &= getRay(self.wieldingunit.square, self.qshot[0])
+        return reach
 
 class Weapon_Vek_Base(Weapon_NPC_Base):
     "Base class for all vek weapons."
-    def __init__(self, qshot=None):
-        super().__init__(qshot)
-        self.dealDamage = self._dealDamageDefault
+    __slots__ = ()
     def _dealDamageDefault(self, square):
         """A helper method for vek to use when dealing damage with their weapon. The amount of damage dealt is self.damage.
         This was implemented because VekHormones needs to deal extra damage when a vek hurts another.
@@ -4295,41 +5238,41 @@ class Weapon_Vek_Base(Weapon_NPC_Base):
         damage is the amount of damage to deal.
         returns nothing."""
         self.game.board[square].takeDamage(self.damage)
-        try:
-            if self.game.board[square].unit.alliance == Alliance.ENEMY:
-                raise FakeException
-        except AttributeError:
-            return
-        except FakeException:
+        if self.game.board[square].unit is not None and self.game.board[square].unit.alliance == Alliance.ENEMY:
             self.game.board[square].takeDamage(self.game.vekhormones)
+    _dealDamage = _dealDamageDefault # Weapon_VekHormones swaps this for _dealDamageVekHormones when it's enabled
 
-class Weapon_Validate_Base():
+class Weapon_Validate_Base(Weapon_Base):
     "This is the base validate class for all others."
+    __slots__ = ()
     def validate(self):
         "The only way this shot can be invalidated is by the shot already being invalidated or the unit being smoked."
         if self.qshot is None:
             return False
         for eff in Effects.SMOKE, Effects.SUBMERGED:
-            if eff in self.game.board[self.wieldingunit.square].effects:
+            if self.game.board[self.wieldingunit.square].effects & eff:
                 self.qshot = None
                 return False
             return True
 
 class Weapon_DirectionalValidate_Base(Weapon_Validate_Base):
     "A validate method that works for melee and projectile weapons."
+    __slots__ = ()
     def validate(self):
         "qshot should be (Direction.XX,). This method checks one square in direction to make sure it's onboard."
         if super().validate(): # if a shot is queued and the unit is not smoked or submerged...
-            self.targetsquare = self.game.board[self.wieldingunit.square].getRelSquare(*self.qshot, 1)
+            self.targetsquare = getRelSquare(self.wieldingunit.square, *self.qshot, 1)
             if not self.targetsquare: # shot was offboard
                 self.qshot = None
             else:
                 return True
         return False
 
-class Weapon_DirectionalFlip_Base():
+class Weapon_DirectionalFlip_Base(Weapon_Base):
     "A flip method that works for melee, projectile, and charge weapons. Doesn't work for artillery"
+    __slots__ = ()
     def flip(self):
+        self.wieldingunit._touch()
         try:
             self.qshot = (Direction.opposite(*self.qshot),)
         except InvalidDirection: # qshot was None
@@ -4339,25 +5282,33 @@ class Weapon_DirectionalFlip_Base():
 # Vek weapon high-level base objects:
 class Weapon_SurroundingShoot_Base(Weapon_Vek_Base):
     "Base weapon for vek weapons that damage adjacent tiles such as blob and digger weapons."
+    __slots__ = ()
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's shot from any of squares, the ones next to them."
+        return getArea(squares, 1)
     def shoot(self):
         "return True if the shot happened, False if it didn't."
         if self.qshot is not None:
             for d in Direction.gen():
-                try:
-                    self._dealDamage(self.game.board[self.wieldingunit.square].getRelSquare(d, 1))
-                except KeyError: # game.board[False]
-                    pass
+                sq = getRelSquare(self.wieldingunit.square, d, 1)
+                if sq:
+                    self._dealDamage(sq)
             return True
         return False
 
 class Weapon_Blob_Base(Weapon_SurroundingShoot_Base):
     "Base weapon for blobs that explode"
+    __slots__ = ()
     def shoot(self):
         if super().shoot():
             self.wieldingunit.die()
 
 class Weapon_VekMelee_Base(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base):
     "Shared shoot method for melee attacks used by Scorpions, Leapers, and hornets."
+    __slots__ = ()
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's shot from any of squares. Melee attacks only hit the square next to the wielder."
+        return getArea(squares, 1)
     def shoot(self):
         if self.qshot is not None:
             self._dealDamage(self.targetsquare)
@@ -4366,6 +5317,7 @@ class Weapon_VekMelee_Base(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, Wea
 
 class Weapon_VekProjectileShoot_Base(Weapon_getSquareOfUnitInDirection_Base):
     "A base shoot method shared by vek projectile weapons such as the Firefly and Centipede weapons."
+    __slots__ = ()
     def shoot(self):
         if self.qshot is not None:
             self.targetsquare = self._getSquareOfUnitInDirection(*self.qshot, edgeok=True)
@@ -4375,30 +5327,30 @@ class Weapon_VekProjectileShoot_Base(Weapon_getSquareOfUnitInDirection_Base):
 
 class Weapon_Thorax_Base(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base, Weapon_VekProjectileShoot_Base):
     "Base class for Firefly Thorax weapons"
+    __slots__ = ()
 
 class Weapon_VekCharge_Base(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base, Weapon_hurtAndPushEnemy_Base):
     "A base for vek charge weapons."
+    __slots__ = ()
     def shoot(self):
         "Have the unit charge across the board, dying if it comes across a swallow tile."
         if self.qshot is not None:
             prevsquare = self.wieldingunit.square # set the previous tile since if we run into a unit we have to put the unit here
-            while True: # self.targetsquare is already set to the first tile from validation
-                if self.game.board[self.targetsquare].unit: # if the next square has a unit on it...
-                    self._hurtAndPushEnemy(self.targetsquare, *self.qshot) # hurt and push the enemy
+            victimsquare = self.game.getFirstUnitSquare(prevsquare, *self.qshot) # None if the vek can charge all the way to the edge
+            for targetsquare in RAYS[prevsquare][self.qshot[0]][1:]: # the first of these is self.targetsquare from validation
+                if targetsquare == victimsquare: # if the next square has a unit on it...
+                    self._hurtAndPushEnemy(targetsquare, *self.qshot) # hurt and push the enemy
                     self.game.board[self.wieldingunit.square].moveUnit(prevsquare) # then move to the square before this one
                     return # and we're done
-                elif self.game.board[self.targetsquare].isSwallow():
-                    self.game.board[self.wieldingunit.square].moveUnit(self.targetsquare) # move the unit here so it can die or trip the mine
+                elif self.game.board[targetsquare].isSwallow():
+                    self.game.board[self.wieldingunit.square].moveUnit(targetsquare) # move the unit here so it can die or trip the mine
                     return
-                else: # there was no unit and the tile didn't kill the vek
-                    prevsquare = self.targetsquare
-                    self.targetsquare = self.game.board[self.targetsquare].getRelSquare(*self.qshot, 1)
-                    if not self.targetsquare: # if we went off the board
-                        self.game.board[self.wieldingunit.square].moveUnit(prevsquare) # move to that edge tile
-                        return
+                prevsquare = targetsquare # there was no unit and the tile didn't kill the vek
+            self.game.board[self.wieldingunit.square].moveUnit(prevsquare) # we reached the edge of the board, move to that edge tile
 
 class Weapon_NPCArtillery_Base(Weapon_NPC_Base, Weapon_Validate_Base, Weapon_getRelSquare_Base):
     "Base object for vek artillery weapons for Scarabs and Crabs and the bots."
+    __slots__ = ()
     def validate(self):
         "qshot is stored as (Direction, RelDistance)"
         if super().validate():
@@ -4407,6 +5359,7 @@ class Weapon_NPCArtillery_Base(Weapon_NPC_Base, Weapon_Validate_Base, Weapon_get
                 self.qshot = None # invalidate the shot
                 return
     def flip(self):
+        self.wieldingunit._touch()
         try:
             self.qshot = (Direction.opposite(self.qshot[0]), self.qshot[1]) # only flip the direction, don't touch the distance
         except TypeError: # None[0]
@@ -4420,54 +5373,62 @@ class Weapon_NPCArtillery_Base(Weapon_NPC_Base, Weapon_Validate_Base, Weapon_get
 
 class Weapon_VekArtillery_Base(Weapon_Vek_Base, Weapon_NPCArtillery_Base):
     "Base object for vek artillery weapons for Scarabs and Crabs and the bots."
+    __slots__ = ()
 
 class Weapon_ExplosiveExpulsions_Base(Weapon_VekArtillery_Base):
     "Base class for Crab weapons"
+    __slots__ = ()
     def shoot(self):
         if super().shoot():
-            try:
-                self._dealDamage(self.game.board[self.targetsquare].getRelSquare(self.qshot[0], 1))
-            except KeyError:  # board[False]
-                pass  # the secondary target can be offboard
+            sq = getRelSquare(self.targetsquare, self.qshot[0], 1)
+            if sq:  # the secondary target can be offboard
+                self._dealDamage(sq)
 
 class Weapon_Vomit_Base(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base, Weapon_VekProjectileShoot_Base):
     "Base class for Centipede weapons"
+    __slots__ = ()
     def shoot(self):
         if super().shoot():
             self.game.board[self.targetsquare].applyAcid() # give acid to the square that was already damaged by the parent obj
             for d in Direction.genPerp(*self.qshot):
-                secondarysquare = self.game.board[self.targetsquare].getRelSquare(d, 1)
-                try:
-                    self._dealDamage(secondarysquare)
-                except KeyError: # board[False]
+                secondarysquare = getRelSquare(self.targetsquare, d, 1)
+                if not secondarysquare:
                     continue # secondary square was offboard
+                self._dealDamage(secondarysquare)
                 self.game.board[secondarysquare].applyAcid() # give it acid after attacking it
 
 class Weapon_Carapace_Base(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base):
     "Base class for Burrower Carapace weapons"
+    __slots__ = ()
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's shot from any of squares. It hits the square next to the wielder and the 2 beside that one."
+        return getArea(squares, 2)
     def shoot(self):
         if self.qshot is not None:
             self._dealDamage(self.targetsquare)# hit the main target square
             for d in Direction.genPerp(*self.qshot):
-                try:
-                    self._dealDamage(self.game.board[self.targetsquare].getRelSquare(d, 1))
-                except KeyError: # board[False]
-                    continue # secondary square was offboard
+                sq = getRelSquare(self.targetsquare, d, 1)
+                if sq: # the secondary square can be offboard
+                    self._dealDamage(sq)
 
 class Weapon_GreaterHornet_Base(Weapon_VekMelee_Base):
     "A base class for AlphaHornet and HornetLeader that stab multiple tiles. self.range must be set by the child object"
+    __slots__ = ()
     damage = 2 # both units do 2 damage
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's shot from any of squares. It stabs the square next to the wielder and self.extrarange more past it."
+        return getLines(squares, 1 + self.extrarange)
     def shoot(self):
         if super().shoot(): # hit the first tile
             for r in range(self.extrarange):
-                self.targetsquare = self.game.board[self.targetsquare].getRelSquare(*self.qshot, 1)
-                try:
-                    self._dealDamage(self.targetsquare)
-                except KeyError: # board[False], secondary tile was offboard
+                self.targetsquare = getRelSquare(self.targetsquare, *self.qshot, 1)
+                if not self.targetsquare: # secondary tile was offboard
                     return # don't process further shots
+                self._dealDamage(self.targetsquare)
 
 class Weapon_Cannon8R_Base(Weapon_NPC_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base, Weapon_getSquareOfUnitInDirection_Base):
     "Base class for the weapons used by Cannon-Bot and Cannon-Mech."
+    __slots__ = ()
     def shoot(self):
         if self.qshot is not None: # copypasta from Weapon_VekArtillery_Base.
             self.targetsquare = self._getSquareOfUnitInDirection(*self.qshot, edgeok=True)
@@ -4476,126 +5437,150 @@ class Weapon_Cannon8R_Base(Weapon_NPC_Base, Weapon_DirectionalValidate_Base, Wea
 
 class Weapon_Vk8Rockets_Base(Weapon_VekArtillery_Base):
     "Base class for the weapons used by ArtilleryBot and ArtilleryMech"
+    __slots__ = ()
     def shoot(self):
         if super().shoot(): # this hits the targeted square
             for d in Direction.genPerp(self.qshot[0]): # now hit the 2 squares beside it
-                try:
-                    self.game.board[self.game.board[self.targetsquare].getRelSquare(d, 1)].takeDamage(self.damage)
-                except KeyError: # board[False]
-                    pass # secondary hit was off the board
+                sq = getRelSquare(self.targetsquare, d, 1)
+                if sq: # a secondary hit can be off the board
+                    self.game.board[sq].takeDamage(self.damage)
 
 class Weapon_BKRBeam_Base(Weapon_NPC_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base, Weapon_BlocksBeamShot_Base):
     "Base class for laser bot/mech weapons"
+    __slots__ = ()
     def shoot(self):
         if self.qshot is not None:
             currentdamage = self.damage # damage being dealt as the beam travels. This decreases the further we go until we reach 1
-            targettile = self.game.board[self.game.board[self.wieldingunit.square].getRelSquare(self.qshot[0], 1)]  # get the target tile, not square
+            targettile = self.game.board[getRelSquare(self.wieldingunit.square, self.qshot[0], 1)]  # get the target tile, not square
             while True:
                 targettile.takeDamage(currentdamage) # damage the tile
                 if self.blocksBeamShot(targettile.unit): # no more pew pew
                     return
                 if currentdamage != 1:
                     currentdamage -= 1
-                try:
-                    targettile = self.game.board[self.game.board[targettile.square].getRelSquare(self.qshot[0], 1)] # get the target tile, not square
-                except KeyError: # self.game.board[False] means we went off the board
+                nextsquare = getRelSquare(targettile.square, self.qshot[0], 1)
+                if not nextsquare: # we went off the board
                     return # no more pew pew
+                targettile = self.game.board[nextsquare] # get the target tile, not square
 
 ############################## Actual vek weapons: #######################################################
 class Weapon_UnstableGuts(Weapon_Blob_Base):
     "Explode, killing itself and damaging adjacent tiles for 1 damage. Kill it first to stop it. Blob"
+    __slots__ = ()
     damage = 1
 
 class Weapon_VolatileGuts(Weapon_Blob_Base):
     "Explode, killing itself and damaging adjacent tiles for 3 damage. Kill it first to stop it. Alpha Blob"
+    __slots__ = ()
     damage = 3
 
 class Weapon_UnstableGrowths(Weapon_Vek_Base):
     "Throw a sticky blob that will explode. Blobber"
+    __slots__ = ()
     def shoot(self):
         self.game.score.submit(-5, 'blob_spawned')
 
 class Weapon_VolatileGrowths(Weapon_Vek_Base):
     "Throw a massive blob that will explode. Blobber"
+    __slots__ = ()
     def shoot(self):
         self.game.score.submit(-6, 'alpha_blob_spawned')
 
 class Weapon_TinyOffspring(Weapon_Vek_Base):
     "Throw a sticky egg that hatches into a Spiderling. Spider"
+    __slots__ = ()
     def shoot(self):
         self.game.score.submit(-2, 'spideregg_spawned')
 
 class Weapon_LargeOffspring(Weapon_Vek_Base):
     "Throw a sticky egg that hatches into an Alpha Spiderling. AlphaSpider"
+    __slots__ = ()
     def shoot(self):
         self.game.score.submit(-3, 'alphaspideregg_spawned')
 
 class Weapon_StingingSpinneret(Weapon_VekMelee_Base):
     "Web an adjacent target, preparing to stab it for 1 damage. (We don't actually do any webbing here). Scorpion."
+    __slots__ = ()
     damage = 1
 
 class Weapon_GoringSpinneret(Weapon_VekMelee_Base):
     "Web an adjacent target, preparing to stab it for 3 damage. (We don't actually do any webbing here). AlphaScorpion."
+    __slots__ = ()
     damage = 3
 
 class Weapon_AcceleratingThorax(Weapon_Thorax_Base):
     "Launch a volatile mass of goo dealing 1 damage. Firefly"
+    __slots__ = ()
     damage = 1
 
 class Weapon_EnhancedThorax(Weapon_Thorax_Base):
     "Launch a volatile mass of goo dealing 3 damage. AlphaFirefly"
+    __slots__ = ()
     damage = 3
 
 class Weapon_Fangs(Weapon_VekMelee_Base):
     "Web a target, preparing to stab it for 3 damage. Leaper"
+    __slots__ = ()
     damage = 3
 
 class Weapon_SharpenedFangs(Weapon_VekMelee_Base):
     "Web a target, preparing to stab it for 5 damage. AlphaLeaper"
+    __slots__ = ()
     damage = 5
 
 class Weapon_Pincers(Weapon_VekCharge_Base):
     "Charge forward to deal 1 damage and push the target. Beetle"
+    __slots__ = ()
     damage = 1
 
 class Weapon_SharpenedPincers(Weapon_VekCharge_Base):
     "Charge forward to deal 3 damage and push the target. AlphaBeetle"
+    __slots__ = ()
     damage = 3
 
 class Weapon_SpittingGlands(Weapon_VekArtillery_Base):
     "Lob an artillery shot at a single tile for 1 damage (5 tile range). Scarab"
+    __slots__ = ()
     damage = 1
 
 class Weapon_AlphaSpittingGlands(Weapon_VekArtillery_Base):
     "Lob an artillery shot at a single tile for 3 damage (5 tile range). AlphaScarab"
+    __slots__ = ()
     damage = 3
 
 class Weapon_ExplosiveExpulsions(Weapon_ExplosiveExpulsions_Base):
     "Launch artillery attack on 2 tiles for 1 damage (5 tile range). Crab"
+    __slots__ = ()
     damage = 1
 
 class Weapon_AlphaExplosiveExpulsions(Weapon_ExplosiveExpulsions_Base):
     "Launch artillery attack on 2 tiles for 3 damage (5 tile range). AlphaCrab"
+    __slots__ = ()
     damage = 3
 
 class Weapon_AcidicVomit(Weapon_Vomit_Base):
     "Launch a volatile mass of goo, dealing 1 damage and applying A.C.I.D. on nearby units. Centipede"
+    __slots__ = ()
     damage = 1
 
 class Weapon_CorrosiveVomit(Weapon_Vomit_Base):
     "Launch a volatile mass of goo, dealing 2 damage and applying A.C.I.D. on nearby units. Centipede"
+    __slots__ = ()
     damage = 2
 
 class Weapon_DiggingTusks(Weapon_SurroundingShoot_Base):
     "Create a defensive rock wall before attacking adjacent tiles for 1 damage."
+    __slots__ = ()
     damage = 1
 
 class Weapon_AlphaDiggingTusks(Weapon_SurroundingShoot_Base):
     "Create a defensive rock wall before attacking adjacent tiles for 2 damage."
+    __slots__ = ()
     damage = 2
 
 class Weapon_Stinger(Weapon_VekMelee_Base):
     "Stab the target for 1 damage. Hornet"
+    __slots__ = ()
     damage = 1
 
 # class Weapon_AcidStinger(Weapon_VekMelee_Base): # acid units aren't really implemented in the game
@@ -4607,18 +5592,22 @@ class Weapon_Stinger(Weapon_VekMelee_Base):
 
 class Weapon_LaunchingStinger(Weapon_GreaterHornet_Base):
     "Stab 2 tiles in front of the unit for 2 damage. AlphaHornet"
+    __slots__ = ()
     extrarange = 1
 
 class Weapon_SpikedCarapace(Weapon_Carapace_Base):
     "Slam against 3 tiles in a row, hitting each for 1 damage. Burrower"
+    __slots__ = ()
     damage = 1
 
 class Weapon_BladedCarapace(Weapon_Carapace_Base):
     "Slam against 3 tiles in a row, hitting each for 2 damage. AlphaBurrower"
+    __slots__ = ()
     damage = 2
 
 class Weapon_FlamingAbdomen(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, Weapon_DirectionalFlip_Base, Weapon_hurtAndPushEnemy_Base):
     "Charge, dealing 3 damage, and light every tile in the path on Fire. BeetleLeader"
+    __slots__ = ()
     # This weapon isn't affected by swallow tiles, just like a mech charge weapon
     damage = 3
     def shoot(self):
@@ -4633,7 +5622,7 @@ class Weapon_FlamingAbdomen(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, We
                 else: # there was no unit
                     firesquares.add(prevsquare)
                     prevsquare = self.targetsquare
-                    self.targetsquare = self.game.board[self.targetsquare].getRelSquare(*self.qshot, 1)
+                    self.targetsquare = getRelSquare(self.targetsquare, *self.qshot, 1)
                     if not self.targetsquare: # if we went off the board
                         self.game.board[self.wieldingunit.square].moveUnit(prevsquare) # move to that edge tile
                         break
@@ -4642,38 +5631,42 @@ class Weapon_FlamingAbdomen(Weapon_Vek_Base, Weapon_DirectionalValidate_Base, We
 
 class Weapon_GooAttack(Weapon_VekMelee_Base):
     "Attempt to squish the adjacent tile, destroying its contents. LargeGoo, MediumGoo, SmallGoo all use this same exact weapon."
+    __slots__ = ()
     damage = 4
     def shoot(self):
         """The way this weapon works is that it damages the unit like a regular melee unit would if it's a mech or if the unit doesn't die.
         However, if the unit dies and is NOT a mech, the goo takes the victim's spot on the board. If it attacks a mountain, it kills it in a single shot without creating a damagedmountain first."""
         if super().shoot():
             targetunit = self.game.board[self.targetsquare].unit
-            try:
-                if (targetunit.hp > 0 or (targetunit.alliance == Alliance.FRIENDLY and Attributes.MASSIVE in targetunit.attributes)) and not targetunit.isMountain():
-                    # if the unit the goo attacked survived or if it was a mech that was killed and the unit wasn't a mountain
-                    return # Do nothing, the goo should NOT take the place of its victim
-                else: # the unit was a mountain or it died and it wasn't a mech
-                    raise AttributeError # so the goo takes the place of the unit
-            except AttributeError: # None.isMountain(), there was no unit
+            if targetunit is not None and (targetunit.hp > 0 or (targetunit.alliance == Alliance.FRIENDLY and targetunit.attributes & Attributes.MASSIVE)) and not targetunit.isMountain():
+                # if the unit the goo attacked survived or if it was a mech that was killed and the unit wasn't a mountain
+                return # Do nothing, the goo should NOT take the place of its victim
+            else: # there was no unit, the unit was a mountain or it died and it wasn't a mech
                 self.game.postattackmoves.add((self.wieldingunit.square, self.targetsquare)) # have the goo take the place of the unit it just killed
 
 class Weapon_SuperStinger(Weapon_GreaterHornet_Base):
     "Stab three tiles in a row for 2 damage each. HornetLeader"
+    __slots__ = ()
     extrarange = 2
 
 class Weapon_MassiveSpinneret(Weapon_Vek_Base, Weapon_hurtAndPushEnemy_Base, Weapon_Validate_Base):
     "Web all targets, preparing to deal 2 damage to adjacent tiles (This attack also pushes targets). ScorpionLeader"
+    __slots__ = ()
     damage = 2
+    def getReach(self, squares):
+        "return a set of squares that this weapon can hit when it's shot from any of squares, the ones next to them."
+        return getArea(squares, 1)
     def shoot(self):
         if self.qshot is not None:
             for d in Direction.gen():
                 try:
-                    self._hurtAndPushEnemy(self.game.board[self.wieldingunit.square].getRelSquare(d, 1), d)
+                    self._hurtAndPushEnemy(getRelSquare(self.wieldingunit.square, d, 1), d)
                 except NullWeaponShot: # game.board[False]
                     pass
 
 class Weapon_BurningThorax(Weapon_Vek_Base, Weapon_Validate_Base, Weapon_getSquareOfUnitInDirection_Base):
     "Launch goo projectiles in two directions, dealing 4 damage with each. FireflyLeader."
+    __slots__ = ()
     # The shot validation for this unit is very wonky. The way Vek targeting works as far as I can tell is that any vek that attacks in a specific direction
     # targets 1 square in the direction of their attack. This means that units like the AlphaHornet can't choose to use less range, they can only choose direction.
     # When the vek is moved to the edge of the board so that their target square goes off the board, their attack is cancelled. This is all good and fine and makes sense.
@@ -4687,6 +5680,10 @@ class Weapon_BurningThorax(Weapon_Vek_Base, Weapon_Validate_Base, Weapon_getSqua
     # consistently. This leads me to the conclusion that it's random and the player can never tell which way the firefly targeted. That means moving it to the edge of the map is
     # a total gamble. I think the only sensible thing for me to do in this program is to treat this weapon as impossible to positionally invalidate.
     damage = 4
+    def getQueuedReach(self):
+        "return a set of squares that the queued shot can hit from where the wielder is now. It shoots out of both sides of the wielder."
+        square = self.wieldingunit.square
+        return getRay(square, self.qshot[0]) | getRay(square, Direction.opposite(*self.qshot))
     def shoot(self):
         if self.qshot is not None:
             for d in self.qshot[0], Direction.opposite(*self.qshot):
@@ -4697,6 +5694,10 @@ class Weapon_BurningThorax(Weapon_Vek_Base, Weapon_Validate_Base, Weapon_getSqua
 
 class Weapon_PlentifulOffspring(Weapon_Vek_Base, Weapon_Validate_Base):
     "Throw out 2-3 Spider eggs. SpiderLeader"
+    __slots__ = ()
+    def getReach(self, squares):
+        "return an empty set since the eggs are only scored, they're never put on the board."
+        return set()
     def shoot(self):
         if self.qshot is not None:
             self.game.score.submit(-5, 'many_spidereggs_spawned')
@@ -4704,6 +5705,7 @@ class Weapon_PlentifulOffspring(Weapon_Vek_Base, Weapon_Validate_Base):
 
 class Weapon_SpiderlingEgg(Weapon_Vek_Base):
     "Hatch into Spiderling. SpiderlingEgg. The unit name and weapon name are the same."
+    __slots__ = ()
     def validate(self):
         pass
     def shoot(self): # A spiderling egg will always hatch unless it is killed first, so we ignore qshot.
@@ -4711,34 +5713,42 @@ class Weapon_SpiderlingEgg(Weapon_Vek_Base):
 
 class Weapon_TinyMandibles(Weapon_VekMelee_Base):
     "Weak 1 damage attack against a single adjacent target. Spiderling"
+    __slots__ = ()
     damage = 1
 
 class Weapon_TinyMandiblesAlpha(Weapon_VekMelee_Base):
     "Weak 2 damage attack against a single adjacent target. AlphaSpiderling"
+    __slots__ = ()
     damage = 2
 
 class Weapon_Cannon8RMarkI(Weapon_Cannon8R_Base):
     "Projectile that causes target to burn. CannonBot"
+    __slots__ = ()
     damage = 1
 
 class Weapon_Cannon8RMarkII(Weapon_Cannon8R_Base):
     "Stronger projectile that causes target to burn. CannonMech"
+    __slots__ = ()
     damage = 3
 
 class Weapon_Vk8RocketsMarkI(Weapon_Vk8Rockets_Base):
     "Launch Rockets at 3 tiles (dealing 1 damage). ArtilleryBot"
+    __slots__ = ()
     damage = 1
 
 class Weapon_Vk8RocketsMarkII(Weapon_Vk8Rockets_Base):
     "Launch Rockets at 3 tiles (dealing 3 damage). ArtilleryMech"
+    __slots__ = ()
     damage = 3
 
 class Weapon_BKRBeamMarkI(Weapon_BKRBeam_Base):
     "Piercing beam, damage reduced by range (2 damage). LaserBot"
+    __slots__ = ()
     damage = 2
 
 class Weapon_BKRBeamMarkII(Weapon_BKRBeam_Base):
     "Piercing beam, damage reduced by range (4 damage). LaserMech"
+    __slots__ = ()
     damage = 4
 
 # MineBot weapon not implemented because it's actually something done during the enemy move/target phase.
@@ -4746,17 +5756,22 @@ class Weapon_BKRBeamMarkII(Weapon_BKRBeam_Base):
 
 class Weapon_Vk8RocketsMarkIII(Weapon_Vk8Rockets_Base):
     "Launch Rockets at 3 tiles dealing 2 damage to each. BotLeader_Attacking"
+    __slots__ = ()
     damage = 2
 
 class Weapon_SelfRepair(Weapon_Vek_Base, Weapon_Validate_Base):
     """This is the BotLeader's self-Repair weapon that it uses after taking damage. BotLeader_Healing
     The Bot Leader gets a shield on the start of his target phase, so this weapon here won't actually give the shield."""
+    __slots__ = ()
+    def getReach(self, squares):
+        "return a set of squares, since this only repairs the wielder."
+        return set(squares)
     # this does remove fire and presumably acid
     def shoot(self):
         if self.qshot is not None:
             self.wieldingunit.hp = self.wieldingunit.maxhp
-            if Effects.FIRE not in self.game.board[self.wieldingunit.square].effects: # these repairs do not remove bad effects from the tile. If you trap him on a fire tile and he repairs there, he keeps fire.
-                self.wieldingunit.effects.discard(Effects.FIRE) # repair doesn't remove acid from the unit, but it does remove fire.
+            if not self.game.board[self.wieldingunit.square].effects & Effects.FIRE: # these repairs do not remove bad effects from the tile. If you trap him on a fire tile and he repairs there, he keeps fire.
+                self.wieldingunit.effects &= ~Effects.FIRE # repair doesn't remove acid from the unit, but it does remove fire.
             # Ice cancels the attack like a regular weapon, he can't repair out of ice.
 
 ############################## Objective Weapons ###########################################
@@ -4766,6 +5781,10 @@ class Weapon_SelfRepair(Weapon_Vek_Base, Weapon_Validate_Base):
 
 class Weapon_ChooChoo(Weapon_Vek_Base):
     "Move forward 2 spaces, but will be destroyed if blocked. Train"
+    __slots__ = ()
+    def getReach(self, squares):
+        "return a set of squares that the train can run over from any of squares, the 2 in front of it."
+        return getLines(squares, 2)
     def validate(self):
         "The only way this shot can be invalidated is by the shot already being invalidated. Freezing it will cancel the shot, but that isn't checked here. The train is immune to smoke and it will never go in water."
         pass
@@ -4773,14 +5792,11 @@ class Weapon_ChooChoo(Weapon_Vek_Base):
         if self.qshot is not None:
             targetsquare = self.wieldingunit.square
             for r in 1, 2:
-                targetsquare = self.game.board[targetsquare].getRelSquare(Direction.RIGHT, 1)
-                try: # try to kill the units in the way of the train
-                    self.game.board[targetsquare].unit.die()
-                except AttributeError: # None.die()
-                    pass
-                except KeyError: # board[False]
+                targetsquare = getRelSquare(targetsquare, Direction.RIGHT, 1)
+                if not targetsquare:
                     raise CantHappenInGame("Train's Choo Choo weapon tried to attack off the board.")
-                else: # there was a unit in the way that died.
+                if self.game.board[targetsquare].unit is not None: # kill the units in the way of the train
+                    self.game.board[targetsquare].unit.die()
                     self.game.board[self.wieldingunit.square].unit.takeDamage(1) # only damage the train itself
                     return
     # These are the old train methods that I first wrote. These ones make the train move like it does in game.
@@ -4794,7 +5810,7 @@ class Weapon_ChooChoo(Weapon_Vek_Base):
     #             self.oldcaboosesquare = self.wieldingunit.companion
     #         prevsquare = self.wieldingunit.square
     #         for r in 1, 2:
-    #             targetsquare = self.game.board[prevsquare].getRelSquare(Direction.RIGHT, 1)
+    #             targetsquare = getRelSquare(prevsquare, Direction.RIGHT, 1)
     #             try: # try to kill the units in the way of the train
     #                 self.game.board[targetsquare].unit.die()
     #             except AttributeError: # None.die()
@@ -4818,57 +5834,56 @@ class Weapon_ChooChoo(Weapon_Vek_Base):
 
 class Weapon_SatelliteLaunch(Weapon_Vek_Base, Weapon_getRelSquare_Base):
     "Launch a satellite into space, destroying surrounding area. SatelliteRocket"
+    __slots__ = ()
+    def getReach(self, squares):
+        "return a set of squares that the launch destroys when the rocket is on any of squares, the ones next to them."
+        return getArea(squares, 1)
     def validate(self):
         pass
     def shoot(self):
         if self.qshot is not None:
             for d in Direction.gen():  # all tiles around wielder must die # copypasta from Weapon_SelfDestruct
-                try:
-                    self.game.board[self._getRelSquare(d, 1)].die()
-                except KeyError:  # game.board[False]
-                    pass
+                sq = self._getRelSquare(d, 1)
+                if sq:
+                    self.game.board[sq].die()
             # no need to actually remove the rocket from the board as it makes no difference at the end of a turn.
 
 class Weapon_Disintegrator(Weapon_AnyTileGen_Base):
     "Dissolve all target tiles with acid. acidlauncher"
+    __slots__ = ()
     def shoot(self, x, y):
         self.action((x, y))
         for d in Direction.gen(): # do all tiles around the target
-            try:
-                self.action(self.game.board[(x, y)].getRelSquare(d, 1))
-            except KeyError:
-                pass # tried to target off the board
+            sq = getRelSquare((x, y), d, 1)
+            if sq: # don't target off the board
+                self.action(sq)
     def action(self, square):
         "Kill the unit and put acid on the tile of square."
-        try:
+        if self.game.board[square].unit is not None:
             self.game.board[square].unit.die()
-        except AttributeError: # board[square].None.die()
-            pass
         self.game.board[square].applyAcid()
 
 class Weapon_Terraformer(Weapon_DirectionalGen_Base):
     "Eradicate all life in front of the Terraformer. Terraformer. Yes, the unit is called Terraformer and the weapon is also called Terraformer"
+    __slots__ = ()
+    def canShoot(self, dir):
+        "return True so that shooting off the board raises CantHappenInGame instead of being skipped."
+        return True
     def shoot(self, dir):
         targetsquare = self.wieldingunit.square
         for distance in 1, 2:
-            targetsquare = self.game.board[targetsquare].getRelSquare(dir, 1)
+            targetsquare = getRelSquare(targetsquare, dir, 1)
             self._convertGrassland(targetsquare)
             for perpsq in Direction.genPerp(dir):
-                self._convertGrassland(self.game.board[targetsquare].getRelSquare(perpsq, 1))
+                self._convertGrassland(getRelSquare(targetsquare, perpsq, 1))
     def _convertGrassland(self, sq):
         "kill the unit on square and convert the tile to sand if it was a grassland tile, ground if it wasn't."
-        try:
-            tile = self.game.board[sq]
-        except KeyError:
+        if not sq:
             raise CantHappenInGame("The Terraformer was placed in a way that it's weapon shoots off the board. This can't happen in the game.")
+        tile = self.game.board[sq]
         # if we're killing a mountain, don't replace the tile. Mountains should always only have ground tiles under them.
         # This is the correct behavior from the game, if you terraform a mountain it leaves a ground tile and not a sand tile
-        try:
-            if tile.unit.isMountain():
-                pass
-            else:
-                raise AttributeError
-        except AttributeError: # tile.None.isMountain()
+        if tile.unit is None or not tile.unit.isMountain():
             tile.replaceTile(Tile_Sand(self.game))
             # TODO: score count the score for the objective goal here.
             # Maybe this should only be counted once per shot. We shouldn't create a scenario where terraforming more grassland tiles is more valuable than killing more vek.
@@ -4882,9 +5897,11 @@ class Weapon_Terraformer(Weapon_DirectionalGen_Base):
     # Mech passives don't have disable() because even if they die and the corpse is removed via a chasm, the passive remains in play.
 # All vek passives must also support giving the passive to mechs which is what the Psionic Receiver mech passive does.
 
-class Weapon_PsionPassive_Base():
+class Weapon_PsionPassive_Base(Weapon_Base):
     "A base class for passive Psion weapons that don't need a turn. Child classes must provide _applyEffect(unit) and _removeEffect(unit)."
-    _mechs = False # Psionic receiver will set this to True via self._enableMechs() if we are to also have mechs benefit from psion passives
+    __slots__ = ('_mechs',)
+    def __init__(self):
+        self._mechs = False # Psionic receiver will set this to True via self._enableMechs() if we are to also have mechs benefit from psion passives
     def enable(self):
         """Enable the passive effect. This should only be run after all units have been placed on the board.
         If self.mechs is True, this will also give the effect to all the mechs as well as all the Vek because of the Psionic Receiver passive.
@@ -4910,9 +5927,17 @@ class Weapon_PsionPassive_Base():
     def _enableMechs(self):
         "Tell this psion weapon to also effect mechs because of Psionic Receiver"
         self._mechs = True
+    def hasGlobalEffects(self):
+        """return True if this passive or the psion dying could raise the score of units anywhere on the board, False if it can only lower it.
+        Vek losing armor or explosions doesn't score anything by itself, but the effect reaches the player's mechs too when Psionic Receiver shares it."""
+        return self._mechs
 
 class Weapon_InvigoratingSpores(Weapon_PsionPassive_Base):
     "All other Vek receive +1 HP as long as the Psion is living. Soldier Psion"
+    __slots__ = ()
+    def hasGlobalEffects(self):
+        "return True since every vek left with 1 hp dies when the psion does."
+        return True
     def _applyEffect(self, unit):
         "Don't give units more hp here, since they were already added to the board in their current state of hp. This is a dummy method."
         #unit.maxhp += 1
@@ -4920,6 +5945,7 @@ class Weapon_InvigoratingSpores(Weapon_PsionPassive_Base):
         pass
     def _removeEffect(self, unit):
         "A helper method to properly remove all the effects or attributes to unit. returns nothing."
+        unit._touch()
         if unit.hp == 1: # if this passive going away is going to kill the unit...
             unit.die() # then just have it die. Since we're not really doing damage here, this is the way to do it.
             return # We can't call takeDamage() because then a shield or ice would prevent the unit from dying which isn't what happens ingame.
@@ -4929,30 +5955,38 @@ class Weapon_InvigoratingSpores(Weapon_PsionPassive_Base):
 
 class Weapon_HardenedCarapace(Weapon_PsionPassive_Base):
     "All other Vek have incoming weapon damage reduced by 1 (By giving them armor). Shell Psion"
+    __slots__ = ('skipmechs',)
     def __init__(self):
+        super().__init__()
         self.skipmechs = set() # a set of mechs that were already armored. This is built when we enable and this is checked when removing armored so we can avoid removing armor from units that already had it before the psion.
     def _applyEffect(self, unit):
-        if Attributes.ARMORED in unit.attributes:
+        unit._touch()
+        if unit.attributes & Attributes.ARMORED:
             self.skipmechs.add(unit) # unit might be a vek, but there are no naturally armored vek
         else:
-            unit.attributes.add(Attributes.ARMORED)
+            unit.attributes |= Attributes.ARMORED
     def _removeEffect(self, unit):
+        unit._touch()
         try:
             if unit in self.skipmechs:
                 return
         except AttributeError: # self.skipmechs doesn't exist
             pass
-        unit.attributes.remove(Attributes.ARMORED)
+        unit.attributes &= ~Attributes.ARMORED
 
 class Weapon_ExplosiveDecay(Weapon_PsionPassive_Base):
     "All other Vek will explode on death, dealing 1 damage to adjacent tiles. Blast Psion"
+    __slots__ = ()
     def _applyEffect(self, unit):
-        unit.effects.add(Effects.EXPLOSIVE)
+        unit._touch()
+        unit.effects |= Effects.EXPLOSIVE
     def _removeEffect(self, unit):
-        unit.effects.remove(Effects.EXPLOSIVE)
+        unit._touch()
+        unit.effects &= ~Effects.EXPLOSIVE
 
 class Weapon_PsionSemiPassive_Base(Weapon_PsionPassive_Base):
     "A base class for passive Psion weapons that DO need a turn to apply their effect. Childs of this one don't need _applyEffect or _removeEffect, but they do need _turnAction()."
+    __slots__ = ()
     def enable(self):
         self.game.psionPassiveTurn = self._turnAction
     def disable(self):
@@ -4960,6 +5994,10 @@ class Weapon_PsionSemiPassive_Base(Weapon_PsionPassive_Base):
 
 class Weapon_Regeneration(Weapon_PsionSemiPassive_Base): # Regenerate happens after fire damage, but before enemy actions.
     "All other Vek heal 1 at the start of their turn. Blood Psion"
+    __slots__ = ()
+    def hasGlobalEffects(self):
+        "return True since healing every vek is scored."
+        return True
     def _turnAction(self):
         "This is the action to run when it's actually time to regenerate health."
         for unit in self.game.nonplayerunits:
@@ -4972,6 +6010,7 @@ class Weapon_Regeneration(Weapon_PsionSemiPassive_Base): # Regenerate happens af
 
 class Weapon_HiveTargeting(Weapon_PsionSemiPassive_Base):
     "All player units take 1 damage at the end of every turn. Psion Tyrant."
+    __slots__ = ()
     def _turnAction(self):
         "This is the action to run when it's time to actually slip 'em the tentacle."
         for unit in self.game.playerunits: # No need to check if it's a mech here, psion tentacle hurts your subunits too
@@ -4991,6 +6030,8 @@ class Weapon_HiveTargeting(Weapon_PsionSemiPassive_Base):
 
 class Weapon_Overpowered(Weapon_PsionSemiPassive_Base):
     "All other Vek gain +1 HP, Regeneration, and explode on death. Psion Abomination"
+    __slots__ = ()
+    hasGlobalEffects = Weapon_InvigoratingSpores.hasGlobalEffects # vek lose the extra hp when it dies too
     def enable(self):
         "a hybrid enable that does both of the full passive and semi passive type of enabling."
         Weapon_PsionPassive_Base.enable(self)
@@ -5014,57 +6055,43 @@ class Weapon_Overpowered(Weapon_PsionSemiPassive_Base):
 
 class Weapon_FlameShielding(Weapon_NoUpgradesInit_Base):
     "All Mechs are immune to Fire."
+    __slots__ = ()
     def enable(self):
         for unit in self.game.playerunits:
             if unit.isMech():
-                unit.attributes.add(Attributes.IMMUNEFIRE)
+                unit.attributes |= Attributes.IMMUNEFIRE
 
-class Weapon_StormGenerator():
+class Weapon_StormGenerator(Weapon_Base):
     "All Smoke deals damage to enemy units every turn."
-    damage = 1
+    __slots__ = ('damage',)
     def __init__(self, power1=False, power2=False):
+        self.damage = 1
         if power1:
             self.damage += 1
     def enable(self):
         self.game.stormtiles = set()
         # replace the game instance's stormGeneratorTurn with a real method
         self.game.stormGeneratorTurn = self._turnAction
-        # Build a set of all tiles on the board that have smoke.
+        # Build a set of all tiles on the board that have smoke. Tiles keep this up to date as smoke comes and goes.
         for t in self.game.board.values():  # for now, iterate through all 64 tiles looking for smoke TODO: optimize?
-            if Effects.SMOKE in t.effects:
+            if t.effects & Effects.SMOKE:
                 self.game.stormtiles.add(t.square)
-        # replace the dummy stormgen methods on the Tile object:
-        Tile_Base._addSmokeStormGen = self._addSmokeStormGen
-        Tile_Base._removeSmokeStormGen = self._removeSmokeStormGen
     def _turnAction(self):
         "Damage all enemy units in a tile with smoke."
         for sq in self.game.stormtiles:
             t = self.game.board[sq]
-            try:
-                if t.unit.alliance == Alliance.ENEMY:
-                    pass
-                else:
-                    continue
-            except AttributeError: # t.None.alliance, no unit
+            if t.unit is None or t.unit.alliance != Alliance.ENEMY:
                 continue
-            if Effects.SMOKE in t.effects:
+            if t.effects & Effects.SMOKE:
                 t.unit.takeDamage(self.damage, ignoreacid=True, ignorearmor=True) # the tile doesn't take damage
         self.game.flushHurt()
-    def _addSmokeStormGen(self, square):
-        self.game.stormtiles.add(square)
-    def _removeSmokeStormGen(self):
-        self.game.stormtiles.discard(self.square)
-    def disable(self):
-        "Undo the big mess we made. This is only to make tests pass ;)"
-        # put the dummy stormgen methods back onto the Tile object:
-        Tile_Base._addSmokeStormGen = Tile_Base._pass
-        Tile_Base._removeSmokeStormGen = Tile_Base._pass
 
-class Weapon_VisceraNanobots():
+class Weapon_VisceraNanobots(Weapon_Base):
     "Mechs heal 1 damage when they deal a killing blow."
-    heal = 1
+    __slots__ = ('heal',)
     def __init__(self, power1=False, power2=False):
         "power2 is ignored."
+        self.heal = 1
         if power1:
             self.heal += 1
     def enable(self): # TODO: finish implementing this into the player's attack turn
@@ -5075,23 +6102,27 @@ class Weapon_VisceraNanobots():
 
 class Weapon_RepairField(Weapon_NoUpgradesInit_Base):
     "Repairing one Mech will affect all Mechs."
+    __slots__ = ()
     def enable(self):
         self.game.otherpassives.add(Passives.REPAIRFIELD)
 
 class Weapon_AutoShields(Weapon_NoUpgradesInit_Base):
     "Buildings gain a Shield after taking damage."
+    __slots__ = ()
     def enable(self):
         self.game.otherpassives.add(Passives.AUTOSHIELDS)
 
 class Weapon_Stabilizers(Weapon_NoUpgradesInit_Base):
     "Mechs no longer take damage when blocking emerging Vek."
+    __slots__ = ()
     def enable(self):
         self.game.otherpassives.add(Passives.STABILIZERS)
 
 class Weapon_PsionicReceiver(Weapon_NoUpgradesInit_Base):
     "Mechs use bonuses from Vek Psion."
+    __slots__ = ()
     def enable(self):
-        raise FakeException
+        self.game.otherpassives.add(Passives.PSIONICRECEIVER)
 
 # Not doing this one, just tell the game how many moves your mechs currently have.
 # class Weapon_KickoffBoosters():
@@ -5112,7 +6143,10 @@ class Weapon_PsionicReceiver(Weapon_NoUpgradesInit_Base):
 
 class Weapon_VekHormones(Weapon_IncreaseDamageWithPowerInit_Base):
     "Enemies do +1 Damage against other enemies."
-    damage = 1
+    __slots__ = ('damage',)
+    def __init__(self, power1=False, power2=False):
+        self.damage = 1
+        super().__init__(power1, power2)
     def enable(self):
         self.game.vekhormones = self.damage
         Weapon_Vek_Base._dealDamage = Weapon_Vek_Base._dealDamageVekHormones
@@ -5122,6 +6156,7 @@ class Weapon_VekHormones(Weapon_IncreaseDamageWithPowerInit_Base):
 
 class Weapon_ForceAmp(Weapon_NoUpgradesInit_Base):
     "All Vek take +1 damage from Bumps and blocking emerging Vek."
+    __slots__ = ()
     def enable(self):
         self.game.otherpassives.add(Passives.FORCEAMP)
 
@@ -5129,6 +6164,7 @@ class Weapon_ForceAmp(Weapon_NoUpgradesInit_Base):
 
 class Weapon_CriticalShields(Weapon_NoUpgradesInit_Base):
     "If Power Grid is reduced to 1, all buildings gain a Shield."
+    __slots__ = ()
     def enable(self):
         "Replace your old and busted powergrid object with the special powergrid for dealing with critical shields."
         self.game.powergrid = Powergrid_CriticalShields(self.game, self.game.powergrid.hp)
@@ -5143,7 +6179,7 @@ class Pilot_AddAttr_Base():
     def __init__(self, attr):
         self.attr = attr
     def enable(self):
-        self.mech.attributes.add(self.attr)
+        self.mech.attributes |= self.attr
 
 class Pilot_SecondaryMove_Base():
     "A base class for pilots that enable moving again after shooting."
@@ -5213,37 +6249,144 @@ class Pilot_Kazaaakpleth(Pilot_ReplaceRepairWep_Base):
         super().__init__(Weapon_MantisSlash())
 
 ############################# SCORING #######################
+class ScoreEventRegistry():
+    """This gives each score event an int code so that ScoreKeepers can log events without building a string for each one.
+    Codes are only good in the process that made them, so ScoreKeepers turn them back into names when they're pickled."""
+    def __init__(self):
+        self.codes = {} # {(event, type): code}
+        self.names = [None] # the readable name of each code. 0 isn't a code so that undone events can be logged as the negative of their code.
+    def getCode(self, event, type=None):
+        """return the int code of a score event, registering it if it's new.
+        event is a string of a score event name. type is the type of the unit or tile that the event happened to, it goes in front of event in the name."""
+        try:
+            return self.codes[(event, type)]
+        except KeyError:
+            pass
+        if type is None:
+            self.names.append(event)
+        else:
+            self.names.append('{0}_{1}'.format(type, event))
+        code = self.codes[(event, type)] = len(self.names) - 1
+        return code
+    def getName(self, code):
+        "return the readable name of the score event with code."
+        return self.names[code]
+
+ScoreEvents = ScoreEventRegistry() # the registry that every ScoreKeeper in this process uses
+
 class ScoreKeeper():
     "This object keeps track of the score of a single game simulation with certain criteria. The MasterScoreKeeper feeds it."
     score = 0
     def __init__(self):
-        self.log = [] # a tally of which events this scorekeeper saw. The amount is prepended to the log event
-        # When a score is undone, a - is prepended to the log event.
-    def submit(self, score, event, amount=1):
+        self.log = array('l') # a tally of which events this scorekeeper saw as pairs of event code and amount. Use getLog() to read it.
+        # When a score is undone, the negative of the event's code is logged.
+    def submit(self, score, event, amount=1, type=None):
         """Submit a single event to be scored.
         score is an int of the points that it's worth.
         event is a string of a score event name.
         amount is the number of times to score it.
+        type is the type of the unit or tile that the event happened to, if any. It's put in front of event when the log is read.
         returns nothing."""
-        self.log.append('{0}{1}'.format(amount, event))
+        self.log.extend((ScoreEvents.getCode(event, type), amount))
         self.score += score * amount
-    def undo(self, score, event, amount=1):
-        "Undo a single event in the score. event is a score constant. amount is the number of times to score it. returns nothing."
-        self.log.append('-{0}{1}'.format(amount, event))
+    def undo(self, score, event, amount=1, type=None):
+        "Undo a single event in the score. event, amount and type are the same as they were for submit(). returns nothing."
+        self.log.extend((-ScoreEvents.getCode(event, type), amount))
         self.score -= score * amount
+    def getLog(self):
+        """return a list of readable strings of the events in the log.
+        Each one is the event name with the amount in front of it, and a - in front of that if the event was undone: ['1building_hurt', '-1building_hurt']"""
+        log = []
+        for index in range(0, len(self.log), 2):
+            code, amount = self.log[index], self.log[index + 1]
+            if code < 0:
+                log.append('-{0}{1}'.format(amount, ScoreEvents.getName(-code)))
+            else:
+                log.append('{0}{1}'.format(amount, ScoreEvents.getName(code)))
+        return log
+    def __getstate__(self):
+        "Pickle the log with event names instead of codes since another process has its own codes."
+        state = self.__dict__.copy()
+        state['log'] = [(ScoreEvents.getName(abs(code)), code < 0, amount) for code, amount in zip(self.log[::2], self.log[1::2])]
+        return state
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.log = array('l')
+        for name, undone, amount in state['log']:
+            code = ScoreEvents.getCode(name)
+            self.log.extend((-code if undone else code, amount))
+    def getCopy(self):
+        "return a copy of this scorekeeper that won't change along with this one."
+        return cloneObject(self, {})
+    def getRank(self):
+        """return a tuple that sorts scorekeepers from worst to best.
+        Equal scores are ranked by their action logs so the same solution is always chosen, no matter which one was found first.
+        A scorekeeper without an action log ranks below one with the same score that has it."""
+        try:
+            return (self.score, True, self.actionlog)
+        except AttributeError: # self.actionlog wasn't set
+            return (self.score, False, [])
     def __lt__(self, other):
-        if self.score < other.score:
-            return True
-        return False
+        return self.getRank() < other.getRank()
     def __gt__(self, other):
-        if self.score > other.score:
-            return True
-        return False
+        return self.getRank() > other.getRank()
     def __str__(self):
         try:
-            return "Score: {0}, Events: {1}, ActionLog: {2}".format(self.score, self.log, self.actionlog)
+            return "Score: {0}, Events: {1}, ActionLog: {2}".format(self.score, self.getLog(), self.actionlog)
         except AttributeError: # self.actionlog wasn't set
-            return "Score: {0}, Events: {1}, ActionLog: None".format(self.score, self.log)
+            return "Score: {0}, Events: {1}, ActionLog: None".format(self.score, self.getLog())
+
+class TopKScoreKeeper():
+    """This keeps the best k distinct solutions that a search found, ranked the same way as ScoreKeeper.getRank().
+    The solutions are kept in a heap with the worst one on top, so a new solution only has to beat that one to get in and at most k action logs are held.
+    Solutions with the same action log are only kept once."""
+    def __init__(self, k=1):
+        "k is the number of solutions to keep."
+        self.k = k
+        self.heap = [] # a heap of (rank, ScoreKeeper) tuples with the worst solution first
+        self.actionlogs = set() # tuples of the action logs of the solutions in heap
+    def submit(self, score, log, actionlog):
+        """Offer a solution. score is the final score int, log is the score log and actionlog is the game's action log.
+        A ScoreKeeper is only made for the solution if it's kept. returns True if it was kept, False if it wasn't good enough or was already kept."""
+        if len(self.heap) >= self.k and (score, True, actionlog) <= self.heap[0][0]:
+            return False
+        key = tuple(actionlog)
+        if key in self.actionlogs:
+            return False
+        scorekeeper = ScoreKeeper()
+        scorekeeper.score = score
+        scorekeeper.log = array('l', log)
+        scorekeeper.actionlog = list(actionlog)
+        entry = (scorekeeper.getRank(), scorekeeper)
+        if len(self.heap) < self.k:
+            heappush(self.heap, entry)
+        else:
+            self.actionlogs.discard(tuple(heapreplace(self.heap, entry)[1].actionlog))
+        self.actionlogs.add(key)
+        return True
+    def add(self, scorekeeper):
+        "Offer the solution in scorekeeper, such as one kept by a TopKScoreKeeper in another process. Blank scorekeepers are ignored. returns True if it was kept, False if not."
+        try:
+            return self.submit(scorekeeper.score, scorekeeper.log, scorekeeper.actionlog)
+        except AttributeError: # scorekeeper.actionlog wasn't set
+            return False
+    def isFull(self):
+        "return True if k solutions are kept, so new ones have to beat getWorst() to get in."
+        return len(self.heap) >= self.k
+    def getWorst(self):
+        "return the ScoreKeeper of the worst solution kept. raise IndexError if there aren't any."
+        return self.heap[0][1]
+    def getBest(self):
+        "return the ScoreKeeper of the best solution kept, or a blank ScoreKeeper if there aren't any."
+        try:
+            return max(self.heap)[1]
+        except ValueError: # max() of an empty heap
+            return ScoreKeeper()
+    def getSolutions(self):
+        "return a list of the ScoreKeepers of the solutions kept, best first."
+        return [scorekeeper for rank, scorekeeper in sorted(self.heap, reverse=True)]
+    def __len__(self):
+        return len(self.heap)
 
 ################################ SIMULATING ############################
 class BinaryCounter():
@@ -5276,9 +6419,11 @@ class BinaryCounter():
 
 class OrderGenerator(): # TODO: we aren't generating orders for tank sub-units spawned by those weapons!
     "This object takes a Game object that's been set up and it generates instructions for worker threads to carry out and simulate."
+    actionranks = {Actions.MOVE: 0, Actions.SHOOT: 1, Actions.SHOOT2: 2, Actions.MOVE2: 3} # the only order that _validate() lets a unit take its actions in
     def __init__(self, game):
         self.game = game
         self.game.start()
+        self.branching = {} # {(unit, action): how many different ways unit can take action from the start of the turn}
     def __iter__(self):
         self.gen = self._gen()
         return self
@@ -5286,34 +6431,101 @@ class OrderGenerator(): # TODO: we aren't generating orders for tank sub-units s
         return next(self.gen)
     def _gen(self):
         "Do the actual generating tuples of tuples: ((unit, Action.xyz), ...)"
+        globaleffects = self.game.hasGlobalEffects()
         for playeractions in self._genActions():
+            if globaleffects:
+                footprints = None
+            else:
+                footprints = self._getFootprints(playeractions)
             for order in permutations(playeractions):
-                if self._validate(order):
+                if self._validate(order) and self._isCanonical(order, playeractions, footprints):
                     #print("Valid:", tuple([(unit.type, Actions.pprint((action,))[0]) for unit, action in order])) # DEBUG
                     yield order
+    def getOrderCount(self):
+        """return the number of orders that this generator makes, including the empty one, without making them.
+        Each unit can only take its actions in one order, so the orders made from a set of actions are the ways to interleave the units' actions,
+        less the ones that _isCanonical() rejects as duplicates. _countOrders() counts those for each set of actions that _genActions() makes."""
+        globaleffects = self.game.hasGlobalEffects()
+        count = 0
+        for playeractions in self._genActions():
+            if globaleffects:
+                footprints = None
+            else:
+                footprints = self._getFootprints(playeractions)
+            count += self._countOrders(playeractions, footprints)
+        return count
+    def estimateSims(self, order):
+        """return an estimate of how many simulations order will take, the product of the number of ways each of its actions can be taken from the start of the turn.
+        This is usually more than OrderSimulator runs since earlier actions can kill units and block squares, and results are shared through the TranspositionTable.
+        It's 0 for the empty order."""
+        if not order:
+            return 0
+        sims = 1
+        for unit, action in order:
+            sims *= self._getBranching(unit, action)
+        return sims
+    def _getBranching(self, unit, action):
+        "return how many different ways unit can take action from the start of the turn, counted with the same generators that Player_Action_Iters use."
+        key = (unit, action)
+        branching = self.branching.get(key)
+        if branching is None:
+            if action in (Actions.SHOOT, Actions.SHOOT2):
+                gen = Player_Action_Iter_Shoot(self.game, unit)._genNextShot()
+            elif action == Actions.MOVE:
+                gen = Player_Action_Iter_Move(self.game, unit, unit.moves)._genNextMove()
+            else:
+                gen = Player_Action_Iter_Move(self.game, unit, unit.secondarymoves)._genNextMove()
+            branching = self.branching[key] = sum(1 for way in gen)
+        return branching
+    def _countOrders(self, playeractions, footprints):
+        """return the number of orders of playeractions that _validate() and _isCanonical() accept. footprints is what _getFootprints() returned for playeractions.
+        Every order that _isCanonical() accepts stands for all the orders that only differ from it by swapping independent actions, so this counts those groups.
+        A group is fixed by which action of each dependent pair goes first, so they're counted by which actions could go first: every group starts with some set of
+        independent actions that each unit can take first, and counting the groups that start with each set, subtracting the ones counted twice, gives the total."""
+        chains = {} # {unit: list of the unit's (unit, action) tuples in the order they have to be taken}
+        for unitaction in playeractions:
+            chains.setdefault(unitaction[0], []).append(unitaction)
+        chains = list(chains.values())
+        for chain in chains:
+            chain.sort(key=lambda unitaction: self.actionranks[unitaction[1]])
+            if chain[-1][1] == Actions.MOVE2 and not (len(chain) > 1 and chain[-2][1] in (Actions.SHOOT, Actions.SHOOT2)): # 2nd moves are only allowed after shooting
+                return 0
+        counts = {} # {tuple of how many actions of each chain were taken: how many groups of orders the rest of the actions can be taken in}
+        def count(taken):
+            if taken in counts:
+                return counts[taken]
+            heads = [index for index, chain in enumerate(chains) if taken[index] < len(chain)] # the chains that have actions left
+            if not heads: # the only order left is the empty one
+                return 1
+            total = 0
+            for size in range(1, len(heads) + 1):
+                for first in combinations(heads, size): # the actions that go first, before any action that depends on them
+                    actions = [chains[index][taken[index]] for index in first]
+                    if size > 1 and (footprints is None or any(not self._isIndependent(a, b, footprints) for a, b in combinations(actions, 2))):
+                        continue
+                    after = list(taken)
+                    for index in first:
+                        after[index] += 1
+                    if size % 2:
+                        total += count(tuple(after))
+                    else:
+                        total -= count(tuple(after))
+            counts[taken] = total
+            return total
+        return count((0,) * len(chains))
     def _getAllActions(self):
         """return a list of all possible actions the player can take on their turn.
         This includes exclusive moves, for example if a unit can shoot twice this will also show that they can move,
         even though they can't do both on a single turn.
         It's a list of tuples: [(unit, action), ...]"""
         allactions = []
-        for pcu in self.game.playerunits:
+        for pcu in sorted(self.game.playerunits, key=lambda unit: unit.square): # sorted so the orders come out the same every time
             allactions.append((pcu, Actions.SHOOT)) # all units can shoot
             if pcu.moves: # if the unit can move
                 allactions.append((pcu, Actions.MOVE)) # give it a move turn
-            try:
-                if pcu.secondarymoves: # if the unit has a secondary move
-                    raise FakeException
-            except AttributeError: # unit didn't have secondarymoves at all, it wasn't a mech
-                pass
-            except FakeException:
+            if getattr(pcu, 'secondarymoves', 0): # if the unit has a secondary move. Units that aren't mechs don't have secondarymoves at all.
                 allactions.append((pcu, Actions.MOVE2))  # give it a 2nd move turn
-            try:
-                if pcu.canDoubleShot(): # if the unit is allowed a 2nd shot
-                    raise FakeException
-            except AttributeError:
-                pass
-            except FakeException:
+            if hasattr(pcu, 'canDoubleShot') and pcu.canDoubleShot(): # if the unit is allowed a 2nd shot
                 allactions.append((pcu, Actions.SHOOT2))
         return allactions
     def _validate(self, actionorder):
@@ -5342,6 +6554,101 @@ class OrderGenerator(): # TODO: we aren't generating orders for tank sub-units s
             elif action == Actions.SHOOT2: # you can't move or take your first shot after your 2nd shot.
                 bannedactions[unit].update({Actions.MOVE, Actions.SHOOT})
         return True
+    def _isCanonical(self, actionorder, playeractions, footprints):
+        """Verify that this order is the one we simulate out of all the orders that only differ by swapping independent actions.
+        Two actions are independent when they belong to different units and can't touch any of the same squares, e.g. 2 mechs moving on opposite sides of the board.
+        Doing them in either order ends with the same game, so only the order that keeps them in the same order as playeractions is simulated.
+        footprints is what _getFootprints() returned for playeractions.
+        return True if this order should be simulated, False if it's a duplicate of another order."""
+        if footprints is None: # nothing is independent, every order is different
+            return True
+        position = {action: index for index, action in enumerate(playeractions)}
+        for j in range(1, len(actionorder)):
+            for i in range(j - 1, -1, -1):
+                if not self._isIndependent(actionorder[i], actionorder[j], footprints):
+                    break # actionorder[j] can't be swapped any further forward than this
+                if position[actionorder[j]] < position[actionorder[i]]: # actionorder[j] could be swapped to before actionorder[i] and it would be earlier in playeractions
+                    return False
+        return True
+    def _isIndependent(self, firstaction, secondaction, footprints):
+        "return True if these 2 (unit, action) tuples can be done in either order with the same result, False if they can't."
+        if firstaction[0] is secondaction[0]: # a unit's own actions always depend on each other
+            return False
+        firstfootprint = footprints[firstaction]
+        secondfootprint = footprints[secondaction]
+        if firstfootprint is None or secondfootprint is None:
+            return False
+        return firstfootprint.isdisjoint(secondfootprint)
+    def _getFootprints(self, playeractions):
+        """Find out which squares each action in playeractions could possibly touch.
+        A shot that could hit another unit might push it anywhere the shot touches, so that unit's actions are worked out from all of those squares too.
+        returns a dict of {(unit, action): frozenset of squares}. The value is None for actions that could touch any square."""
+        starts = {unit: {unit.square} for unit, action in playeractions} # {unit: set of squares the unit could be on before it moves}
+        changed = {unit.square for unit in starts} # squares that the other actions could change, so a blocker there might not block a move
+        while True:
+            positions = {} # {unit: set of squares the unit can be on when it acts}
+            for unit, start in starts.items():
+                if (unit, Actions.MOVE) not in playeractions:
+                    positions[unit] = start
+                elif len(start) == 1: # it can't be pushed before it moves
+                    positions[unit] = self._getMoveReach(unit, changed)
+                else:
+                    positions[unit] = getArea(start, unit.moves)
+            footprints = {}
+            pushed = False
+            for unit, action in playeractions:
+                if action == Actions.MOVE: # a move can only touch the squares it passes through and the ones next to them
+                    footprint = getArea(positions[unit], 1)
+                    if unit.effects & Effects.EXPLOSIVE: # the unit explodes if it dies where it moves
+                        footprints[(unit, action)] = self._widenFootprint(footprint)
+                    else:
+                        footprints[(unit, action)] = frozenset(footprint)
+                    continue # units can't push others by moving
+                if action == Actions.SHOOT:
+                    landings = self._getShotFootprint(unit, positions[unit]) # where the units it hits could end up
+                else: # 2nd moves and shots happen after the unit may have been flung anywhere by its own weapon
+                    landings = None
+                if landings is None:
+                    footprints[(unit, action)] = None
+                    landings = SQUARES
+                else:
+                    landings |= self.game.getBlastReach(landings) # explosions that the shot sets off can destroy blockers too
+                    footprints[(unit, action)] = self._widenFootprint(landings)
+                if not changed.issuperset(landings):
+                    changed.update(landings)
+                    pushed = True
+                for otherunit, start in starts.items():
+                    if otherunit is not unit and not start.issuperset(landings) and not positions[otherunit].isdisjoint(landings):
+                        start.update(landings)
+                        pushed = True
+            if not pushed:
+                return footprints
+    def _getMoveReach(self, unit, changed):
+        """return a set of the squares that unit could move through or to from where it is now, including that square.
+        changed is a set of squares that other actions could change. Blockers on them are ignored since they could be pushed or destroyed out of the way.
+        Webs and ice are ignored too since other actions could free the unit."""
+        blockers = 0
+        if not unit.attributes & Attributes.FLYING: # flying units can pass through any unit and tile
+            for square in _getSquareArea(unit.square, unit.moves):
+                if square != unit.square and square not in changed and unit._isMoveObstruction(square):
+                    blockers |= 1 << SQUAREINDEX[square]
+        return getReachableSquares(unit.square, unit.moves, blockers) | {unit.square}
+    def _getShotFootprint(self, unit, positions):
+        """return a set of squares that unit's weapons could touch when shot from any of positions, not counting what explosions and psions add to it.
+        returns None if a weapon can reach any square."""
+        reach = unit.getShotReach(positions)
+        if reach is None:
+            return None
+        return getArea(reach, 2) | positions # weapons hurt or push the squares around where they hit and pushed units land one square further
+    def _widenFootprint(self, footprint):
+        """return a frozenset of the squares in footprint, a set of squares that an action could touch, and the squares that explosions set off in it could hurt.
+        returns None if the action could kill a psion since that changes vek all over the board."""
+        footprint |= self.game.getBlastReach(footprint)
+        for square in footprint:
+            unit = self.game.board[square].unit
+            if unit is not None and unit.isPsion():
+                return None
+        return frozenset(footprint)
     def _genActions(self):
         "This generates unique combinations from _getAllActions. yields a set of {(unit, action), ...} tuples."
         # The way this works is that the bool at the beginning indicates whether it should be included or not.
@@ -5356,77 +6663,389 @@ class OrderGenerator(): # TODO: we aren't generating orders for tank sub-units s
             except StopIteration:
                 return
 
+class TranspositionTable():
+    """This remembers the outcome of every group of player actions that an OrderSimulator has finished simulating.
+    Results are keyed by the hash of the game before the actions were taken and the (unit, action) tuples that were left in the order.
+    Different orders often reach the same game state, such as moving mech A then mech B instead of B then A. Sharing one table
+    between all the OrderSimulators for a game means that the actions left after that state are only simulated once.
+    Only share a table between simulators that use the same game object."""
+    __slots__ = ('size', 'results')
+    def __init__(self, size=100000):
+        """size is the maximum number of results to remember. When the table is full, the oldest result is forgotten to make room for a new one.
+        A size of 0 or less turns the table off, nothing is remembered."""
+        self.size = size
+        self.results = {} # {(hash, remaining order): (results, cutoff)}. results is a tuple of the best outcomes of the actions, best first, as (score change, score log, action log) tuples. It's empty when none of them had a valid outcome.
+                          # cutoff is None unless some of the actions were pruned, then it's the score change that every pruned outcome was below.
+    def get(self, key):
+        "return the result stored for key, or None if there isn't one."
+        return self.results.get(key)
+    def put(self, key, result):
+        "Store result for key, forgetting the oldest result if the table is full. returns nothing."
+        if len(self.results) >= self.size:
+            if self.size <= 0: # the table is off
+                return
+            del self.results[next(iter(self.results))]
+        self.results[key] = result
+
+class EndTurnCache():
+    """This remembers what Game.endPlayerTurn() did to the score for each game state that the player's turn ended in.
+    Results are keyed by the game's hash. Many simulations end with the board in the same state, such as a unit shooting at 2 different empty tiles,
+    so this saves running the fire, environment and enemy turns again for them.
+    Only share a cache between simulators that use the same game object."""
+    __slots__ = ('size', 'results')
+    def __init__(self, size=100000):
+        """size is the maximum number of results to remember. When the cache is full, the least recently used result is forgotten to make room for a new one.
+        A size of 0 or less turns the cache off, nothing is remembered."""
+        self.size = size
+        self.results = OrderedDict() # {hash: result}. result is None when the turn ended with GameOver, otherwise it's a tuple of (score change, score log)
+    def get(self, key):
+        "return the result stored for key. raise KeyError if there isn't one."
+        result = self.results[key]
+        self.results.move_to_end(key)
+        return result
+    def put(self, key, result):
+        "Store result for key, forgetting the least recently used result if the cache is full. returns nothing."
+        if len(self.results) >= self.size:
+            if self.size <= 0: # the cache is off
+                return
+            self.results.popitem(last=False)
+        self.results[key] = result
+
+class ActionOrderer():
+    """This decides which order the Player_Action_Iters of an OrderSimulator try their unit's actions in.
+    The best solution is the same no matter which order they're tried in, but the sooner a good one is found, the more actions can be pruned for not being able to beat it.
+    This base class leaves them in the order they were generated in. Subclass it and pass it to OrderSimulator to change that."""
+    def orderShots(self, unit, shots):
+        "return an iter of shots, an iter of (weapon, shot) tuples that unit can take, in the order to try them."
+        return shots
+    def orderMoves(self, unit, squares):
+        "return an iter of squares, an iter of squares that unit can move to, in the order to try them."
+        return squares
+    def reward(self, actions):
+        """Learn from the actions that led to a new best solution.
+        actions is a list of (unit, Actions.SHOOT or Actions.MOVE, action) tuples in the order they were taken. action is a (weapon, shot) tuple or a square.
+        returns nothing."""
+        pass
+
+class HeuristicOrderer(ActionOrderer):
+    """This tries the actions that are most likely to lead to a good solution first.
+    Shots at enemies that have attacks queued or that are nearly dead go first. So do moves next to those enemies, then moves in line with any enemy so that artillery and projectiles can hit it.
+    Actions that led to new best solutions are remembered. The one that most recently did so for each unit and kind of action at the same depth of the turn is tried first (the killer action),
+    then the others that did so most often (the history). The depth of an action is the number of actions made before it this turn.
+    Share one between every OrderSimulator of a game so this is learned across orders."""
+    cachesize = 10000 # the most game states to keep the targets of
+    def __init__(self):
+        self.history = {} # {(unit, action): the number of times this action led to a new best solution}
+        self.killers = {} # {(depth, unit, Actions.SHOOT or Actions.MOVE): the action that most recently led to a new best solution}
+        self.targets = {} # {game.zobrist: what _findTargets() returned for that state}
+    def orderShots(self, unit, shots):
+        targets = self._getTargets(unit.game)[0]
+        history = self.history
+        killer = self.killers.get((len(unit.game.actionlog), unit, Actions.SHOOT))
+        def rank(shot):
+            value = 0
+            for square in getattr(unit, shot[0]).getShotSquares(shot[1]):
+                value += targets.get(square, 0)
+            return (shot == killer, history.get((unit, shot), 0), value)
+        return sorted(shots, key=rank, reverse=True) # the sort is stable, so actions that rank the same stay in the order they were generated
+    def orderMoves(self, unit, squares):
+        targets, adjacent, columns, rows = self._getTargets(unit.game)
+        history = self.history
+        killer = self.killers.get((len(unit.game.actionlog), unit, Actions.MOVE))
+        def rank(square):
+            value = adjacent.get(square, 0)
+            if square[0] in columns or square[1] in rows: # artillery and projectiles can hit an enemy from here
+                value += 1
+            return (square == killer, history.get((unit, square), 0), value)
+        return sorted(squares, key=rank, reverse=True)
+    def reward(self, actions):
+        for depth, (unit, kind, action) in enumerate(actions):
+            key = (unit, action)
+            self.history[key] = self.history.get(key, 0) + 1
+            self.killers[(depth, unit, kind)] = action
+    def _getTargets(self, game):
+        """return what _findTargets() returns for game, reusing it if game is in a state whose targets were already found.
+        The state is only known when game.getHash() is up to date, which it is for every state that OrderSimulator looks up in its table."""
+        if game.zobrist is None or game.dirtysquares: # the board changed since it was last hashed
+            return self._findTargets(game)
+        try:
+            return self.targets[game.zobrist]
+        except KeyError:
+            if len(self.targets) >= self.cachesize:
+                self.targets.clear()
+            result = self.targets[game.zobrist] = self._findTargets(game)
+            return result
+    def _findTargets(self, game):
+        """Find the enemies in game that are worth shooting and the squares to move to to attack them.
+        Enemies are worth 1, 2 more if they have an attack queued or are a psion and 1 more if they have 2 hp or less and could be killed with a shot.
+        returns a tuple of (targets, adjacent, columns, rows). targets is a dict of {square: value} of the enemies, adjacent is a dict of {square: the total value of the targets next to it}
+        and columns and rows are sets of the x and y coordinates that have a target in them."""
+        targets = {}
+        for unit in game.nonplayerunits:
+            if unit.alliance != Alliance.ENEMY:
+                continue
+            value = 1
+            if unit._psion or getattr(getattr(unit, 'weapon1', None), 'qshot', None) is not None: # not every enemy has a weapon
+                value += 2
+            if unit.hp <= 2:
+                value += 1
+            targets[unit.square] = value
+        adjacent = {}
+        columns = set()
+        rows = set()
+        for square, value in targets.items():
+            for direction, neighbor in NEIGHBORS[square]:
+                adjacent[neighbor] = adjacent.get(neighbor, 0) + value
+            columns.add(square[0])
+            rows.add(square[1])
+        return targets, adjacent, columns, rows
+
 class OrderSimulator():
     """This object takes a Game object that's been set up and a game order tuple.
     It simulates all possible unit moves/shots and returns the best possible score.
     This can be thought of as a worker thread."""
     sims = 0 # a count of the unique simulations attempted.
-    def __init__(self, game, order):
-        if not order:
-            print("Empty Order Simulation skipped") # TODO: do game ending score counting for the null set order where the player does nothing
+    prunes = 0 # a count of the player_action_iters that were skipped because their actions couldn't beat the solutions kept.
+    def __init__(self, game, order, table=None, endturncache=None, keep=1, solutions=None, orderer=None):
+        """table is a TranspositionTable to share with other OrderSimulators of the same game.
+        endturncache is an EndTurnCache to share the same way.
+        If either is None, a new one is made that only this simulator uses.
+        keep is the number of best distinct solutions to keep in self.solutions. Only share a table between simulators that keep the same number.
+        solutions is a TopKScoreKeeper to use as self.solutions instead of a new one, so that several simulators keep the best solutions of all their orders together.
+        Actions are then pruned when they can't beat the solutions found by any of them, not just this one. keep is ignored when it's given.
+        orderer is an ActionOrderer that decides which order each unit's actions are tried in, None to try them in the order they're generated."""
+        if not order: # TODO: do game ending score counting for the null set order where the player does nothing
             return
-        else:
-            pass
-            #print("\nOrder is: ", order)
         self.game = game  # set the final game instance to be persistent so run can use it.
         self.order = order
+        if solutions is None:
+            solutions = TopKScoreKeeper(keep)
+        self.solutions = solutions
+        self.highscore = solutions.getBest() # the best of self.solutions, a blank scorekeeper if there aren't any yet
+        if table is None:
+            table = TranspositionTable()
+        self.table = table
+        if endturncache is None:
+            endturncache = EndTurnCache()
+        self.endturncache = endturncache
+        self.orderer = orderer
+        # For each action after the first, subtrees holds a tuple of (table key, score, score log length, action log length) taken from the game when its player_action_iter was made.
+        # This is None when that iter's result is already in the table.
+        self.subtrees = [None] * len(order)
+        self.subtreebests = [None] * len(order) # a list of the best results found so far for each of subtrees, best first, in the same format that TranspositionTable stores
+        self.subtreecutoffs = [None] * len(order) # the score change that every result pruned from each of subtrees was below, None if nothing was pruned
         self.player_action_iters = [None] * len(order)
+        self.finished = False # set to True when every action was skipped because its result was already in the table
+        self.interrupted = False # set to True when run() stopped at its deadline before simulating every action
+        self.tableresults = 0 # the number of results that were submitted from self.table
+        self.bounded = not game.hasGlobalEffects() # the score can't be bounded when actions can affect the whole board
+        self.reaches = {} # {(index, squares of the units left to act): what _getReach() returned}
         # build out self.player_action_iters based on order
-        self._increment_player_action_iters(len(self.player_action_iters)-1, game, order)
+        try:
+            self._increment_player_action_iters(len(self.player_action_iters)-1, game, order)
+        except SimulationFinished:
+            if not self.tableresults: # no result came from the table either, so there were no valid actions to take
+                raise SimulationFinished
+            self.finished = True
         #print("self.pai is", self.player_action_iters)
-        self.highscore = ScoreKeeper() # initialize with a blank scorekeeper
-    def run(self):
+    def run(self, deadline=None):
         """Start brute forcing all possible player actions for this particular order.
+        deadline is the perf_counter() time to stop at, None to simulate every action no matter how long it takes.
+        If it's reached first, self.interrupted is set to True, the game is put back the way it was and the best solution found so far is returned.
         returns a tuple of how many simulations were run and the best high score object."""
         try:
             game = self.game
         except AttributeError: # self.game was never set because we're working on the null set of orders
             return # TODO: end the game for the null set
         del self.game # don't keep the cruft
+        if self.finished:
+            return self.sims, self.highscore
         finalaction = len(self.player_action_iters) - 1
         while True:
             self.sims += 1
-            try:
-                game.endPlayerTurn()
-            except GameOver:
-                pass # continue on to the next simulation
-            else:
-                if game.score > self.highscore:
-                    self.highscore = game.score
-                    self.highscore.actionlog = game.actionlog
+            result = self._endPlayerTurn(game)
+            if result is not None: # otherwise the game ended, continue on to the next simulation
+                scorechange, log = result
+                self._submitResult(game.score.score + scorechange, game.score.log + log, game.actionlog, len(self.subtrees))
+            if deadline is not None and perf_counter() >= deadline:
+                for player_action_iter in reversed(self.player_action_iters): # the unfinished subtrees aren't put in the table
+                    player_action_iter.stop()
+                self.interrupted = True
+                return self.sims, self.highscore
             try:
                 game = self._increment_player_action_iters(finalaction)
             except SimulationFinished:
-                print('{0} sims finished for order {1}'.format(self.sims, [(x[0].type, Actions.pprint((x[1],))) for x in self.order]))
                 return self.sims, self.highscore
+    def _endPlayerTurn(self, game):
+        """End the player's turn in game and undo it, using the result in self.endturncache if this state was seen before.
+        returns a tuple of (score change, score log array) of the enemy's turn, or None if it ended in GameOver."""
+        key = game.getHash()
+        try:
+            result = self.endturncache.get(key)
+        except KeyError:
+            checkpoint = game.checkpoint()
+            score, loglen = game.score.score, len(game.score.log)
+            try:
+                game.endPlayerTurn()
+            except GameOver:
+                result = None
+            else:
+                result = (game.score.score - score, game.score.log[loglen:])
+            game.rollback(checkpoint)
+            self.endturncache.put(key, result)
+        return result
+    def _submitResult(self, score, log, actionlog, index):
+        """Record the outcome of a finished simulation.
+        score is the final score int, log is the score log and actionlog is the game's action log.
+        index is the index of the first player_action_iter that the result didn't come from, only subtrees before it are updated.
+        returns nothing."""
+        if self.solutions.submit(score, log, actionlog):
+            self.highscore = self.solutions.getBest()
+            if self.orderer is not None:
+                self.orderer.reward([(pai.unit, pai.actiontype, pai.action) for pai in self.player_action_iters[:index]])
+        keep = self.solutions.k
+        for i in range(1, index):
+            if self.subtrees[i] is None: # this subtree's result was already known
+                continue
+            key, startscore, loglen, actionloglen = self.subtrees[i]
+            bests = self.subtreebests[i]
+            rank = (score - startscore, tuple(actionlog[actionloglen:])) # ties are broken by the action log the same way ScoreKeeper.getRank() does
+            position = len(bests)
+            while position and rank > (bests[position - 1][0], bests[position - 1][2]):
+                position -= 1
+            if position >= keep or (position and rank == (bests[position - 1][0], bests[position - 1][2])): # not good enough, or this result is already kept
+                continue
+            bests.insert(position, (rank[0], log[loglen:], rank[1]))
+            del bests[keep:]
+    def _startSubtree(self, game, index):
+        """Look up the result of the player_action_iter at index and all the ones after it from game's current state in self.table.
+        If it's known, the iter is told to skip its actions and the stored result is submitted instead. returns nothing."""
+        key = (game.getHash(), self.order[index:])
+        entry = self.table.get(key)
+        if entry is not None:
+            results, cutoff = entry
+            if self._isUsable(results, cutoff, game.score.score):
+                self.subtrees[index] = None
+                self.player_action_iters[index].skip()
+                self.tableresults += len(results)
+                for scorechange, log, actionlog in results:
+                    self._submitResult(game.score.score + scorechange, game.score.log + log, game.actionlog + list(actionlog), index)
+                return
+        self.subtrees[index] = (key, game.score.score, len(game.score.log), len(game.actionlog))
+        self.subtreebests[index] = []
+        self.subtreecutoffs[index] = None
+    def _isUsable(self, results, cutoff, score):
+        """return True if results and cutoff from self.table can be used instead of simulating the actions again from a game with score, False if they can't.
+        When actions were pruned, cutoff is the score change that every pruned result was below. Otherwise it's None and the results are always usable."""
+        if cutoff is None:
+            return True
+        if len(results) >= self.solutions.k and results[-1][0] >= cutoff: # every result kept beat everything that was pruned
+            return True
+        if not self.solutions.isFull(): # the pruned results could make the cut
+            return False
+        return score + cutoff <= self.solutions.getWorst().score # the pruned results can't beat the solutions kept now either
+    def _finishSubtree(self, index):
+        "Store the result of the player_action_iter at index and all the ones after it in self.table now that they've run out of actions. returns nothing."
+        if self.subtrees[index] is None: # the result was already in the table
+            return
+        key = self.subtrees[index][0]
+        self.table.put(key, (tuple(self.subtreebests[index]), self.subtreecutoffs[index]))
+        self.subtrees[index] = None
+    def _pruneSubtree(self, index):
+        """Skip the actions of the player_action_iter at index and all the ones after it because they can't beat the worst of self.solutions.
+        The subtrees that contain it are marked so their results are only used again when the pruned actions still couldn't beat the high score. returns nothing."""
+        self.player_action_iters[index].skip()
+        self.prunes += 1
+        for i in range(1, index + 1):
+            if self.subtrees[i] is None: # this subtree's result was already known
+                continue
+            startscore = self.subtrees[i][1]
+            cutoff = self.solutions.getWorst().score - startscore
+            if self.subtreecutoffs[i] is None or cutoff > self.subtreecutoffs[i]:
+                self.subtreecutoffs[i] = cutoff
+    def _isHopeless(self, game, index):
+        """return True if the player_action_iter at index and all the ones after it can't beat the worst of self.solutions from game's current state, False if they might.
+        Results that tie it aren't pruned so that ties are still broken the same way."""
+        if not self.bounded or not self.solutions.isFull(): # there's nothing to beat yet
+            return False
+        worstscore = self.solutions.getWorst().score
+        if game.score.score >= worstscore: # not worth finding the bound when it would have to be negative
+            return False
+        if self.order[index][0] not in game.playerunits: # the iter has no actions to skip
+            return False
+        bound = game.getScoreBound(*self._getReach(game, index), limit=worstscore - game.score.score)
+        return bound is not None and game.score.score + bound < worstscore
+    def _getReach(self, game, index):
+        """Find out which squares the actions in self.order from index on could touch in game.
+        returns a tuple of (reach, repairs). reach is a set of squares or None if the actions could touch any square.
+        repairs is the number of those actions that could repair a mech."""
+        key = (index, tuple(unit.square if unit in game.playerunits else None for unit, action in self.order[index:])) # only where the units are matters
+        result = self.reaches.get(key)
+        if result is None:
+            self.reaches[key] = result = self._findReach(game, index)
+        return result
+    def _findReach(self, game, index):
+        "Work out _getReach() for the actions in self.order from index on without looking in self.reaches."
+        reach = set()
+        repairs = 0
+        positions = {} # {unit: set of squares the unit could be on}
+        for unit, action in self.order[index:]:
+            if unit not in game.playerunits: # this unit died and can't act
+                continue
+            squares = positions.get(unit)
+            if squares is None:
+                squares = positions[unit] = {unit.square}
+                if unit.square in reach: # an earlier action could have pushed it anywhere it touched
+                    squares.update(reach)
+            if action in (Actions.MOVE, Actions.MOVE2):
+                if action == Actions.MOVE:
+                    moves = unit.moves
+                else:
+                    moves = unit.secondarymoves
+                reach.update(getArea(squares, moves + 1))
+                squares.update(getArea(squares, moves))
+                continue
+            shotreach = unit.getShotReach(squares)
+            if shotreach is None:
+                return None, repairs
+            footprint = getArea(shotreach, 2) # weapons hurt or push the squares around where they hit and pushed units land one square further
+            reach.update(footprint)
+            for othersquares in positions.values(): # the shot could push or fling any unit it touches, including the one that fired it
+                if othersquares is squares or not othersquares.isdisjoint(footprint):
+                    othersquares.update(footprint)
+            if unit.isMech(): # only mechs can repair
+                repairs += 1
+        return reach, repairs
     def _increment_player_action_iters(self, index, startingstate=None, startingorder=None):
-        """increment self.player_action_iters.
+        """increment self.player_action_iters like an odometer.
+        The iter at index is advanced. When an iter runs out, the one before it is advanced and the iter is replaced with a new one
+        starting from that game. This is done in a loop so the stack doesn't grow with the length of the order.
         index is an int of the index of self.player_action_iters to operate on.
         startingstate is the initial gamestate to use when bootstrapping
         startingorder is the order to to use when bootstrapping
         returns the next game object.
         :raise SimulationFinished when we run out of unit actions to iterate through."""
         assert index > -1
-        try:
-            return next(self.player_action_iters[index])
-        except StopIteration: # this one ran out, so increment the previous one and get a new gamestate from it
-            if index == 0: # don't wrap around to -1
-                raise SimulationFinished
-            self._replace_pai(self._increment_player_action_iters(index - 1), index)
-            return self._increment_player_action_iters(index) # and now try to get the next game from this newly replaced pai
-        except TypeError: # raised when trying to next(None) on initial startup
-            if not startingstate:
-                #print("No startingstate! Caught TypeError when trying to next(self.player_action_iters[{0}]). That Iter was: {1}".format(index, self.player_action_iters[index]))
-                raise
-            #print("replacing pai at index", index)
-            #print("startingstate is ", startingstate)
-            #print("startingorder is", startingorder)
-            if index == 0:
-                self._replace_pai(startingstate, 0, startingorder)
-            else:
-                self._replace_pai(self._increment_player_action_iters(index - 1, startingstate, startingorder), index, startingorder)
-            # Now that a pai has been put in place, call this same method recursively to get the next one and return a game
-            return self._increment_player_action_iters(index, startingstate, startingorder)
+        level = index # the index of the iter being advanced
+        while True:
+            if self.player_action_iters[level] is None: # this iter hasn't been made yet on initial startup
+                assert startingstate
+                if level == 0:
+                    self._replace_pai(startingstate, 0, startingorder)
+                else: # the iter before this one needs to be set up first
+                    level -= 1
+                continue
+            game = self.player_action_iters[level].getNext()
+            if game is None: # this one ran out, so increment the previous one and get a new gamestate from it
+                if level == 0: # don't wrap around to -1
+                    raise SimulationFinished
+                self._finishSubtree(level)
+                level -= 1
+                continue
+            if level == index:
+                return game
+            level += 1 # replace the next iter with a new one that starts from this game
+            self._replace_pai(game, level, startingorder)
     def _replace_pai(self, game, index, orders=None):
         """Replace a player_action_iter with a new one with game as it's starting state.
         game is the game state with which to start this new iterator.
@@ -5435,136 +7054,561 @@ class OrderSimulator():
         returns nothing."""
         #print("game is", game)
         assert game
-        try:
+        if self.player_action_iters[index] is not None:
             self.player_action_iters[index] = type(self.player_action_iters[index])(game, *self.player_action_iters[index].getArgs())
-        except AttributeError: # type(None)(...)
+        else:
             if not orders:
                 raise Exception("No orders given!") # TODO: Debug
             if orders[index][1] in (Actions.SHOOT, Actions.SHOOT2):  # if this action is to shoot...
-                self.player_action_iters[index] = Player_Action_Iter_Shoot(game, orders[index][0])  # add a shoot iterator (orders[index][0] is the unit in orders)
+                self.player_action_iters[index] = Player_Action_Iter_Shoot(game, orders[index][0], self.orderer)  # add a shoot iterator (orders[index][0] is the unit in orders)
             elif orders[index][1] == Actions.MOVE:  # if the action is to move
-                self.player_action_iters[index] = Player_Action_Iter_Move(game, orders[index][0], orders[index][0].moves)  # add a MOVE iterator
+                self.player_action_iters[index] = Player_Action_Iter_Move(game, orders[index][0], orders[index][0].moves, self.orderer)  # add a MOVE iterator
             else:  # it must be a MOVE2 action
-                self.player_action_iters[index] = Player_Action_Iter_Move(game, orders[index][0], orders[index][0].secondarymoves)  # add a MOVE2 iterator
+                self.player_action_iters[index] = Player_Action_Iter_Move(game, orders[index][0], orders[index][0].secondarymoves, self.orderer)  # add a MOVE2 iterator
+        if index:
+            self._startSubtree(game, index)
+            if self.subtrees[index] is None: # the result was already in the table
+                return
+        if self._isHopeless(game, index): # branch and bound: don't bother simulating actions that can't beat the high score
+            self._pruneSubtree(index)
+
+class Profiler():
+    """This times the phases of a solve and counts how many times each one runs, to find out which weapon or unit makes a scenario slow.
+    While it's enabled, the method of each phase is replaced on its class with one that times it. disable() puts the originals back, so a Profiler costs nothing when it's not enabled.
+    That affects every game in the process, so only enable it in a with block or a try/finally that always disables it again.
+    Times include the phases run from within a phase, e.g. a flushHurt() during a shot counts toward both. A phase that runs itself again, such as through super(), is only timed once.
+    Only one Profiler can be enabled at a time. Use it in a with block:
+        with Profiler() as profiler:
+            ParallelSolver(game, processes=1).run()
+        print(profiler.formatReport())
+    or pass profile=True to ParallelSolver to get a report from every worker process in solver.profiler."""
+    enabled = None # the Profiler that's enabled right now, None if there isn't one
+    # (phase, class name, method name) of the phases to time. The genShots(), shoot() and shoot_*() methods of every weapon class are timed as well.
+    # Weapons that pick their shoot method when they're made (like self.shoot = self.shoot_punch) hold on to it, pass their game to enable() to rebind it to the timed one.
+    phases = (('order generation', 'OrderGenerator', '__next__'),
+              ('game copy', 'Game', 'getCopy'),
+              ('checkpoint', 'Game', 'checkpoint'),
+              ('rollback', 'Game', 'rollback'),
+              ('player moves', 'Player_Action_Iter_Move', 'getNext'),
+              ('player shots', 'Player_Action_Iter_Shoot', 'getNext'),
+              ('getMoves', 'Unit_PlayerControlled_Base', 'getMoves'),
+              ('flushHurt', 'Game', 'flushHurt'),
+              ('end turn: fire', 'Game', '_fireTurn'),
+              ('end turn: storm', 'Game', '_stormTurn'),
+              ('end turn: psion', 'Game', '_psionTurn'),
+              ('end turn: environment', 'Game', '_environTurn'),
+              ('end turn: enemy', 'Game', '_enemyTurn'),
+              ('end turn: NPC', 'Game', '_npcTurn'),
+              ('end turn: emerge', 'Game', '_emergeTurn'))
+    def __init__(self):
+        self.stats = {} # {phase: [calls, seconds]}. Weapons are timed as 'genShots' and 'shoot Weapon_Name'.
+        self.active = set() # the phases being timed right now
+        self.originals = [] # (class, method name, original method) of each method replaced by enable()
+        self.rebound = [] # (weapon, original bound method) of each weapon whose shoot attribute was rebound by enable()
+    def __enter__(self):
+        self.enable()
+        return self
+    def __exit__(self, exctype, excvalue, traceback):
+        self.disable()
+    def enable(self, game=None):
+        """Start timing the phases.
+        game is a game that was set up before this Profiler was enabled. Its weapons that picked their shoot method when they were made are rebound to the timed one.
+        returns nothing."""
+        assert Profiler.enabled is None, "Another Profiler is already enabled"
+        Profiler.enabled = self
+        for phase, classname, methodname in self.phases:
+            self._replace(globals()[classname], methodname, self._timeCall, phase)
+        for name, obj in tuple(globals().items()):
+            if name.startswith('Weapon_') and isinstance(obj, type):
+                if 'genShots' in obj.__dict__:
+                    self._replace(obj, 'genShots', self._timeGenerator, 'genShots')
+                for methodname, method in tuple(obj.__dict__.items()):
+                    if (methodname == 'shoot' or methodname.startswith('shoot_')) and type(method) is FunctionType: # not the slot of weapons that pick their shoot method
+                        self._replace(obj, methodname, self._timeCall, None)
+        if game is not None:
+            self._rebindShoots(game)
+    def disable(self):
+        "Stop timing the phases and put the original methods back. returns nothing."
+        for weapon, shoot in reversed(self.rebound):
+            weapon.shoot = shoot
+        self.rebound = []
+        for cls, methodname, method in reversed(self.originals):
+            setattr(cls, methodname, method)
+        self.originals = []
+        self.active.clear()
+        Profiler.enabled = None
+    def reset(self):
+        "Forget everything timed so far. returns nothing."
+        self.stats.clear()
+    def add(self, stats):
+        "Add stats from another Profiler, such as one in a worker process, to this one's. returns nothing."
+        for phase, (calls, seconds) in stats.items():
+            self._record(phase, calls, seconds)
+    def getReport(self):
+        "return a list of (phase, calls, seconds) tuples, the slowest phase first."
+        return sorted(((phase, calls, seconds) for phase, (calls, seconds) in self.stats.items()), key=lambda item: item[2], reverse=True)
+    def formatReport(self):
+        "return the report from getReport() as a string with a line for each phase."
+        return '\n'.join('{0:<40} {1:>10} calls {2:>10.3f}s'.format(phase, calls, seconds) for phase, calls, seconds in self.getReport())
+    def _record(self, phase, calls, seconds):
+        "Add calls and seconds to phase's stats. returns nothing."
+        try:
+            entry = self.stats[phase]
+        except KeyError:
+            self.stats[phase] = [calls, seconds]
+        else:
+            entry[0] += calls
+            entry[1] += seconds
+    def _rebindShoots(self, game):
+        "Rebind the shoot attribute of every weapon in game that holds one of its shoot_*() methods to the timed method. returns nothing."
+        units = {tile.unit for tile in game.board.values() if tile.unit is not None} | game.playerunits | set(game.nonplayerunits) # burrowed units aren't on the board
+        for unit in units:
+            for weap in 'weapon1', 'weapon2', 'repweapon':
+                weapon = getattr(unit, weap, None)
+                if weapon is not None and 'shoot' in getSlots(type(weapon))[0]:
+                    shoot = weapon.shoot
+                    self.rebound.append((weapon, shoot))
+                    weapon.shoot = getattr(weapon, shoot.__func__.__name__)
+    def _replace(self, cls, methodname, timer, phase):
+        "Replace the method called methodname on cls with one made by timer(method, phase). returns nothing."
+        method = cls.__dict__[methodname]
+        self.originals.append((cls, methodname, method))
+        setattr(cls, methodname, timer(method, phase))
+    def _timeCall(self, method, phase):
+        """return a function that times calls to method as phase.
+        If phase is None, the phase is 'shoot' and the type of the weapon that's shooting."""
+        active = self.active
+        record = self._record
+        @wraps(method) # bound methods are pickled by name, so weapons that hold a timed shoot_*() method can still be sent to a worker process
+        def timed(obj, *args, **kwargs):
+            key = phase or 'shoot ' + type(obj).__name__
+            if key in active: # this phase is already being timed
+                return method(obj, *args, **kwargs)
+            active.add(key)
+            start = perf_counter()
+            try:
+                return method(obj, *args, **kwargs)
+            finally:
+                record(key, 1, perf_counter() - start)
+                active.discard(key)
+        return timed
+    def _timeGenerator(self, method, phase):
+        "return a generator function that times every item that the generator from method makes as phase. A call is counted for each generator."
+        active = self.active
+        record = self._record
+        done = object()
+        def timed(obj, *args, **kwargs):
+            calls = 1
+            gen = None
+            while True:
+                if phase in active: # this phase is already being timed, such as by a generator that's yielding from this one
+                    start = None
+                else:
+                    active.add(phase)
+                    start = perf_counter()
+                try:
+                    if gen is None:
+                        gen = iter(method(obj, *args, **kwargs))
+                    item = next(gen, done)
+                finally:
+                    if start is not None:
+                        record(phase, calls, perf_counter() - start)
+                        calls = 0
+                        active.discard(phase)
+                if item is done:
+                    return
+                yield item
+        return timed
+
+class Progress():
+    """This reports how far a solve has got to its subscribers, at most once every interval seconds so that reporting doesn't slow the solve down.
+    A subscriber is any function that takes a report, such as printProgress() or the put() method of a queue that another thread reads reports from.
+    A report is a dict of:
+        'orders': the number of orders simulated so far
+        'total': the number of orders to simulate
+        'sims': the number of simulations run so far
+        'seconds': the seconds since the solve started
+        'sims_per_sec': sims divided by seconds
+        'best_score': the score of the best solution found so far, None if there isn't one yet
+        'eta': an estimate of the seconds until the solve finishes, None until the first order is simulated
+    The ETA is based on the sims that OrderGenerator.estimateSims() expects the orders to take when the solver gives them, since orders take very different amounts of time.
+    Pass a Progress to solve() or ParallelSolver and subscribe to it:
+        progress = Progress(interval=5)
+        progress.subscribe(printProgress)
+        ParallelSolver(game, progress=progress).run()"""
+    def __init__(self, interval=1.0):
+        "interval is the least number of seconds between reports, 0 to report after every order. A final report is always made when the solve finishes."
+        self.interval = interval
+        self.subscribers = []
+        self.start(0)
+    def subscribe(self, subscriber):
+        "Call subscriber with every report from now on. returns nothing."
+        self.subscribers.append(subscriber)
+    def unsubscribe(self, subscriber):
+        "Stop calling subscriber with reports. returns nothing."
+        self.subscribers.remove(subscriber)
+    def start(self, total, totalwork=0):
+        """Start timing a new solve of total orders. The solver calls this.
+        totalwork is the sum of the estimated sims of every order, 0 to base the ETA on the number of orders instead. returns nothing."""
+        self.total = total
+        self.totalwork = totalwork
+        self.orders = 0
+        self.sims = 0
+        self.work = 0 # the estimated sims of the orders simulated so far
+        self.bestscore = None
+        self.starttime = self.lastreport = perf_counter()
+    def update(self, sims, solutions, work=0, orders=1):
+        """Count an order that was simulated. The solver calls this after every order.
+        sims is the number of simulations that the order ran, solutions is the TopKScoreKeeper of the solutions found so far and work is the order's estimated sims.
+        orders is 0 for an order that was stopped before it finished, so only its sims are counted.
+        Subscribers get a report if interval seconds have passed since the last one. returns nothing."""
+        self.orders += orders
+        self.sims += sims
+        self.work += work
+        if solutions:
+            self.bestscore = solutions.getBest().score
+        if perf_counter() - self.lastreport >= self.interval:
+            self._report()
+    def finish(self):
+        "Send subscribers a final report. The solver calls this when it finishes or stops. returns nothing."
+        self._report()
+    def getReport(self):
+        "return a report of how far the solve has got. See the class docstring for its format."
+        seconds = perf_counter() - self.starttime
+        if self.totalwork and self.work:
+            eta = seconds * (self.totalwork - self.work) / self.work
+        elif self.orders:
+            eta = seconds * (self.total - self.orders) / self.orders
+        else:
+            eta = None
+        return {'orders': self.orders,
+                'total': self.total,
+                'sims': self.sims,
+                'seconds': seconds,
+                'sims_per_sec': self.sims / seconds if seconds else 0.0,
+                'best_score': self.bestscore,
+                'eta': eta}
+    def _report(self):
+        "Send a report to every subscriber. returns nothing."
+        self.lastreport = perf_counter()
+        report = self.getReport()
+        for subscriber in self.subscribers:
+            subscriber(report)
+
+def printProgress(report):
+    "A Progress subscriber that prints each report on a line. returns nothing."
+    if report['eta'] is None:
+        eta = 'unknown'
+    else:
+        eta = '{0:.0f}s'.format(report['eta'])
+    print('Order {0}/{1}, {2} sims, {3:.0f} sims/sec, best score {4}, ETA {5}'.format(report['orders'], report['total'], report['sims'], report['sims_per_sec'], report['best_score'], eta))
+
+_solverworker = {} # the game, player units, caches and orderer that a ParallelSolver worker process simulates orders with
+
+def _initSolverWorker(game, units, keep, profile=False):
+    """Set up a ParallelSolver worker process to simulate orders on game. units is the list of player units that orders refer to by index.
+    keep is the number of best solutions to keep from each order. If profile is True, the worker times its phases with a Profiler."""
+    if profile:
+        if Profiler.enabled is None: # a spawned worker doesn't get the main process's Profiler, _simulateOrder() enables this one while it simulates
+            _solverworker['profiler'] = Profiler()
+        else: # a forked worker's copy of the main process's Profiler is already timing
+            Profiler.enabled.reset() # it holds what the main process timed before the pool started
+            _solverworker['profiler'] = Profiler.enabled
+    else:
+        _solverworker['profiler'] = None
+    _solverworker['game'] = game
+    _solverworker['units'] = units
+    _solverworker['keep'] = keep
+    _solverworker['table'] = TranspositionTable()
+    _solverworker['endturncache'] = EndTurnCache()
+    _solverworker['orderer'] = HeuristicOrderer()
+
+def _simulateOrder(task):
+    """Simulate a single order in a ParallelSolver worker process. task is a tuple of the order, a tuple of (unit index, action) tuples, and its estimated sims.
+    returns a tuple of how many simulations were run, a list of the best ScoreKeepers, best first, the stats that the worker's Profiler timed during this order and the estimated sims.
+    The list is empty if there were no valid actions to take. The stats are None if the worker isn't profiling."""
+    order, work = task
+    profiler = _solverworker['profiler']
+    if profiler is None:
+        return (*_runOrder(order), None, work)
+    if Profiler.enabled is profiler: # a forked worker
+        sims, solutions = _runOrder(order)
+    else:
+        profiler.enable(_solverworker['game'])
+        try:
+            sims, solutions = _runOrder(order)
+        finally:
+            profiler.disable()
+    stats = profiler.stats.copy()
+    profiler.reset()
+    return (sims, solutions, stats, work)
+
+def _runOrder(order):
+    "Simulate order, a tuple of (unit index, action) tuples, for _simulateOrder(). returns a tuple of how many simulations were run and a list of the best ScoreKeepers, best first."
+    units = _solverworker['units']
+    order = tuple((units[index], action) for index, action in order)
+    try:
+        simulator = OrderSimulator(_solverworker['game'], order, _solverworker['table'], _solverworker['endturncache'], _solverworker['keep'], orderer=_solverworker['orderer'])
+    except SimulationFinished: # there were no valid actions to be taken
+        return 0, []
+    return simulator.run()[0], simulator.solutions.getSolutions()
+
+class ParallelSolver():
+    """This object takes a Game object that's been set up and finds the best possible score by spreading the orders from OrderGenerator across a pool of worker processes.
+    Each worker gets its own copy of the game and simulates whole orders with its own TranspositionTable and EndTurnCache.
+    The best ScoreKeepers from each order are reduced into the overall best with ScoreKeeper's ranking, so the same solutions are chosen as a serial run would choose."""
+    def __init__(self, game, processes=None, keep=1, profile=False, progress=None):
+        """processes is the number of worker processes to use, None uses one for each CPU.
+        If processes is 1, every order is simulated in this process without starting a pool.
+        keep is the number of best distinct solutions to keep in self.solutions after run().
+        If profile is True, self.profiler is a Profiler that has timed the phases of every process after run(). It's None otherwise.
+        progress is a Progress to report to as each order finishes, None to not report progress."""
+        self.game = game
+        self.processes = processes
+        self.progress = progress
+        self.solutions = TopKScoreKeeper(keep)
+        if profile:
+            self.profiler = Profiler()
+        else:
+            self.profiler = None
+    def run(self):
+        "Simulate every order. returns a tuple of how many simulations were run and the best ScoreKeeper."
+        if self.profiler is None:
+            return self._run()
+        self.profiler.enable(self.game) # the game's weapons were made before the profiler was enabled
+        try:
+            return self._run()
+        finally:
+            self.profiler.disable()
+    def _run(self):
+        "Do run() with or without the profiler. returns the same."
+        generator = OrderGenerator(self.game) # this starts the game, so it has to be made before the game is sent to the workers
+        units = sorted(self.game.playerunits, key=lambda unit: unit.square)
+        unitindexes = {unit: index for index, unit in enumerate(units)}
+        # Units are sent to the workers as indexes into units since each worker has its own copy of them.
+        # The empty order is skipped, OrderSimulator doesn't simulate it.
+        tasks = [(tuple((unitindexes[unit], action) for unit, action in order), generator.estimateSims(order)) for order in generator if order]
+        if self.progress is not None:
+            self.progress.start(len(tasks), sum(work for order, work in tasks))
+        if self.processes == 1:
+            _initSolverWorker(self.game, units, self.solutions.k) # self.profiler is already timing this process
+            return self._reduce(map(_simulateOrder, tasks))
+        with Pool(self.processes, _initSolverWorker, (self.game, units, self.solutions.k, self.profiler is not None)) as pool:
+            return self._reduce(pool.imap_unordered(_simulateOrder, tasks))
+    def _reduce(self, results):
+        """Combine results, an iter of (sims, list of ScoreKeepers, profiler stats, estimated sims) tuples from _simulateOrder, into self.solutions and self.profiler.
+        returns a tuple of the total sims and the best ScoreKeeper."""
+        totalsims = 0
+        for sims, solutions, stats, work in results:
+            totalsims += sims
+            for solution in solutions:
+                self.solutions.add(solution)
+            if stats is not None:
+                self.profiler.add(stats)
+            if self.progress is not None:
+                self.progress.update(sims, self.solutions, work)
+        if self.progress is not None:
+            self.progress.finish()
+        return totalsims, self.solutions.getBest()
+
+def _getOrderPromise(order):
+    """return a key that sorts orders from the most to the least promising for solve().
+    Orders with the most shots come first since shots are what score points, then the orders with the most actions.
+    A longer order can do almost anything a shorter one can since a mech can always repair instead of shooting, so its best solution is usually at least as good."""
+    return (-sum(action in (Actions.SHOOT, Actions.SHOOT2) for unit, action in order), -len(order))
+
+def solve(game, timeout=None, orderer=None, progress=None, solutions=None):
+    """Find the best solution for game in this process, simulating the most promising orders first so that a good solution is found early.
+    One TopKScoreKeeper is kept as the best solution found so far and every order is pruned against it.
+    timeout is the number of seconds to search for, None to search until every order is simulated no matter how long that takes.
+    orderer is the ActionOrderer that decides which order each unit's actions are tried in, None to use a new HeuristicOrderer.
+    progress is a Progress to report to as each order finishes, None to not report progress.
+    solutions is the TopKScoreKeeper to keep the best solutions in, None to use a new one that keeps 1.
+    When time runs out, the order being simulated is stopped and the best solution found so far is returned.
+    returns a tuple of how many simulations were run, the best ScoreKeeper and True if the search finished or False if it was stopped by the timeout."""
+    if timeout is None:
+        deadline = None
+    else:
+        deadline = perf_counter() + timeout # OrderSimulator.run() takes the perf_counter() time to stop at
+    generator = OrderGenerator(game)
+    orders = sorted((order for order in generator if order), key=_getOrderPromise) # the empty order is skipped, OrderSimulator doesn't simulate it
+    table = TranspositionTable()
+    endturncache = EndTurnCache()
+    if solutions is None:
+        solutions = TopKScoreKeeper()
+    if orderer is None:
+        orderer = HeuristicOrderer()
+    if progress is not None:
+        progress.start(len(orders), sum(generator.estimateSims(order) for order in orders))
+    totalsims = 0
+    finished = True
+    for order in orders:
+        if deadline is not None and perf_counter() >= deadline:
+            finished = False
+            break
+        try:
+            simulator = OrderSimulator(game, order, table, endturncache, solutions=solutions, orderer=orderer)
+        except SimulationFinished: # there were no valid actions to be taken
+            sims, interrupted = 0, False
+        else:
+            sims = simulator.run(deadline)[0]
+            interrupted = simulator.interrupted
+        totalsims += sims
+        if interrupted:
+            if progress is not None:
+                progress.update(sims, solutions, orders=0)
+            finished = False
+            break
+        if progress is not None:
+            progress.update(sims, solutions, generator.estimateSims(order))
+    if progress is not None:
+        progress.finish()
+    return totalsims, solutions.getBest(), finished
 
 class Player_Action_Iter_Base():
     """The base object for Player Action iters.
     Player Action Iters are used by Order Simulator for a single unit to take every possible action.
     Actions consist of moves or shots.
-    __next__ methods return a new deepcopy of a game object with this unit's next move already made."""
-    def __init__(self, prevgame, unit):
+    __next__ methods return the game object with this unit's next move already made. The game is changed in place and the move is undone with game.rollback()
+    before the next one is made, so every iter of an order shares the same game object."""
+    __slots__ = ('prevgame', 'unit', 'orderer', 'checkpoint', 'action', 'gen')
+    actiontype = None # Actions.SHOOT or Actions.MOVE, the kind of actions that the iter makes. This is what an ActionOrderer is told.
+    def __init__(self, prevgame, unit, orderer=None):
         """prevgame is the game object and state before this unit makes it's moves.
-        prevgame should not be a deepcopy.
         unit is the unit object that this iter is iterating through.
+        orderer is the ActionOrderer that decides which order the actions are made in, None to make them in the order they're generated.
         returns nothing."""
         assert prevgame
-        #self.prevgame = deepcopy(prevgame) # the starting state for each action that this object generates. This should never change.
-        self.prevgame = prevgame # the starting state for each action that this object generates. This should never change.
-        self.origunitid = unit.id # this won't change and is used to find the corresponding unit in new copies of prevgame.
-        for u in self.prevgame.playerunits:
-            try:
-                if unit.id == u.id:
-                    self.unit = u
-                    break
-            except AttributeError: # Unit_Mech_Corpse' object has no attribute 'id'
-                continue
-        self.unit = unit # if unit wasn't set from the previous game, set it to what was passed in so this can keep being passed to new iterators
-        # until we find a game object with this unit in it
+        self.prevgame = prevgame # the game that this iter makes its actions in. Its state before each action is restored with rollback() so it's always the same starting state.
+        self.unit = unit
+        self.orderer = orderer
+        self.checkpoint = None # this is set to the game's checkpoint while an action made by this iter is in play
+        self.action = None # the last action that this iter made, a (weapon, shot) tuple or a square
     def __iter__(self):
         return self
-    def _copygame(self):
-        "Return a deepcopy of the previous game and also set self.unit to the proper unit in the new deepcopy."
+    def __next__(self):
+        """return the game with this unit's next action made in it. Subclasses define getNext() which returns the same game or None
+        when it has run out of actions. getNext() is __next__ without raising StopIteration, for OrderSimulator."""
+        game = self.getNext()
+        if game is None:
+            raise StopIteration
+        return game
+    def skip(self):
+        "Stop this iter from making any actions. This is used when the outcome of its actions is already known. returns nothing."
+        self.gen = iter(())
+    def stop(self):
+        "Undo the action made by this iter that's in play, if there is one, and stop making any more. returns nothing."
+        self._undo()
+        self.skip()
+    def _undo(self):
+        "Undo the last action made by this iter if there is one. returns nothing."
+        if self.checkpoint is not None:
+            self.prevgame.rollback(self.checkpoint)
+            self.checkpoint = None
+    def _startAction(self):
+        """Start a checkpoint on the game to make this unit's next action in.
+        return False if this unit isn't able to take an action in the game, such as when it was killed by an earlier action, True if it is."""
         assert self.prevgame
-        newgame = deepcopy(self.prevgame)
-        #print("prevgame units is: ", self.prevgame.playerunits)
-        #print("newgame units is: ", newgame.playerunits)
-        #print("playerunits is", [x.square for x in newgame.playerunits])
-        for u in newgame.playerunits:
-            try:
-                if self.origunitid == u.id:
-                    self.unit = u
-                    return newgame
-            except AttributeError: # Unit_Mech_Corpse' object has no attribute 'id'
-                continue
-        #print("originunitsquare is", self.origunitsquare)
-        #raise Exception("No unit with square {0} found in prevgame. playerunits are: {1}".format(self.origunitsquare, [x.square for x in newgame.playerunits]))
-        raise StopIteration # If self.unit didn't get set, raise StopIteration as that unit is not available to make an action.
-    def __iter__(self):
-        return self
+        if self.unit not in self.prevgame.playerunits:
+            return False # that unit is not available to make an action.
+        self.checkpoint = self.prevgame.checkpoint()
+        return True
 
 class Player_Action_Iter_Shoot(Player_Action_Iter_Base):
     """This object iterates through Action.SHOOT actions."""
-    def __init__(self, prevgame, unit):
-        super().__init__(prevgame, unit)
-        self.gen = self._genNextShot()
-    def __next__(self):
+    __slots__ = ()
+    actiontype = Actions.SHOOT
+    def __init__(self, prevgame, unit, orderer=None):
+        super().__init__(prevgame, unit, orderer)
+        if orderer is None:
+            self.gen = self._genNextShot()
+        else:
+            self.gen = self._genOrderedShots()
+    def getNext(self):
         while True:
-            shot = next(self.gen) # will raise StopIteration and stop this from advancing.
-            newgame = self._copygame()
+            self._undo()
+            shot = next(self.gen, None)
+            if shot is None or not self._startAction(): # out of shots or the unit can't shoot
+                return None
+            self.unit._touch() # the weapon about to be fired can change itself
             try:
                 getattr(self.unit, shot[0]).shoot(*shot[1])
             except (NullWeaponShot, GameOver) as exc:
                 #print("Disqualified: ", exc)
                 continue # this wasn't a valid solution if the shot did nothing or ended the game
             try:
-                newgame.flushHurt()
+                self.prevgame.flushHurt()
             except GameOver:
                 continue
-            newgame.actionlog.append('{0} on {1} shoots {2} {3}'.format(self.unit.type, self.unit.square, *shot))  # record this action to the game's action log
-            return newgame
+            self.prevgame.actionlog.append('{0} on {1} shoots {2} {3}'.format(self.unit.type, self.unit.square, *shot))  # record this action to the game's action log
+            self.action = shot
+            return self.prevgame
     def _genNextShot(self):
         "generate tuples of (weapon, (shot,)) for __next__ to use."
-        try:
-            if Effects.SMOKE in self.unit.game.board[self.unit.square].effects: # if this unit is in smoke
-                if Attributes.IMMUNESMOKE not in self.unit.attributes: # and it's not smoke immune...
-                    return # it can't shoot
-        except AttributeError: # self.unit was never initially set
-            return
-        if Effects.ICE in self.unit.effects: # if this unit is frozen...
+        if self.unit.game.board[self.unit.square].effects & Effects.SMOKE: # if this unit is in smoke
+            if not self.unit.attributes & Attributes.IMMUNESMOKE: # and it's not smoke immune...
+                return # it can't shoot
+        if self.unit.effects & Effects.ICE: # if this unit is frozen...
             weapons = ('repweapon',) # the only weapon you can fire is your repair
         else:
             weapons = ('repweapon', 'weapon1', 'weapon2')
         for weapon in weapons:
-            try:
-                gs = getattr(getattr(self.unit, weapon), 'genShots') # see if this weapon exists and can be shot
-            except AttributeError: # this unit didn't have this weapon attribute at all or it's a passive weapon that can't be fired.
+            wep = getattr(self.unit, weapon, None)
+            gs = getattr(wep, 'genShots', None) # see if this weapon exists and can be shot
+            if gs is None: # this unit didn't have this weapon attribute at all or it's a passive weapon that can't be fired.
                 continue # onto the next weapon
+            canshoot = wep.canShoot
             for shot in gs():
-                yield (weapon, shot)
+                if canshoot(*shot): # shots that are sure to raise NullWeaponShot are skipped before a checkpoint is made for them
+                    yield (weapon, shot)
+    def _genOrderedShots(self):
+        "generate the shots from _genNextShot() in the order that self.orderer decides. They aren't generated and ordered until the first one is needed."
+        yield from self.orderer.orderShots(self.unit, self._genNextShot())
     def getArgs(self):
-        """return a tuple of the (unit,) argument that was used to construct this object.
+        """return a tuple of the (unit, orderer) arguments that were used to construct this object.
         note that the prevgame argument is omitted, because this is what changes in the replacement object.
         This is used to initialize a replacement object after this one has run it's course."""
-        return (self.unit,)
+        return (self.unit, self.orderer)
 
 class Player_Action_Iter_Move(Player_Action_Iter_Base):
     """This object iterates through Action.MOVE actions."""
-    def __init__(self, prevgame, unit, moves):
+    __slots__ = ('moves', 'originsquare')
+    actiontype = Actions.MOVE
+    def __init__(self, prevgame, unit, moves, orderer=None):
         """Moves is the number of squares this unit can move.
         This is provided because this object is used for both regular moves and secondary moves."""
-        super().__init__(prevgame, unit)
+        super().__init__(prevgame, unit, orderer)
         self.moves = moves
-        self.gen = self._genNextMove()
+        if orderer is None:
+            self.gen = self._genNextMove()
+        else:
+            self.gen = self._genOrderedMoves()
         self.originsquare = self.unit.square
-    def __next__(self):
+    def getNext(self):
         while True:
-            sq = next(self.gen) # will raise StopIteration and stop this from advancing
-            newgame = self._copygame()
-            newgame.board[self.unit.square].moveUnit(sq)
+            self._undo()
+            sq = next(self.gen, None)
+            if sq is None or not self._startAction(): # out of moves or the unit can't move
+                return None
+            self.prevgame.board[self.unit.square].moveUnit(sq)
             try: # you can move onto a mine and die so we need flushHurt after moving
-                newgame.flushHurt()
+                self.prevgame.flushHurt()
             except GameOver:
                 continue
-            #newgame.actionlog.append((self.unit, Actions.MOVE, sq)) # record this action to the game's action log
-            newgame.actionlog.append('{0} on {1} moves to {2}'.format(self.unit.type, self.originsquare, self.unit.square)) # record this action to the game's action log
-            return newgame
+            #self.prevgame.actionlog.append((self.unit, Actions.MOVE, sq)) # record this action to the game's action log
+            self.prevgame.actionlog.append('{0} on {1} moves to {2}'.format(self.unit.type, self.originsquare, self.unit.square)) # record this action to the game's action log
+            self.action = sq
+            return self.prevgame
     def _genNextMove(self):
         "generate tuples of squares (x, y) for __next__ to use."
         for square in self.unit.getMoves(self.moves):
             if not self.unit.game.board[square].unit: # if there's not a unit present on the square
                 yield square
+    def _genOrderedMoves(self):
+        "generate the squares from _genNextMove() in the order that self.orderer decides. They aren't generated and ordered until the first one is needed."
+        yield from self.orderer.orderMoves(self.unit, self._genNextMove())
     def getArgs(self):
-        """return a tuple of the (unit, moves) arguments that were used to construct this object.
+        """return a tuple of the (unit, moves, orderer) arguments that were used to construct this object.
         note that the prevgame argument is omitted, because this is what changes in the replacement object.
         This is used to initialize a replacement object after this one has run it's course."""
-        return (self.unit, self.moves)
+        return (self.unit, self.moves, self.orderer)
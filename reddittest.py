@@ -44,30 +44,10 @@ g.board[(2, 3)].createUnitHere(Unit_AlphaHornet(g, qshot=(Direction.UP,)))
 g.board[(3, 4)].createUnitHere(Unit_Hornet(g, qshot=(Direction.LEFT,)))
 g.board[(4, 2)].createUnitHere(Unit_BlastPsion(g))
 
-# init a blank score
-highestscore = ScoreKeeper()
-
-# Get a count of how many orders we need to simulate:
-totalorders = 0
-for i in OrderGenerator(g):
-    totalorders += 1
-
-currentorder = 0
-totalsims = 0
-for i in OrderGenerator(g):
-    currentorder += 1
-    print('Order {0}/{1}, {2} simulations.'.format(currentorder, totalorders, totalsims))
-    try:
-        os = OrderSimulator(g, i)
-    except SimulationFinished: # this can happen when there were no valid actions to be taken.
-        continue
-    try:
-        sims, highscore = os.run()
-    except TypeError: # os.run was the empty order that we skipped
-        continue
-    totalsims += sims
-    if highscore:
-        if highscore > highestscore:
-            highestscore = highscore
-
-print("Solution found:", highestscore)
+if __name__ == '__main__': # worker processes may import this file, only the main process should start solving
+    # simulate every order across all the CPUs, printing the progress every 10 seconds
+    progress = Progress(interval=10)
+    progress.subscribe(printProgress)
+    totalsims, highestscore = ParallelSolver(g, progress=progress).run()
+    print('{0} simulations.'.format(totalsims))
+    print("Solution found:", highestscore)
@@ -3,6 +3,7 @@
 "These are u nit tests for itbsolver. All test functions must start with t_ to differentiate them from the functions of the main script."
 
 from itbsolver import *
+from queue import Queue
 
 def runTest(funcname):
     "This runs the function funcname and prints information about the tests. This prints out the name of the function, and then PASSED if assertion errors didn't short-circuit this whole script."
@@ -40,7 +41,7 @@ def testTheTests():
 def t_BumpDamage():
     "2 units bump into each other and take 1 damage each."
     g = Game()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
     g.board[(2, 1)].createUnitHere(Unit_AlphaBeetle(g))
     assert g.board[(1, 1)].unit.hp == 3
@@ -57,51 +58,51 @@ def t_BumpDamageOnForestNoFire():
     g.board[(2, 1)].replaceTile(Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
     g.board[(2, 1)].createUnitHere(Unit_AlphaBeetle(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(2, 1)].unit.hp == 5
     g.board[(2, 1)].push(Direction.LEFT)
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
 
 def t_ForestCatchesFire():
     "A forest tile takes damage and catches fire."
     g = Game()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
 
 def t_FireTurnsIceToWater():
     "An ice tile takes fire damage and turns to water. A flying unit on the tile catches fire."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Ice(g))
     g.board[(1, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
     g.flushHurt()
     assert g.board[(1, 1)].type == "water"
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
 
 def t_ShieldBlocksTileFire():
     "a shielded unit that is hit with fire doesn't catch fire but the tile does. The shield remains."
     g = Game()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g, effects={Effects.SHIELD}))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
 
 def t_IceAndShieldHitWithFire():
     "A frozen unit with a shield is hit by fire. The ice is removed, the shield remains, the tile catches on fire."
@@ -109,12 +110,12 @@ def t_IceAndShieldHitWithFire():
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
     g.board[(1, 1)].applyIce()
     g.board[(1, 1)].applyShield()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ICE | Effects.SHIELD
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
 
 def t_ShieldRemovedOnFireTile():
     "A shielded unit is put onto a fire tile. The unit takes a hit which removes the shield and the unit catches fire."
@@ -123,36 +124,36 @@ def t_ShieldRemovedOnFireTile():
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g, effects={Effects.SHIELD}))
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
 
 def t_MountainOverkill():
     "A mountain takes 5 damage twice and needs two hits to be destroyed."
     g = Game()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].createUnitHere(Unit_Mountain(g))
     g.board[(1, 1)].takeDamage(5)
     assert g.board[(1, 1)].unit.type == 'mountaindamaged'
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
 
 def t_FlyingUnitOnFireOverWater():
     "A flying unit that is on fire that moves to a water tile remains on fire"
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(1, 2)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 2)].effects == 0
     g.board[(1, 2)].applyFire()
     g.board[(1, 2)].moveUnit((1, 1))
     g.flushHurt()
     assert g.board[(1, 1)].unit.type == 'hornet'
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(1, 2)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
+    assert g.board[(1, 2)].effects == Effects.FIRE
     assert g.board[(1, 2)].unit == None
 
 def t_FlyingUnitCatchesFireOverWater():
@@ -160,26 +161,26 @@ def t_FlyingUnitCatchesFireOverWater():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Ice(g))
     g.board[(1, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 2)].effects == 0
     g.board[(1, 1)].applyFire()
     g.flushHurt()
     assert g.board[(1, 1)].unit.type == 'hornet'
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
 
 def t_FlyingUnitIcedOverWater():
     "A flying unit that is frozen on water remains frozen because the tile under it becomes ice instead of water."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(1, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyIce()
     g.flushHurt()
     assert g.board[(1, 1)].unit.type == 'hornet'
     assert g.board[(1, 1)].type == 'ice'
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
 
 def t_WaterRemovesIceFromUnit():
     "A flying unit or ground unit that is frozen and is then moved onto a water tile is unfrozen."
@@ -188,20 +189,20 @@ def t_WaterRemovesIceFromUnit():
     g.board[(1, 2)].replaceTile(Tile_Water(g))
     g.board[(2, 1)].createUnitHere(Unit_Hornet(g)) # flying unit on the bottom next to the tile
     g.board[(2, 2)].createUnitHere(Unit_Blobber(g)) # ground unit above it next to water tile
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED} # no new tile effects
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
-    assert g.board[(1, 2)].effects == {Effects.SUBMERGED}  # no new tile effects
-    assert g.board[(2, 2)].unit.effects == set()  # no unit effects
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED # no new tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
+    assert g.board[(1, 2)].effects == Effects.SUBMERGED  # no new tile effects
+    assert g.board[(2, 2)].unit.effects == 0  # no unit effects
     g.board[(2, 1)].applyIce() # freeze the flyer
     g.board[(2, 2)].applyIce()  # freeze the flyer
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
-    assert g.board[(2, 2)].unit.effects == {Effects.ICE}
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
+    assert g.board[(2, 2)].unit.effects == Effects.ICE
     assert g.board[(1, 1)].type == 'water'
     assert g.board[(1, 2)].type == 'water'
     g.board[(2, 1)].push(Direction.LEFT)
     g.board[(2, 2)].push(Direction.LEFT)
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 2)].unit == None # the ground unit didn't survive the water
 
 def t_WaterTileTurnsToIceWhenIce():
@@ -217,109 +218,109 @@ def t_WaterTilePutsOutUnitFire():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(2, 1)].createUnitHere(Unit_BeetleLeader(g)) # massive unit on the bottom next to the water tile
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyFire()
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_RepairWaterAcidTileDoesntRemoveAcid():
     "When a water tile has acid on it, it becomes an acid water tile. A flying unit repairing here does NOT remove the acid."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g, effects={Effects.ACID}))
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
     g.board[(1, 1)].repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
 
 def t_IceAcidWaterThenThawingWithFireRemovesAcid():
     "When an acid water tile is frozen, it becomes a frozen acid tile that behaves just like an ice tile. When this frozen acid tile is destroyed by fire, it becomes a regular water tile."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g, effects={Effects.ACID}))
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
     g.board[(1, 1)].applyIce()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].type == 'ice'
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
     assert g.board[(1, 1)].type == 'water'
 
 def t_IceAcidWaterThenThawingWithDamageLeavesAcid():
     "When an acid water tile is frozen, it becomes a frozen acid tile that behaves just like an ice tile. When this frozen acid tile is destroyed by damage, it reverts to an acid water tile."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g, effects={Effects.ACID}))
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
     g.board[(1, 1)].applyIce()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].type == 'ice'
     g.board[(1, 1)].takeDamage(10) # we only damage it once, it needs 2 hits like a mountain.
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].type == 'ice_damaged'
     g.board[(1, 1)].takeDamage(10) # now the ice should be gone
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.ACID
     assert g.board[(1, 1)].type == 'water'
 
 def t_UnitDoesntGetAcidFromIcedAcidWater():
     "If acid is put onto an ice tile, it becomes a frozen acid tile. This means there is no pool of acid on it and a unit can't pick up acid by moving here."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
     g.board[(1, 1)].applyIce()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].type == 'ice'
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].type == 'ice'
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_RepairingInSmokeLeavesSmoke():
     "A unit that repairs in a smoke cloud (because camilla allows actions while smoked) does NOT remove the smoke."
     g = Game()
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     g.board[(1, 1)].repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
 
 def t_FlyingDoesntGetAcidFromAcidWater():
     "A flying unit on an acid water tile does not get acid on it."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g, effects={Effects.ACID}))
     g.board[(2, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].push(Direction.LEFT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_IceDoesntEffectAcidPool():
     "If a tile with acid on it is frozen, nothing happens. The acid remains."
     g = Game()
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     g.board[(1, 1)].applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
 
 def t_IceDoesNothingToLava():
     "Lava is unfreezable."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Lava(g))
-    assert g.board[(1, 1)].effects == {Effects.FIRE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.FIRE | Effects.SUBMERGED
     g.board[(1, 1)].applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.FIRE | Effects.SUBMERGED
     assert g.board[(1, 1)].type == 'lava'
 
 def t_LavaSetsMassiveOnFire():
@@ -327,68 +328,68 @@ def t_LavaSetsMassiveOnFire():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Lava(g))
     g.board[(1, 2)].createUnitHere(Unit_BeetleLeader(g))
-    assert g.board[(1, 1)].effects == {Effects.FIRE, Effects.SUBMERGED}
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.FIRE | Effects.SUBMERGED
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     g.board[(1, 2)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE, Effects.SUBMERGED}
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE | Effects.SUBMERGED
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
 
 def t_UnitTakesAcidFromTile():
     "When you step on an acid tile, it becomes a regular tile. the first unit that steps there takes acid away."
     g = Game()
     g.board[(1, 1)].applyAcid()
     g.board[(1, 2)].createUnitHere(Unit_BeetleLeader(g))
-    assert g.board[(1, 1)].effects == {Effects.ACID}
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     g.board[(1, 2)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
 
 def t_UnitLeavesAcidWhenKilled():
     "When a unit with acid dies, it leaves behind an acid pool."
     g = Game()
     g.board[(1, 2)].createUnitHere(Unit_BeetleLeader(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     g.board[(1, 2)].applyAcid()
     g.board[(1, 2)].moveUnit((1, 1))
     g.board[(1, 1)].die()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID
+    assert g.board[(1, 2)].effects == 0
 
 def t_MountainTileCantGainAcid():
     "Mountain tile can't gain acid., absolutely nothing happens to the mountain or the tile."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mountain(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_IceGroundUnitDiesInChasm():
     "A frozen unit dies in a chasm."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Chasm(g))
     g.board[(1, 2)].createUnitHere(Unit_BeetleLeader(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     g.board[(1, 2)].applyIce()
-    assert g.board[(1, 2)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 2)].unit.effects == Effects.ICE
     g.board[(1, 2)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 2)].effects == 0
     assert g.board[(1, 1)].unit == None
 
 def t_IceFlyingUnitDiesInChasm():
@@ -396,15 +397,15 @@ def t_IceFlyingUnitDiesInChasm():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Chasm(g))
     g.board[(1, 2)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     g.board[(1, 2)].applyIce()
-    assert g.board[(1, 2)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 2)].unit.effects == Effects.ICE
     g.board[(1, 2)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 2)].effects == 0
     assert g.board[(1, 1)].unit == None
     assert g.board[(1, 2)].unit == None
 
@@ -412,55 +413,55 @@ def t_AcidPutsOutTileFire():
     "When a tile gets acid, it removes the fire from the tile."
     g = Game()
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     g.board[(1, 1)].applyAcid()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
 
 def t_AcidFromDeadUnitPutsOutTileFire():
     "If a tile is on fire and a unit with acid dies on it, Acid pool is left on the tile removing the fire."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.ACID
     g.board[(1, 1)].takeDamage(10)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
 
 def t_RockWithAcidLeavesAcidWhenKilled():
     "A rock leaves acid when killed just like a vek"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Rock(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
 
 def t_UnitsOnFireDontLightTileOnDeath():
     "flying units that are on fire doesn't transfer fire to the vek emerge tile below."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].moveUnit((2, 1))
     g.board[(2, 1)].die()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit == None
 
 def t_SmallGroundUnitBringsAcidIntoWater():
@@ -468,16 +469,16 @@ def t_SmallGroundUnitBringsAcidIntoWater():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(2, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.ACID
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit == None # unit wasn't massive so it died.
 
 def t_MassiveGroundUnitBringsAcidIntoWater():
@@ -485,192 +486,192 @@ def t_MassiveGroundUnitBringsAcidIntoWater():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(2, 1)].createUnitHere(Unit_LargeGoo(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.MASSIVE
     g.board[(2, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.ACID
     g.board[(2, 1)].moveUnit((1, 1))
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID} # unit is massive so it survived.
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID # unit is massive so it survived.
     g.board[(1, 1)].moveUnit((2, 1)) # the unit moves out and still has acid
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID}  # unit still has acid
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.ACID  # unit still has acid
 
 def t_GroundUnitWithAcidAndFireDies():
     "a ground unit with acid and fire dies on a normal tile: acid pool is left on the tile."
     g = Game()
     g.board[(2, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyAcid()
     g.board[(2, 1)].applyFire()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID, Effects.FIRE}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.ACID | Effects.FIRE
     g.board[(2, 1)].moveUnit((1, 1))
     g.board[(1, 1)].die()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.ACID
+    assert g.board[(2, 1)].effects == Effects.FIRE
     assert g.board[(1, 1)].unit == None
 
 def t_MountainCantBeSetOnFire():
     "mountains can't be set on fire, but the tile they're on can!"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mountain(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_SmokePutsOutFireTile():
     "Attacking a forest tile with something that leaves behind smoke doesn't light it on fire! Does smoke put out fire? Yes, smoke reverts it back to a forest tile. When the jet mech attacks and smokes a forest, it is only smoked. the forest remains, there's no fire, but there is smoke."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     g.board[(1, 1)].applySmoke()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'forest'
 
 def t_SmokePutsOutFireUnit():
     "If a unit is on fire and their tile gets smoked, they lose fire."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Leaper(g))
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire() # set the tile and unit on fire
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].applySmoke()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
-    assert g.board[(1, 1)].unit.effects == set() # unit no longer on fire
+    assert g.board[(1, 1)].effects == Effects.SMOKE
+    assert g.board[(1, 1)].unit.effects == 0 # unit no longer on fire
 
 def t_AttackingSmokedForestRemovesSmokeAndCatchesFire():
     "Attacking a forest that is smoked will remove the smoke and set the tile on fire."
     g = Game() # This is all the exact same as smoke puts out fire
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'forest' # until here, now let's attack it again!
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
 
 def t_SettingFireToSmokedTileRemovesSmokeAndCatchesFire():
     "Setting fire to a normal tile that is smoked will remove the smoke and set the tile on fire."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Ground(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'ground'
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
 
 def t_SettingFireToSmokedTileRemovesSmokeAndCatchesFireShield():
     "Setting fire to a normal tile that is smoked will remove the smoke and set the tile on fire, even with a shielded unit present."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Ground(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'ground'
     g.board[(1, 1)].createUnitHere(Unit_Ice_Mech(g, effects={Effects.SHIELD}))
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
 
 def t_SettingFireToSmokedWaterTileDoesNothing():
     "Setting fire to a water tile that is smoked will leave the smoke."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SMOKE | Effects.SUBMERGED
     assert g.board[(1, 1)].type == 'water'
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SMOKE | Effects.SUBMERGED
 
 def t_SettingFireToSmokedChasmTileDoesNothing():
     "Setting fire to a chasm tile that is smoked will leave the smoke."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Chasm(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'chasm'
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
 
 def t_SettingFireToSmokedIceTileRemovesSmokeAndTurnsToWater():
     "Setting fire to an ice tile that is smoked will remove the smoke and turn it into a water tile."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Ice(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SMOKE | Effects.SUBMERGED
     assert g.board[(1, 1)].type == 'water'
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.SMOKE
 
 def t_BuildingAcidGoesToTile():
     "When a building on a normal tile is hit with acid, the tile has acid."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Building(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_FlyingUnitWithAcidDiesInWater():
     "When a flying unit with acid dies over water, it becomes a water acid tile."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(2, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.ACID
     g.board[(2, 1)].moveUnit((1, 1))
     g.board[(1, 1)].die()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
     assert g.board[(2, 1)].unit == None
 
@@ -679,17 +680,17 @@ def t_IceGroundUnitWithAcidDiesInWater():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(2, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyAcid()
     g.board[(2, 1)].applyIce()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID, Effects.ICE}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.ACID | Effects.ICE
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
     assert g.board[(2, 1)].unit == None
 
@@ -698,11 +699,11 @@ def t_IceFlyingUnitOverChasmKillsIt():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Chasm(g))
     g.board[(1, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
 
 def t_UnitsOnFireCatchForestsOnFireByMovingToThem():
@@ -710,17 +711,17 @@ def t_UnitsOnFireCatchForestsOnFireByMovingToThem():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
     g.board[(2, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyFire()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     assert g.board[(2, 1)].unit == None
 
 def t_UnitsOnFireCatchSmokedForestsOnFireByMovingToThem():
@@ -728,17 +729,17 @@ def t_UnitsOnFireCatchSmokedForestsOnFireByMovingToThem():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Forest(g, effects={Effects.SMOKE}))
     g.board[(2, 1)].createUnitHere(Unit_Hornet(g))
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SMOKE
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyFire()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     assert g.board[(2, 1)].unit == None
 
 def t_ShieldedUnitOnForestWontIgnightForest():
@@ -747,145 +748,145 @@ def t_ShieldedUnitOnForestWontIgnightForest():
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_Hornet(g))
     g.board[(1, 1)].applyShield()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no fire on tile
-    assert g.board[(1, 1)].unit.effects == set()  # shield gone, but not on fire
+    assert g.board[(1, 1)].effects == 0  # no fire on tile
+    assert g.board[(1, 1)].unit.effects == 0  # shield gone, but not on fire
 
 def t_UnitSetOnFireThenShieldedNothingWeird():
     "a unit can be set on fire and then shielded, the fire stays."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].applyShield()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.SHIELD
 
 def t_UnitFireAndShieldMovedToForestSetOnFire():
     "if a unit that is on fire and shielded moves to a forest tile, it is set on fire."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
     g.board[(2, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyFire()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(1, 1)].effects == 0
     g.board[(2, 1)].applyShield()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD}
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE | Effects.SHIELD
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.SHIELD
 
 def t_IceRemovesFireFromUnitAndTile():
     "Ice puts out fire on unit and tile."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
 
 def t_ShieldBlocksIceFromFire():
     "What happens when a unit is set on fire, shielded, then frozen? Ice has no effect, unit remains shielded and on fire. Tile remains on fire."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].applyShield()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.SHIELD
     g.board[(1, 1)].applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.SHIELD
 
 def t_ShieldBlocksDirectIceFromFire():
     "What happens when a unit is set on fire, shielded, then frozen? Ice has no effect, unit remains shielded and on fire. Tile remains on fire. Here, ice is given directly to the unit."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].applyShield()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.SHIELD
     g.board[(1, 1)].unit.applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.SHIELD
 
 def t_ShieldBlocksIce():
     "You can't be frozen when you have a shield"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyShield()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     g.board[(1, 1)].applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
 
 def t_FireBreaksIceWithShield():
     "If a unit is iced, shielded, then fired, the ice breaks, the tile catches fire, but the unit remains shielded and not on fire."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyIce()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
     g.board[(1, 1)].applyShield()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE, Effects.SHIELD}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ICE | Effects.SHIELD
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
 
 def t_AcidVatOnFireDoesntCreateFireAcidWater():
     "Test keepeffects by setting an acid vat on fire and then destroying it. The resulting acid water tile should not have fire."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Acid_Vat(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].takeDamage(10)
     #print(g.board[(1, 1)])
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
     assert g.board[(1, 1)].unit == None
 
 def t_AcidVatWithSmokeKeepsSmokeAfterKilled():
     "Test keepeffects by smoking an acid vat and then destroying it. The resulting tile should be acid water with smoke."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Acid_Vat(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SMOKE
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].takeDamage(10)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED, Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED | Effects.SMOKE
     assert g.board[(1, 1)].unit == None
 
 def t_AcidUnitAttackedOnSandLeavesAcidNoSmoke():
@@ -893,14 +894,14 @@ def t_AcidUnitAttackedOnSandLeavesAcidNoSmoke():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Sand(g))
     g.board[(1, 1)].createUnitHere(Unit_Blobber(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
     g.board[(1, 1)].takeDamage(10)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SMOKE
     assert g.board[(1, 1)].unit == None
     assert g.board[(1, 1)].type == 'ground'
 
@@ -908,10 +909,10 @@ def t_AcidRemovesSand():
     "Acid that lands on sand converts it to a ground tile with acid."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Sand(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applyAcid()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
     assert g.board[(1, 1)].type == 'ground'
 
@@ -919,10 +920,10 @@ def t_AcidRemovesForest():
     "Acid that lands on forest converts it to a ground tile with acid."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].applyAcid()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
     assert g.board[(1, 1)].type == 'ground'
 
@@ -930,9 +931,9 @@ def t_AcidDoesNothingToLava():
   "Nothing happens when acid hits lava."
   g = Game()
   g.board[(1, 1)].replaceTile(Tile_Lava(g))
-  assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
+  assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
   g.board[(1, 1)].applyAcid()
-  assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
+  assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
   assert g.board[(1, 1)].unit == None
   assert g.board[(1, 1)].type == 'lava'
 
@@ -940,20 +941,20 @@ def t_FireErasesSandTile():
   "A sand tile being set on fire converts the sand tile to a ground tile on fire."
   g = Game()
   g.board[(1, 1)].replaceTile(Tile_Sand(g))
-  assert g.board[(1, 1)].effects == set()
+  assert g.board[(1, 1)].effects == 0
   g.board[(1, 1)].applyFire()
-  assert g.board[(1, 1)].effects == {Effects.FIRE}
+  assert g.board[(1, 1)].effects == Effects.FIRE
   assert g.board[(1, 1)].unit == None
   assert g.board[(1, 1)].type == 'ground'
 
 def t_FireRemovesAcidPool():
   "If there's an acid pool on a tile, setting it on fire removes the acid pool."
   g = Game()
-  assert g.board[(1, 1)].effects == set()
+  assert g.board[(1, 1)].effects == 0
   g.board[(1, 1)].applyAcid()
-  assert g.board[(1, 1)].effects == {Effects.ACID}
+  assert g.board[(1, 1)].effects == Effects.ACID
   g.board[(1, 1)].applyFire()
-  assert g.board[(1, 1)].effects == {Effects.FIRE}
+  assert g.board[(1, 1)].effects == Effects.FIRE
   assert g.board[(1, 1)].unit == None
   assert g.board[(1, 1)].type == 'ground'
 
@@ -961,37 +962,37 @@ def t_FireImmuneUnitDoesntCatchFire():
     "A unit with fire immunity doesn't catch fire, duh."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Hornet(g, attributes={Attributes.IMMUNEFIRE}))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.IMMUNEFIRE, Attributes.FLYING}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.IMMUNEFIRE | Attributes.FLYING
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # tile on fire
-    assert g.board[(1, 1)].unit.effects == set() # unit is not
+    assert g.board[(1, 1)].effects == Effects.FIRE # tile on fire
+    assert g.board[(1, 1)].unit.effects == 0 # unit is not
 
 def t_MechCorpsePush():
     "Dead mechs are not stable and can be pushed around."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mech_Corpse(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     g.board[(1, 1)].push(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.attributes == Attributes.MASSIVE
 
 def t_MechCorpsePushIntoChasm():
     "Dead mechs disappear into chasms. They have the flying attribute ingame for some reason but are clearly not flying."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mech_Corpse(g))
     g.board[(2, 1)].replaceTile( Tile_Chasm(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit ==  None
     g.board[(1, 1)].push(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
     assert g.board[(2, 1)].unit == None
 
@@ -999,100 +1000,100 @@ def t_MechCorpseCantBeIced():
     "Mech corpses cannot be frozen."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mech_Corpse(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     g.board[(1, 1)].applyIce()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_MechCorpseSpreadsFire():
     "Even though in the game it doesn't show mech corpses as having fire or acid, they do as evidenced by spreading of fire to forests and acid to water. Here we test fire."
     g = Game()
     g.board[(2, 1)].replaceTile( Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_Mech_Corpse(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit == None
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit == None
     g.board[(1, 1)].push(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
 
 def t_MechCorpseSpreadsAcid():
     "Even though in the game it doesn't show mech corpses as having fire or acid, they do as evidenced by spreading of fire to forests and acid to water. Here we test acid"
     g = Game()
     g.board[(2, 1)].replaceTile( Tile_Water(g))
     g.board[(1, 1)].createUnitHere(Unit_Mech_Corpse(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED
     assert g.board[(2, 1)].unit == None
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED
     assert g.board[(2, 1)].unit == None
     g.board[(1, 1)].push(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED, Effects.ACID}
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED | Effects.ACID
+    assert g.board[(2, 1)].unit.effects == Effects.ACID
 
 def t_MechCorpseInvulnerable():
     "Dead mechs can't be killed by damage."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mech_Corpse(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     g.board[(1, 1)].takeDamage(100)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
     g.board[(1, 1)].takeDamage(100)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
 
 def t_MechCorpseCantBeShielded():
     "Mech corpses cannot be shielded even though the game implies that it can be."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mech_Corpse(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyShield()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_UnitWithAcidKilledOnSandThenSetOnFire():
     "A unit with acid is killed on a sand tile, tile now has smoke and acid and is no longer a sand tile. Setting it on fire gets rid of smoke and acid."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Sand(g))
     g.board[(1, 1)].createUnitHere(Unit_Scarab(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
     g.board[(1, 1)].takeDamage(10)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SMOKE
     assert g.board[(1, 1)].unit == None
     assert g.board[(1, 1)].type == 'ground'
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     assert g.board[(1, 1)].unit == None
     assert g.board[(1, 1)].type == 'ground'
 
@@ -1127,24 +1128,24 @@ def t_WorkingTeleporter():
     g.board[(1, 1)].replaceTile(Tile_Teleporter(g, companion=(8, 8)))
     g.board[(8, 8)].replaceTile(Tile_Teleporter(g, companion=(1, 1)))
     g.board[(2, 1)].createUnitHere(Unit_Scarab(g))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(8, 8)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].moveUnit((1, 1))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(2, 1)].unit == None
-    assert g.board[(8, 8)].unit.effects == set() # unit is on far teleporter
+    assert g.board[(8, 8)].unit.effects == 0 # unit is on far teleporter
     g.board[(8, 8)].moveUnit((7, 8)) # move it off teleporter
     assert g.board[(1, 1)].unit == None
     assert g.board[(8, 8)].unit == None
-    assert g.board[(7, 8)].unit.effects == set() # unit is here
+    assert g.board[(7, 8)].unit.effects == 0 # unit is here
     g.board[(7, 8)].moveUnit((8, 8)) # move it back to far teleporter
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set() # unit is here
+    assert g.board[(1, 1)].unit.effects == 0 # unit is here
     assert g.board[(8, 8)].unit == None
     assert g.board[(7, 8)].unit == None
 
@@ -1154,15 +1155,15 @@ def t_TeleporterSwaps2Units():
     g.board[(1, 1)].replaceTile(Tile_Teleporter(g, companion=(8, 8)))
     g.board[(8, 8)].replaceTile(Tile_Teleporter(g, companion=(1, 1)))
     g.board[(2, 1)].createUnitHere(Unit_Scarab(g)) # put scarab next to near teleporter
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(8, 8)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].moveUnit((1, 1)) # move scarab to near teleporter
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(2, 1)].unit == None
     assert g.board[(8, 8)].unit.type == 'scarab' # unit is on far teleporter
     g.board[(1, 1)].createUnitHere(Unit_HornetLeader(g)) # they instantly swap
@@ -1176,18 +1177,18 @@ def t_TeleporterWithFire():
     g.board[(1, 1)].replaceTile(Tile_Teleporter(g, effects={Effects.FIRE}, companion=(8, 8)))
     g.board[(8, 8)].replaceTile(Tile_Teleporter(g, companion=(1, 1)))
     g.board[(2, 1)].createUnitHere(Unit_Scarab(g))
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     assert g.board[(1, 1)].unit == None
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(8, 8)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(2, 1)].unit == None
-    assert g.board[(8, 8)].unit.effects == {Effects.FIRE} # unit is on far teleporter
+    assert g.board[(8, 8)].unit.effects == Effects.FIRE # unit is on far teleporter
 
 def t_TeleporterWithAcid():
     "If there's an acid pool on a teleporter, it's picked up by the unit that moves there and then the unit is teleported."
@@ -1195,18 +1196,18 @@ def t_TeleporterWithAcid():
     g.board[(1, 1)].replaceTile(Tile_Teleporter(g, effects={Effects.ACID}, companion=(8, 8)))
     g.board[(8, 8)].replaceTile(Tile_Teleporter(g, companion=(1, 1)))
     g.board[(2, 1)].createUnitHere(Unit_Scarab(g))
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(8, 8)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(2, 1)].unit == None
-    assert g.board[(8, 8)].unit.effects == {Effects.ACID} # unit is on far teleporter
+    assert g.board[(8, 8)].unit.effects == Effects.ACID # unit is on far teleporter
 
 def t_DamDies():
     "The Dam is a special 2-tile unit. In this program, it's treated as 2 separate units that replicate actions to each other. In this test, we kill one and make sure they both die and flood the map."
@@ -1216,10 +1217,10 @@ def t_DamDies():
     g.board[(8, 3)].createUnitHere(Unit_Dam(g))
     g.board[(8, 4)].createUnitHere(Unit_Dam(g))
     g.start()
-    assert g.board[(8, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(8, 4)].effects == {Effects.SUBMERGED}
-    assert g.board[(7, 3)].effects == set() # the tiles next to the dam are normal
-    assert g.board[(7, 4)].effects == set()
+    assert g.board[(8, 3)].effects == Effects.SUBMERGED
+    assert g.board[(8, 4)].effects == Effects.SUBMERGED
+    assert g.board[(7, 3)].effects == 0 # the tiles next to the dam are normal
+    assert g.board[(7, 4)].effects == 0
     g.board[(8, 3)].takeDamage(1)
     assert g.board[(8, 3)].unit.hp == 1
     assert g.board[(8, 4)].unit.hp == 1
@@ -1241,10 +1242,10 @@ def t_DamDiesInstantDeath():
     g.board[(7, 4)].createUnitHere(Unit_Jet_Mech(g, weapon1=Weapon_SelfDestruct()))  # power is ignored
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     g.start()
-    assert g.board[(8, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(8, 4)].effects == {Effects.SUBMERGED}
-    assert g.board[(7, 3)].effects == set() # the tiles next to the dam are normal
-    assert g.board[(7, 4)].effects == set()
+    assert g.board[(8, 3)].effects == Effects.SUBMERGED
+    assert g.board[(8, 4)].effects == Effects.SUBMERGED
+    assert g.board[(7, 3)].effects == 0 # the tiles next to the dam are normal
+    assert g.board[(7, 4)].effects == 0
     gs = g.board[(7, 4)].unit.weapon1.genShots()
     g.board[(7, 4)].unit.weapon1.shoot(*next(gs))
     g.flushHurt()
@@ -1265,10 +1266,10 @@ def t_DamDiesInstantDeathWebbed():
     g.board[(7, 4)].unit._makeWeb((8, 4))
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     g.start()
-    assert g.board[(8, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(8, 4)].effects == {Effects.SUBMERGED}
-    assert g.board[(7, 3)].effects == set() # the tiles next to the dam are normal
-    assert g.board[(7, 4)].effects == set()
+    assert g.board[(8, 3)].effects == Effects.SUBMERGED
+    assert g.board[(8, 4)].effects == Effects.SUBMERGED
+    assert g.board[(7, 3)].effects == 0 # the tiles next to the dam are normal
+    assert g.board[(7, 4)].effects == 0
     gs = g.board[(7, 4)].unit.weapon1.genShots()
     g.board[(7, 4)].unit.weapon1.shoot(*next(gs))
     g.flushHurt()
@@ -1288,12 +1289,12 @@ def t_DamDiesWithAcidUnits():
     g.board[(7, 3)].createUnitHere(Unit_Blobber(g, effects={Effects.ACID}))
     g.board[(7, 4)].createUnitHere(Unit_Hornet(g, effects={Effects.ACID}))
     g.start()
-    assert g.board[(8, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(8, 4)].effects == {Effects.SUBMERGED}
-    assert g.board[(7, 3)].effects == set() # the tiles next to the dam are normal
-    assert g.board[(7, 4)].effects == set()
-    assert g.board[(7, 3)].unit.effects == {Effects.ACID}  # the units next to the dam have acid
-    assert g.board[(7, 4)].unit.effects == {Effects.ACID}
+    assert g.board[(8, 3)].effects == Effects.SUBMERGED
+    assert g.board[(8, 4)].effects == Effects.SUBMERGED
+    assert g.board[(7, 3)].effects == 0 # the tiles next to the dam are normal
+    assert g.board[(7, 4)].effects == 0
+    assert g.board[(7, 3)].unit.effects == Effects.ACID  # the units next to the dam have acid
+    assert g.board[(7, 4)].unit.effects == Effects.ACID
     g.board[(8, 3)].takeDamage(1)
     assert g.board[(8, 3)].unit.hp == 1
     assert g.board[(8, 4)].unit.hp == 1
@@ -1305,9 +1306,9 @@ def t_DamDiesWithAcidUnits():
             assert g.board[(x, y)].type == 'water'
     g.flushHurt()
     assert g.board[(7, 3)].unit == None # the blobber died
-    assert g.board[(7, 3)].effects == {Effects.ACID, Effects.SUBMERGED} # the blobber left acid in the water
+    assert g.board[(7, 3)].effects == Effects.ACID | Effects.SUBMERGED # the blobber left acid in the water
     assert g.board[(7, 4)].unit.type == 'hornet' # the hornet survived
-    assert g.board[(7, 4)].effects == {Effects.SUBMERGED}  # the acid is still on the hornet and not the water
+    assert g.board[(7, 4)].effects == Effects.SUBMERGED  # the acid is still on the hornet and not the water
 
 def t_DamDiesWithAcidOnGround():
     "In this test, we kill one and make sure that a ground tile with acid leaves acid in the new water tile."
@@ -1318,10 +1319,10 @@ def t_DamDiesWithAcidOnGround():
     g.board[(8, 4)].createUnitHere(Unit_Dam(g))
     g.board[(7, 3)].applyAcid()
     g.start()
-    assert g.board[(8, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(8, 4)].effects == {Effects.SUBMERGED}
-    assert g.board[(7, 3)].effects == {Effects.ACID} # the tile next to the dam has acid
-    assert g.board[(7, 4)].effects == set()
+    assert g.board[(8, 3)].effects == Effects.SUBMERGED
+    assert g.board[(8, 4)].effects == Effects.SUBMERGED
+    assert g.board[(7, 3)].effects == Effects.ACID # the tile next to the dam has acid
+    assert g.board[(7, 4)].effects == 0
     g.board[(8, 3)].takeDamage(1)
     assert g.board[(8, 3)].unit.hp == 1
     assert g.board[(8, 4)].unit.hp == 1
@@ -1332,8 +1333,8 @@ def t_DamDiesWithAcidOnGround():
         for x in range(1, 8):
             assert g.board[(x, y)].type == 'water'
     g.flushHurt()
-    assert g.board[(7, 3)].effects == {Effects.ACID, Effects.SUBMERGED} # the acid on the ground left acid in the water
-    assert g.board[(7, 4)].effects == {Effects.SUBMERGED} # this tile never got acid
+    assert g.board[(7, 3)].effects == Effects.ACID | Effects.SUBMERGED # the acid on the ground left acid in the water
+    assert g.board[(7, 4)].effects == Effects.SUBMERGED # this tile never got acid
 
 def t_DamDiesFromElectricWhip():
     "In this test, we kill the dam by chaining the electric whip through it."
@@ -1347,8 +1348,8 @@ def t_DamDiesFromElectricWhip():
     g.board[(7, 4)].createUnitHere(Unit_Scorpion(g))
     g.board[(7, 5)].createUnitHere(Unit_TechnoBeetle_Mech(g, weapon1=Weapon_ElectricWhip()))
     g.start()
-    assert g.board[(8, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(8, 4)].effects == {Effects.SUBMERGED}
+    assert g.board[(8, 3)].effects == Effects.SUBMERGED
+    assert g.board[(8, 4)].effects == Effects.SUBMERGED
     gs = g.board[(7, 5)].unit.weapon1.genShots()
     for i in range(3):
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
@@ -1360,8 +1361,8 @@ def t_DamDiesFromElectricWhip():
         for x in range(1, 8):
             assert g.board[(x, y)].type == 'water'
     g.flushHurt()
-    assert g.board[(7, 3)].effects == {Effects.SUBMERGED} # the acid on the ground left acid in the water
-    assert g.board[(7, 4)].effects == {Effects.SUBMERGED} # this tile never got acid
+    assert g.board[(7, 3)].effects == Effects.SUBMERGED # the acid on the ground left acid in the water
+    assert g.board[(7, 4)].effects == Effects.SUBMERGED # this tile never got acid
 
 # I don't think this is true and was created under a mistaken understanding.
 # My guess is that I tested this out with the acid projector before I realized that the weapon gives targets acid regardless of shield.
@@ -1375,32 +1376,32 @@ def t_DamDiesFromElectricWhip():
 #     g.board[(8, 3)].createUnitHere(Unit_Dam(g))
 #     g.board[(8, 4)].createUnitHere(Unit_Dam(g))
 #     g.board[(8, 4)].applyShield()
-#     assert g.board[(8, 3)].unit.effects == {Effects.SHIELD}
-#     assert g.board[(8, 4)].unit.effects == {Effects.SHIELD}
+#     assert g.board[(8, 3)].unit.effects == Effects.SHIELD
+#     assert g.board[(8, 4)].unit.effects == Effects.SHIELD
 #     g.board[(8, 3)].applyAcid()
 #     g.flushHurt()
-#     assert g.board[(8, 3)].unit.effects == {Effects.SHIELD, Effects.ACID}
-#     assert g.board[(8, 4)].unit.effects == {Effects.SHIELD, Effects.ACID}
+#     assert g.board[(8, 3)].unit.effects == Effects.SHIELD | Effects.ACID
+#     assert g.board[(8, 4)].unit.effects == Effects.SHIELD | Effects.ACID
 
 def t_ShieldedUnitDoesntGetAcidFromGround():
     "a shielded unit does not pick up acid from the ground."
     g = Game()
     g.board[(2, 1)].createUnitHere(Unit_Scorpion(g))
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyShield()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID} # still acid on the ground
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD} # still shielded only
-    assert g.board[(2, 1)].effects == set() # nothing on that tile
+    assert g.board[(1, 1)].effects == Effects.ACID # still acid on the ground
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD # still shielded only
+    assert g.board[(2, 1)].effects == 0 # nothing on that tile
     assert g.board[(2, 1)].unit == None  # nothing on that tile
 
 def t_ShieldedUnitRepairsDoesntRemoveAcidFromGround():
@@ -1408,25 +1409,25 @@ def t_ShieldedUnitRepairsDoesntRemoveAcidFromGround():
     g = Game()
     g.board[(2, 1)].createUnitHere(Unit_Aegis_Mech(g))
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyShield()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD
     g.board[(2, 1)].moveUnit((1, 1))
-    assert g.board[(1, 1)].effects == {Effects.ACID} # still acid on the ground
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD} # still shielded only
-    assert g.board[(2, 1)].effects == set() # nothing on that tile
+    assert g.board[(1, 1)].effects == Effects.ACID # still acid on the ground
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD # still shielded only
+    assert g.board[(2, 1)].effects == 0 # nothing on that tile
     assert g.board[(2, 1)].unit == None  # nothing on that tile
     g.board[(1, 1)].repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}  # still acid on the ground
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}  # still shielded only
-    assert g.board[(2, 1)].effects == set()  # nothing on that tile
+    assert g.board[(1, 1)].effects == Effects.ACID  # still acid on the ground
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD  # still shielded only
+    assert g.board[(2, 1)].effects == 0  # nothing on that tile
     assert g.board[(2, 1)].unit == None  # nothing on that tile
 
 def t_ShieldedUnitDoesntGetAcidFromWater():
@@ -1435,20 +1436,20 @@ def t_ShieldedUnitDoesntGetAcidFromWater():
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(2, 1)].createUnitHere(Unit_ScorpionLeader(g))
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].applyShield()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID, Effects.SUBMERGED} # still acid in the water
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD,} # Shielded with no acid
-    assert g.board[(2, 1)].effects == set() # nothing on that tile
+    assert g.board[(1, 1)].effects == Effects.ACID | Effects.SUBMERGED # still acid in the water
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD # Shielded with no acid
+    assert g.board[(2, 1)].effects == 0 # nothing on that tile
     assert g.board[(2, 1)].unit == None  # nothing on that tile
 
 def t_MechRepairsRemovesBadEffectsTileAndUnit():
@@ -1456,21 +1457,21 @@ def t_MechRepairsRemovesBadEffectsTileAndUnit():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     assert g.board[(1, 1)].unit.hp == 2
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.ACID
     assert g.board[(1, 1)].unit.hp == 2
     g.board[(1, 1)].repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
 
 def t_MechRepairsRemovesIceFromUnit():
@@ -1478,39 +1479,39 @@ def t_MechRepairsRemovesIceFromUnit():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(1, 1)].createUnitHere(Unit_Cannon_Mech(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].takeDamage(1)
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
     g.board[(1, 1)].applyIce()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].type == 'ice'
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
     assert g.board[(1, 1)].unit.hp == 2
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE, Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ICE | Effects.ACID
     assert g.board[(1, 1)].unit.hp == 2
     g.board[(1, 1)].repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
 
 def t_BurrowerWithAcidLeavesItWhenKilled():
     "Do burrowers leave acid when they die? Yes!"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Burrower(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
     g.board[(1, 1)].takeDamage(2)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
 
 def t_LavaDoesntRemoveAcidFromUnit():
@@ -1518,32 +1519,32 @@ def t_LavaDoesntRemoveAcidFromUnit():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Lava(g))
     g.board[(1, 2)].createUnitHere(Unit_Laser_Mech(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
+    assert g.board[(1, 2)].unit.effects == 0
     g.board[(1, 2)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
-    assert g.board[(1, 2)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
+    assert g.board[(1, 2)].unit.effects == Effects.ACID
     g.board[(1, 2)].push(Direction.DOWN)
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.ACID
     g.board[(1, 1)].push(Direction.UP)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
-    assert g.board[(1, 2)].unit.effects == {Effects.FIRE, Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
+    assert g.board[(1, 2)].unit.effects == Effects.FIRE | Effects.ACID
 
 def t_UnitWithAcidDiesInLava():
     "Lava doesn't get acid from an acid unit dying on it."
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Lava(g))
     g.board[(1, 2)].createUnitHere(Unit_Scorpion(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
+    assert g.board[(1, 2)].unit.effects == 0
     g.board[(1, 2)].applyAcid()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
-    assert g.board[(1, 2)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
+    assert g.board[(1, 2)].unit.effects == Effects.ACID
     g.board[(1, 2)].push(Direction.DOWN)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED, Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED | Effects.FIRE
     assert g.board[(1, 1)].unit == None
 
 def t_MechCorpseIsRepairedBackToLife():
@@ -1551,14 +1552,14 @@ def t_MechCorpseIsRepairedBackToLife():
     g = Game()
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     g.board[(1, 1)].createUnitHere(Unit_Judo_Mech(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].takeDamage(4) # 3 hp, but it has armor :)
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.type == 'mechcorpse'
     g.board[(1, 1)].repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.type == 'judo'
     assert g.board[(1, 1)].unit.hp == 1
 
@@ -1569,26 +1570,26 @@ def t_MechDiesAndRevivedOnTeleporter():
     g.board[(8, 8)].replaceTile(Tile_Teleporter(g, companion=(1, 1)))
     g.board[(2, 1)].createUnitHere(Unit_Flame_Mech(g))
     g.board[(7, 7)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(8, 8)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].moveUnit((1, 1))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(2, 1)].unit == None
-    assert g.board[(8, 8)].unit.effects == set() # unit is on far teleporter
+    assert g.board[(8, 8)].unit.effects == 0 # unit is on far teleporter
     g.board[(8, 8)].takeDamage(3)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
-    assert g.board[(8, 8)].unit.effects == set()  # unit is on far teleporter
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
+    assert g.board[(8, 8)].unit.effects == 0  # unit is on far teleporter
     assert g.board[(8, 8)].unit.type == 'mechcorpse'
     g.board[(8, 8)].repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(8, 8)].unit == None  # no unit on far teleporter
     assert g.board[(1, 1)].unit.type == 'flame'  # unit is back on the near teleporter
     assert g.board[(1, 1)].unit.hp == 1 # the repair worked properly
@@ -1600,21 +1601,21 @@ def t_MechCorpsesDontGoThroughTelePorter():
     g.board[(8, 8)].replaceTile(Tile_Teleporter(g, companion=(1, 1)))
     g.board[(2, 1)].createUnitHere(Unit_Leap_Mech(g))
     g.board[(7, 7)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(8, 8)].unit == None
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].takeDamage(3)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.type == 'mechcorpse'
     g.board[(2, 1)].moveUnit((1, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 8)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 8)].effects == 0
     assert g.board[(2, 1)].unit == None
     assert g.board[(8, 8)].unit == None  # unit is on near teleporter
     assert g.board[(1, 1)].unit.type == 'mechcorpse'
@@ -1624,24 +1625,24 @@ def t_RevivedMechCorpsesKeepAcidButNotFire():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Cannon_Mech(g))
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.ACID
     g.board[(1, 1)].takeDamage(2)
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     assert g.board[(1, 1)].unit.type == 'mechcorpse'
     g.board[(1, 1)].moveUnit((2, 1))
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     assert g.board[(2, 1)].unit.type == 'mechcorpse'
     g.board[(2, 1)].unit.repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.ACID
     assert g.board[(2, 1)].unit.type == 'cannon'
 
 def t_ReviveMechCorpseKeepsAcidGetsFireFromTile():
@@ -1649,20 +1650,20 @@ def t_ReviveMechCorpseKeepsAcidGetsFireFromTile():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g))
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyAcid()
     g.board[(1, 1)].applyFire()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE, Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE | Effects.ACID
     g.board[(1, 1)].takeDamage(1)
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     assert g.board[(1, 1)].unit.type == 'mechcorpse'
     g.board[(1, 1)].unit.repair(1)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID, Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.ACID | Effects.FIRE
     assert g.board[(1, 1)].unit.type == 'jet'
 
 def t_IceStormEnvironmental():
@@ -1671,17 +1672,17 @@ def t_IceStormEnvironmental():
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g))
     g.board[(2, 1)].replaceTile(Tile_Water(g))
     g.board[(3, 1)].applyFire()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED
+    assert g.board[(3, 1)].effects == Effects.FIRE
     g.environeffect.run()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].type == 'ice'
-    assert g.board[(3, 1)].effects == set()
+    assert g.board[(3, 1)].effects == 0
 
 def t_AirStrikeEnvironmental():
     "test an airstrike"
@@ -1692,31 +1693,31 @@ def t_AirStrikeEnvironmental():
     g.board[(2, 1)].applyFire()
     g.board[(3, 2)].replaceTile(Tile_Sand(g))
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(2, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 2)].effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(3, 2)].effects == set()
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(2, 3)].effects == Effects.SUBMERGED
+    assert g.board[(2, 2)].effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(3, 2)].effects == 0
     g.environeffect.run()
     g.flushHurt()
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     assert g.board[(1, 2)].unit.type == 'mechcorpse'
-    assert g.board[(2, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 2)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(3, 2)].effects == {Effects.SMOKE}
+    assert g.board[(2, 3)].effects == Effects.SUBMERGED
+    assert g.board[(2, 2)].effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(3, 2)].effects == Effects.SMOKE
 
 def t_AirStrikeEnvironmentalAcidForest():
     "if a vek with acid is on a forest and is then hit with an airstrike, the tile is damaged and catches fire, then the unit dies leaving its acid and removing the fire and forest."
     g = Game(environeffect=Environ_AirStrike({(1, 1)}))
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_Scorpion(g, effects={Effects.ACID}))
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     g.environeffect.run()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == Effects.ACID
     assert g.board[(1, 1)].unit == None
     assert g.board[(1, 1)].type == 'ground'
 
@@ -1729,21 +1730,21 @@ def t_LightningEnvironmental():
     g.board[(2, 1)].applyFire()
     g.board[(3, 2)].replaceTile(Tile_Sand(g))
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(2, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 2)].effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(3, 2)].effects == set()
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(2, 3)].effects == Effects.SUBMERGED
+    assert g.board[(2, 2)].effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(3, 2)].effects == 0
     g.environeffect.run()
     g.flushHurt()
-    assert g.board[(1, 2)].effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 2)].effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     assert g.board[(1, 2)].unit.type == 'mechcorpse'
-    assert g.board[(2, 3)].effects == {Effects.SUBMERGED}
-    assert g.board[(2, 2)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(3, 2)].effects == {Effects.SMOKE}
+    assert g.board[(2, 3)].effects == Effects.SUBMERGED
+    assert g.board[(2, 2)].effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(3, 2)].effects == Effects.SMOKE
 
 def t_TsunamiEnvironmental():
     "test a tsunami"
@@ -1752,22 +1753,22 @@ def t_TsunamiEnvironmental():
     g.board[(2, 1)].createUnitHere(Unit_Scorpion(g))
     g.board[(3, 1)].createUnitHere(Unit_BloodPsion(g))
     g.board[(3, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     g.environeffect.run()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED
     assert g.board[(2, 1)].unit == None # he drowned
-    assert g.board[(3, 1)].effects == {Effects.SUBMERGED, Effects.SMOKE} # smoke remains
-    assert g.board[(3, 1)].unit.effects == set() # so does this flying unit
+    assert g.board[(3, 1)].effects == Effects.SUBMERGED | Effects.SMOKE # smoke remains
+    assert g.board[(3, 1)].unit.effects == 0 # so does this flying unit
     g.board[(1, 1)].applyIce() # make sure these new tiles are tied to this Game instance:
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].type == 'ice'
 
 def t_CataclysmEnvironmental():
@@ -1779,22 +1780,22 @@ def t_CataclysmEnvironmental():
     g.board[(3, 1)].createUnitHere(Unit_BlastPsion(g))
     g.board[(3, 1)].applySmoke()
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g)) # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     g.environeffect.run()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None # mech died, so did the corpse
-    assert g.board[(2, 1)].effects == set() # no more fire since the ground is gone lol
+    assert g.board[(2, 1)].effects == 0 # no more fire since the ground is gone lol
     assert g.board[(2, 1)].unit == None # he also died
-    assert g.board[(3, 1)].effects == {Effects.SMOKE} # smoke remains
-    assert g.board[(3, 1)].unit.effects == set() # so does this flying unit
+    assert g.board[(3, 1)].effects == Effects.SMOKE # smoke remains
+    assert g.board[(3, 1)].unit.effects == 0 # so does this flying unit
     g.board[(1, 1)].applySmoke() # make sure these new tiles are tied to this Game instance:
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'chasm'
 
 def t_FallingRockEnvironmental():
@@ -1806,22 +1807,22 @@ def t_FallingRockEnvironmental():
     g.board[(3, 1)].createUnitHere(Unit_PsionTyrant(g))
     g.board[(3, 1)].applySmoke()
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     g.environeffect.run()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit.type == 'mechcorpse' # mech died, the corpse remains
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # fire remains after rocks fall
+    assert g.board[(2, 1)].effects == Effects.FIRE # fire remains after rocks fall
     assert g.board[(2, 1)].unit == None # he also died
-    assert g.board[(3, 1)].effects == {Effects.SMOKE} # smoke remains
+    assert g.board[(3, 1)].effects == Effects.SMOKE # smoke remains
     assert g.board[(3, 1)].unit == None # flying unit died
     g.board[(1, 1)].applySmoke() # make sure these new tiles are tied to this Game instance:
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'ground'
 
 def t_TentaclesEnvironmental():
@@ -1833,22 +1834,22 @@ def t_TentaclesEnvironmental():
     g.board[(3, 1)].createUnitHere(Unit_Hornet(g))
     g.board[(3, 1)].applySmoke()
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     g.environeffect.run()
-    assert g.board[(1, 1)].effects == {Effects.FIRE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.FIRE | Effects.SUBMERGED
     assert g.board[(1, 1)].unit.type == 'mechcorpse' # mech died, the corpse remains
-    assert g.board[(2, 1)].effects == {Effects.FIRE, Effects.SUBMERGED} # fire doubly so
+    assert g.board[(2, 1)].effects == Effects.FIRE | Effects.SUBMERGED # fire doubly so
     assert g.board[(2, 1)].unit == None # he also died
-    assert g.board[(3, 1)].effects == {Effects.SMOKE, Effects.FIRE, Effects.SUBMERGED} # smoke remains
+    assert g.board[(3, 1)].effects == Effects.SMOKE | Effects.FIRE | Effects.SUBMERGED # smoke remains
     assert g.board[(3, 1)].unit == None # flying unit died
     g.board[(1, 1)].applySmoke() # make sure these new tiles are tied to this Game instance:
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE, Effects.FIRE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SMOKE | Effects.FIRE | Effects.SUBMERGED
     assert g.board[(1, 1)].type == 'lava'
 
 def t_LavaFlowEnvironmental():
@@ -1859,22 +1860,22 @@ def t_LavaFlowEnvironmental():
     g.board[(2, 1)].applyFire()
     g.board[(3, 1)].createUnitHere(Unit_Hornet(g))
     g.board[(3, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     g.environeffect.run()
-    assert g.board[(1, 1)].effects == {Effects.FIRE, Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE} # mech survived but is now in lava
-    assert g.board[(2, 1)].effects == {Effects.FIRE, Effects.SUBMERGED} # fire doubly so
+    assert g.board[(1, 1)].effects == Effects.FIRE | Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE # mech survived but is now in lava
+    assert g.board[(2, 1)].effects == Effects.FIRE | Effects.SUBMERGED # fire doubly so
     assert g.board[(2, 1)].unit == None # he died
-    assert g.board[(3, 1)].effects == {Effects.SMOKE, Effects.FIRE, Effects.SUBMERGED} # smoke remains
-    assert g.board[(3, 1)].unit.effects == set() # flying unit survived and did not catch on fire
+    assert g.board[(3, 1)].effects == Effects.SMOKE | Effects.FIRE | Effects.SUBMERGED # smoke remains
+    assert g.board[(3, 1)].unit.effects == 0 # flying unit survived and did not catch on fire
     g.board[(1, 1)].applySmoke() # make sure these new tiles are tied to this Game instance:
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE, Effects.FIRE, Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SMOKE | Effects.FIRE | Effects.SUBMERGED
     assert g.board[(1, 1)].type == 'lava'
 
 def t_VolcanicProjectileEnvironmental():
@@ -1886,22 +1887,22 @@ def t_VolcanicProjectileEnvironmental():
     g.board[(3, 1)].createUnitHere(Unit_HornetLeader(g))
     g.board[(3, 1)].applySmoke()
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     g.environeffect.run()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
     assert g.board[(1, 1)].unit.type == 'mechcorpse' # mech died
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == Effects.FIRE
     assert g.board[(2, 1)].unit == None # he died
-    assert g.board[(3, 1)].effects == {Effects.FIRE} # smoke removed by fire
+    assert g.board[(3, 1)].effects == Effects.FIRE # smoke removed by fire
     assert g.board[(3, 1)].unit == None # flying unit died
     g.board[(1, 1)].applySmoke() # make sure these new tiles are tied to this Game instance:
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'ground'
 
 def t_VekEmergeEnvironmental():
@@ -1913,27 +1914,27 @@ def t_VekEmergeEnvironmental():
     g.board[(3, 1)].createUnitHere(Unit_ScorpionLeader(g))
     g.board[(3, 1)].applySmoke()
     g.board[(4, 1)].createUnitHere(Unit_Mech_Corpse(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     g.vekemerge.run()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 1 # mech took bump damage
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == Effects.FIRE
     assert g.board[(2, 1)].unit == None # he died from the bump
-    assert g.board[(3, 1)].effects == {Effects.SMOKE} # smoke remains
+    assert g.board[(3, 1)].effects == Effects.SMOKE # smoke remains
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].effects == set()
+    assert g.board[(4, 1)].effects == 0
     assert g.board[(4, 1)].unit.hp == 1 # corpse didn't take damage
     assert g.board[(4, 1)].unit.type == 'mechcorpse' # and is a corpse
     g.board[(1, 1)].applySmoke() # make sure these new tiles are tied to this Game instance:
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(1, 1)].type == 'ground'
 
 def t_TsunamiEnvironmentalReplaceTile():
@@ -1943,27 +1944,27 @@ def t_TsunamiEnvironmentalReplaceTile():
     g.board[(2, 1)].createUnitHere(Unit_Scorpion(g))
     g.board[(3, 1)].createUnitHere(Unit_BloodPsion(g))
     g.board[(3, 1)].applySmoke()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     g.environeffect.run()
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED
     assert g.board[(2, 1)].unit == None  # he drowned
-    assert g.board[(3, 1)].effects == {Effects.SUBMERGED, Effects.SMOKE}  # smoke remains
-    assert g.board[(3, 1)].unit.effects == set()  # so does this flying unit
+    assert g.board[(3, 1)].effects == Effects.SUBMERGED | Effects.SMOKE  # smoke remains
+    assert g.board[(3, 1)].unit.effects == 0  # so does this flying unit
     g.board[(1, 1)].applyIce()
     g.board[(2, 1)].applyAcid()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # one tile is frozen, one has acid, the last has smoke
+    assert g.board[(1, 1)].effects == 0 # one tile is frozen, one has acid, the last has smoke
     assert g.board[(1, 1)].type == 'ice'
-    assert g.board[(2, 1)].effects == {Effects.ACID, Effects.SUBMERGED}
+    assert g.board[(2, 1)].effects == Effects.ACID | Effects.SUBMERGED
     assert g.board[(2, 1)].type == 'water'
-    assert g.board[(3, 1)].effects == {Effects.SUBMERGED, Effects.SMOKE}
+    assert g.board[(3, 1)].effects == Effects.SUBMERGED | Effects.SMOKE
     assert g.board[(3, 1)].type == 'water'
 
 def t_ConveyorBeltsEnviron():
@@ -1990,20 +1991,20 @@ def t_WeaponTitanFistFirst():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist()))
     g.board[(2, 1)].createUnitHere(Unit_Judo_Mech(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT) # POW RIGHT INDA KISSAH
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(2, 1)].unit == None # judo was pushed off this square
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 2 # he only lost 1 health because of armor
 
 def t_WeaponTitanFistChargeSecond():
@@ -2011,21 +2012,21 @@ def t_WeaponTitanFistChargeSecond():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power1=True)))
     g.board[(6, 1)].createUnitHere(Unit_Judo_Mech(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(6, 1)].effects == set()
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].effects == 0
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(6, 1)].unit.hp == 3
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT) # POW RIGHT INDA KISSAH
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None # Combat dashed off of this tile
-    assert g.board[(5, 1)].unit.effects == set() # and he's now here
+    assert g.board[(5, 1)].unit.effects == 0 # and he's now here
     assert g.board[(5, 1)].unit.hp == 3
     assert g.board[(6, 1)].unit == None # judo was pushed off this square
-    assert g.board[(7, 1)].effects == set() # and he's here now
-    assert g.board[(7, 1)].unit.effects == set()
+    assert g.board[(7, 1)].effects == 0 # and he's here now
+    assert g.board[(7, 1)].unit.effects == 0
     assert g.board[(7, 1)].unit.hp == 2 # he only lost 1 health because of armor
 
 def t_WeaponTitanFistChargeToEdge():
@@ -2033,17 +2034,17 @@ def t_WeaponTitanFistChargeToEdge():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power1=True)))
     g.board[(8, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     assert g.board[(8, 1)].unit == None
     assert g.board[(8, 1)].type == 'forest'
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # he's not here anymore
-    assert g.board[(8, 1)].effects == set() # still no fire
-    assert g.board[(8, 1)].unit.effects == set() # no change
+    assert g.board[(8, 1)].effects == 0 # still no fire
+    assert g.board[(8, 1)].unit.effects == 0 # no change
     assert g.board[(8, 1)].unit.hp == 3 # no change
     assert g.board[(8, 1)].type == 'forest'
 
@@ -2053,21 +2054,21 @@ def t_WeaponTitanFistIceOnIce():
     g.board[(2, 1)].replaceTile(Tile_Ice(g))
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist()))
     g.board[(2, 1)].createUnitHere(Unit_Judo_Mech(g, effects={Effects.ICE}))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
     assert g.board[(2, 1)].unit.hp == 3
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT) # POW RIGHT INDA KISSAH
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(2, 1)].unit == None # judo was pushed off this square
     assert g.board[(2, 1)].type == 'ice' # tile wasn't damaged
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 3 # he only lost 0 health because of ice
 
 def t_WeaponTitanFistIceBumpDamage():
@@ -2076,21 +2077,21 @@ def t_WeaponTitanFistIceBumpDamage():
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist()))
     g.board[(2, 1)].createUnitHere(Unit_Judo_Mech(g, effects={Effects.ICE}, attributes={Attributes.ARMORED}))
     g.board[(3, 1)].createUnitHere(Unit_Mountain(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
-    assert g.board[(2, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
+    assert g.board[(2, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 3
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT) # POW RIGHT INDA KISSAH
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(2, 1)].unit.hp == 2 # judo had ice broken by fist damage, then took 1 bump damage which bypassed the armor
-    assert g.board[(2, 1)].unit.effects == set() # ice is gone
-    assert g.board[(2, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE} # this hasn't changed
+    assert g.board[(2, 1)].unit.effects == 0 # ice is gone
+    assert g.board[(2, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE # this hasn't changed
 
 def t_HurtAndPushedVekOnFireSetsForestOnFire():
     "This is testing the concept of the vek corpse. A vek is lit on fire, and then punched for 4 damage so it's killed, but it's fake corpse is pushed to a forest tile and sets it on fire."
@@ -2098,23 +2099,23 @@ def t_HurtAndPushedVekOnFireSetsForestOnFire():
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power2=True)))
     g.board[(2, 1)].createUnitHere(Unit_Firefly(g, effects={Effects.FIRE}))
     g.board[(3, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == set()
+    assert g.board[(3, 1)].effects == 0
     assert g.board[(3, 1)].unit == None
     assert g.board[(3, 1)].type == 'forest'
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no change for punchbot
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no change for punchbot
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set() # still no effects here
+    assert g.board[(2, 1)].effects == 0 # still no effects here
     assert g.board[(2, 1)].unit == None # firefly was pushed off this tile
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
     assert g.board[(3, 1)].unit == None # The firefly died after spreading fire here. We did a strong 4 damage punch
     assert g.board[(3, 1)].type == 'forest' # still a forest? lol
 
@@ -2124,24 +2125,24 @@ def t_HurtAndPushedMechOnFireDoesNotSetForestOnFire():
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power2=True)))
     g.board[(2, 1)].createUnitHere(Unit_Swap_Mech(g, effects={Effects.FIRE}))
     g.board[(3, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].effects == set()
+    assert g.board[(3, 1)].effects == 0
     assert g.board[(3, 1)].unit == None
     assert g.board[(3, 1)].type == 'forest'
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no change for punchbot
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no change for punchbot
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set() # still no effects here
+    assert g.board[(2, 1)].effects == 0 # still no effects here
     assert g.board[(2, 1)].unit == None # swapper was pushed off this tile
-    assert g.board[(3, 1)].effects == set() # forest is not on fire
-    assert g.board[(3, 1)].unit.effects == set()  # corpse is not on fire
+    assert g.board[(3, 1)].effects == 0 # forest is not on fire
+    assert g.board[(3, 1)].unit.effects == 0  # corpse is not on fire
     assert g.board[(3, 1)].unit.type == 'mechcorpse' # The swapper died after spreading fire here. We did a strong 4 damage punch
     assert g.board[(3, 1)].type == 'forest' # still a forest? lol
 
@@ -2150,24 +2151,24 @@ def t_HurtAndPushedVekRemovesMine():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power2=True)))
     g.board[(2, 1)].createUnitHere(Unit_Firefly(g))
-    g.board[(3, 1)].effects.add(Effects.MINE)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    g.board[(3, 1)].effects |= Effects.MINE
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == {Effects.MINE}
+    assert g.board[(3, 1)].effects == Effects.MINE
     assert g.board[(3, 1)].unit == None
     assert g.board[(3, 1)].type == 'ground'
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no change for punchbot
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no change for punchbot
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set() # still no effects here
+    assert g.board[(2, 1)].effects == 0 # still no effects here
     assert g.board[(2, 1)].unit == None # firefly was pushed off this tile
-    assert g.board[(3, 1)].effects == set() # mine is gone
+    assert g.board[(3, 1)].effects == 0 # mine is gone
     assert g.board[(3, 1)].unit == None # The firefly died after we did a strong 4 damage punch
     assert g.board[(3, 1)].type == 'ground' # still a forest? lol
 
@@ -2176,24 +2177,24 @@ def t_HurtAndPushedVekDoesntRemovePod():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power2=True)))
     g.board[(2, 1)].createUnitHere(Unit_Firefly(g))
-    g.board[(3, 1)].effects.add(Effects.TIMEPOD)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    g.board[(3, 1)].effects |= Effects.TIMEPOD
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == {Effects.TIMEPOD}
+    assert g.board[(3, 1)].effects == Effects.TIMEPOD
     assert g.board[(3, 1)].unit == None
     assert g.board[(3, 1)].type == 'ground'
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no change for punchbot
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no change for punchbot
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set() # still no effects here
+    assert g.board[(2, 1)].effects == 0 # still no effects here
     assert g.board[(2, 1)].unit == None # firefly was pushed off this tile
-    assert g.board[(3, 1)].effects == {Effects.TIMEPOD} # timepod is still there
+    assert g.board[(3, 1)].effects == Effects.TIMEPOD # timepod is still there
     assert g.board[(3, 1)].unit == None # The firefly died after we did a strong 4 damage punch
     assert g.board[(3, 1)].type == 'ground' # still a forest? lol
 
@@ -2202,24 +2203,24 @@ def t_HurtAndPushedVekRemovesFreezeMine():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power2=True)))
     g.board[(2, 1)].createUnitHere(Unit_Firefly(g))
-    g.board[(3, 1)].effects.add(Effects.FREEZEMINE)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    g.board[(3, 1)].effects |= Effects.FREEZEMINE
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == {Effects.FREEZEMINE}
+    assert g.board[(3, 1)].effects == Effects.FREEZEMINE
     assert g.board[(3, 1)].unit == None
     assert g.board[(3, 1)].type == 'ground'
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no change for punchbot
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no change for punchbot
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == set() # still no effects here
+    assert g.board[(2, 1)].effects == 0 # still no effects here
     assert g.board[(2, 1)].unit == None # firefly was pushed off this tile
-    assert g.board[(3, 1)].effects == set() # mine is gone
+    assert g.board[(3, 1)].effects == 0 # mine is gone
     assert g.board[(3, 1)].unit == None # The firefly died after we did a strong 4 damage punch
     assert g.board[(3, 1)].type == 'ground' # still a forest? lol
 
@@ -2227,37 +2228,37 @@ def t_MechMovesToMine():
     "Make sure mines work"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power2=True)))
-    g.board[(2, 1)].effects.add(Effects.MINE)
+    g.board[(2, 1)].effects |= Effects.MINE
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == {Effects.MINE}
+    assert g.board[(2, 1)].effects == Effects.MINE
     assert g.board[(2, 1)].unit == None
     g.board[(1, 1)].moveUnit((2, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set() # mine tripped
+    assert g.board[(2, 1)].effects == 0 # mine tripped
     assert g.board[(2, 1)].unit.type == 'mechcorpse' # ol' punchbot died
 
 def t_MechMovesToFreezeMine():
     "Make sure freezemines work"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(power2=True)))
-    g.board[(2, 1)].effects.add(Effects.FREEZEMINE)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    g.board[(2, 1)].effects |= Effects.FREEZEMINE
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].effects == {Effects.FREEZEMINE}
+    assert g.board[(2, 1)].effects == Effects.FREEZEMINE
     assert g.board[(2, 1)].unit == None
     g.board[(1, 1)].moveUnit((2, 1))
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].effects == set() # mine tripped
+    assert g.board[(2, 1)].effects == 0 # mine tripped
     assert g.board[(2, 1)].unit.type == 'combat' # ol' punchbot survived
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}  # ol' punchbot survived
+    assert g.board[(2, 1)].unit.effects == Effects.ICE  # ol' punchbot survived
 
 def t_WeaponElectricWhipLowPower():
     "Shoot the electric whip without building chain or extra damage powered and make sure it goes through units it should and not through units it shouldn't."
@@ -2506,7 +2507,7 @@ def t_WeaponBurstBeamNoPower():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # wielder untouched
     assert g.board[(2, 1)].unit == None # still nothing here
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(3, 1)].unit.hp == 3 # vek took 2 damage
     assert g.board[(4, 1)].unit.hp == 1 # friendly took 1 damage
     assert g.board[(5, 1)].unit.type == 'mountaindamaged' # mountain was damaged
@@ -2529,7 +2530,7 @@ def t_WeaponBurstBeamAllyPower():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # wielder untouched
     assert g.board[(2, 1)].unit == None # still nothing here
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(3, 1)].unit.hp == 3 # vek took 2 damage
     assert g.board[(4, 1)].unit.hp == 2 # friendly took NO damage
     assert g.board[(5, 1)].unit.type == 'mountaindamaged' # mountain was damaged
@@ -2553,10 +2554,10 @@ def t_WeaponBurstBeamShieldedAllyPower():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # wielder untouched
     assert g.board[(2, 1)].unit == None # still nothing here
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(3, 1)].unit.hp == 3 # vek took 2 damage
     assert g.board[(4, 1)].unit.hp == 2 # friendly took NO damage
-    assert g.board[(4, 1)].unit.effects == {Effects.SHIELD}  # friendly still has shield
+    assert g.board[(4, 1)].unit.effects == Effects.SHIELD  # friendly still has shield
     assert g.board[(5, 1)].unit.type == 'mountaindamaged' # mountain was damaged
     assert g.board[(6, 1)].unit.hp == 5 # this vek was saved by the mountain
 
@@ -2576,7 +2577,7 @@ def t_WeaponBurstBeamDamagePower():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # wielder untouched
     assert g.board[(2, 1)].unit == None # still nothing here
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(3, 1)].unit.hp == 2 # vek took 3 damage
     assert g.board[(4, 1)].unit.type == 'mechcorpse' # friendly took 2 damage and died
     assert g.board[(5, 1)].unit.type == 'mountaindamaged' # mountain was damaged
@@ -2597,7 +2598,7 @@ def t_WeaponBurstBeamFullPower():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # wielder untouched
     assert g.board[(2, 1)].unit == None # still nothing here
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(3, 1)].unit.hp == 2 # vek took 3 damage
     assert g.board[(4, 1)].unit.hp == 2 # friendly took NO damage
     assert g.board[(5, 1)].unit.type == 'mountaindamaged' # mountain was damaged
@@ -2708,18 +2709,18 @@ def t_WeaponRammingEnginesTileDamage():
     g.board[(3, 1)].replaceTile(Tile_Sand(g))
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(1, 1)].effects == set() # sand tiles are all normal
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(3, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0 # sand tiles are all normal
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(3, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # wielder moved
     assert g.board[(2, 1)].unit.hp == 2  # wielder took 1 damage
     assert g.board[(3, 1)].unit == None # vek pushed off this tile
     assert g.board[(4, 1)].unit.hp == 3 # vek pushed here took 2 damage
-    assert g.board[(1, 1)].effects == set() # this one untouched
-    assert g.board[(2, 1)].effects == {Effects.SMOKE} # these 2 got smoked from the self damage
-    assert g.board[(3, 1)].effects == {Effects.SMOKE} # and vek getting hit
+    assert g.board[(1, 1)].effects == 0 # this one untouched
+    assert g.board[(2, 1)].effects == Effects.SMOKE # these 2 got smoked from the self damage
+    assert g.board[(3, 1)].effects == Effects.SMOKE # and vek getting hit
 
 def t_WeaponRammingEnginesShieldedTileDamage():
     "Do the weapon demo with no powered upgrades but on sand tiles with a shield to make sure they don't get damaged"
@@ -2732,18 +2733,18 @@ def t_WeaponRammingEnginesShieldedTileDamage():
     g.board[(3, 1)].replaceTile(Tile_Sand(g))
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(1, 1)].effects == set() # sand tiles are all normal
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(3, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0 # sand tiles are all normal
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(3, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # wielder moved
     assert g.board[(2, 1)].unit.hp == 3  # wielder took 0 damage
     assert g.board[(3, 1)].unit == None # vek pushed off this tile
     assert g.board[(4, 1)].unit.hp == 3 # vek pushed here took 2 damage
-    assert g.board[(1, 1)].effects == set() # this one untouched
-    assert g.board[(2, 1)].effects == set() # this sand tile took no damage since the mech was shielded
-    assert g.board[(3, 1)].effects == {Effects.SMOKE} # this one does take damage because this is where the vek got hit
+    assert g.board[(1, 1)].effects == 0 # this one untouched
+    assert g.board[(2, 1)].effects == 0 # this sand tile took no damage since the mech was shielded
+    assert g.board[(3, 1)].effects == Effects.SMOKE # this one does take damage because this is where the vek got hit
 
 def t_WeaponRammingEnginesIntoChasm():
     "Charge but stop at a chasm and die in it"
@@ -2754,14 +2755,14 @@ def t_WeaponRammingEnginesIntoChasm():
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(3, 1)].effects == set() # normal chasm tile
+    assert g.board[(3, 1)].effects == 0 # normal chasm tile
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # wielder moved
     assert g.board[(2, 1)].unit == None # wielder and mech corpse died in the chasm
     assert g.board[(3, 1)].unit == None # vek pushed off this tile
     assert g.board[(4, 1)].unit.hp == 3 # vek pushed here took 2 damage
-    assert g.board[(3, 1)].effects == set()  # normal chasm tile
+    assert g.board[(3, 1)].effects == 0  # normal chasm tile
 
 def t_WeaponRammingEnginesOverChasm():
     "Charge over a chasm and don't die in it"
@@ -2771,7 +2772,7 @@ def t_WeaponRammingEnginesOverChasm():
     g.board[(4, 1)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set() # normal chasm tile
+    assert g.board[(2, 1)].effects == 0 # normal chasm tile
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     #for x in range(1, 6):
     #    print(g.board[x, 1])
@@ -2780,7 +2781,7 @@ def t_WeaponRammingEnginesOverChasm():
     assert g.board[(3, 1)].unit.hp == 2 # wielder took 1 damage
     assert g.board[(4, 1)].unit == None # vek pushed off this tile
     assert g.board[(5, 1)].unit.hp == 3 # vek pushed here took 2 damage
-    assert g.board[(2, 1)].effects == set()  # normal chasm tile
+    assert g.board[(2, 1)].effects == 0  # normal chasm tile
 
 def t_WeaponRammingEnginesShield():
     "A shielded unit that uses ramming engines takes no self-damage."
@@ -2788,7 +2789,7 @@ def t_WeaponRammingEnginesShield():
     g.board[(1, 1)].createUnitHere(Unit_Charge_Mech(g, weapon1=Weapon_RammingEngines(power1=True, power2=True), effects={Effects.SHIELD}))
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     assert g.board[(3, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
@@ -2804,15 +2805,15 @@ def t_WeaponRammingEnginesMiss():
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
     g.board[(8, 1)].replaceTile(Tile_Forest(g))
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(8, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None  # wielder moved
     assert g.board[(8, 1)].unit.hp == 3  # wielder took 0 damage
-    assert g.board[(1, 1)].effects == set() # original forest tile didn't take damage
-    assert g.board[(8, 1)].effects == set() # destination forest tile undamaged as well
+    assert g.board[(1, 1)].effects == 0 # original forest tile didn't take damage
+    assert g.board[(8, 1)].effects == 0 # destination forest tile undamaged as well
 
 # These 2 tests were removed because weapon shot generators were changed to not explicitly validate each shot like we tested here
 # def t_NoOffBoardShotsGenCorner():
@@ -2851,20 +2852,20 @@ def t_WeaponTaurusCannonDefaultPower():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon()))
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(3, 1)].unit == None # vek was pushed off this square
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 4 # vek lost 1 hp
 
 def t_WeaponTaurusCannonDefaultPower1():
@@ -2872,20 +2873,20 @@ def t_WeaponTaurusCannonDefaultPower1():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(power1=True)))
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(3, 1)].unit == None # vek was pushed off this square
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 3 # vek lost 2 hp
 
 def t_WeaponTaurusCannonPower2():
@@ -2893,20 +2894,20 @@ def t_WeaponTaurusCannonPower2():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(power2=True)))
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(3, 1)].unit == None # vek was pushed off this square
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 3 # vek lost 2 hp
 
 def t_WeaponTaurusCannonFullPower():
@@ -2914,20 +2915,20 @@ def t_WeaponTaurusCannonFullPower():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(power1=True, power2=True)))
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(3, 1)].unit == None # vek was pushed off this square
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 2 # vek lost 3 hp
 
 def t_WeaponTaurusCannonHitsEdgeTile():
@@ -2935,16 +2936,16 @@ def t_WeaponTaurusCannonHitsEdgeTile():
     g = Game()
     g.board[(8, 1)].replaceTile(Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(power1=True, power2=True)))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(8, 1)].effects == {Effects.FIRE}
+    assert g.board[(8, 1)].effects == Effects.FIRE
     assert g.board[(8, 1)].unit == None
 
 def t_WeaponAttractionPulseDefault():
@@ -2952,20 +2953,20 @@ def t_WeaponAttractionPulseDefault():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Defense_Mech(g, weapon1=Weapon_AttractionPulse(power1=False, power2=False)))
     g.board[(4, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(4, 1)].unit == None # vek was pushed off this square
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set() # pulled 1 square closer
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0 # pulled 1 square closer
     assert g.board[(3, 1)].unit.hp == 5 # vek lost 0 hp
 
 def t_WeaponAttractionPulseFullPower():
@@ -2973,20 +2974,20 @@ def t_WeaponAttractionPulseFullPower():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Defense_Mech(g, weapon1=Weapon_AttractionPulse(power1=True, power2=True)))
     g.board[(4, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(4, 1)].unit == None # vek was pushed off this square
-    assert g.board[(3, 1)].effects == set()
-    assert g.board[(3, 1)].unit.effects == set() # pulled 1 square closer
+    assert g.board[(3, 1)].effects == 0
+    assert g.board[(3, 1)].unit.effects == 0 # pulled 1 square closer
     assert g.board[(3, 1)].unit.hp == 5 # vek lost 0 hp
 
 def t_WeaponAttractionPulseBump():
@@ -2996,19 +2997,19 @@ def t_WeaponAttractionPulseBump():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
     for x in 1, 2:
         g.board[(x, 1)].replaceTile(Tile_Forest(g))
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no fire
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no fire
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 1 # took 1 damage
-    assert g.board[(2, 1)].effects == set() # no fire
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0 # no fire
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 4 # vek lost 1 hp from bump
 
 def t_WeaponShieldProjectorDefaultPower():
@@ -3026,22 +3027,22 @@ def t_WeaponShieldProjectorDefaultPower():
     g.board[(5, 2)].createUnitHere(Unit_AlphaScorpion(g))
     for x in range(1, 6):
         for y in range(1, 3):
-            assert g.board[(x, y)].unit.effects == set()
+            assert g.board[(x, y)].unit.effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for i in range(7):
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set()  # no change
-    assert g.board[(2, 1)].unit.effects == set() # shot over this one
-    assert g.board[(3, 1)].unit.effects == {Effects.SHIELD}
-    assert g.board[(4, 1)].unit.effects == {Effects.SHIELD}
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(1, 2)].unit.effects == set()  # no change to anything in the 2nd row
-    assert g.board[(2, 2)].unit.effects == set()
-    assert g.board[(3, 2)].unit.effects == set()
-    assert g.board[(4, 2)].unit.effects == set()
-    assert g.board[(5, 2)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0  # no change
+    assert g.board[(2, 1)].unit.effects == 0 # shot over this one
+    assert g.board[(3, 1)].unit.effects == Effects.SHIELD
+    assert g.board[(4, 1)].unit.effects == Effects.SHIELD
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(1, 2)].unit.effects == 0  # no change to anything in the 2nd row
+    assert g.board[(2, 2)].unit.effects == 0
+    assert g.board[(3, 2)].unit.effects == 0
+    assert g.board[(4, 2)].unit.effects == 0
+    assert g.board[(5, 2)].unit.effects == 0
 
 def t_WeaponShieldProjectorPower2():
     "Shield Projector with power2"
@@ -3058,22 +3059,22 @@ def t_WeaponShieldProjectorPower2():
     g.board[(5, 2)].createUnitHere(Unit_AlphaScorpion(g))
     for x in range(1, 6):
         for y in range(1, 3):
-            assert g.board[(x, y)].unit.effects == set()
+            assert g.board[(x, y)].unit.effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for i in range(7):
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set()  # no change
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD} # shot over this one but he got shielded anyway
-    assert g.board[(3, 1)].unit.effects == {Effects.SHIELD}
-    assert g.board[(4, 1)].unit.effects == {Effects.SHIELD}
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(2, 2)].unit.effects == set()
-    assert g.board[(3, 2)].unit.effects == {Effects.SHIELD}
-    assert g.board[(4, 2)].unit.effects == set()
-    assert g.board[(5, 2)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0  # no change
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD # shot over this one but he got shielded anyway
+    assert g.board[(3, 1)].unit.effects == Effects.SHIELD
+    assert g.board[(4, 1)].unit.effects == Effects.SHIELD
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(2, 2)].unit.effects == 0
+    assert g.board[(3, 2)].unit.effects == Effects.SHIELD
+    assert g.board[(4, 2)].unit.effects == 0
+    assert g.board[(5, 2)].unit.effects == 0
 
 # This test became invalid when I removed all the LimitedGen methods for weapons with limited ammo.
 # Now the ammo is used when the weapon is actually fired.
@@ -3319,7 +3320,7 @@ def t_WeaponSpartanShieldPower1():
     g.board[(1, 1)].createUnitHere(Unit_Aegis_Mech(g, weapon1=Weapon_SpartanShield(power1=True, power2=False)))
     g.board[(2, 1)].createUnitHere(Unit_Scorpion(g, qshot=(Direction.LEFT,), hp=5, maxhp=5))
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.weapon1.qshot == (Direction.LEFT,)
     gs = g.board[(1, 1)].unit.weapon1.genShots()
@@ -3328,7 +3329,7 @@ def t_WeaponSpartanShieldPower1():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # untouched wielder
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     assert g.board[(2, 1)].unit.hp == 3 # vek lost 2 hp
     assert g.board[(2, 1)].unit.weapon1.qshot == (Direction.RIGHT,) # qshot is flipped as we expect
 
@@ -3338,7 +3339,7 @@ def t_WeaponSpartanShieldPower2():
     g.board[(1, 1)].createUnitHere(Unit_Aegis_Mech(g, weapon1=Weapon_SpartanShield(power1=False, power2=True)))
     g.board[(2, 1)].createUnitHere(Unit_Scorpion(g, qshot=(Direction.LEFT,), hp=5, maxhp=5))
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.weapon1.qshot == (Direction.LEFT,)
     gs = g.board[(1, 1)].unit.weapon1.genShots()
@@ -3347,7 +3348,7 @@ def t_WeaponSpartanShieldPower2():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # untouched wielder
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 2 # vek lost 3 hp
     assert g.board[(2, 1)].unit.weapon1.qshot == (Direction.RIGHT,) # qshot is flipped as we expect
 
@@ -3357,7 +3358,7 @@ def t_WeaponSpartanShieldPowerMax():
     g.board[(1, 1)].createUnitHere(Unit_Aegis_Mech(g, weapon1=Weapon_SpartanShield(power1=True, power2=True)))
     g.board[(2, 1)].createUnitHere(Unit_Scorpion(g, qshot=(Direction.LEFT,), hp=5, maxhp=5))
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.weapon1.qshot == (Direction.LEFT,)
     gs = g.board[(1, 1)].unit.weapon1.genShots()
@@ -3366,7 +3367,7 @@ def t_WeaponSpartanShieldPowerMax():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # untouched wielder
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     assert g.board[(2, 1)].unit.hp == 2 # vek lost 3 hp
     assert g.board[(2, 1)].unit.weapon1.qshot == (Direction.RIGHT,) # qshot is flipped as we expect
 
@@ -3472,16 +3473,16 @@ def t_WeaponCryoLauncher():
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(1, 1)].createUnitHere(Unit_Ice_Mech(g, weapon1=Weapon_CryoLauncher(power1=True, power2=True))) # this weapon doesn't use power
     g.board[(5, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for i in range(9):
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # (Direction.RIGHT, 4)
     g.flushHurt() # not necessary since nothing was hurt
     assert g.board[(1, 1)].type == 'ice' # tile is now frozen
-    assert g.board[(1, 1)].effects == set() # not submerged
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE} # wielder was frozen
-    assert g.board[(5, 1)].unit.effects == {Effects.ICE}  # wielder was frozen
+    assert g.board[(1, 1)].effects == 0 # not submerged
+    assert g.board[(1, 1)].unit.effects == Effects.ICE # wielder was frozen
+    assert g.board[(5, 1)].unit.effects == Effects.ICE  # wielder was frozen
 
 def t_WeaponCryoLauncherShielded():
     "Shoot the CryoLauncher cannon with a shielded wielder."
@@ -3489,16 +3490,16 @@ def t_WeaponCryoLauncherShielded():
     g.board[(1, 1)].replaceTile(Tile_Water(g))
     g.board[(1, 1)].createUnitHere(Unit_Ice_Mech(g, weapon1=Weapon_CryoLauncher(power1=True, power2=True), effects={Effects.SHIELD})) # this weapon doesn't use power
     g.board[(5, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED}
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for i in range(9):
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 4
     g.flushHurt() # not necessary since nothing was hurt
     assert g.board[(1, 1)].type == 'water' # no change since the wielder's shield prevented ice from being applied to the wielder and the tile it's on
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED} # no change
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD} # wielder was NOT frozen, still shielded
-    assert g.board[(5, 1)].unit.effects == {Effects.ICE}  # wielder was frozen as expected
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED # no change
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD # wielder was NOT frozen, still shielded
+    assert g.board[(5, 1)].unit.effects == Effects.ICE  # wielder was frozen as expected
 
 def t_WeaponAerialBombs1():
     "Shoot the AerialBombs with default power."
@@ -3508,7 +3509,7 @@ def t_WeaponAerialBombs1():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 1)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 4 # hit for 1 dmg
     assert g.board[(3, 1)].unit.hp == 2 # jet landed here
     assert g.board[(3, 1)].unit.type == 'jet'
@@ -3521,7 +3522,7 @@ def t_WeaponAerialBombs2():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 1)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 3 # hit for 2 dmg
     assert g.board[(3, 1)].unit.hp == 2 # jet landed here
     assert g.board[(3, 1)].unit.type == 'jet'
@@ -3535,9 +3536,9 @@ def t_WeaponAerialBombs3():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 2)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 4 # hit for 1 dmg
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
+    assert g.board[(3, 1)].effects == Effects.SMOKE
     assert g.board[(3, 1)].unit.hp == 4  # hit for 1 dmg
     assert g.board[(4, 1)].unit.hp == 2 # jet landed here
     assert g.board[(4, 1)].unit.type == 'jet'
@@ -3551,9 +3552,9 @@ def t_WeaponAerialBombs4():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 2)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 3 # hit for 2 dmg
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
+    assert g.board[(3, 1)].effects == Effects.SMOKE
     assert g.board[(3, 1)].unit.hp == 3  # hit for 2 dmg
     assert g.board[(4, 1)].unit.hp == 2 # jet landed here
     assert g.board[(4, 1)].unit.type == 'jet'
@@ -3568,9 +3569,9 @@ def t_WeaponAerialBombsForest():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 2)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 4 # hit for 1 dmg
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
+    assert g.board[(3, 1)].effects == Effects.SMOKE
     assert g.board[(3, 1)].unit.hp == 4  # hit for 1 dmg
     assert g.board[(4, 1)].unit.hp == 2 # jet landed here
     assert g.board[(4, 1)].unit.type == 'jet'
@@ -3605,12 +3606,12 @@ def t_WeaponRocketArtillery1():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set() # no change for shooter
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0 # no change for shooter
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit == None # vek pushed off this tile
-    assert g.board[(3, 1)].effects == set() # no effects change to the tile
+    assert g.board[(3, 1)].effects == 0 # no effects change to the tile
     assert g.board[(4, 1)].unit.hp == 3 # vek took 2 dmg
-    assert g.board[(4, 1)].effects == set()  # no effects change to the tile
+    assert g.board[(4, 1)].effects == 0  # no effects change to the tile
 
 def t_WeaponRocketArtillery2():
     "Shoot the Rocket Artillery weapon with 1 power with its back against the edge."
@@ -3623,12 +3624,12 @@ def t_WeaponRocketArtillery2():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set() # no change for shooter
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0 # no change for shooter
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit == None # vek pushed off this tile
-    assert g.board[(3, 1)].effects == set() # no effects change to the tile
+    assert g.board[(3, 1)].effects == 0 # no effects change to the tile
     assert g.board[(4, 1)].unit.hp == 2 # vek took 3 dmg
-    assert g.board[(4, 1)].effects == set()  # no effects change to the tile
+    assert g.board[(4, 1)].effects == 0  # no effects change to the tile
     
 def t_WeaponRocketArtillery3():
     "Shoot the Rocket Artillery weapon with full power with its back against the edge."
@@ -3641,12 +3642,12 @@ def t_WeaponRocketArtillery3():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set() # no change for shooter
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0 # no change for shooter
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit == None # vek pushed off this tile
-    assert g.board[(3, 1)].effects == set() # no effects change to the tile
+    assert g.board[(3, 1)].effects == 0 # no effects change to the tile
     assert g.board[(4, 1)].unit.hp == 1 # vek took 4 dmg
-    assert g.board[(4, 1)].effects == set()  # no effects change to the tile
+    assert g.board[(4, 1)].effects == 0  # no effects change to the tile
 
 def t_WeaponRocketArtillery4():
     "Shoot the Rocket Artillery weapon with full power with a tile for it to fart smoke onto"
@@ -3659,13 +3660,13 @@ def t_WeaponRocketArtillery4():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 3 # no change for shooter
-    assert g.board[(2, 1)].unit.effects == set() # no change for shooter
-    assert g.board[(2, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(2, 1)].unit.effects == 0 # no change for shooter
+    assert g.board[(2, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(4, 1)].unit == None # vek pushed off this tile
-    assert g.board[(4, 1)].effects == set() # no effects change to the tile
+    assert g.board[(4, 1)].effects == 0 # no effects change to the tile
     assert g.board[(5, 1)].unit.hp == 1 # vek took 4 dmg
-    assert g.board[(5, 1)].effects == set()  # no effects change to the tile
-    assert g.board[(1, 1)].effects == {Effects.SMOKE} # smoke was farted behind the wielder
+    assert g.board[(5, 1)].effects == 0  # no effects change to the tile
+    assert g.board[(1, 1)].effects == Effects.SMOKE # smoke was farted behind the wielder
 
 def t_WeaponRepulse1():
     "Shoot the Repulse weapon with no power"
@@ -3676,16 +3677,16 @@ def t_WeaponRepulse1():
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # no change for shooter
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0  # no change for shooter
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(2, 1)].unit == None # vek pushed off here
     assert g.board[(3, 1)].unit.hp == 5  # no change for vek
-    assert g.board[(3, 1)].unit.effects == set()  # no change for vek
-    assert g.board[(3, 1)].effects == set()  # no change for vek's tile
+    assert g.board[(3, 1)].unit.effects == 0  # no change for vek
+    assert g.board[(3, 1)].effects == 0  # no change for vek's tile
     assert g.board[(1, 2)].unit == None  # ally pushed off here
     assert g.board[(1, 3)].unit.hp == 3  # no change for ally
-    assert g.board[(1, 3)].unit.effects == set()  # no change for vally
-    assert g.board[(1, 3)].effects == set()  # no change for ally's tile
+    assert g.board[(1, 3)].unit.effects == 0  # no change for vally
+    assert g.board[(1, 3)].effects == 0  # no change for ally's tile
 
 def t_WeaponRepulse2():
     "Shoot the Repulse weapon with 1 power"
@@ -3696,16 +3697,16 @@ def t_WeaponRepulse2():
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD} # shooter shielded
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD # shooter shielded
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(2, 1)].unit == None # vek pushed off here
     assert g.board[(3, 1)].unit.hp == 5  # no change for vek
-    assert g.board[(3, 1)].unit.effects == set()  # no change for vek
-    assert g.board[(3, 1)].effects == set()  # no change for vek's tile
+    assert g.board[(3, 1)].unit.effects == 0  # no change for vek
+    assert g.board[(3, 1)].effects == 0  # no change for vek's tile
     assert g.board[(1, 2)].unit == None  # ally pushed off here
     assert g.board[(1, 3)].unit.hp == 3  # no change for ally
-    assert g.board[(1, 3)].unit.effects == set()  # no change for ally
-    assert g.board[(1, 3)].effects == set()  # no change for ally's tile
+    assert g.board[(1, 3)].unit.effects == 0  # no change for ally
+    assert g.board[(1, 3)].effects == 0  # no change for ally's tile
 
 def t_WeaponRepulse3():
     "Shoot the Repulse weapon with 2nd power"
@@ -3716,16 +3717,16 @@ def t_WeaponRepulse3():
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set() # no change for shooter
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0 # no change for shooter
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(2, 1)].unit == None # vek pushed off here
     assert g.board[(3, 1)].unit.hp == 5  # no change for vek
-    assert g.board[(3, 1)].unit.effects == set()  # no change for vek
-    assert g.board[(3, 1)].effects == set()  # no change for vek's tile
+    assert g.board[(3, 1)].unit.effects == 0  # no change for vek
+    assert g.board[(3, 1)].effects == 0  # no change for vek's tile
     assert g.board[(1, 2)].unit == None  # ally pushed off here
     assert g.board[(1, 3)].unit.hp == 3  # no change for ally
-    assert g.board[(1, 3)].unit.effects == {Effects.SHIELD}  # ally is shielded
-    assert g.board[(1, 3)].effects == set()  # no change for ally's tile
+    assert g.board[(1, 3)].unit.effects == Effects.SHIELD  # ally is shielded
+    assert g.board[(1, 3)].effects == 0  # no change for ally's tile
 
 def t_WeaponRepulse4():
     "Shoot the Repulse weapon with full power"
@@ -3736,16 +3737,16 @@ def t_WeaponRepulse4():
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}  # shooter shielded
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD  # shooter shielded
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(2, 1)].unit == None # vek pushed off here
     assert g.board[(3, 1)].unit.hp == 5  # no change for vek
-    assert g.board[(3, 1)].unit.effects == set()  # no change for vek
-    assert g.board[(3, 1)].effects == set()  # no change for vek's tile
+    assert g.board[(3, 1)].unit.effects == 0  # no change for vek
+    assert g.board[(3, 1)].effects == 0  # no change for vek's tile
     assert g.board[(1, 2)].unit == None  # ally pushed off here
     assert g.board[(1, 3)].unit.hp == 3  # no change for ally
-    assert g.board[(1, 3)].unit.effects == {Effects.SHIELD}  # ally is shielded
-    assert g.board[(1, 3)].effects == set()  # no change for ally's tile
+    assert g.board[(1, 3)].unit.effects == Effects.SHIELD  # ally is shielded
+    assert g.board[(1, 3)].effects == 0  # no change for ally's tile
 
 def t_WeaponRepulse5():
     "Shoot the Repulse weapon with full power and a building to get shielded. And a mountain for the vek to bump into."
@@ -3757,15 +3758,15 @@ def t_WeaponRepulse5():
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}  # shooter shielded
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD  # shooter shielded
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(2, 1)].unit.hp == 4  # vek took 1 bump damage
-    assert g.board[(2, 1)].unit.effects == set()  # no change for vek
-    assert g.board[(2, 1)].effects == set()  # no change for vek's tile
+    assert g.board[(2, 1)].unit.effects == 0  # no change for vek
+    assert g.board[(2, 1)].effects == 0  # no change for vek's tile
     assert g.board[(3, 1)].unit.type == 'mountaindamaged' # mountain got bumped into
     assert g.board[(1, 2)].unit.hp == 1  # no change for building
-    assert g.board[(1, 2)].unit.effects == {Effects.SHIELD}  # building is shielded
-    assert g.board[(1, 2)].effects == set()  # no change for ally's tile
+    assert g.board[(1, 2)].unit.effects == Effects.SHIELD  # building is shielded
+    assert g.board[(1, 2)].effects == 0  # no change for ally's tile
 
 def t_WeaponRepulse6():
     "Shoot the Repulse weapon with full power and have a friendly gain a shield, then immediately lose it to the bump."
@@ -3776,11 +3777,11 @@ def t_WeaponRepulse6():
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}  # shooter shielded
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD  # shooter shielded
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(2, 1)].unit.hp == 3  # 2nd mech took NO bump damage
-    assert g.board[(2, 1)].unit.effects == set()  # he gained a shield and lose it
-    assert g.board[(2, 1)].effects == set()  # no change for 2nd mech's tile
+    assert g.board[(2, 1)].unit.effects == 0  # he gained a shield and lose it
+    assert g.board[(2, 1)].effects == 0  # no change for 2nd mech's tile
     assert g.board[(3, 1)].unit.type == 'mountaindamaged' # mountain got bumped into
 
 def t_WeaponGrapplingHook1():
@@ -3791,13 +3792,13 @@ def t_WeaponGrapplingHook1():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit == None # unit moved from here
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 5  # vek is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # no change for vek
-    assert g.board[(2, 1)].effects == set()  # no change for vek's tile
+    assert g.board[(2, 1)].unit.effects == 0  # no change for vek
+    assert g.board[(2, 1)].effects == 0  # no change for vek's tile
 
 def t_WeaponGrapplingHook2():
     "Shoot the grappling hook weapon at an enemy with 1 power"
@@ -3807,13 +3808,13 @@ def t_WeaponGrapplingHook2():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit == None # unit moved from here
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 5  # vek is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # no change for vek
-    assert g.board[(2, 1)].effects == set()  # no change for vek's tile
+    assert g.board[(2, 1)].unit.effects == 0  # no change for vek
+    assert g.board[(2, 1)].effects == 0  # no change for vek's tile
 
 def t_WeaponGrapplingHook3():
     "Shoot the grappling hook weapon at a friendly with no power"
@@ -3823,13 +3824,13 @@ def t_WeaponGrapplingHook3():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit == None # unit moved from here
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 3  # ally is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # no change for ally
-    assert g.board[(2, 1)].effects == set()  # no change for ally's tile
+    assert g.board[(2, 1)].unit.effects == 0  # no change for ally
+    assert g.board[(2, 1)].effects == 0  # no change for ally's tile
 
 def t_WeaponGrapplingHook4():
     "Shoot the grappling hook weapon at a friendly with power"
@@ -3839,13 +3840,13 @@ def t_WeaponGrapplingHook4():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit == None # unit moved from here
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 3  # ally is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD} # ally is shielded
-    assert g.board[(2, 1)].effects == set()  # no change for ally's tile
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD # ally is shielded
+    assert g.board[(2, 1)].effects == 0  # no change for ally's tile
 
 def t_WeaponGrapplingHook5():
     "Shoot the grappling hook weapon at a mountain with no power"
@@ -3856,13 +3857,13 @@ def t_WeaponGrapplingHook5():
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit == None  # wielder moved from this spot
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(2, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(2, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(2, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit.type == 'mountain'
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 3  # wielder is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == set() # wielder gets no new effect
-    assert g.board[(2, 1)].effects == set()  # no change for wielder's new tile
+    assert g.board[(2, 1)].unit.effects == 0 # wielder gets no new effect
+    assert g.board[(2, 1)].effects == 0  # no change for wielder's new tile
 
 def t_WeaponGrapplingHook6():
     "Shoot the grappling hook weapon at a mountain with power"
@@ -3873,13 +3874,13 @@ def t_WeaponGrapplingHook6():
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit == None  # wielder moved from this spot
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(2, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(2, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(2, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit.type == 'mountain'
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 3  # wielder is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == set() # wielder gets no new effect
-    assert g.board[(2, 1)].effects == set()  # no change for wielder's new tile
+    assert g.board[(2, 1)].unit.effects == 0 # wielder gets no new effect
+    assert g.board[(2, 1)].effects == 0  # no change for wielder's new tile
 
 def t_WeaponGrapplingHook7():
     "Shoot the grappling hook weapon at a building with power"
@@ -3890,14 +3891,14 @@ def t_WeaponGrapplingHook7():
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit == None  # wielder moved from this spot
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(2, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(2, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(2, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit.type == 'building'
-    assert g.board[(3, 1)].unit.effects == {Effects.SHIELD} # building is now shielded
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].unit.effects == Effects.SHIELD # building is now shielded
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 3  # wielder is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == set() # wielder gets no new effect
-    assert g.board[(2, 1)].effects == set()  # no change for wielder's new tile
+    assert g.board[(2, 1)].unit.effects == 0 # wielder gets no new effect
+    assert g.board[(2, 1)].effects == 0  # no change for wielder's new tile
 
 def t_WeaponGrapplingHook8():
     "Shoot the grappling hook weapon at a building with no power"
@@ -3908,14 +3909,14 @@ def t_WeaponGrapplingHook8():
     g.flushHurt() # redundant as no units are hurt
     assert g.board[(1, 1)].unit == None  # wielder moved from this spot
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(2, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(2, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(2, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit.type == 'building'
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(2, 1)].unit.hp == 3  # wielder is now here, took no damage
-    assert g.board[(2, 1)].unit.effects == set() # wielder gets no new effect
-    assert g.board[(2, 1)].effects == set()  # no change for wielder's new tile
+    assert g.board[(2, 1)].unit.effects == 0 # wielder gets no new effect
+    assert g.board[(2, 1)].effects == 0  # no change for wielder's new tile
 
 def t_WeaponGrapplingHook9():
     """Shoot the grappling hook weapon at a unit next to us. I caught a bug where the grappling hook ignore the tile next to you and start searching for a unit on the 2nd square since it couldn't grapple something next to it."""
@@ -3946,10 +3947,10 @@ def t_WeaponRockLauncher1():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
-    assert g.board[(3, 1)].unit.effects == set() # target gets no new effects
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
+    assert g.board[(3, 1)].unit.effects == 0 # target gets no new effects
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(3, 1)].unit.hp == 3 # vek took 2 damage
     assert g.board[(3, 2)].unit == None  # 2nd vek pushed from here
     assert g.board[(3, 3)].unit.hp == 5 # to here, took no damage
@@ -3966,10 +3967,10 @@ def t_WeaponRockLauncher2():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
-    assert g.board[(3, 1)].unit.effects == set() # target gets no new effects
-    assert g.board[(3, 1)].effects == set() # target's tile untouched
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
+    assert g.board[(3, 1)].unit.effects == 0 # target gets no new effects
+    assert g.board[(3, 1)].effects == 0 # target's tile untouched
     assert g.board[(3, 1)].unit.hp == 2 # vek took 3 damage
     assert g.board[(3, 2)].unit == None  # 2nd vek pushed from here
     assert g.board[(3, 3)].unit.hp == 5 # to here, took no damage
@@ -3986,10 +3987,10 @@ def t_WeaponRockLauncher3():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
-    assert g.board[(3, 1)].unit.effects == set() # target gets no new effects
-    assert g.board[(3, 1)].effects == set() # targets tile untouched
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
+    assert g.board[(3, 1)].unit.effects == 0 # target gets no new effects
+    assert g.board[(3, 1)].effects == 0 # targets tile untouched
     assert g.board[(3, 1)].unit.hp == 1 # vek took 4 damage
     assert g.board[(3, 2)].unit == None  # 2nd vek pushed from here
     assert g.board[(3, 3)].unit.hp == 5 # to here, took no damage
@@ -4007,10 +4008,10 @@ def t_WeaponRockLauncher4():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
-    assert g.board[(3, 1)].unit.effects == {Effects.FIRE} # target is set on fire
-    assert g.board[(3, 1)].effects == {Effects.FIRE} # tile on fire
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
+    assert g.board[(3, 1)].unit.effects == Effects.FIRE # target is set on fire
+    assert g.board[(3, 1)].effects == Effects.FIRE # tile on fire
     assert g.board[(3, 1)].unit.hp == 1 # vek took 4 damage
     assert g.board[(3, 2)].unit == None  # 2nd vek pushed from here
     assert g.board[(3, 3)].unit.hp == 5 # to here, took no damage
@@ -4027,10 +4028,10 @@ def t_WeaponRockLauncher5():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change for shooter
-    assert g.board[(1, 1)].unit.effects == set()  # shooter get no new effects
-    assert g.board[(1, 1)].effects == set()  # no change for shooter's tile
+    assert g.board[(1, 1)].unit.effects == 0  # shooter get no new effects
+    assert g.board[(1, 1)].effects == 0  # no change for shooter's tile
     assert g.board[(3, 1)].unit.type == 'rock' # rock landed here and survives
-    assert g.board[(3, 1)].effects == set() # tile doesn't catch fire since no damage was actually done to the tile
+    assert g.board[(3, 1)].effects == 0 # tile doesn't catch fire since no damage was actually done to the tile
     assert g.board[(3, 2)].unit == None  # 2nd vek pushed from here
     assert g.board[(3, 3)].unit.hp == 5 # to here, took no damage
 
@@ -4043,11 +4044,11 @@ def t_WeaponFlameThrower1():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 1)
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile caught on fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile caught on fire
     assert g.board[(2, 1)].type == 'ground' # tile converted from sand to ground
     assert g.board[(2, 1)].unit == None # vek pushed
-    assert g.board[(3, 1)].effects == set() # no change to destination
-    assert g.board[(3, 1)].unit.effects == {Effects.FIRE} # vek is now on fire
+    assert g.board[(3, 1)].effects == 0 # no change to destination
+    assert g.board[(3, 1)].unit.effects == Effects.FIRE # vek is now on fire
     assert g.board[(3, 1)].unit.hp == 5  # vek took no damage
 
 def t_WeaponFlameThrower2():
@@ -4059,12 +4060,12 @@ def t_WeaponFlameThrower2():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 2)
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile caught on fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile caught on fire
     assert g.board[(2, 1)].type == 'ground' # tile converted from sand to ground
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(2, 1)].unit.hp == 5  # vek took no damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE} # tile past the vek caught fire
-    assert g.board[(4, 1)].effects == set() # no change to push destination
+    assert g.board[(3, 1)].effects == Effects.FIRE # tile past the vek caught fire
+    assert g.board[(4, 1)].effects == 0 # no change to push destination
 
 def t_WeaponFlameThrower3():
     "Shoot the Flame Thrower with max range/power."
@@ -4075,13 +4076,13 @@ def t_WeaponFlameThrower3():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 3)
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile caught on fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile caught on fire
     assert g.board[(2, 1)].type == 'ground' # tile converted from sand to ground
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(2, 1)].unit.hp == 5  # vek took no damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE} # tile past the vek caught fire
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # this tile caught fire too
-    assert g.board[(5, 1)].effects == set() # no change to push destination
+    assert g.board[(3, 1)].effects == Effects.FIRE # tile past the vek caught fire
+    assert g.board[(4, 1)].effects == Effects.FIRE # this tile caught fire too
+    assert g.board[(5, 1)].effects == 0 # no change to push destination
 
 def t_WeaponFlameThrower4():
     "Shoot the Flame Thrower twice with max range/power to cause damage."
@@ -4094,13 +4095,13 @@ def t_WeaponFlameThrower4():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 3)
     g.flushHurt() # redundant as the first shot didn't kill anything
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile caught on fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile caught on fire
     assert g.board[(2, 1)].type == 'ground' # tile converted from sand to ground
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(2, 1)].unit.hp == 3  # vek took 2 damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE} # tile past the vek caught fire
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # this tile caught fire too
-    assert g.board[(5, 1)].effects == set() # no change to push destination
+    assert g.board[(3, 1)].effects == Effects.FIRE # tile past the vek caught fire
+    assert g.board[(4, 1)].effects == Effects.FIRE # this tile caught fire too
+    assert g.board[(5, 1)].effects == 0 # no change to push destination
 
 def t_WeaponFlameThrowerMountain():
     "Shoot the Flame Thrower with max range/power through a mountain."
@@ -4141,12 +4142,12 @@ def t_WeaponVulcanArtillery1():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt() # no units actually hurt
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(3, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(3, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(3, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(3, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(3, 1)].unit.hp == 5 # no damage
     assert g.board[(3, 2)].unit == None # vek pushed from here
-    assert g.board[(3, 3)].effects == set()
-    assert g.board[(3, 3)].unit.effects == set()
+    assert g.board[(3, 3)].effects == 0
+    assert g.board[(3, 3)].unit.effects == 0
     assert g.board[(3, 3)].unit.hp == 5  # no damage
 
 def t_WeaponVulcanArtillery2():
@@ -4161,12 +4162,12 @@ def t_WeaponVulcanArtillery2():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt() # no units actually hurt
     assert g.board[(1, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(3, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(3, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(3, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(3, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(3, 1)].unit.hp == 5 # no damage
     assert g.board[(3, 2)].unit == None # vek pushed from here
-    assert g.board[(3, 3)].effects == set()
-    assert g.board[(3, 3)].unit.effects == set()
+    assert g.board[(3, 3)].effects == 0
+    assert g.board[(3, 3)].unit.effects == 0
     assert g.board[(3, 3)].unit.hp == 5  # no damage
 
 def t_WeaponVulcanArtillery3():
@@ -4181,14 +4182,14 @@ def t_WeaponVulcanArtillery3():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # (Direction.RIGHT, 2)
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(4, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(4, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(4, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(4, 1)].unit.hp == 5 # no damage
     assert g.board[(4, 2)].unit == None # vek pushed from here
-    assert g.board[(4, 3)].effects == set()
-    assert g.board[(4, 3)].unit.effects == set()
+    assert g.board[(4, 3)].effects == 0
+    assert g.board[(4, 3)].unit.effects == 0
     assert g.board[(4, 3)].unit.hp == 5  # no damage
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # fire farted
+    assert g.board[(1, 1)].effects == Effects.FIRE # fire farted
 
 def t_WeaponVulcanArtillery4():
     "Shoot the Vulcan Artillery withOUT backburn power NOT up against a wall."
@@ -4202,14 +4203,14 @@ def t_WeaponVulcanArtillery4():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(4, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(4, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(4, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(4, 1)].unit.hp == 5 # no damage
     assert g.board[(4, 2)].unit == None # vek pushed from here
-    assert g.board[(4, 3)].effects == set()
-    assert g.board[(4, 3)].unit.effects == set()
+    assert g.board[(4, 3)].effects == 0
+    assert g.board[(4, 3)].unit.effects == 0
     assert g.board[(4, 3)].unit.hp == 5  # no damage
-    assert g.board[(1, 1)].effects == set() # NO fire farted
+    assert g.board[(1, 1)].effects == 0 # NO fire farted
 
 def t_WeaponVulcanArtillery5():
     "Shoot the Vulcan Artillery withOUT backburn power NOT up against a wall and WITH damage power."
@@ -4223,14 +4224,14 @@ def t_WeaponVulcanArtillery5():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(4, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(4, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(4, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(4, 1)].unit.hp == 3 # 2 damage
     assert g.board[(4, 2)].unit == None # vek pushed from here
-    assert g.board[(4, 3)].effects == set()
-    assert g.board[(4, 3)].unit.effects == set()
+    assert g.board[(4, 3)].effects == 0
+    assert g.board[(4, 3)].unit.effects == 0
     assert g.board[(4, 3)].unit.hp == 5  # no damage
-    assert g.board[(1, 1)].effects == set() # NO fire farted
+    assert g.board[(1, 1)].effects == 0 # NO fire farted
 
 def t_WeaponVulcanArtillery6():
     "Shoot the Vulcan Artillery with backburn power NOT up against a wall and WITH damage power."
@@ -4244,14 +4245,14 @@ def t_WeaponVulcanArtillery6():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(4, 1)].unit.effects == {Effects.FIRE}  # vek is now on fire, he was not pushed
+    assert g.board[(4, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(4, 1)].unit.effects == Effects.FIRE  # vek is now on fire, he was not pushed
     assert g.board[(4, 1)].unit.hp == 3 # 2 damage
     assert g.board[(4, 2)].unit == None # vek pushed from here
-    assert g.board[(4, 3)].effects == set()
-    assert g.board[(4, 3)].unit.effects == set()
+    assert g.board[(4, 3)].effects == 0
+    assert g.board[(4, 3)].unit.effects == 0
     assert g.board[(4, 3)].unit.hp == 5  # no damage
-    assert g.board[(1, 1)].effects == {Effects.FIRE}  # fire farted
+    assert g.board[(1, 1)].effects == Effects.FIRE  # fire farted
 
 def t_WeaponVulcanArtillery7():
     "Shoot the Vulcan Artillery with full power against a mountain for some reason."
@@ -4265,14 +4266,14 @@ def t_WeaponVulcanArtillery7():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(4, 1)].unit.effects == set()  # mountains can't catch on fire
+    assert g.board[(4, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(4, 1)].unit.effects == 0  # mountains can't catch on fire
     assert g.board[(4, 1)].unit.type == 'mountaindamaged'
     assert g.board[(4, 2)].unit == None # vek pushed from here
-    assert g.board[(4, 3)].effects == set()
-    assert g.board[(4, 3)].unit.effects == set()
+    assert g.board[(4, 3)].effects == 0
+    assert g.board[(4, 3)].unit.effects == 0
     assert g.board[(4, 3)].unit.hp == 5  # no damage
-    assert g.board[(1, 1)].effects == {Effects.FIRE}  # fire farted
+    assert g.board[(1, 1)].effects == Effects.FIRE  # fire farted
 
 def t_WeaponVulcanArtillery8():
     "Shoot the Vulcan Artillery with no damage power against a mountain for some reason."
@@ -4286,14 +4287,14 @@ def t_WeaponVulcanArtillery8():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 3  # no change for shooter
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # tile caught on fire
-    assert g.board[(4, 1)].unit.effects == set()  # mountains can't catch on fire
+    assert g.board[(4, 1)].effects == Effects.FIRE # tile caught on fire
+    assert g.board[(4, 1)].unit.effects == 0  # mountains can't catch on fire
     assert g.board[(4, 1)].unit.type == 'mountain'
     assert g.board[(4, 2)].unit == None # vek pushed from here
-    assert g.board[(4, 3)].effects == set()
-    assert g.board[(4, 3)].unit.effects == set()
+    assert g.board[(4, 3)].effects == 0
+    assert g.board[(4, 3)].unit.effects == 0
     assert g.board[(4, 3)].unit.hp == 5  # no damage
-    assert g.board[(1, 1)].effects == {Effects.FIRE}  # fire farted
+    assert g.board[(1, 1)].effects == Effects.FIRE  # fire farted
 
 def t_WeaponTeleporter1():
     "Shoot the teleporter with no power and no unit to swap with"
@@ -4303,9 +4304,9 @@ def t_WeaponTeleporter1():
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 2  # no change for shooter who is now here
     assert g.board[(2, 1)].unit.type == 'swap'
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(1, 1)].unit == None
 
 def t_WeaponTeleporter2():
@@ -4317,10 +4318,10 @@ def t_WeaponTeleporter2():
     g.flushHurt() # no units actually hurt
     assert g.board[(2, 1)].unit.hp == 2  # no change for shooter who is now here
     assert g.board[(2, 1)].unit.type == 'swap'
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 5  # no damage to vek who is now here
 
 def t_WeaponTeleporter3():
@@ -4332,10 +4333,10 @@ def t_WeaponTeleporter3():
     g.flushHurt() # no units actually hurt
     assert g.board[(5, 1)].unit.hp == 2  # no change for shooter who is now here
     assert g.board[(5, 1)].unit.type == 'swap'
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 5  # no damage to vek who is now here
 
 def t_WeaponTeleporterOffBoard():
@@ -4364,20 +4365,20 @@ def t_WeaponHydraulicLegsLowPower():
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 1
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # forest caught fire
+    assert g.board[(1, 1)].effects == Effects.FIRE # forest caught fire
     assert g.board[(1, 1)].unit == None # wielder leaped from here
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught fire from self-damage
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE} # wielder caught fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught fire from self-damage
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE # wielder caught fire
     assert g.board[(2, 1)].unit.hp == 2  # wielder took 1 damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
     assert g.board[(3, 1)].unit == None # unit pushed from here
-    assert g.board[(4, 1)].effects == set() # This forest DID NOT catch fire from the vek that was pushed here!
-    assert g.board[(4, 1)].unit.effects == set() # This vek never caught fire! He was pushed to the forest tile before it was lit on fire
+    assert g.board[(4, 1)].effects == 0 # This forest DID NOT catch fire from the vek that was pushed here!
+    assert g.board[(4, 1)].unit.effects == 0 # This vek never caught fire! He was pushed to the forest tile before it was lit on fire
     assert g.board[(4, 1)].unit.hp == 4 # vek took 1 damage
-    assert g.board[(2, 2)].effects == {Effects.FIRE}
+    assert g.board[(2, 2)].effects == Effects.FIRE
     assert g.board[(2, 2)].unit == None # no unit here
-    assert g.board[(2, 3)].effects == set()
-    assert g.board[(2, 3)].unit.effects == set()
+    assert g.board[(2, 3)].effects == 0
+    assert g.board[(2, 3)].unit.effects == 0
     assert g.board[(2, 3)].unit.hp == 4 # took 1 damage
 
 def t_WeaponHydraulicLegsPower1():
@@ -4394,20 +4395,20 @@ def t_WeaponHydraulicLegsPower1():
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 1
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # forest caught fire
+    assert g.board[(1, 1)].effects == Effects.FIRE # forest caught fire
     assert g.board[(1, 1)].unit == None # wielder leaped from here
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught fire from self-damage
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE} # wielder caught fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught fire from self-damage
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE # wielder caught fire
     assert g.board[(2, 1)].unit.hp == 1  # wielder took 2 damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
     assert g.board[(3, 1)].unit == None # unit pushed from here
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 3 # vek took 2 damage
-    assert g.board[(2, 2)].effects == {Effects.FIRE}
+    assert g.board[(2, 2)].effects == Effects.FIRE
     assert g.board[(2, 2)].unit == None # no unit here
-    assert g.board[(2, 3)].effects == set()
-    assert g.board[(2, 3)].unit.effects == set()
+    assert g.board[(2, 3)].effects == 0
+    assert g.board[(2, 3)].unit.effects == 0
     assert g.board[(2, 3)].unit.hp == 3 # took 2 damage
 
 def t_WeaponHydraulicLegsPower2():
@@ -4424,20 +4425,20 @@ def t_WeaponHydraulicLegsPower2():
         shot = next(gs)  # iterate through the shotgenerator until it sets self.destinationsquare where we need it
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 1
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # forest caught fire
+    assert g.board[(1, 1)].effects == Effects.FIRE # forest caught fire
     assert g.board[(1, 1)].unit == None # wielder leaped from here
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught fire from self-damage
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE} # wielder caught fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught fire from self-damage
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE # wielder caught fire
     assert g.board[(2, 1)].unit.hp == 2  # wielder took 1 damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
     assert g.board[(3, 1)].unit == None # unit pushed from here
-    assert g.board[(4, 1)].effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 3 # vek took 2 damage
-    assert g.board[(2, 2)].effects == {Effects.FIRE}
+    assert g.board[(2, 2)].effects == Effects.FIRE
     assert g.board[(2, 2)].unit == None # no unit here
-    assert g.board[(2, 3)].effects == set()
-    assert g.board[(2, 3)].unit.effects == set()
+    assert g.board[(2, 3)].effects == 0
+    assert g.board[(2, 3)].unit.effects == 0
     assert g.board[(2, 3)].unit.hp == 3 # took 2 damage
 
 def t_WeaponHydraulicLegsMaxPower():
@@ -4455,19 +4456,19 @@ def t_WeaponHydraulicLegsMaxPower():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 1
     g.flushHurt()
     assert g.board[(1, 1)].unit == None  # wielder leaped from here
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # forest caught fire
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught fire from self-damage
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE} # wielder caught fire
+    assert g.board[(1, 1)].effects == Effects.FIRE # forest caught fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught fire from self-damage
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE # wielder caught fire
     assert g.board[(2, 1)].unit.hp == 1  # wielder took 2 damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
     assert g.board[(3, 1)].unit == None # unit pushed from here
-    assert g.board[(4, 1)].effects == set() # the vek pushed from the tile that caught fire did not catch fire itself!
-    assert g.board[(4, 1)].unit.effects == set() # told ya so
+    assert g.board[(4, 1)].effects == 0 # the vek pushed from the tile that caught fire did not catch fire itself!
+    assert g.board[(4, 1)].unit.effects == 0 # told ya so
     assert g.board[(4, 1)].unit.hp == 2 # vek took 3 damage
-    assert g.board[(2, 2)].effects == {Effects.FIRE}
+    assert g.board[(2, 2)].effects == Effects.FIRE
     assert g.board[(2, 2)].unit == None # no unit here
-    assert g.board[(2, 3)].effects == set()
-    assert g.board[(2, 3)].unit.effects == set()
+    assert g.board[(2, 3)].effects == 0
+    assert g.board[(2, 3)].unit.effects == 0
     assert g.board[(2, 3)].unit.hp == 2 # took 3 damage
 
 def t_WeaponHydraulicLegsMaxPowerIntoAcid():
@@ -4485,21 +4486,21 @@ def t_WeaponHydraulicLegsMaxPowerIntoAcid():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 1
     g.flushHurt()
     assert g.board[(1, 1)].unit == None  # wielder leaped from here
-    assert g.board[(1, 1)].effects == set() # wielder picked up the acid that was here
-    assert g.board[(2, 1)].effects == set() # wielder picked up the acid
+    assert g.board[(1, 1)].effects == 0 # wielder picked up the acid that was here
+    assert g.board[(2, 1)].effects == 0 # wielder picked up the acid
     assert g.board[(2, 1)].unit.hp == 6  # wielder took 4 damage because it got acid and THEN took 2 self damage x2
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID} # wielder picked up acid
+    assert g.board[(2, 1)].unit.effects == Effects.ACID # wielder picked up acid
     # I gave the mech more health so we can tell exactly how much HP was lost
-    #assert g.board[(2, 1)].unit.effects == set() # wielder DIED from taking 4 self damage on acid
+    #assert g.board[(2, 1)].unit.effects == 0 # wielder DIED from taking 4 self damage on acid
     #assert g.board[(2, 1)].unit.hp == 1  # this is the corpse
     #assert g.board[(2, 1)].unit.type == 'mechcorpse'  # don't believe me?
-    assert g.board[(3, 1)].effects == set() # the vek here got the acid
+    assert g.board[(3, 1)].effects == 0 # the vek here got the acid
     assert g.board[(3, 1)].unit == None # unit pushed from here
-    assert g.board[(4, 1)].effects == {Effects.ACID} # the vek pushed from the tile died here and dropped acid. he took 6 damage
+    assert g.board[(4, 1)].effects == Effects.ACID # the vek pushed from the tile died here and dropped acid. he took 6 damage
     assert g.board[(4, 1)].unit == None  # the vek pushed from the tile died here and dropped acid. he took 6 damage
-    assert g.board[(2, 2)].effects == set()
+    assert g.board[(2, 2)].effects == 0
     assert g.board[(2, 2)].unit == None # no unit here
-    assert g.board[(2, 3)].effects == {Effects.ACID} # vek dropped acid here
+    assert g.board[(2, 3)].effects == Effects.ACID # vek dropped acid here
     assert g.board[(2, 3)].unit == None # vek took 6 damage
 
 def t_WeaponUnstableCannonLowPower():
@@ -4513,14 +4514,14 @@ def t_WeaponUnstableCannonLowPower():
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(2, 1)].unit == None  # wielder pushed from here
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile caught fire from self-damage
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()  # No new unit effects
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile caught fire from self-damage
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0  # No new unit effects
     assert g.board[(1, 1)].unit.hp == 2  # took 1 self-damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
     assert g.board[(3, 1)].unit == None # vek pushed from here
-    assert g.board[(4, 1)].effects == set() # forest is not on fire
-    assert g.board[(4, 1)].unit.effects == set() # vek is not on fire
+    assert g.board[(4, 1)].effects == 0 # forest is not on fire
+    assert g.board[(4, 1)].unit.effects == 0 # vek is not on fire
     assert g.board[(4, 1)].unit.hp == 3 # vek took 2 damage
 
 def t_WeaponUnstableCannonPower1():
@@ -4530,15 +4531,15 @@ def t_WeaponUnstableCannonPower1():
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set() # No new effects
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0 # No new effects
     assert g.board[(1, 1)].unit.hp == 1 # took 2 self-damage
-    assert g.board[(2, 1)].effects == set() # no tile effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
     assert g.board[(2, 1)].unit == None # wielder pushed from here
-    assert g.board[(3, 1)].effects == set() # no tile effects
+    assert g.board[(3, 1)].effects == 0 # no tile effects
     assert g.board[(3, 1)].unit == None # vek pushed from here
-    assert g.board[(4, 1)].effects == set() # no tile effects
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0 # no tile effects
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 2 # vek took 3 damage
 
 def t_WeaponUnstableCannonPower2():
@@ -4548,15 +4549,15 @@ def t_WeaponUnstableCannonPower2():
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set() # No new effects
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0 # No new effects
     assert g.board[(1, 1)].unit.hp == 2 # took 1 self-damage
-    assert g.board[(2, 1)].effects == set() # no tile effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
     assert g.board[(2, 1)].unit == None # wielder pushed from here
-    assert g.board[(3, 1)].effects == set() # no tile effects
+    assert g.board[(3, 1)].effects == 0 # no tile effects
     assert g.board[(3, 1)].unit == None # vek pushed from here
-    assert g.board[(4, 1)].effects == set() # no tile effects
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0 # no tile effects
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 2 # vek took 3 damage
 
 def t_WeaponUnstableCannonMaxPower():
@@ -4566,15 +4567,15 @@ def t_WeaponUnstableCannonMaxPower():
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set() # No new effects
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0 # No new effects
     assert g.board[(1, 1)].unit.hp == 1 # took 2 self-damage
-    assert g.board[(2, 1)].effects == set() # no tile effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
     assert g.board[(2, 1)].unit == None # wielder pushed from here
-    assert g.board[(3, 1)].effects == set() # no tile effects
+    assert g.board[(3, 1)].effects == 0 # no tile effects
     assert g.board[(3, 1)].unit == None # vek pushed from here
-    assert g.board[(4, 1)].effects == set() # no tile effects
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0 # no tile effects
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 1 # vek took 4 damage
 
 def t_WeaponUnstableCannonWielderForest():
@@ -4585,15 +4586,15 @@ def t_WeaponUnstableCannonWielderForest():
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set() # No new effects, the wielder does NOT catch on fire because he's pushed off before it happens.
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0 # No new effects, the wielder does NOT catch on fire because he's pushed off before it happens.
     assert g.board[(1, 1)].unit.hp == 1 # took 2 self-damage
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught on fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught on fire
     assert g.board[(2, 1)].unit == None # wielder pushed from here
-    assert g.board[(3, 1)].effects == set() # no tile effects
+    assert g.board[(3, 1)].effects == 0 # no tile effects
     assert g.board[(3, 1)].unit == None # vek pushed from here
-    assert g.board[(4, 1)].effects == set() # no tile effects
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].effects == 0 # no tile effects
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 1 # vek took 4 damage
 
 def t_WeaponAcidProjector():
@@ -4603,13 +4604,13 @@ def t_WeaponAcidProjector():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt() # not needed here, nothing got hurt.
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].effects == set()  # no tile effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
     assert g.board[(2, 1)].unit == None  # no unit here
-    assert g.board[(3, 1)].effects == set()  # no tile effects
-    assert g.board[(3, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(3, 1)].effects == 0  # no tile effects
+    assert g.board[(3, 1)].unit.effects == Effects.ACID
     assert g.board[(3, 1)].unit.hp == 5
 
 def t_WeaponAcidProjectorShielded():
@@ -4619,13 +4620,13 @@ def t_WeaponAcidProjectorShielded():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, effects={Effects.SHIELD}))
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt() # not needed here, nothing got hurt.
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].effects == set()  # no tile effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
     assert g.board[(2, 1)].unit == None  # no unit here
-    assert g.board[(3, 1)].effects == set()  # no tile effects
-    assert g.board[(3, 1)].unit.effects == {Effects.ACID, Effects.SHIELD} # shield doesn't protect you from acid from this weapon
+    assert g.board[(3, 1)].effects == 0  # no tile effects
+    assert g.board[(3, 1)].unit.effects == Effects.ACID | Effects.SHIELD # shield doesn't protect you from acid from this weapon
     assert g.board[(3, 1)].unit.hp == 5
 
 def t_WeaponAcidProjectorBumpDeath():
@@ -4636,13 +4637,13 @@ def t_WeaponAcidProjectorBumpDeath():
     g.board[(3, 1)].createUnitHere(Unit_Mountain(g))
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].effects == {Effects.ACID} # dead vek left acid
+    assert g.board[(2, 1)].effects == Effects.ACID # dead vek left acid
     assert g.board[(2, 1)].unit == None  # vek died
-    assert g.board[(3, 1)].effects == set()  # no tile effects
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == 0  # no tile effects
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.type == 'mountaindamaged'
 
 def t_WeaponAcidProjectorOutOfWater():
@@ -4653,13 +4654,13 @@ def t_WeaponAcidProjectorOutOfWater():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, attributes={Attributes.MASSIVE})) # lol massive alpha scorpion
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED} # water didn't get acid
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED # water didn't get acid
     assert g.board[(2, 1)].unit == None  # vek pushed from here
-    assert g.board[(3, 1)].effects == set()  # no tile effects
-    assert g.board[(3, 1)].unit.effects == {Effects.ACID} # the unit got acid
+    assert g.board[(3, 1)].effects == 0  # no tile effects
+    assert g.board[(3, 1)].unit.effects == Effects.ACID # the unit got acid
 
 def t_WeaponAcidProjectorFlyingWater():
     "If a flying mech is over water and is hit by the acid gun, neither the water tile where he started or landed gets acid. The unit does."
@@ -4670,13 +4671,13 @@ def t_WeaponAcidProjectorFlyingWater():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, attributes={Attributes.FLYING})) # lol flying alpha scorpion
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].effects == {Effects.SUBMERGED} # water didn't get acid
+    assert g.board[(2, 1)].effects == Effects.SUBMERGED # water didn't get acid
     assert g.board[(2, 1)].unit == None  # vek pushed from here
-    assert g.board[(3, 1)].effects == {Effects.SUBMERGED} # water didn't get acid
-    assert g.board[(3, 1)].unit.effects == {Effects.ACID} # the unit got acid
+    assert g.board[(3, 1)].effects == Effects.SUBMERGED # water didn't get acid
+    assert g.board[(3, 1)].unit.effects == Effects.ACID # the unit got acid
 
 def t_WeaponAcidProjectorMountain():
     "Make sure the correct thing happens when the acid projector hits a mountain"
@@ -4690,11 +4691,11 @@ def t_WeaponAcidProjectorMountain():
     else:
         assert False # ya fucked up
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set() # the mountain didn't get acid
-    assert g.board[(2, 1)].effects == set()  # no tile effects either
+    assert g.board[(2, 1)].unit.effects == 0 # the mountain didn't get acid
+    assert g.board[(2, 1)].effects == 0  # no tile effects either
 
 def t_WeaponAcidProjectorBuilding():
     "Make sure the correct thing happens when the acid projector hits a building"
@@ -4703,11 +4704,11 @@ def t_WeaponAcidProjectorBuilding():
     g.board[(2, 1)].createUnitHere(Unit_Building(g))
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set() # the building didn't get acid
-    assert g.board[(2, 1)].effects == {Effects.ACID}  # The tile does get acid
+    assert g.board[(2, 1)].unit.effects == 0 # the building didn't get acid
+    assert g.board[(2, 1)].effects == Effects.ACID  # The tile does get acid
 
 def t_WeaponRammingSpeedDefault():
     "Fire the RammingSpeed weapon with no powered upgrades"
@@ -4733,7 +4734,7 @@ def t_WeaponRammingSpeedPower1():
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None  # never was a unit here
-    assert g.board[(1, 1)].effects == {Effects.SMOKE} # smoke was farted
+    assert g.board[(1, 1)].effects == Effects.SMOKE # smoke was farted
     assert g.board[(2, 1)].unit.hp == 3  # wielder took 0 damage and didn't move
     assert g.board[(3, 1)].unit == None # vek pushed off this tile
     assert g.board[(4, 1)].unit.hp == 4 # vek pushed here took 1 damage
@@ -4762,7 +4763,7 @@ def t_WeaponRammingSpeedFullPower():
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None  # never was a unit here
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}  # smoke was farted
+    assert g.board[(1, 1)].effects == Effects.SMOKE  # smoke was farted
     assert g.board[(2, 1)].unit.hp == 3  # wielder took 0 damage and didn't move
     assert g.board[(3, 1)].unit == None  # vek pushed off this tile
     assert g.board[(4, 1)].unit.hp == 2 # vek pushed here took 3 damage
@@ -4779,18 +4780,18 @@ def t_WeaponNeedleShotNoPower():
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set() # forest is fine
+    assert g.board[(4, 1)].effects == 0 # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 1
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set() # no effects
+    assert g.board[(1, 1)].unit.effects == 0 # no effects
     assert g.board[(2, 1)].unit.hp == 3 # this vek took 2 damage; 1 from weapon, 1 from bump
     assert g.board[(3, 1)].unit.hp == 4 # this one took 1 bump damage
     assert g.board[(4, 1)].unit.hp == 5 # this one took none
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     assert g.board[(5, 1)].unit == None # Nothing got pushed here
 
 def t_WeaponNeedleShot1Power():
@@ -4805,18 +4806,18 @@ def t_WeaponNeedleShot1Power():
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set() # forest is fine
+    assert g.board[(4, 1)].effects == 0 # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(4):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set() # no effects
+    assert g.board[(1, 1)].unit.effects == 0 # no effects
     assert g.board[(2, 1)].unit.hp == 3 # this vek took 2 damage from weapon, no bump
     assert g.board[(3, 1)].unit.hp == 2 # this one took 3 damage; 2 from weapon, 1 from bump
     assert g.board[(4, 1)].unit.hp == 4 # this one took 1 bump damage
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     assert g.board[(5, 1)].unit == None # Nothing got pushed here
 
 def t_WeaponNeedleShot2Power():
@@ -4831,18 +4832,18 @@ def t_WeaponNeedleShot2Power():
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set() # forest is fine
+    assert g.board[(4, 1)].effects == 0 # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(4):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set() # no effects
+    assert g.board[(1, 1)].unit.effects == 0 # no effects
     assert g.board[(2, 1)].unit.hp == 3 # this vek took 2 damage from weapon, no bump
     assert g.board[(3, 1)].unit.hp == 2 # this one took 3 damage; 2 from weapon, 1 from bump
     assert g.board[(4, 1)].unit.hp == 4 # this one took 1 bump damage
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     assert g.board[(5, 1)].unit == None # Nothing got pushed here
 
 def t_WeaponNeedleShotFullPower():
@@ -4857,20 +4858,20 @@ def t_WeaponNeedleShotFullPower():
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set() # forest is fine
+    assert g.board[(4, 1)].effects == 0 # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(6):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 3
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set() # no effects
+    assert g.board[(1, 1)].unit.effects == 0 # no effects
     assert g.board[(2, 1)].unit.hp == 2 # this vek took 3 damage from weapon, no bump
     assert g.board[(3, 1)].unit.hp == 2 # this one took 3 damage from weapon
     assert g.board[(4, 1)].unit == None # last vek got pushed from here
-    assert g.board[(4, 1)].effects == {Effects.FIRE}  # forest is on fire
+    assert g.board[(4, 1)].effects == Effects.FIRE  # forest is on fire
     assert g.board[(5, 1)].unit.hp == 2 # this one took 3 damage from weapon
-    assert g.board[(5, 1)].unit.effects == set() # the vek didn't catch on fire
+    assert g.board[(5, 1)].unit.effects == 0 # the vek didn't catch on fire
 
 def t_WeaponExplosiveGooNoPower():
     "Fire the NeedleShot weapon with no upgrade power."
@@ -4890,7 +4891,7 @@ def t_WeaponExplosiveGooNoPower():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(1, 3)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 3)].unit.effects == set() # no unit effects
+    assert g.board[(1, 3)].unit.effects == 0 # no unit effects
     del allunits[(1, 3)]  # delete the wielder from allunits
     assert g.board[(4, 3)].unit.hp == 4  # target took 1 damage
     del allunits[(4, 3)]  # delete the target unit from all
@@ -4931,7 +4932,7 @@ def t_WeaponExplosiveGooPower2():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(1, 3)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 3)].unit.effects == set() # no unit effects
+    assert g.board[(1, 3)].unit.effects == 0 # no unit effects
     del allunits[(1, 3)]  # delete the wielder from allunits
     assert g.board[(4, 3)].unit.hp == 2  # target took 3 damage
     del allunits[(4, 3)]  # delete the target unit from all
@@ -4972,7 +4973,7 @@ def t_WeaponExplosiveGooPower1():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(1, 3)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 3)].unit.effects == set() # no unit effects
+    assert g.board[(1, 3)].unit.effects == 0 # no unit effects
     del allunits[(1, 3)]  # delete the wielder from allunits
     assert g.board[(4, 3)].unit.hp == 4  # target took 1 damage
     del allunits[(4, 3)]  # delete the target unit from all
@@ -5023,7 +5024,7 @@ def t_WeaponExplosiveGooFullPower():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(1, 3)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 3)].unit.effects == set() # no unit effects
+    assert g.board[(1, 3)].unit.effects == 0 # no unit effects
     del allunits[(1, 3)]  # delete the wielder from allunits
     assert g.board[(4, 3)].unit.hp == 2  # target took 3 damage
     del allunits[(4, 3)]  # delete the target unit from all
@@ -5067,7 +5068,7 @@ def t_WeaponSidewinderFistNoPower():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # UP, 1
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     assert g.board[(2, 2)].unit == None  # target pushed off this tile
     assert g.board[(1, 2)].unit.hp == 3  # target took 2 damage
 
@@ -5082,7 +5083,7 @@ def t_WeaponSidewinderFistPower1():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # UP, 1
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     assert g.board[(2, 2)].unit == None  # target pushed off this tile
     assert g.board[(1, 2)].unit.hp == 2  # target took 3 damage
 
@@ -5097,7 +5098,7 @@ def t_WeaponSidewinderFistPower2():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # UP, 1
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     assert g.board[(2, 2)].unit == None  # target pushed off this tile
     assert g.board[(1, 2)].unit.hp == 2  # target took 3 damage
 
@@ -5112,7 +5113,7 @@ def t_WeaponSidewinderFistFullPower():
     g.board[(2, 1)].unit.weapon1.shoot(*shot) # UP, 1
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     assert g.board[(2, 2)].unit == None  # target pushed off this tile
     assert g.board[(1, 2)].unit.hp == 1  # target took 4 damage
 
@@ -5128,7 +5129,7 @@ def t_WeaponSidewinderFistFullPowerDash():
     g.flushHurt()
     assert g.board[(2, 1)].unit == None # wielder moved from this square
     assert g.board[(3, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(3, 1)].unit.effects == set() # no unit effects
+    assert g.board[(3, 1)].unit.effects == 0 # no unit effects
     assert g.board[(4, 1)].unit == None  # target pushed off this tile
     assert g.board[(4, 2)].unit.hp == 1  # target took 4 damage
 
@@ -5144,10 +5145,10 @@ def t_WeaponRocketFistNoPower():
     g.flushHurt()
     assert g.board[(2, 1)].unit == None  # wielder pushed from starting square
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(3, 1)].unit == None  # target pushed from here
     assert g.board[(4, 1)].unit.hp == 3  # target took 2 damage
-    assert g.board[(4, 1)].unit.effects == set()  # no new effects
+    assert g.board[(4, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponRocketFist2ndPower():
     "Fire RocketFist with extra damage powered."
@@ -5161,10 +5162,10 @@ def t_WeaponRocketFist2ndPower():
     g.flushHurt()
     assert g.board[(2, 1)].unit == None  # wielder pushed from starting square
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(3, 1)].unit == None  # target pushed from here
     assert g.board[(4, 1)].unit.hp == 1  # target took 4 damage
-    assert g.board[(4, 1)].unit.effects == set()  # no new effects
+    assert g.board[(4, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponRocketFist1stPower():
     "Fire RocketFist with rocket projectile powered."
@@ -5178,10 +5179,10 @@ def t_WeaponRocketFist1stPower():
     g.flushHurt()
     assert g.board[(2, 1)].unit == None  # wielder pushed from starting square
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(4, 1)].unit == None  # target pushed from here
     assert g.board[(5, 1)].unit.hp == 3  # target took 2 damage
-    assert g.board[(5, 1)].unit.effects == set()  # no new effects
+    assert g.board[(5, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponRocketFistFullPower():
     "Fire RocketFist with full power."
@@ -5195,10 +5196,10 @@ def t_WeaponRocketFistFullPower():
     g.flushHurt()
     assert g.board[(2, 1)].unit == None  # wielder pushed from starting square
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(4, 1)].unit == None  # target pushed from here
     assert g.board[(5, 1)].unit.hp == 1  # target took 4 damage
-    assert g.board[(5, 1)].unit.effects == set()  # no new effects
+    assert g.board[(5, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponExplosiveVentsNoPower():
     "Shoot explosive vents with no power."
@@ -5213,13 +5214,13 @@ def t_WeaponExplosiveVentsNoPower():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # () no choice!
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].effects == set()  # wielder's tile untouched
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].effects == 0  # wielder's tile untouched
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(1, 2)].unit == None  # never was a unit here
-    assert g.board[(1, 2)].effects == {Effects.SMOKE} # sand was hit
+    assert g.board[(1, 2)].effects == Effects.SMOKE # sand was hit
     assert g.board[(2, 1)].unit == None  # target pushed from here
     assert g.board[(3, 1)].unit.hp == 4  # target took 1 damage
-    assert g.board[(3, 1)].unit.effects == set()  # no new effects
+    assert g.board[(3, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponExplosiveVents1Power():
     "Shoot explosive vents with 1 power."
@@ -5234,13 +5235,13 @@ def t_WeaponExplosiveVents1Power():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # () no choice!
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].effects == set()  # wielder's tile untouched
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].effects == 0  # wielder's tile untouched
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(1, 2)].unit == None  # never was a unit here
-    assert g.board[(1, 2)].effects == {Effects.SMOKE} # sand was hit
+    assert g.board[(1, 2)].effects == Effects.SMOKE # sand was hit
     assert g.board[(2, 1)].unit == None  # target pushed from here
     assert g.board[(3, 1)].unit.hp == 3  # target took 2 damage
-    assert g.board[(3, 1)].unit.effects == set()  # no new effects
+    assert g.board[(3, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponExplosiveVents2ndPower():
     "Shoot explosive vents with 2nd power."
@@ -5255,13 +5256,13 @@ def t_WeaponExplosiveVents2ndPower():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # () no choice!
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].effects == set()  # wielder's tile untouched
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].effects == 0  # wielder's tile untouched
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(1, 2)].unit == None  # never was a unit here
-    assert g.board[(1, 2)].effects == {Effects.SMOKE} # sand was hit
+    assert g.board[(1, 2)].effects == Effects.SMOKE # sand was hit
     assert g.board[(2, 1)].unit == None  # target pushed from here
     assert g.board[(3, 1)].unit.hp == 3  # target took 2 damage
-    assert g.board[(3, 1)].unit.effects == set()  # no new effects
+    assert g.board[(3, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponExplosiveVentsMaxPower():
     "Shoot explosive vents with max power."
@@ -5276,13 +5277,13 @@ def t_WeaponExplosiveVentsMaxPower():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # () no choice!
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 1)].effects == set()  # wielder's tile untouched
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
+    assert g.board[(1, 1)].effects == 0  # wielder's tile untouched
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
     assert g.board[(1, 2)].unit == None  # never was a unit here
-    assert g.board[(1, 2)].effects == {Effects.SMOKE} # sand was hit
+    assert g.board[(1, 2)].effects == Effects.SMOKE # sand was hit
     assert g.board[(2, 1)].unit == None  # target pushed from here
     assert g.board[(3, 1)].unit.hp == 2  # target took 3 damage
-    assert g.board[(3, 1)].unit.effects == set()  # no new effects
+    assert g.board[(3, 1)].unit.effects == 0  # no new effects
 
 def t_WeaponPrimeSpearNoPower():
     "Fire the PrimeSpear weapon with the no upgrades powered"
@@ -5295,22 +5296,22 @@ def t_WeaponPrimeSpearNoPower():
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set() # forest is fine
+    assert g.board[(4, 1)].effects == 0 # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(4):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set() # no effects
+    assert g.board[(1, 1)].unit.effects == 0 # no effects
     assert g.board[(2, 1)].unit.hp == 3 # this vek took 2 damage; 2 from weapon, 0 from bump
     assert g.board[(3, 1)].unit.hp == 2 # this one took 3 damage, 2 weapon, 1 bump damage
-    assert g.board[(3, 1)].effects == set() # this tile didn't get acid
-    assert g.board[(3, 1)].unit.effects == set()  # this unit didn't get acid
+    assert g.board[(3, 1)].effects == 0 # this tile didn't get acid
+    assert g.board[(3, 1)].unit.effects == 0  # this unit didn't get acid
     assert g.board[(4, 1)].unit.hp == 4 # this one took 1 bump damage
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     assert g.board[(5, 1)].unit == None # Nothing got pushed here
 
 def t_WeaponPrimeSpear1Power():
@@ -5324,22 +5325,22 @@ def t_WeaponPrimeSpear1Power():
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(4):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set()  # no effects
+    assert g.board[(1, 1)].unit.effects == 0  # no effects
     assert g.board[(2, 1)].unit.hp == 3  # this vek took 2 damage; 2 from weapon, 0 from bump
     assert g.board[(3, 1)].unit.hp == 2  # this one took 3 damage, 2 weapon, 1 bump damage
-    assert g.board[(3, 1)].effects == set()  # this tile didn't get acid
-    assert g.board[(3, 1)].unit.effects == {Effects.ACID}  # this unit DID get acid
+    assert g.board[(3, 1)].effects == 0  # this tile didn't get acid
+    assert g.board[(3, 1)].unit.effects == Effects.ACID  # this unit DID get acid
     assert g.board[(4, 1)].unit.hp == 4  # this one took 1 bump damage
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     assert g.board[(5, 1)].unit == None  # Nothing got pushed here
 
 def t_WeaponPrimeSpear2Power():
@@ -5353,24 +5354,24 @@ def t_WeaponPrimeSpear2Power():
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(6):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 3
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set()  # no effects
+    assert g.board[(1, 1)].unit.effects == 0  # no effects
     assert g.board[(2, 1)].unit.hp == 3  # this vek took 2 damage; 2 from weapon, 0 from bump
     assert g.board[(3, 1)].unit.hp == 3  # this one took 2 damage, 2 weapon, 0 bump damage
-    assert g.board[(3, 1)].effects == set()  # this tile didn't get acid
-    assert g.board[(3, 1)].unit.effects == set()  # this unit didn't get acid
+    assert g.board[(3, 1)].effects == 0  # this tile didn't get acid
+    assert g.board[(3, 1)].unit.effects == 0  # this unit didn't get acid
     assert g.board[(4, 1)].unit == None # unit pushed from here
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # forest is FIRE
+    assert g.board[(4, 1)].effects == Effects.FIRE # forest is FIRE
     assert g.board[(5, 1)].unit.hp == 3  # this one took 2 damage; 2 weapon, 0 bump damage
-    assert g.board[(5, 1)].unit.effects == set() # no acid here
+    assert g.board[(5, 1)].unit.effects == 0 # no acid here
 
 def t_WeaponPrimeSpearFullPower():
     "Fire the PrimeSpear weapon with full upgrade power."
@@ -5383,24 +5384,24 @@ def t_WeaponPrimeSpearFullPower():
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 5
-    assert g.board[(4, 1)].effects == set()  # forest is fine
+    assert g.board[(4, 1)].effects == 0  # forest is fine
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(6):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 3
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set()  # no effects
+    assert g.board[(1, 1)].unit.effects == 0  # no effects
     assert g.board[(2, 1)].unit.hp == 3  # this vek took 2 damage; 2 from weapon, 0 from bump
     assert g.board[(3, 1)].unit.hp == 3  # this one took 2 damage, 2 weapon, 0 bump damage
-    assert g.board[(3, 1)].effects == set()  # this tile didn't get acid
-    assert g.board[(3, 1)].unit.effects == set()  # this unit didn't get acid
+    assert g.board[(3, 1)].effects == 0  # this tile didn't get acid
+    assert g.board[(3, 1)].unit.effects == 0  # this unit didn't get acid
     assert g.board[(4, 1)].unit == None # unit pushed from here
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # forest is FIRE
+    assert g.board[(4, 1)].effects == Effects.FIRE # forest is FIRE
     assert g.board[(5, 1)].unit.hp == 3  # this one took 2 damage; 2 weapon, 0 bump damage
-    assert g.board[(5, 1)].unit.effects == {Effects.ACID} # this unit did get acid
+    assert g.board[(5, 1)].unit.effects == Effects.ACID # this unit did get acid
 
 def t_WeaponPrimeSpearAcidWeirdness1():
     "Fire the PrimeSpear weapon and test the weirdness that happens when the unit that gets acid dies from this attack."
@@ -5409,19 +5410,19 @@ def t_WeaponPrimeSpearAcidWeirdness1():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, hp=2))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set() # no acid on unit
-    assert g.board[(2, 1)].effects == set()  # no acid on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no acid on unit
+    assert g.board[(2, 1)].effects == 0  # no acid on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(4):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set()  # no effects
+    assert g.board[(1, 1)].unit.effects == 0  # no effects
     assert g.board[(2, 1)].unit == None  # vek pushed from here
-    assert g.board[(2, 1)].effects == {Effects.ACID}  # this tile got acid from the buggy/weird behavior of the acid spear
+    assert g.board[(2, 1)].effects == Effects.ACID  # this tile got acid from the buggy/weird behavior of the acid spear
     assert g.board[(3, 1)].unit == None # the vek pushed here died
-    assert g.board[(3, 1)].effects == {Effects.ACID}  # this tile got acid from the vek that got it and then died here
+    assert g.board[(3, 1)].effects == Effects.ACID  # this tile got acid from the vek that got it and then died here
 
 def t_WeaponPrimeSpearAcidWeirdness2():
     "Fire the PrimeSpear weapon and test the weirdness that happens when a mountain that gets acid dies from this attack."
@@ -5430,24 +5431,24 @@ def t_WeaponPrimeSpearAcidWeirdness2():
     g.board[(2, 1)].createUnitHere(Unit_Mountain(g))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].unit.effects == set() # no acid on unit
-    assert g.board[(2, 1)].effects == set()  # no acid on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no acid on unit
+    assert g.board[(2, 1)].effects == 0  # no acid on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(4):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set()  # no effects
+    assert g.board[(1, 1)].unit.effects == 0  # no effects
     assert g.board[(2, 1)].unit.type == 'mountaindamaged'
-    assert g.board[(2, 1)].effects == set()  # no acid here yet
-    assert g.board[(2, 1)].unit.effects == set() # none here yet
+    assert g.board[(2, 1)].effects == 0  # no acid here yet
+    assert g.board[(2, 1)].unit.effects == 0 # none here yet
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set()  # no effects
+    assert g.board[(1, 1)].unit.effects == 0  # no effects
     assert g.board[(2, 1)].unit == None # mountain died
-    assert g.board[(2, 1)].effects == {Effects.ACID}  # Acid left here from dead mountain or something
+    assert g.board[(2, 1)].effects == Effects.ACID  # Acid left here from dead mountain or something
 
 def t_WeaponPrimeSpearAcidWeirdness3():
     "Fire the PrimeSpear weapon and test the non-weirdness that happens when a unit dies from this attack but doesn't move tiles."
@@ -5457,23 +5458,23 @@ def t_WeaponPrimeSpearAcidWeirdness3():
     g.board[(3, 1)].createUnitHere(Unit_Mountain(g))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].unit.effects == set() # no acid on unit
-    assert g.board[(2, 1)].effects == set()  # no acid on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no acid on unit
+    assert g.board[(2, 1)].effects == 0  # no acid on tile
     assert g.board[(3, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()  # no acid on unit
-    assert g.board[(3, 1)].effects == set()  # no acid on tile
+    assert g.board[(3, 1)].unit.effects == 0  # no acid on unit
+    assert g.board[(3, 1)].effects == 0  # no acid on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for r in range(4):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # no change to the wielder
-    assert g.board[(1, 1)].unit.effects == set()  # no effects
+    assert g.board[(1, 1)].unit.effects == 0  # no effects
     assert g.board[(2, 1)].unit == None # this unit died
-    assert g.board[(2, 1)].effects == {Effects.ACID}  # acid on tile
+    assert g.board[(2, 1)].effects == Effects.ACID  # acid on tile
     assert g.board[(3, 1)].unit.type == 'mountaindamaged'
-    assert g.board[(3, 1)].effects == set()  # no acid here yet
-    assert g.board[(3, 1)].unit.effects == set() # none here yet
+    assert g.board[(3, 1)].effects == 0  # no acid here yet
+    assert g.board[(3, 1)].unit.effects == 0 # none here yet
 
 def t_WeaponVortexFistNoPower():
     "Fire the VortexFist weapon with no power."
@@ -5483,11 +5484,11 @@ def t_WeaponVortexFistNoPower():
     g.board[(1, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 5 # gave it more health so it doesn't die
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 5
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in gs: # this should only yield one empty value
         g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
@@ -5495,11 +5496,11 @@ def t_WeaponVortexFistNoPower():
     assert g.board[(1, 1)].unit.hp == 3 # 2 self-damage
     assert g.board[(2, 1)].unit == None # vek pushed from here
     assert g.board[(2, 2)].unit.hp == 3 # took 2 damage
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 3 # this one wasn't pushed because there's nowhere to go
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
 
 def t_WeaponVortexFist1Power():
     "Fire the VortexFist weapon with 1 power."
@@ -5509,11 +5510,11 @@ def t_WeaponVortexFist1Power():
     g.board[(1, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 5 # gave it more health so it doesn't die
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 5
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in gs: # this should only yield one empty value
         g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
@@ -5521,11 +5522,11 @@ def t_WeaponVortexFist1Power():
     assert g.board[(1, 1)].unit.hp == 4 # 1 self-damage
     assert g.board[(2, 1)].unit == None # vek pushed from here
     assert g.board[(2, 2)].unit.hp == 3 # took 2 damage
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 3 # this one wasn't pushed because there's nowhere to go
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
 
 def t_WeaponVortexFist2Power():
     "Fire the VortexFist weapon with 2nd power."
@@ -5535,11 +5536,11 @@ def t_WeaponVortexFist2Power():
     g.board[(1, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 5 # gave it more health so it doesn't die
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 5
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in gs: # this should only yield one empty value
         g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
@@ -5547,11 +5548,11 @@ def t_WeaponVortexFist2Power():
     assert g.board[(1, 1)].unit.hp == 3 # 2 self-damage
     assert g.board[(2, 1)].unit == None # vek pushed from here
     assert g.board[(2, 2)].unit.hp == 2 # took 3 damage
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 2 # this one wasn't pushed because there's nowhere to go
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
 
 def t_WeaponVortexFistFullPower():
     "Fire the VortexFist weapon with full power."
@@ -5561,11 +5562,11 @@ def t_WeaponVortexFistFullPower():
     g.board[(1, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 5 # gave it more health so it doesn't die
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 5
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in gs: # this should only yield one empty value
         g.board[(1, 1)].unit.weapon1.shoot(*shot)  # RIGHT, 1
@@ -5573,11 +5574,11 @@ def t_WeaponVortexFistFullPower():
     assert g.board[(1, 1)].unit.hp == 4 # 1 self-damage
     assert g.board[(2, 1)].unit == None # vek pushed from here
     assert g.board[(2, 2)].unit.hp == 2 # took 3 damage
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     assert g.board[(1, 2)].unit.hp == 2 # this one wasn't pushed because there's nowhere to go
-    assert g.board[(1, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(1, 2)].effects == set()  # no effects on tile
+    assert g.board[(1, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(1, 2)].effects == 0  # no effects on tile
 
 def t_WeaponTitaniteBladeNoPower():
     "Fire the TitaniteBlade weapon with no power."
@@ -5587,11 +5588,11 @@ def t_WeaponTitaniteBladeNoPower():
     g.board[(2, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit.hp == 5
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs))  # this shot happens and spends the one ammo
     g.flushHurt()
@@ -5603,12 +5604,12 @@ def t_WeaponTitaniteBladeNoPower():
         raise Exception  # ya fucked up
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5 # this vek was untouched
-    assert g.board[(2, 1)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit == None # vek pushed from here
     assert g.board[(2, 3)].unit.hp == 3 # took 2 damage
-    assert g.board[(2, 3)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 3)].effects == set()  # no effects on tile
+    assert g.board[(2, 3)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 3)].effects == 0  # no effects on tile
 
 def t_WeaponTitaniteBlade1Power():
     "Fire the TitaniteBlade weapon with 1 power. This has no effect on the outcome."
@@ -5618,11 +5619,11 @@ def t_WeaponTitaniteBlade1Power():
     g.board[(2, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit.hp == 5
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs)) # this shot happens and spends the one ammo
     g.flushHurt()
@@ -5634,12 +5635,12 @@ def t_WeaponTitaniteBlade1Power():
         raise Exception # ya fucked up
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5 # this vek was untouched
-    assert g.board[(2, 1)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit == None # vek pushed from here
     assert g.board[(2, 3)].unit.hp == 3 # took 2 damage
-    assert g.board[(2, 3)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 3)].effects == set()  # no effects on tile
+    assert g.board[(2, 3)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 3)].effects == 0  # no effects on tile
 
 def t_WeaponTitaniteBladeExtraUse():
     "Fire the TitaniteBlade weapon with 1 power and an extra use given."
@@ -5649,11 +5650,11 @@ def t_WeaponTitaniteBladeExtraUse():
     g.board[(2, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit.hp == 5
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for i in range(2):
         g.board[(1, 1)].unit.weapon1.shoot(*next(gs))  # this shot happens and spends the one ammo
@@ -5668,12 +5669,12 @@ def t_WeaponTitaniteBladeExtraUse():
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit == None # Pushed from this square
     assert g.board[(3, 1)].unit.hp == 3  # this vek took 2 damage
-    assert g.board[(3, 1)].unit.effects == set()  # no effects on unit
-    assert g.board[(3, 1)].effects == set()  # no effects on tile
+    assert g.board[(3, 1)].unit.effects == 0  # no effects on unit
+    assert g.board[(3, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit == None # vek pushed from here
     assert g.board[(2, 3)].unit.hp == 3 # took 2 damage
-    assert g.board[(2, 3)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 3)].effects == set()  # no effects on tile
+    assert g.board[(2, 3)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 3)].effects == 0  # no effects on tile
 
 def t_WeaponTitaniteBlade2Power():
     "Fire the TitaniteBlade weapon with extra damage powered."
@@ -5683,11 +5684,11 @@ def t_WeaponTitaniteBlade2Power():
     g.board[(2, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set() # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0 # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit.hp == 5
-    assert g.board[(2, 2)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 2)].effects == set()  # no effects on tile
+    assert g.board[(2, 2)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 2)].effects == 0  # no effects on tile
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs))  # this shot happens and spends the one ammo
     g.flushHurt()
@@ -5699,12 +5700,12 @@ def t_WeaponTitaniteBlade2Power():
         raise Exception  # ya fucked up
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 5 # this vek was untouched
-    assert g.board[(2, 1)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 1)].effects == set()  # no effects on tile
+    assert g.board[(2, 1)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 1)].effects == 0  # no effects on tile
     assert g.board[(2, 2)].unit == None # vek pushed from here
     assert g.board[(2, 3)].unit.hp == 1 # took 4 damage
-    assert g.board[(2, 3)].unit.effects == set()  # no effects on unit
-    assert g.board[(2, 3)].effects == set()  # no effects on tile
+    assert g.board[(2, 3)].unit.effects == 0  # no effects on unit
+    assert g.board[(2, 3)].effects == 0  # no effects on tile
 
 def t_WeaponTitaniteBlade2Power2():
     "Fire the TitaniteBlade weapon with extra damage powered powered and hit 3 vek at the same time."
@@ -5782,7 +5783,7 @@ def t_WeaponPhaseCannonNoPower():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1 # building unaffected
-    assert g.board[(2, 1)].unit.effects == set() # no shield for building
+    assert g.board[(2, 1)].unit.effects == 0 # no shield for building
     assert g.board[(3, 1)].unit == None # vek pushed from here
     assert g.board[(4, 1)].unit.hp == 4 # took 1 damage
 
@@ -5794,7 +5795,7 @@ def t_WeaponPhaseCannonNoPowerEdgeHit():
     g.board[(2, 1)].createUnitHere(Unit_Building(g))
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
@@ -5802,8 +5803,8 @@ def t_WeaponPhaseCannonNoPowerEdgeHit():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1 # building unaffected
-    assert g.board[(2, 1)].unit.effects == set() # no shield for building
-    assert g.board[(8, 1)].effects == {Effects.FIRE}
+    assert g.board[(2, 1)].unit.effects == 0 # no shield for building
+    assert g.board[(8, 1)].effects == Effects.FIRE
 
 def t_WeaponPhaseCannon1Power():
     "Fire the PhaseCannon weapon with 1 power."
@@ -5821,7 +5822,7 @@ def t_WeaponPhaseCannon1Power():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1 # building unaffected
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD} # building got shielded
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD # building got shielded
     assert g.board[(3, 1)].unit == None # vek pushed from here
     assert g.board[(4, 1)].unit.hp == 4 # took 1 damage
 
@@ -5841,7 +5842,7 @@ def t_WeaponPhaseCannon2Power():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1 # building unaffected
-    assert g.board[(2, 1)].unit.effects == set() # no shield for building
+    assert g.board[(2, 1)].unit.effects == 0 # no shield for building
     assert g.board[(3, 1)].unit == None # vek pushed from here
     assert g.board[(4, 1)].unit.hp == 3 # took 2 damage
 
@@ -5861,7 +5862,7 @@ def t_WeaponPhaseCannonMaxPower():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1 # building unaffected
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD} # building got shielded
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD # building got shielded
     assert g.board[(3, 1)].unit == None # vek pushed from here
     assert g.board[(4, 1)].unit.hp == 3 # took 2 damage
 
@@ -5881,7 +5882,7 @@ def t_WeaponDefShrapnel1():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(2, 1)].unit.hp == 1 # building unaffected
-    assert g.board[(2, 1)].unit.effects == set() # no new effects
+    assert g.board[(2, 1)].unit.effects == 0 # no new effects
     assert g.board[(3, 1)].unit == None # vek pushed from here
     assert g.board[(4, 1)].unit.hp == 5 # took 0 damage
 
@@ -5987,14 +5988,14 @@ def t_WeaponRailCannonMaxPowerMiss():
     g.board[(8, 1)].replaceTile(Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_TechnoHornet_Mech(g, weapon1=Weapon_RailCannon(power1=True, power2=True)))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(8, 1)].effects == {Effects.FIRE}
+    assert g.board[(8, 1)].effects == Effects.FIRE
 
 def t_WeaponShockCannonNoPower():
     "Fire the ShockCannon with no power"
@@ -6468,16 +6469,16 @@ def t_WeaponSmokeMortar1():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1  # wielder took 1 bump damage
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 4 # 1 bump damage
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].effects == Effects.SMOKE
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 5 # no damage
-    assert g.board[(4, 1)].effects == set() # no tile effects
+    assert g.board[(4, 1)].effects == 0 # no tile effects
     assert g.board[(4, 1)].unit == None # no unit here
-    assert g.board[(5, 1)].effects == set() # no tile effects
-    assert g.board[(5, 1)].unit.effects == set() #
+    assert g.board[(5, 1)].effects == 0 # no tile effects
+    assert g.board[(5, 1)].unit.effects == 0 #
     assert g.board[(5, 1)].unit.hp == 5 # no damage
 
 def t_WeaponSmokeMortar2():
@@ -6491,7 +6492,7 @@ def t_WeaponSmokeMortar2():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # UP, 7
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took 0 damage
-    assert g.board[(1, 8)].effects == {Effects.SMOKE}
+    assert g.board[(1, 8)].effects == Effects.SMOKE
 
 def t_WeaponBurningMortarNoPower():
     "Fire the BurningMortar with no power"
@@ -6510,17 +6511,17 @@ def t_WeaponBurningMortarNoPower():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1  # wielder took 1 self damage
-    assert g.board[(1, 1)].unit.effects == set()  # no fire here
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].unit.effects == 0  # no fire here
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     assert g.board[(2, 1)].unit.hp == 5 # 0 damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
-    assert g.board[(3, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
+    assert g.board[(3, 1)].unit.effects == Effects.FIRE
     assert g.board[(3, 1)].unit.hp == 5 # no damage
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # no tile effects
-    assert g.board[(4, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(4, 1)].effects == Effects.FIRE # no tile effects
+    assert g.board[(4, 1)].unit.effects == Effects.FIRE
     assert g.board[(4, 1)].unit.hp == 5 # no damage
-    assert g.board[(3, 2)].effects == {Effects.FIRE}
+    assert g.board[(3, 2)].effects == Effects.FIRE
 
 def t_WeaponBurningMortar1Power():
     "Fire the BurningMortar with 1 power"
@@ -6539,17 +6540,17 @@ def t_WeaponBurningMortar1Power():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took 0 self damage
-    assert g.board[(1, 1)].unit.effects == set()  # no fire here
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].unit.effects == 0  # no fire here
+    assert g.board[(2, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     assert g.board[(2, 1)].unit.hp == 5 # 0 damage
-    assert g.board[(3, 1)].effects == {Effects.FIRE}
-    assert g.board[(3, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(3, 1)].effects == Effects.FIRE
+    assert g.board[(3, 1)].unit.effects == Effects.FIRE
     assert g.board[(3, 1)].unit.hp == 5 # no damage
-    assert g.board[(4, 1)].effects == {Effects.FIRE} # no tile effects
-    assert g.board[(4, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(4, 1)].effects == Effects.FIRE # no tile effects
+    assert g.board[(4, 1)].unit.effects == Effects.FIRE
     assert g.board[(4, 1)].unit.hp == 5 # no damage
-    assert g.board[(3, 2)].effects == {Effects.FIRE}
+    assert g.board[(3, 2)].effects == Effects.FIRE
 
 def t_WeaponRainingDeathNoPower():
     "Fire the RainingDeath similar to the ingame demo with no power."
@@ -6755,22 +6756,22 @@ def t_WeaponSmokePelletsNoPower():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(1, 2)].createUnitHere(Unit_Flame_Mech(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 2)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # ()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}
+    assert g.board[(1, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].effects == {Effects.SMOKE}
+    assert g.board[(1, 2)].effects == Effects.SMOKE
 
 def t_WeaponSmokePelletsMaxPower():
     "Fire the SmokePellets with max power"
@@ -6779,22 +6780,22 @@ def t_WeaponSmokePelletsMaxPower():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(1, 2)].createUnitHere(Unit_Flame_Mech(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 2)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # ()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set() # self not smoked
+    assert g.board[(1, 1)].effects == 0 # self not smoked
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].effects == set() # friendly not smoked
+    assert g.board[(1, 2)].effects == 0 # friendly not smoked
 
 def t_WeaponFireBeam():
     "Fire the FireBeam with max power"
@@ -6804,26 +6805,26 @@ def t_WeaponFireBeam():
     g.board[(3, 1)].createUnitHere(Unit_Flame_Mech(g))
     g.board[(4, 1)].createUnitHere(Unit_Mountain(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(4, 1)].effects == set()
+    assert g.board[(4, 1)].effects == 0
     assert g.board[(5, 1)].unit == None
-    assert g.board[(5, 1)].effects == set()
+    assert g.board[(5, 1)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == Effects.FIRE
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(4, 1)].effects == {Effects.FIRE}
+    assert g.board[(4, 1)].effects == Effects.FIRE
     assert g.board[(5, 1)].unit == None
-    assert g.board[(5, 1)].effects == set() # mountain blocked this tile from catching on fire
+    assert g.board[(5, 1)].effects == 0 # mountain blocked this tile from catching on fire
 
 def t_WeaponFrostBeam():
     "Fire the FrostBeam with max power"
@@ -6833,26 +6834,26 @@ def t_WeaponFrostBeam():
     g.board[(3, 1)].createUnitHere(Unit_Flame_Mech(g))
     g.board[(4, 1)].createUnitHere(Unit_Mountain(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(4, 1)].effects == set()
+    assert g.board[(4, 1)].effects == 0
     assert g.board[(5, 1)].unit == None
-    assert g.board[(5, 1)].effects == set()
+    assert g.board[(5, 1)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(4, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(4, 1)].unit.effects == Effects.ICE
     assert g.board[(5, 1)].unit == None
-    assert g.board[(5, 1)].effects == set() # mountain blocked this tile from catching on fire
+    assert g.board[(5, 1)].effects == 0 # mountain blocked this tile from catching on fire
 
 def t_WeaponShieldArrayNoPower():
     "Fire the ShieldArray with no power in the corner of the map"
@@ -6862,24 +6863,24 @@ def t_WeaponShieldArrayNoPower():
     g.board[(1, 2)].createUnitHere(Unit_Flame_Mech(g))
     g.board[(2, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 2)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # ()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 2)].unit.effects == Effects.SHIELD
     assert g.board[(2, 2)].unit.hp == 5
-    assert g.board[(2, 2)].unit.effects == set() # this unit not shielded
+    assert g.board[(2, 2)].unit.effects == 0 # this unit not shielded
 
 def t_WeaponShieldArrayMaxPower():
     "Fire the ShieldArray with max power in the corner of the map"
@@ -6889,24 +6890,24 @@ def t_WeaponShieldArrayMaxPower():
     g.board[(1, 2)].createUnitHere(Unit_Flame_Mech(g))
     g.board[(2, 2)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].effects == set()
+    assert g.board[(1, 2)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # ()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 1)].unit.effects == Effects.SHIELD
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD
     assert g.board[(1, 2)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == {Effects.SHIELD}
+    assert g.board[(1, 2)].unit.effects == Effects.SHIELD
     assert g.board[(2, 2)].unit.hp == 5
-    assert g.board[(2, 2)].unit.effects == {Effects.SHIELD}
+    assert g.board[(2, 2)].unit.effects == Effects.SHIELD
 
 def t_WeaponShieldArrayCenterLow():
     "Fire the ShieldArray with no power in the center of the map"
@@ -6926,13 +6927,13 @@ def t_WeaponShieldArrayCenterLow():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(4, 4)].unit.hp == 2  # no change to the wielder
-    assert g.board[(4, 4)].unit.effects == {Effects.SHIELD}
+    assert g.board[(4, 4)].unit.effects == Effects.SHIELD
     del allunits[(4, 4)]  # delete the wielder from allunits
     for sq in (3, 4), (4, 3), (4, 5), (5, 4):
-        assert g.board[sq].unit.effects == {Effects.SHIELD}
+        assert g.board[sq].unit.effects == Effects.SHIELD
         del allunits[sq]  # delete the target unit from all
     for u in allunits:
-        assert g.board[u].unit.effects == set() # no change in effects to all other vek
+        assert g.board[u].unit.effects == 0 # no change in effects to all other vek
 
 def t_WeaponShieldArrayCenterHigh():
     "Fire the ShieldArray with power power in the center of the map"
@@ -6952,13 +6953,13 @@ def t_WeaponShieldArrayCenterHigh():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(4, 4)].unit.hp == 2  # no change to the wielder
-    assert g.board[(4, 4)].unit.effects == {Effects.SHIELD}
+    assert g.board[(4, 4)].unit.effects == Effects.SHIELD
     del allunits[(4, 4)]  # delete the wielder from allunits
     for sq in (3, 4), (4, 3), (4, 5), (5, 4), (4, 6), (5, 5), (6, 4), (5, 3), (4, 2), (3, 3), (2, 4), (3, 5):
-        assert g.board[sq].unit.effects == {Effects.SHIELD}
+        assert g.board[sq].unit.effects == Effects.SHIELD
         del allunits[sq]  # delete the target unit from all
     for u in allunits:
-        assert g.board[u].unit.effects == set() # no change in effects to all other vek
+        assert g.board[u].unit.effects == 0 # no change in effects to all other vek
 
 def t_WeaponPushBeamMountain():
     "Fire the PushBeam with a mountain blocking some of the shot"
@@ -6969,31 +6970,31 @@ def t_WeaponPushBeamMountain():
     g.board[(4, 1)].createUnitHere(Unit_Mountain(g))
     g.board[(5, 1)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(4, 1)].effects == set()
+    assert g.board[(4, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 5
-    assert g.board[(5, 1)].effects == set()
+    assert g.board[(5, 1)].effects == 0
     assert g.board[(6, 1)].unit == None
-    assert g.board[(6, 1)].effects == set()
+    assert g.board[(6, 1)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 4 # 1 bump damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 1  # 2 bump damage
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.type == 'mountaindamaged'
     assert g.board[(5, 1)].unit.hp == 5 # this unit was not pushed because of the mountain
-    assert g.board[(5, 1)].effects == set()
+    assert g.board[(5, 1)].effects == 0
 
 def t_WeaponPushBeamBuilding():
     "Fire the PushBeam with a building blocking some of the shot"
@@ -7004,30 +7005,30 @@ def t_WeaponPushBeamBuilding():
     g.board[(4, 1)].createUnitHere(Unit_Building(g))
     g.board[(5, 1)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(4, 1)].effects == set()
+    assert g.board[(4, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 5
-    assert g.board[(5, 1)].effects == set()
+    assert g.board[(5, 1)].effects == 0
     assert g.board[(6, 1)].unit == None
-    assert g.board[(6, 1)].effects == set()
+    assert g.board[(6, 1)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 4 # 1 bump damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 1  # 2 bump damage
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit == None # building destroyed
-    assert g.board[(4, 1)].effects == set()
+    assert g.board[(4, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 5 # this unit was not pushed because of the building. The building died after this square was considered for pushing
-    assert g.board[(5, 1)].effects == set()
+    assert g.board[(5, 1)].effects == 0
 
 def t_WeaponPushBeamNoMountain():
     "Fire the PushBeam with no mountain blocking it"
@@ -7037,29 +7038,29 @@ def t_WeaponPushBeamNoMountain():
     g.board[(3, 1)].createUnitHere(Unit_Flame_Mech(g))
     g.board[(5, 1)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(4, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(4, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 5
-    assert g.board[(5, 1)].effects == set()
+    assert g.board[(5, 1)].effects == 0
     assert g.board[(6, 1)].unit == None
-    assert g.board[(6, 1)].effects == set()
+    assert g.board[(6, 1)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit == None # pushed from here
     assert g.board[(3, 1)].unit.hp == 5 # to here
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 3  # flame pushed here
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(5, 1)].unit == None  # pushed from here
     assert g.board[(6, 1)].unit.hp == 5 # this unit was not pushed because of the mountain
-    assert g.board[(6, 1)].effects == set()
+    assert g.board[(6, 1)].effects == 0
 
 def t_WeaponBoosters():
     "Fire the Boosters"
@@ -7109,7 +7110,7 @@ def t_WeaponSmokeBombs1():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 1)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 5 # no damage
     assert g.board[(3, 1)].unit.hp == 2 # jet landed here
     assert g.board[(3, 1)].unit.type == 'jet'
@@ -7122,7 +7123,7 @@ def t_WeaponSmokeBombs2():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 1)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 2 # jet landed here
     assert g.board[(3, 1)].unit.type == 'jet'
@@ -7136,9 +7137,9 @@ def t_WeaponSmokeBombs3():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 2)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
+    assert g.board[(3, 1)].effects == Effects.SMOKE
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 2 # jet landed here
     assert g.board[(4, 1)].unit.type == 'jet'
@@ -7152,9 +7153,9 @@ def t_WeaponSmokeBombs4():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 2)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
+    assert g.board[(3, 1)].effects == Effects.SMOKE
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 2 # jet landed here
     assert g.board[(4, 1)].unit.type == 'jet'
@@ -7169,9 +7170,9 @@ def t_WeaponSmokeBombsForest():
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 2)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # jet moved from starting position
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}
+    assert g.board[(2, 1)].effects == Effects.SMOKE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(3, 1)].effects == {Effects.SMOKE}
+    assert g.board[(3, 1)].effects == Effects.SMOKE
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 2 # jet landed here
     assert g.board[(4, 1)].unit.type == 'jet'
@@ -7198,10 +7199,10 @@ def t_WeaponHeatConverter1():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set() # no change
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0 # no change
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
 
 def t_WeaponHeatConverter2():
     "Shoot the HeatConverter but have the fire NOT be off-board"
@@ -7209,11 +7210,11 @@ def t_WeaponHeatConverter2():
     g.board[(2, 1)].createUnitHere(Unit_Jet_Mech(g, weapon1=Weapon_HeatConverter(power1=False, power2=False)))  # power is ignored
     g.board[(2, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 2
     assert g.board[(3, 1)].unit == None
-    assert g.board[(3, 1)].effects == set() # nothing here to freeze
+    assert g.board[(3, 1)].effects == 0 # nothing here to freeze
 
 def t_WeaponSelfDestruct1():
     "Shoot SelfDestruct."
@@ -7229,10 +7230,10 @@ def t_WeaponSelfDestruct1():
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs))
     g.flushHurt()
     assert g.board[(1, 1)].unit.type == 'mechcorpse' # wielder died
-    assert g.board[(1, 1)].effects == {Effects.FIRE}  # forest caught fire
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught fire
+    assert g.board[(1, 1)].effects == Effects.FIRE  # forest caught fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught fire
     assert g.board[(2, 1)].unit == None # vek died
-    assert g.board[(1, 2)].effects == {Effects.ACID}  # forest caught fire, but then the vek died and dropped its acid here
+    assert g.board[(1, 2)].effects == Effects.ACID  # forest caught fire, but then the vek died and dropped its acid here
     assert g.board[(1, 2)].unit == None  # vek died
 
 def t_WeaponTargetedStrike1():
@@ -7248,15 +7249,15 @@ def t_WeaponTargetedStrike1():
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs))
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1 # wielder took 1 damage
-    assert g.board[(1, 1)].effects == {Effects.FIRE}  # forest did catch fire
-    assert g.board[(2, 1)].effects == set()  # forest did not catch fire
+    assert g.board[(1, 1)].effects == Effects.FIRE  # forest did catch fire
+    assert g.board[(2, 1)].effects == 0  # forest did not catch fire
     assert g.board[(2, 1)].unit == None # vek pushed from here
     assert g.board[(3, 1)].unit.hp == 5 # to here, took no damage
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(1, 2)].effects == set()  # forest did not catch fire
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(1, 2)].effects == 0  # forest did not catch fire
     assert g.board[(1, 2)].unit == None  # vek pushed from here
-    assert g.board[(1, 3)].effects == set()  # no tile effects
-    assert g.board[(1, 3)].unit.effects == {Effects.ACID} # never lost acid
+    assert g.board[(1, 3)].effects == 0  # no tile effects
+    assert g.board[(1, 3)].unit.effects == Effects.ACID # never lost acid
     assert g.board[(1, 3)].unit.hp == 5
 
 def t_WeaponSmokeDrop1():
@@ -7272,12 +7273,12 @@ def t_WeaponSmokeDrop1():
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs))
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2 # wielder took 0 damage
-    assert g.board[(1, 1)].effects == {Effects.SMOKE}  # forest did not catch fire
-    assert g.board[(2, 1)].effects == {Effects.SMOKE}  # forest did not catch fire
+    assert g.board[(1, 1)].effects == Effects.SMOKE  # forest did not catch fire
+    assert g.board[(2, 1)].effects == Effects.SMOKE  # forest did not catch fire
     assert g.board[(2, 1)].unit.hp == 5 # to here, took no damage
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 2)].effects == {Effects.SMOKE}  # forest did not catch fire
-    assert g.board[(1, 2)].unit.effects == {Effects.ACID} # never lost acid
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 2)].effects == Effects.SMOKE  # forest did not catch fire
+    assert g.board[(1, 2)].unit.effects == Effects.ACID # never lost acid
     assert g.board[(1, 2)].unit.hp == 5
 
 def t_WeaponMissileBarrageLowPower():
@@ -7293,10 +7294,10 @@ def t_WeaponMissileBarrageLowPower():
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs))
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2 # wielder untouched
-    assert g.board[(1, 1)].effects == set()  # forest untouched
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught fire
+    assert g.board[(1, 1)].effects == 0  # forest untouched
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught fire
     assert g.board[(2, 1)].unit.hp == 4 # vek took 1 damage
-    assert g.board[(1, 2)].effects == {Effects.FIRE}  # forest caught fire,
+    assert g.board[(1, 2)].effects == Effects.FIRE  # forest caught fire,
     assert g.board[(1, 2)].unit.hp == 3  # vek took 2 damage because of acid
 
 def t_WeaponMissileBarrageMaxPower():
@@ -7312,10 +7313,10 @@ def t_WeaponMissileBarrageMaxPower():
     g.board[(1, 1)].unit.weapon1.shoot(*next(gs))
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2 # wielder untouched
-    assert g.board[(1, 1)].effects == set()  # forest untouched
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # forest caught fire
+    assert g.board[(1, 1)].effects == 0  # forest untouched
+    assert g.board[(2, 1)].effects == Effects.FIRE # forest caught fire
     assert g.board[(2, 1)].unit.hp == 3 # vek took 2 damage
-    assert g.board[(1, 2)].effects == {Effects.FIRE}  # forest caught fire,
+    assert g.board[(1, 2)].effects == Effects.FIRE  # forest caught fire,
     assert g.board[(1, 2)].unit.hp == 1  # vek took 4 damage because of acid
 
 def t_WeaponWindTorrentUp():
@@ -7396,13 +7397,13 @@ def t_WeaponIceGeneratorLowPower():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(4, 4)].unit.hp == 2  # no damage to the wielder
-    assert g.board[(4, 4)].unit.effects == {Effects.ICE} # wielder now in ice
+    assert g.board[(4, 4)].unit.effects == Effects.ICE # wielder now in ice
     del allunits[(4, 4)]  # delete the wielder from allunits
     for sq in (3, 4), (4, 3), (4, 5), (5, 4):
-        assert g.board[sq].unit.effects == {Effects.ICE}
+        assert g.board[sq].unit.effects == Effects.ICE
         del allunits[sq]  # delete the target unit from all
     for u in allunits:
-        assert g.board[u].unit.effects == set() # no change in effects to all other vek
+        assert g.board[u].unit.effects == 0 # no change in effects to all other vek
 
 def t_WeaponIceGeneratorMedPower1():
     "Fire the IceGenerator with power1 in the center of the map"
@@ -7422,13 +7423,13 @@ def t_WeaponIceGeneratorMedPower1():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(4, 4)].unit.hp == 2  # no damage to the wielder
-    assert g.board[(4, 4)].unit.effects == {Effects.ICE} # wielder now in ice
+    assert g.board[(4, 4)].unit.effects == Effects.ICE # wielder now in ice
     del allunits[(4, 4)]  # delete the wielder from allunits
     for sq in (3, 4), (4, 3), (4, 5), (5, 4), (4, 6), (5, 5), (6, 4), (5, 3), (4, 2), (3, 3), (2, 4), (3, 5):
-        assert g.board[sq].unit.effects == {Effects.ICE}
+        assert g.board[sq].unit.effects == Effects.ICE
         del allunits[sq]  # delete the target unit from all
     for u in allunits:
-        assert g.board[u].unit.effects == set() # no change in effects to all other vek
+        assert g.board[u].unit.effects == 0 # no change in effects to all other vek
 
 def t_WeaponIceGeneratorMedPower2():
     "Fire the IceGenerator with power2 in the center of the map. Outcome is the same as last test"
@@ -7448,13 +7449,13 @@ def t_WeaponIceGeneratorMedPower2():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(4, 4)].unit.hp == 2  # no damage to the wielder
-    assert g.board[(4, 4)].unit.effects == {Effects.ICE} # wielder now in ice
+    assert g.board[(4, 4)].unit.effects == Effects.ICE # wielder now in ice
     del allunits[(4, 4)]  # delete the wielder from allunits
     for sq in (3, 4), (4, 3), (4, 5), (5, 4), (4, 6), (5, 5), (6, 4), (5, 3), (4, 2), (3, 3), (2, 4), (3, 5):
-        assert g.board[sq].unit.effects == {Effects.ICE}
+        assert g.board[sq].unit.effects == Effects.ICE
         del allunits[sq]  # delete the target unit from all
     for u in allunits:
-        assert g.board[u].unit.effects == set() # no change in effects to all other vek
+        assert g.board[u].unit.effects == 0 # no change in effects to all other vek
 
 def t_WeaponIceGeneratorMaxPower():
     "Fire the IceGenerator with max powerin the center of the map."
@@ -7474,13 +7475,13 @@ def t_WeaponIceGeneratorMaxPower():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(4, 4)].unit.hp == 2  # no damage to the wielder
-    assert g.board[(4, 4)].unit.effects == {Effects.ICE} # wielder now in ice
+    assert g.board[(4, 4)].unit.effects == Effects.ICE # wielder now in ice
     del allunits[(4, 4)]  # delete the wielder from allunits
     for sq in (3, 4), (4, 3), (4, 5), (5, 4), (4, 6), (5, 5), (6, 4), (5, 3), (4, 2), (3, 3), (2, 4), (3, 5), (4, 7), (5, 6), (6, 5), (7, 4), (6, 3), (5, 2), (4, 1), (3, 2), (2, 3), (1, 4), (2, 5), (3, 6):
-        assert g.board[sq].unit.effects == {Effects.ICE}
+        assert g.board[sq].unit.effects == Effects.ICE
         del allunits[sq]  # delete the target unit from all
     for u in allunits:
-        assert g.board[u].unit.effects == set() # no change in effects to all other vek
+        assert g.board[u].unit.effects == 0 # no change in effects to all other vek
 
 def t_WeaponDeployableGenSwallow():
     "Test genShots() for deployable weapons to make sure it skips over water, lava, and chasms"
@@ -7591,13 +7592,13 @@ def t_WeaponLightTankMaxPowerMiss():
     g.flushHurt()
     assert g.board[(3, 1)].unit.hp == 3  # this is the light tank
     assert g.board[(3, 1)].unit.type == 'lighttank'
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     gs = g.board[(3, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(3, 1)].unit.weapon1.shoot(*shot)  # RIGHT
     g.flushHurt()
-    assert g.board[(8, 1)].effects == {Effects.FIRE}
+    assert g.board[(8, 1)].effects == Effects.FIRE
 
 def t_WeaponShieldTankLowPower():
     "Shoot and deploy a ShieldTank with no power."
@@ -7618,7 +7619,7 @@ def t_WeaponShieldTankLowPower():
     g.board[(3, 1)].unit.weapon1.shoot(*shot)  # RIGHT
     g.flushHurt()
     assert g.board[(4, 1)].unit.hp == 5  # vek is here, but no damage done
-    assert g.board[(4, 1)].unit.effects == {Effects.SHIELD}  # vek is now shielded
+    assert g.board[(4, 1)].unit.effects == Effects.SHIELD  # vek is now shielded
 
 def t_WeaponShieldTankPower1():
     "Shoot and deploy a ShieldTank with power1."
@@ -7639,7 +7640,7 @@ def t_WeaponShieldTankPower1():
     g.board[(3, 1)].unit.weapon1.shoot(*shot)  # RIGHT
     g.flushHurt()
     assert g.board[(4, 1)].unit.hp == 5  # vek is here, but no damage done
-    assert g.board[(4, 1)].unit.effects == {Effects.SHIELD}  # vek is now shielded
+    assert g.board[(4, 1)].unit.effects == Effects.SHIELD  # vek is now shielded
 
 def t_WeaponShieldTankPower1Miss():
     "Shoot and deploy a ShieldTank with power1 but with the vek out of range."
@@ -7683,7 +7684,7 @@ def t_WeaponShieldTankMaxPower():
     g.board[(3, 1)].unit.weapon1.shoot(*shot)  # RIGHT
     g.flushHurt()
     assert g.board[(5, 1)].unit.hp == 5  # vek is here, but no damage done
-    assert g.board[(5, 1)].unit.effects == {Effects.SHIELD}  # vek is now shielded
+    assert g.board[(5, 1)].unit.effects == Effects.SHIELD  # vek is now shielded
 
 def t_WeaponShieldTankMaxPowerMiss():
     "Shoot and deploy a ShieldTank with max power but without a vek to hit."
@@ -7717,7 +7718,7 @@ def t_WeaponAcidTankLowPower():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(4, 1)].unit.hp == 5  # vek untouched
-    assert g.board[(4, 1)].unit.effects == set()  # vek untouched
+    assert g.board[(4, 1)].unit.effects == 0  # vek untouched
     assert g.board[(3, 1)].unit.hp == 1  # this is the acidtank
     assert g.board[(3, 1)].unit.type == 'acidtank'
     gs = g.board[(3, 1)].unit.weapon1.genShots()
@@ -7726,7 +7727,7 @@ def t_WeaponAcidTankLowPower():
     g.board[(3, 1)].unit.weapon1.shoot(*shot)  # RIGHT
     g.flushHurt()
     assert g.board[(4, 1)].unit.hp == 5  # no damage done
-    assert g.board[(4, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(4, 1)].unit.effects == Effects.ACID
 
 def t_WeaponAcidTank1Power():
     "Shoot and deploy a AcidTank with power 1 powered for more hp."
@@ -7739,7 +7740,7 @@ def t_WeaponAcidTank1Power():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(4, 1)].unit.hp == 5  # vek untouched
-    assert g.board[(4, 1)].unit.effects == set()  # vek untouched
+    assert g.board[(4, 1)].unit.effects == 0  # vek untouched
     assert g.board[(3, 1)].unit.hp == 3  # this is the acidtank
     assert g.board[(3, 1)].unit.type == 'acidtank'
     gs = g.board[(3, 1)].unit.weapon1.genShots()
@@ -7748,7 +7749,7 @@ def t_WeaponAcidTank1Power():
     g.board[(3, 1)].unit.weapon1.shoot(*shot)  # RIGHT
     g.flushHurt()
     assert g.board[(4, 1)].unit.hp == 5  # no damage done
-    assert g.board[(4, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(4, 1)].unit.effects == Effects.ACID
 
 def t_WeaponAcidTankPower2():
     "Shoot and deploy a AcidTank with power2 activated for pushing."
@@ -7770,7 +7771,7 @@ def t_WeaponAcidTankPower2():
     g.flushHurt()
     assert not g.board[(4, 1)].unit  # vek pushed from here
     assert g.board[(5, 1)].unit.hp == 5  # vek pushed here
-    assert g.board[(5, 1)].unit.effects == {Effects.ACID} # vek pushed here
+    assert g.board[(5, 1)].unit.effects == Effects.ACID # vek pushed here
 
 def t_WeaponAcidTankMaxPower():
     "Shoot and deploy a AcidTank with Max power."
@@ -7792,7 +7793,7 @@ def t_WeaponAcidTankMaxPower():
     g.flushHurt()
     assert not g.board[(4, 1)].unit  # vek pushed from here
     assert g.board[(5, 1)].unit.hp == 5  # vek pushed here
-    assert g.board[(5, 1)].unit.effects == {Effects.ACID}  # vek pushed here
+    assert g.board[(5, 1)].unit.effects == Effects.ACID  # vek pushed here
 
 def t_WeaponAcidTankMaxPowerMiss():
     "Shoot and deploy a AcidTank with Max power with no vek to hit."
@@ -7806,13 +7807,13 @@ def t_WeaponAcidTankMaxPowerMiss():
     g.flushHurt()
     assert g.board[(3, 1)].unit.hp == 3  # this is the acidtank
     assert g.board[(3, 1)].unit.type == 'acidtank'
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     gs = g.board[(3, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(3, 1)].unit.weapon1.shoot(*shot)  # RIGHT
     g.flushHurt()
-    assert g.board[(8, 1)].effects == {Effects.ACID}
+    assert g.board[(8, 1)].effects == Effects.ACID
 
 def t_WeaponPullTankLowPower():
     "Shoot and deploy a PullTank with no power."
@@ -7825,10 +7826,10 @@ def t_WeaponPullTankLowPower():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(5, 1)].unit.hp == 5  # vek untouched
-    assert g.board[(5, 1)].unit.effects == set()  # vek untouched
+    assert g.board[(5, 1)].unit.effects == 0  # vek untouched
     assert g.board[(3, 1)].unit.hp == 1  # this is the PullTank
     assert g.board[(3, 1)].unit.type == 'pulltank'
-    assert g.board[(3, 1)].unit.attributes == set()
+    assert g.board[(3, 1)].unit.attributes == 0
     gs = g.board[(3, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
@@ -7836,7 +7837,7 @@ def t_WeaponPullTankLowPower():
     g.flushHurt()
     assert not g.board[(5, 1)].unit # vek pulled from here
     assert g.board[(4, 1)].unit.hp == 5  # no damage done
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
 
 def t_WeaponPullTank1Power():
     "Shoot and deploy a PullTank with power 1 powered for more hp."
@@ -7849,10 +7850,10 @@ def t_WeaponPullTank1Power():
     g.board[(1, 1)].unit.weapon1.shoot(*shot) # RIGHT, 2
     g.flushHurt()
     assert g.board[(5, 1)].unit.hp == 5  # vek untouched
-    assert g.board[(5, 1)].unit.effects == set()  # vek untouched
+    assert g.board[(5, 1)].unit.effects == 0  # vek untouched
     assert g.board[(3, 1)].unit.hp == 3  # this is the PullTank
     assert g.board[(3, 1)].unit.type == 'pulltank'
-    assert g.board[(3, 1)].unit.attributes == set()
+    assert g.board[(3, 1)].unit.attributes == 0
     gs = g.board[(3, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
@@ -7860,7 +7861,7 @@ def t_WeaponPullTank1Power():
     g.flushHurt()
     assert not g.board[(5, 1)].unit  # vek pulled from here
     assert g.board[(4, 1)].unit.hp == 5  # no damage done
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
 
 def t_WeaponPullTankPower2():
     "Shoot and deploy a PullTank with power2 activated for flying."
@@ -7875,7 +7876,7 @@ def t_WeaponPullTankPower2():
     assert g.board[(5, 1)].unit.hp == 5  # vek untouched
     assert g.board[(3, 1)].unit.hp == 1  # this is the PullTank
     assert g.board[(3, 1)].unit.type == 'pulltank'
-    assert g.board[(3, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(3, 1)].unit.attributes == Attributes.FLYING
     gs = g.board[(3, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
@@ -7883,7 +7884,7 @@ def t_WeaponPullTankPower2():
     g.flushHurt()
     assert not g.board[(5, 1)].unit  # vek pulled from here
     assert g.board[(4, 1)].unit.hp == 5  # vek pushed here
-    assert g.board[(4, 1)].unit.effects == set() # vek pushed here
+    assert g.board[(4, 1)].unit.effects == 0 # vek pushed here
 
 def t_WeaponPullTankMaxPower():
     "Shoot and deploy a PullTank with Max power."
@@ -7898,7 +7899,7 @@ def t_WeaponPullTankMaxPower():
     assert g.board[(5, 1)].unit.hp == 5  # vek untouched
     assert g.board[(3, 1)].unit.hp == 3  # this is the PullTank
     assert g.board[(3, 1)].unit.type == 'pulltank'
-    assert g.board[(3, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(3, 1)].unit.attributes == Attributes.FLYING
     gs = g.board[(3, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
@@ -7906,7 +7907,7 @@ def t_WeaponPullTankMaxPower():
     g.flushHurt()
     assert not g.board[(5, 1)].unit  # vek pulled from here
     assert g.board[(4, 1)].unit.hp == 5  # vek pushed here
-    assert g.board[(4, 1)].unit.effects == set()  # vek pushed here
+    assert g.board[(4, 1)].unit.effects == 0  # vek pushed here
 
 def t_WeaponPullTankMaxPowerMiss():
     "Shoot and deploy a PullTank with Max power with no vek to hit."
@@ -7920,8 +7921,8 @@ def t_WeaponPullTankMaxPowerMiss():
     g.flushHurt()
     assert g.board[(3, 1)].unit.hp == 3  # this is the PullTank
     assert g.board[(3, 1)].unit.type == 'pulltank'
-    assert g.board[(3, 1)].unit.attributes == {Attributes.FLYING}
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(3, 1)].unit.attributes == Attributes.FLYING
+    assert g.board[(8, 1)].effects == 0
     gs = g.board[(3, 1)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
@@ -7936,20 +7937,20 @@ def t_WeaponRepair():
     "Have a unit take damage and then repair."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g, hp=10, maxhp=10)) # no weapons added, unit should have a Weapon_Repair set as it's default repweapon
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 10
     g.board[(1, 1)].takeDamage(3)
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 7 # took 3 damage
     gs = g.board[(1, 1)].unit.repweapon.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.repweapon.shoot(*shot) # ()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 8  # repaired 1 damage
 
 def t_WeaponRepairFire():
@@ -7957,20 +7958,20 @@ def t_WeaponRepairFire():
     g = Game()
     g.board[(1, 1)].replaceTile(Tile_Forest(g))
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g, hp=10, maxhp=10)) # no weapons added, unit should have a Weapon_Repair set as it's default repweapon
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 10
     g.board[(1, 1)].takeDamage(3)
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE
     assert g.board[(1, 1)].unit.hp == 7 # took 3 damage
     gs = g.board[(1, 1)].unit.repweapon.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.repweapon.shoot(*shot) # ()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 8  # repaired 1 damage
 
 def t_WeaponRepairAcid():
@@ -7978,20 +7979,20 @@ def t_WeaponRepairAcid():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g, hp=10, maxhp=10)) # no weapons added, unit should have a Weapon_Repair set as it's default repweapon
     g.board[(1, 1)].applyAcid()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
     assert g.board[(1, 1)].unit.hp == 10
     g.board[(1, 1)].takeDamage(3)
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
     assert g.board[(1, 1)].unit.hp == 4 # took 6 damage
     gs = g.board[(1, 1)].unit.repweapon.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.repweapon.shoot(*shot) # ()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 5  # repaired 1 damage
 
 def t_WeaponRepairIce():
@@ -7999,16 +8000,16 @@ def t_WeaponRepairIce():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g, hp=10, maxhp=10)) # no weapons added, unit should have a Weapon_Repair set as it's default repweapon
     g.board[(1, 1)].applyIce()
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
     assert g.board[(1, 1)].unit.hp == 10
     gs = g.board[(1, 1)].unit.repweapon.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.repweapon.shoot(*shot) # ()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set() # no more ice
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0 # no more ice
     assert g.board[(1, 1)].unit.hp == 10  # hp was never lost and we didn't repair over the max
 
 def t_WeaponFrenziedRepair():
@@ -8016,23 +8017,23 @@ def t_WeaponFrenziedRepair():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g, repweapon=Weapon_FrenziedRepair(), hp=10, maxhp=10))
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 10
     g.board[(1, 1)].takeDamage(3)
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 7 # took 3 damage
     gs = g.board[(1, 1)].unit.repweapon.genShots()
     for shot in range(1):
         shot = next(gs)
     g.board[(1, 1)].unit.repweapon.shoot(*shot) # ()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 8  # repaired 1 damage
     assert g.board[(2, 1)].unit == None  # vek pushed from here
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 5
 
 def t_WeaponMantisSlash():
@@ -8040,23 +8041,23 @@ def t_WeaponMantisSlash():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g, repweapon=Weapon_MantisSlash(), hp=10, maxhp=10))
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 10
     g.board[(1, 1)].takeDamage(3)
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 7 # took 3 damage
     gs = g.board[(1, 1)].unit.repweapon.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.repweapon.shoot(*shot) # (RIGHT,)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 7  # repaired 0 damage
     assert g.board[(2, 1)].unit == None  # vek pushed from here
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 3 # vek took 2 damage
 
 def t_WeaponMantisSlashIce():
@@ -8064,23 +8065,23 @@ def t_WeaponMantisSlashIce():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Jet_Mech(g, repweapon=Weapon_MantisSlash(), hp=10, maxhp=10))
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g))
-    assert g.board[(1, 1)].effects == set() # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0 # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 10
     g.board[(1, 1)].applyIce()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
     assert g.board[(1, 1)].unit.hp == 10 # unit wasn't attacked at all this time
     gs = g.board[(1, 1)].unit.repweapon.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(1, 1)].unit.repweapon.shoot(*shot) # (RIGHT,)
     g.flushHurt()
-    assert g.board[(1, 1)].effects == set()  # no tile effects
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 10  # repaired 0 damage
     assert g.board[(2, 1)].unit == None  # vek pushed from here
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 3 # vek took 2 damage
 
 def t_WeaponUnstableGuts():
@@ -8106,7 +8107,7 @@ def t_WeaponUnstableGutsShielded():
     g.board[(3, 1)].createUnitHere(Unit_AlphaScorpion(g))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD
     assert g.board[(3, 1)].unit.hp == 5
     g.board[(2, 1)].unit.weapon1.shoot() # ()
     g.flushHurt()
@@ -8217,14 +8218,14 @@ def t_WeaponStingingSpinneret():
     g.board[(2, 1)].createUnitHere(Unit_Scorpion(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 4  # wielder took 1 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 # def t_WeaponStingingSpinneretAcid(): # acid units aren't really implemented in the game
 #     "Have an  AcidScorpion do his attack"
@@ -8233,14 +8234,14 @@ def t_WeaponStingingSpinneret():
 #     g.board[(2, 1)].createUnitHere(Unit_AcidScorpion(g, qshot=(Direction.LEFT,)))
 #     assert g.board[(1, 1)].unit.hp == 5
 #     assert g.board[(2, 1)].unit.hp == 4
-#     assert g.board[(1, 1)].unit.effects == set()
-#     assert g.board[(2, 1)].unit.effects == set()
+#     assert g.board[(1, 1)].unit.effects == 0
+#     assert g.board[(2, 1)].unit.effects == 0
 #     g.board[(2, 1)].unit.weapon1.shoot()
 #     g.flushHurt()
 #     assert g.board[(1, 1)].unit.hp == 4  # wielder took 1 damage
-#     assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+#     assert g.board[(1, 1)].unit.effects == Effects.ACID
 #     assert g.board[(2, 1)].unit.hp == 4 # vek took no damage
-#     assert g.board[(2, 1)].unit.effects == set()
+#     assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponGoringSpinneret():
     "Have an AlphaScorpion do his attack"
@@ -8249,14 +8250,14 @@ def t_WeaponGoringSpinneret():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took 3 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponAcceleratingThorax():
     "Have a Firefly do his attack against our mech"
@@ -8266,15 +8267,15 @@ def t_WeaponAcceleratingThorax():
     g.board[(2, 1)].createUnitHere(Unit_Firefly(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 4  # wielder took 1 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == set() # forest did not catch on fire
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == 0 # forest did not catch on fire
 
 def t_WeaponAcceleratingThoraxFlip():
     "Have a Firefly do his attack but it got flipped and hit the forest instead"
@@ -8284,16 +8285,16 @@ def t_WeaponAcceleratingThoraxFlip():
     g.board[(2, 1)].createUnitHere(Unit_Firefly(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5  # wielder took 0 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == {Effects.FIRE} # forest did catch on fire
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == Effects.FIRE # forest did catch on fire
 
 def t_WeaponAcceleratingThoraxInvalidFlip():
     "Have a Firefly do his attack but it got flipped and invalidated instead"
@@ -8303,17 +8304,17 @@ def t_WeaponAcceleratingThoraxInvalidFlip():
     g.board[(2, 1)].createUnitHere(Unit_Firefly(g, qshot=(Direction.UP,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     assert g.board[(2, 1)].unit.weapon1.qshot is None
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5  # wielder took 0 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == set() # forest did not catch on fire
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == 0 # forest did not catch on fire
 
 # def t_WeaponAcceleratingThoraxAcid(): # acid units aren't really implemented in the game
 #     "Have an AcidFirefly do his attack against our mech"
@@ -8323,15 +8324,15 @@ def t_WeaponAcceleratingThoraxInvalidFlip():
 #     g.board[(2, 1)].createUnitHere(Unit_AcidFirefly(g, qshot=(Direction.LEFT,)))
 #     assert g.board[(1, 1)].unit.hp == 5
 #     assert g.board[(2, 1)].unit.hp == 3
-#     assert g.board[(1, 1)].unit.effects == set()
-#     assert g.board[(2, 1)].unit.effects == set()
+#     assert g.board[(1, 1)].unit.effects == 0
+#     assert g.board[(2, 1)].unit.effects == 0
 #     g.board[(2, 1)].unit.weapon1.shoot()
 #     g.flushHurt()
 #     assert g.board[(1, 1)].unit.hp == 4  # wielder took 1 damage
-#     assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+#     assert g.board[(1, 1)].unit.effects == Effects.ACID
 #     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-#     assert g.board[(2, 1)].unit.effects == set()
-#     assert g.board[(8, 1)].effects == set() # forest did not catch on fire
+#     assert g.board[(2, 1)].unit.effects == 0
+#     assert g.board[(8, 1)].effects == 0 # forest did not catch on fire
 
 # def t_WeaponAcceleratingThoraxAcidFlip(): # acid units aren't really implemented in the game
 #     "Have an AcidFirefly do his attack but it got flipped and hit the forest instead"
@@ -8341,16 +8342,16 @@ def t_WeaponAcceleratingThoraxInvalidFlip():
 #     g.board[(2, 1)].createUnitHere(Unit_AcidFirefly(g, qshot=(Direction.LEFT,)))
 #     assert g.board[(1, 1)].unit.hp == 5
 #     assert g.board[(2, 1)].unit.hp == 3
-#     assert g.board[(1, 1)].unit.effects == set()
-#     assert g.board[(2, 1)].unit.effects == set()
+#     assert g.board[(1, 1)].unit.effects == 0
+#     assert g.board[(2, 1)].unit.effects == 0
 #     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
 #     g.board[(2, 1)].unit.weapon1.shoot()
 #     g.flushHurt()
 #     assert g.board[(1, 1)].unit.hp == 5  # wielder took 0 damage
-#     assert g.board[(1, 1)].unit.effects == set()
+#     assert g.board[(1, 1)].unit.effects == 0
 #     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-#     assert g.board[(2, 1)].unit.effects == set()
-#     assert g.board[(8, 1)].effects == {Effects.ACID} # forest erased by acid
+#     assert g.board[(2, 1)].unit.effects == 0
+#     assert g.board[(8, 1)].effects == Effects.ACID # forest erased by acid
 
 # def t_WeaponAcceleratingThoraxAcidInvalidFlip(): # acid units aren't really implemented in the game
 #     "Have an AcidFirefly do his attack but it got flipped and invalidated instead"
@@ -8360,17 +8361,17 @@ def t_WeaponAcceleratingThoraxInvalidFlip():
 #     g.board[(2, 1)].createUnitHere(Unit_AcidFirefly(g, qshot=(Direction.UP,)))
 #     assert g.board[(1, 1)].unit.hp == 5
 #     assert g.board[(2, 1)].unit.hp == 3
-#     assert g.board[(1, 1)].unit.effects == set()
-#     assert g.board[(2, 1)].unit.effects == set()
+#     assert g.board[(1, 1)].unit.effects == 0
+#     assert g.board[(2, 1)].unit.effects == 0
 #     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
 #     assert g.board[(2, 1)].unit.weapon1.qshot is None
 #     g.board[(2, 1)].unit.weapon1.shoot()
 #     g.flushHurt()
 #     assert g.board[(1, 1)].unit.hp == 5  # wielder took 0 damage
-#     assert g.board[(1, 1)].unit.effects == set()
+#     assert g.board[(1, 1)].unit.effects == 0
 #     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-#     assert g.board[(2, 1)].unit.effects == set()
-#     assert g.board[(8, 1)].effects == set() # forest did not catch on fire
+#     assert g.board[(2, 1)].unit.effects == 0
+#     assert g.board[(8, 1)].effects == 0 # forest did not catch on fire
 
 def t_WeaponEnhancedThorax():
     "Have an AlphaFirefly do his attack against our mech"
@@ -8380,15 +8381,15 @@ def t_WeaponEnhancedThorax():
     g.board[(2, 1)].createUnitHere(Unit_AlphaFirefly(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took 3 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == set() # forest did not catch on fire
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == 0 # forest did not catch on fire
 
 def t_WeaponEnhancedThoraxFlip():
     "Have an AlphaFirefly do his attack but it got flipped and hit the forest instead"
@@ -8398,16 +8399,16 @@ def t_WeaponEnhancedThoraxFlip():
     g.board[(2, 1)].createUnitHere(Unit_AlphaFirefly(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5  # wielder took 0 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == {Effects.FIRE} # forest did catch on fire
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == Effects.FIRE # forest did catch on fire
 
 def t_WeaponEnhancedThoraxInvalidFlip():
     "Have an AlphaFirefly do his attack but it got flipped and invalidated instead"
@@ -8417,17 +8418,17 @@ def t_WeaponEnhancedThoraxInvalidFlip():
     g.board[(2, 1)].createUnitHere(Unit_AlphaFirefly(g, qshot=(Direction.UP,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT)
     assert g.board[(2, 1)].unit.weapon1.qshot is None
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5  # wielder took 0 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == set() # forest did not catch on fire
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == 0 # forest did not catch on fire
 
 def t_WeaponFangs():
     "Have a Leaper do his attack"
@@ -8436,14 +8437,14 @@ def t_WeaponFangs():
     g.board[(2, 1)].createUnitHere(Unit_Leaper(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2  # wielder took 3 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 1 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponSharpenedFangs():
     "Have an AlphaLeaper do his attack"
@@ -8452,14 +8453,14 @@ def t_WeaponSharpenedFangs():
     g.board[(2, 1)].createUnitHere(Unit_AlphaLeaper(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 6
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1  # wielder took 5 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponPincersNormal():
     "Have a Beetle do his attack against a unit"
@@ -8468,53 +8469,53 @@ def t_WeaponPincersNormal():
     g.board[(1, 1)].createUnitHere(Unit_Beetle(g, qshot=(Direction.RIGHT,)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # vek dashed from here
     assert g.board[(7, 1)].unit.hp == 5  # mech took 1 damage
-    assert g.board[(7, 1)].unit.effects == set()
+    assert g.board[(7, 1)].unit.effects == 0
     assert g.board[(5, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(5, 1)].unit.effects == set()
+    assert g.board[(5, 1)].unit.effects == 0
 
 def t_WeaponPincersMine():
     "Have a Beetle do his attack against a unit but there's a mine in the way"
     g = Game()
     g.board[(6, 1)].createUnitHere(Unit_TechnoHornet_Mech(g, weapon1=Weapon_RainingDeath(power1=False, power2=False), hp=6, maxhp=6)) # extra hp given
     g.board[(1, 1)].createUnitHere(Unit_Beetle(g, qshot=(Direction.RIGHT,)))
-    g.board[(4, 1)].effects.add(Effects.MINE)
+    g.board[(4, 1)].effects |= Effects.MINE
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # vek dashed from here
     assert g.board[(7, 1)].unit.hp == 5  # mech took 1 damage
-    assert g.board[(7, 1)].unit.effects == set()
+    assert g.board[(7, 1)].unit.effects == 0
     assert g.board[(5, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(5, 1)].unit.effects == set()  # vek froze from the mine and took no damage
-    assert g.board[(4, 1)].effects == {Effects.MINE} # mine is still there
+    assert g.board[(5, 1)].unit.effects == 0  # vek froze from the mine and took no damage
+    assert g.board[(4, 1)].effects == Effects.MINE # mine is still there
 
 def t_WeaponPincersFreezeMine():
     "Have a Beetle do his attack against a unit but there's a freezemine in the way which it goes over"
     g = Game()
     g.board[(6, 1)].createUnitHere(Unit_TechnoHornet_Mech(g, weapon1=Weapon_RainingDeath(power1=False, power2=False), hp=6, maxhp=6)) # extra hp given
     g.board[(1, 1)].createUnitHere(Unit_Beetle(g, qshot=(Direction.RIGHT,)))
-    g.board[(4, 1)].effects.add(Effects.FREEZEMINE)
+    g.board[(4, 1)].effects |= Effects.FREEZEMINE
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # vek dashed from here
     assert g.board[(7, 1)].unit.hp == 5  # mech took 1 damage
-    assert g.board[(7, 1)].unit.effects == set()
+    assert g.board[(7, 1)].unit.effects == 0
     assert g.board[(5, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(5, 1)].unit.effects == set()  # vek froze from the mine and took no damage
-    assert g.board[(4, 1)].effects == {Effects.FREEZEMINE} # mine is still there
+    assert g.board[(5, 1)].unit.effects == 0  # vek froze from the mine and took no damage
+    assert g.board[(4, 1)].effects == Effects.FREEZEMINE # mine is still there
 
 def t_WeaponPincersWater():
     "Have a Beetle do his attack against a unit but there's a water tile in the way"
@@ -8524,15 +8525,15 @@ def t_WeaponPincersWater():
     g.board[(4, 1)].replaceTile(Tile_Water(g))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # vek dashed from here
     assert g.board[(6, 1)].unit.hp == 6  # mech took NO damage
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit == None # vek died in the water
-    assert g.board[(4, 1)].effects == {Effects.SUBMERGED} # water still wet
+    assert g.board[(4, 1)].effects == Effects.SUBMERGED # water still wet
 
 def t_WeaponPincersLava():
     "Have a Beetle do his attack against a unit but there's a Lava tile in the way"
@@ -8542,15 +8543,15 @@ def t_WeaponPincersLava():
     g.board[(4, 1)].replaceTile(Tile_Lava(g))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # vek dashed from here
     assert g.board[(6, 1)].unit.hp == 6  # mech took NO damage
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit == None # vek died in the lava
-    assert g.board[(4, 1)].effects == {Effects.SUBMERGED, Effects.FIRE} # water still wet
+    assert g.board[(4, 1)].effects == Effects.SUBMERGED | Effects.FIRE # water still wet
 
 def t_WeaponPincersChasm():
     "Have a Beetle do his attack against a unit but there's a chasm tile in the way"
@@ -8560,15 +8561,15 @@ def t_WeaponPincersChasm():
     g.board[(4, 1)].replaceTile(Tile_Chasm(g))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # vek dashed from here
     assert g.board[(6, 1)].unit.hp == 6  # mech took NO damage
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit == None # vek died in the chasm
-    assert g.board[(4, 1)].effects == set() # never had effects
+    assert g.board[(4, 1)].effects == 0 # never had effects
 
 def t_WeaponPincersFlip():
     "Have a Beetle do his attack against a unit but it gets flipped and invalidated"
@@ -8577,16 +8578,16 @@ def t_WeaponPincersFlip():
     g.board[(1, 1)].createUnitHere(Unit_Beetle(g, qshot=(Direction.RIGHT,)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.flip()
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.weapon1.qshot is None
     assert g.board[(6, 1)].unit.hp == 6  # mech took NO damage
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 4 # vek didn't move
-    assert g.board[(1, 1)].effects == set() # never had effects
+    assert g.board[(1, 1)].effects == 0 # never had effects
 
 def t_WeaponSharpenedPincersNormal():
     "Have an AlphaBeetle do his attack against a unit"
@@ -8595,15 +8596,15 @@ def t_WeaponSharpenedPincersNormal():
     g.board[(1, 1)].createUnitHere(Unit_AlphaBeetle(g, qshot=(Direction.RIGHT,)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 5
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit == None # vek dashed from here
     assert g.board[(7, 1)].unit.hp == 3  # mech took 3 damage
-    assert g.board[(7, 1)].unit.effects == set()
+    assert g.board[(7, 1)].unit.effects == 0
     assert g.board[(5, 1)].unit.hp == 5 # vek took no damage
-    assert g.board[(5, 1)].unit.effects == set()
+    assert g.board[(5, 1)].unit.effects == 0
 
 def t_WeaponSpittingGlandsNormal():
     "Have a Scarab do his attack against a unit"
@@ -8612,14 +8613,14 @@ def t_WeaponSpittingGlandsNormal():
     g.board[(1, 1)].createUnitHere(Unit_Scarab(g, qshot=(Direction.RIGHT, 5)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(6, 1)].unit.hp == 5  # mech took 1 damage
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2 # vek took no damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_WeaponSpittingGlandsFlip():
     "Have a Scarab do his attack against a unit but it got flipped and did nothing"
@@ -8628,15 +8629,15 @@ def t_WeaponSpittingGlandsFlip():
     g.board[(1, 1)].createUnitHere(Unit_Scarab(g, qshot=(Direction.RIGHT, 5)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.flip()
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(6, 1)].unit.hp == 6  # mech took 0 damage
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 2 # vek took no damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_WeaponSpittingGlandsFlipValid():
     "Have a Scarab do his attack against a unit but it got flipped and hit a different tile"
@@ -8656,14 +8657,14 @@ def t_WeaponAlphaSpittingGlandsNormal():
     g.board[(1, 1)].createUnitHere(Unit_AlphaScarab(g, qshot=(Direction.RIGHT, 5)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(1, 1)].unit.hp == 4
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(6, 1)].unit.hp == 3  # mech took 3 damage
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(1, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
 
 def t_WeaponExplosiveExpulsionsNormal():
     "Have a Crab do his attack against 2 units"
@@ -8702,16 +8703,16 @@ def t_WeaponAcidicVomit():
     g.board[(2, 1)].createUnitHere(Unit_Centipede(g, qshot=(Direction.RIGHT,)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(6, 2)].effects == set() # no tile effects next to mech
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(6, 2)].effects == 0 # no tile effects next to mech
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 3  # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # vek picked up no new effects
+    assert g.board[(2, 1)].unit.effects == 0  # vek picked up no new effects
     assert g.board[(6, 1)].unit.hp == 5  # mech took 1 damage
-    assert g.board[(6, 1)].unit.effects == {Effects.ACID} # and now has acid
-    assert g.board[(6, 2)].effects == {Effects.ACID}  # tile next to mech now has acid
+    assert g.board[(6, 1)].unit.effects == Effects.ACID # and now has acid
+    assert g.board[(6, 2)].effects == Effects.ACID  # tile next to mech now has acid
 
 def t_WeaponAcidicVomitFlipped():
     "Have a Centipede do his attack but he got flipped"
@@ -8720,19 +8721,19 @@ def t_WeaponAcidicVomitFlipped():
     g.board[(2, 1)].createUnitHere(Unit_Centipede(g, qshot=(Direction.RIGHT,)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(6, 2)].effects == set() # no tile effects next to mech
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(6, 2)].effects == 0 # no tile effects next to mech
     g.board[(2, 1)].unit.weapon1.flip()
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 3  # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # vek picked up no new effects
+    assert g.board[(2, 1)].unit.effects == 0  # vek picked up no new effects
     assert g.board[(6, 1)].unit.hp == 6  # mech took 0 damage
-    assert g.board[(6, 1)].unit.effects == set() # and didn't get acid
-    assert g.board[(6, 2)].effects == set()  # tile next to mech unaffected
-    assert g.board[(1, 1)].effects == {Effects.ACID}  # tile now has acid
-    assert g.board[(1, 2)].effects == {Effects.ACID}  # tile now has acid
+    assert g.board[(6, 1)].unit.effects == 0 # and didn't get acid
+    assert g.board[(6, 2)].effects == 0  # tile next to mech unaffected
+    assert g.board[(1, 1)].effects == Effects.ACID  # tile now has acid
+    assert g.board[(1, 2)].effects == Effects.ACID  # tile now has acid
 
 def t_WeaponCorrosiveVomit():
     "Have an AlphaCentipede do his attack against a unit"
@@ -8741,16 +8742,16 @@ def t_WeaponCorrosiveVomit():
     g.board[(2, 1)].createUnitHere(Unit_AlphaCentipede(g, qshot=(Direction.RIGHT,)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(6, 2)].effects == set() # no tile effects next to mech
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(6, 2)].effects == 0 # no tile effects next to mech
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 5  # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # vek picked up no new effects
+    assert g.board[(2, 1)].unit.effects == 0  # vek picked up no new effects
     assert g.board[(6, 1)].unit.hp == 4  # mech took 2 damage
-    assert g.board[(6, 1)].unit.effects == {Effects.ACID} # and now has acid
-    assert g.board[(6, 2)].effects == {Effects.ACID}  # tile next to mech now has acid
+    assert g.board[(6, 1)].unit.effects == Effects.ACID # and now has acid
+    assert g.board[(6, 2)].effects == Effects.ACID  # tile next to mech now has acid
 
 def t_WeaponCorrosiveVomitFlipped():
     "Have an AlphaCentipede do his attack but he got flipped"
@@ -8759,19 +8760,19 @@ def t_WeaponCorrosiveVomitFlipped():
     g.board[(2, 1)].createUnitHere(Unit_AlphaCentipede(g, qshot=(Direction.RIGHT,)))
     assert g.board[(6, 1)].unit.hp == 6
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(6, 2)].effects == set() # no tile effects next to mech
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(6, 2)].effects == 0 # no tile effects next to mech
     g.board[(2, 1)].unit.weapon1.flip()
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 5  # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # vek picked up no new effects
+    assert g.board[(2, 1)].unit.effects == 0  # vek picked up no new effects
     assert g.board[(6, 1)].unit.hp == 6  # mech took 0 damage
-    assert g.board[(6, 1)].unit.effects == set() # and didn't get acid
-    assert g.board[(6, 2)].effects == set()  # tile next to mech unaffected
-    assert g.board[(1, 1)].effects == {Effects.ACID}  # tile now has acid
-    assert g.board[(1, 2)].effects == {Effects.ACID}  # tile now has acid
+    assert g.board[(6, 1)].unit.effects == 0 # and didn't get acid
+    assert g.board[(6, 2)].effects == 0  # tile next to mech unaffected
+    assert g.board[(1, 1)].effects == Effects.ACID  # tile now has acid
+    assert g.board[(1, 2)].effects == Effects.ACID  # tile now has acid
 
 def t_WeaponDiggingTusks():
     "Have a digger do its thing"
@@ -8831,14 +8832,14 @@ def t_WeaponStinger():
     g.board[(2, 1)].createUnitHere(Unit_Hornet(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 4  # wielder took 1 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 2 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 # def t_WeaponStingerAcid(): # acid units aren't really implemented in the game
 #     "Have an  AcidHornet do his attack"
@@ -8847,14 +8848,14 @@ def t_WeaponStinger():
 #     g.board[(2, 1)].createUnitHere(Unit_AcidHornet(g, qshot=(Direction.LEFT,)))
 #     assert g.board[(1, 1)].unit.hp == 5
 #     assert g.board[(2, 1)].unit.hp == 3
-#     assert g.board[(1, 1)].unit.effects == set()
-#     assert g.board[(2, 1)].unit.effects == set()
+#     assert g.board[(1, 1)].unit.effects == 0
+#     assert g.board[(2, 1)].unit.effects == 0
 #     g.board[(2, 1)].unit.weapon1.shoot()
 #     g.flushHurt()
 #     assert g.board[(1, 1)].unit.hp == 4  # wielder took 1 damage
-#     assert g.board[(1, 1)].unit.effects == {Effects.ACID}
+#     assert g.board[(1, 1)].unit.effects == Effects.ACID
 #     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-#     assert g.board[(2, 1)].unit.effects == set()
+#     assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponLaunchingStinger():
     "Have an AlphaHornet do his attack but the secondary tile is offboard"
@@ -8863,14 +8864,14 @@ def t_WeaponLaunchingStinger():
     g.board[(2, 1)].createUnitHere(Unit_AlphaHornet(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponLaunchingStinger2():
     "Have an AlphaHornet do his attack where he actually hits 2 tiles"
@@ -8881,17 +8882,17 @@ def t_WeaponLaunchingStinger2():
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 4
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     g.board[(3, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(2, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
 
 def t_WeaponLaunchingStinger3():
     "Have an AlphaHornet do his attack where he actually hits 2 tiles and doesn't hit a third unit that is present"
@@ -8904,20 +8905,20 @@ def t_WeaponLaunchingStinger3():
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 4
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     g.board[(4, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5  # mech took NO damage
     assert g.board[(2, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(3, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
 
 def t_WeaponLaunchingStingerFlip():
     "Have an AlphaHornet do his attack where he was going to miss but flipping makes him hit"
@@ -8928,18 +8929,18 @@ def t_WeaponLaunchingStingerFlip():
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 4
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     g.board[(3, 1)].unit.weapon1.flip()
     g.board[(3, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(2, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
 
 def t_WeaponLaunchingStingerFlipInvalidated():
     "Have an AlphaHornet do his attack where he was going to miss but flipping makes him cancel his shot"
@@ -8950,9 +8951,9 @@ def t_WeaponLaunchingStingerFlipInvalidated():
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 4
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.weapon1.qshot == (Direction.UP,)
     g.board[(3, 1)].unit.weapon1.flip()
     assert g.board[(3, 1)].unit.weapon1.qshot == None
@@ -8960,10 +8961,10 @@ def t_WeaponLaunchingStingerFlipInvalidated():
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5  # mech took 0 damage
     assert g.board[(2, 1)].unit.hp == 5  # mech took 0 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 4 # vek took no damage
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
 
 def t_WeaponSpikedCaparace():
     "Have a Burrower do his attack"
@@ -8974,17 +8975,17 @@ def t_WeaponSpikedCaparace():
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(1, 2)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 4  # mech took 1 damage
     assert g.board[(1, 2)].unit.hp == 4  # mech took 1 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 3 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponBladedCaparace():
     "Have an AlphaBurrower do his attack"
@@ -8995,17 +8996,17 @@ def t_WeaponBladedCaparace():
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(1, 2)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(1, 2)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 2)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 2)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 5 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponFlamingAbdomen():
     "Have a BeetleLeader do his attack"
@@ -9013,26 +9014,26 @@ def t_WeaponFlamingAbdomen():
     g.board[(7, 1)].createUnitHere(Unit_TechnoHornet_Mech(g, hp=5, maxhp=5)) # extra hp given
     g.board[(2, 1)].createUnitHere(Unit_BeetleLeader(g, qshot=(Direction.RIGHT,)))
     assert g.board[(7, 1)].unit.hp == 5
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].effects == set()
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 6
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit == None # vek charged from here
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # vek starting point caught fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # vek starting point caught fire
     assert g.board[(6, 1)].unit.hp == 6 # to here, took no damage
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].effects == 0
     assert g.board[(7, 1)].unit == None # mech pushed from here
-    assert g.board[(7, 1)].effects == set() # no fire here
+    assert g.board[(7, 1)].effects == 0 # no fire here
     assert g.board[(8, 1)].unit.hp == 2 # mech took 2 damage
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == 0
     for x in range(2, 6):
-        assert g.board[(x, 1)].effects == {Effects.FIRE}
+        assert g.board[(x, 1)].effects == Effects.FIRE
 
 def t_WeaponBeetleLeaderOnFireChargesOverWater():
     "If a huge charging vek like the beetle leader is on fire and charges over water, he remains on fire."
@@ -9041,29 +9042,29 @@ def t_WeaponBeetleLeaderOnFireChargesOverWater():
     g.board[(7, 1)].createUnitHere(Unit_TechnoHornet_Mech(g, hp=5, maxhp=5)) # extra hp given
     g.board[(2, 1)].createUnitHere(Unit_BeetleLeader(g, qshot=(Direction.RIGHT,), effects={Effects.FIRE}))
     assert g.board[(7, 1)].unit.hp == 5
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].effects == set()
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 6
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit == None # vek charged from here
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # vek starting point caught fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # vek starting point caught fire
     assert g.board[(6, 1)].unit.hp == 6 # to here, took no damage
-    assert g.board[(6, 1)].unit.effects == {Effects.FIRE} # beetle still on fire
-    assert g.board[(6, 1)].effects == set()
+    assert g.board[(6, 1)].unit.effects == Effects.FIRE # beetle still on fire
+    assert g.board[(6, 1)].effects == 0
     assert g.board[(7, 1)].unit == None # mech pushed from here
-    assert g.board[(7, 1)].effects == set() # no fire here
+    assert g.board[(7, 1)].effects == 0 # no fire here
     assert g.board[(8, 1)].unit.hp == 2 # mech took 2 damage
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].effects == 0
     for x in range(2, 6):
         if x == 4:
-            assert g.board[(x, 1)].effects == {Effects.SUBMERGED} # the water tile
+            assert g.board[(x, 1)].effects == Effects.SUBMERGED # the water tile
         else:
-            assert g.board[(x, 1)].effects == {Effects.FIRE}
+            assert g.board[(x, 1)].effects == Effects.FIRE
 
 
 def t_WeaponGooAttackMechSurvive():
@@ -9072,20 +9073,20 @@ def t_WeaponGooAttackMechSurvive():
     g.board[(2, 1)].createUnitHere(Unit_TechnoHornet_Mech(g, hp=5, maxhp=5)) # extra hp given
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 1 # unit took 4 damage
-    assert g.board[(2, 1)].unit.effects == set() # no new effects
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0 # no new effects
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit.type == 'technohornet' # not a corpse
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
 
 def t_WeaponGooAttackMechDies():
     "Have a Goo do his attack against a mech that dies."
@@ -9094,20 +9095,20 @@ def t_WeaponGooAttackMechDies():
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 1 # unit took 4 damage, died and is now a mech corpse
-    assert g.board[(2, 1)].unit.effects == set() # no new effects
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0 # no new effects
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit.type == 'mechcorpse' # is a corpse
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
 
 def t_WeaponGooAttackSubTank():
     "Have a Goo do his attack against a deployable tank that dies."
@@ -9115,16 +9116,16 @@ def t_WeaponGooAttackSubTank():
     g.board[(2, 1)].createUnitHere(Unit_PullTank(g, hp=1, maxhp=1)) # less hp given
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 3 # goo took the spot of the pull tank
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit == None # goo moved from here
 
 def t_WeaponGooAttackEnemyDies():
@@ -9133,16 +9134,16 @@ def t_WeaponGooAttackEnemyDies():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, hp=1, maxhp=1)) # less hp given
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 3 # goo took the spot of the vek
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit == None # goo moved from here
 
 def t_WeaponGooAttackEnemySurvives():
@@ -9151,19 +9152,19 @@ def t_WeaponGooAttackEnemySurvives():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, hp=5, maxhp=5)) # more hp given
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # goo took the spot of the vek
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 1  # unit took 4 damage
-    assert g.board[(2, 1)].unit.effects == set()  # no new effects
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0  # no new effects
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit.type == 'alphascorpion'
 
 def t_WeaponGooAttackEnemySurvivesIce():
@@ -9172,19 +9173,19 @@ def t_WeaponGooAttackEnemySurvivesIce():
     g.board[(2, 1)].createUnitHere(Unit_AlphaScorpion(g, hp=1, maxhp=1, effects={Effects.ICE})) # less hp given
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3 # goo took the spot of the vek
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     assert g.board[(2, 1)].unit.hp == 1  # unit took no damage
-    assert g.board[(2, 1)].unit.effects == set()  # lost its ice
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0  # lost its ice
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(2, 1)].unit.type == 'alphascorpion'
 
 def t_WeaponGooAttackBuildingDies():
@@ -9193,16 +9194,16 @@ def t_WeaponGooAttackBuildingDies():
     g.board[(2, 1)].createUnitHere(Unit_Building(g, hp=2, maxhp=2)) # more hp given
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 3 # goo took the spot of the building
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit == None # goo moved from here
 
 def t_WeaponGooAttackMountainDies():
@@ -9211,16 +9212,16 @@ def t_WeaponGooAttackMountainDies():
     g.board[(2, 1)].createUnitHere(Unit_Mountain(g))
     g.board[(1, 1)].createUnitHere(Unit_LargeGoo(g, qshot=(Direction.RIGHT,)))
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 3 # goo took the spot of the mountain
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(1, 1)].unit == None # goo moved from here
 
 def t_WeaponSuperStinger():
@@ -9230,14 +9231,14 @@ def t_WeaponSuperStinger():
     g.board[(2, 1)].createUnitHere(Unit_HornetLeader(g, qshot=(Direction.LEFT,)))
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 6
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 6 # vek took no damage
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
 
 def t_WeaponSuperStinger2():
     "Have a HornetLeader do his attack where he actually hits 2 tiles"
@@ -9248,17 +9249,17 @@ def t_WeaponSuperStinger2():
     assert g.board[(1, 1)].unit.hp == 5
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     g.board[(3, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(2, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 6 # vek took no damage
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(3, 1)].unit.effects == 0
 
 def t_WeaponSuperStinger3():
     "Have a HornetLeader do his attack where he actually hits 3 tiles"
@@ -9271,20 +9272,20 @@ def t_WeaponSuperStinger3():
     assert g.board[(2, 1)].unit.hp == 5
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 6
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     g.board[(4, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(2, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(3, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 6 # vek took no damage
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
 
 def t_WeaponSuperStinger4():
     "Have a HornetLeader do his attack where he actually hits 3 tiles and there's a 4th that isn't hit"
@@ -9299,23 +9300,23 @@ def t_WeaponSuperStinger4():
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 5
     assert g.board[(5, 1)].unit.hp == 6
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.effects == 0
     g.board[(5, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5  # mech took NO damage
     assert g.board[(2, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(3, 1)].unit.hp == 3  # mech took 2 damage
     assert g.board[(4, 1)].unit.hp == 3  # mech took 2 damage
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(5, 1)].unit.hp == 6 # vek took no damage
-    assert g.board[(5, 1)].unit.effects == set()
+    assert g.board[(5, 1)].unit.effects == 0
 
 def t_WeaponMassiveSpinneret():
     "Have a ScorpionLeader do his attack."
@@ -9349,8 +9350,8 @@ def t_WeaponMassiveSpinneretOnIceFire():
     assert g.board[(2, 1)].unit.web == {(1, 1)}
     assert g.board[(1, 2)].unit.web == {(1, 1)}
     assert g.board[(1, 1)].unit.web == {(2, 1), (1, 2)}
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(2, 1)].unit.weapon1.shoot(Direction.LEFT, 1) # this should sink the scorpion boss into the water, disabling his attack.
     g.flushHurt()
     g.board[(1, 1)].unit.weapon1.shoot() # this did nothing
@@ -9361,8 +9362,8 @@ def t_WeaponMassiveSpinneretOnIceFire():
     assert g.board[(2, 1)].unit.web == {(1, 1)} # webs remain
     assert g.board[(1, 2)].unit.web == {(1, 1)}
     assert g.board[(1, 1)].unit.web == {(2, 1), (1, 2)}
-    assert g.board[(1, 1)].effects == {Effects.SUBMERGED} # tile is now water
-    assert g.board[(1, 1)].unit.effects == set() # no fire on the boss
+    assert g.board[(1, 1)].effects == Effects.SUBMERGED # tile is now water
+    assert g.board[(1, 1)].unit.effects == 0 # no fire on the boss
 
 def t_WeaponBurningThorax():
     "Have a FireflyLeader do his attack."
@@ -9416,33 +9417,33 @@ def t_WeaponCannon8RMarkI1():
     g.board[(1, 1)].createUnitHere(Unit_CannonBot(g, qshot=(Direction.RIGHT,)))
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1  # bot took no damage
     assert g.board[(2, 1)].unit.hp == 4 # mech took 1 damage
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == Effects.FIRE
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
 
 def t_WeaponCannon8RMarkI2():
     "Have a CannonBot do his attack but not hit a unit."
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_CannonBot(g, qshot=(Direction.RIGHT,)))
     assert g.board[(1, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1  # bot took no damage
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == {Effects.FIRE}
+    assert g.board[(8, 1)].effects == Effects.FIRE
 
 def t_WeaponCannon8RMarkII1():
     "Have a CannonMech do his attack."
@@ -9451,18 +9452,18 @@ def t_WeaponCannon8RMarkII1():
     g.board[(1, 1)].createUnitHere(Unit_CannonMech(g, qshot=(Direction.RIGHT,)))
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1  # bot took no damage
     assert g.board[(2, 1)].unit.hp == 2 # mech took 3 damage
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == Effects.FIRE
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
 
 def t_WeaponCannon8RMarkIIShielded():
     "Have a CannonMech do his attack against a shielded unit."
@@ -9471,18 +9472,18 @@ def t_WeaponCannon8RMarkIIShielded():
     g.board[(1, 1)].createUnitHere(Unit_CannonMech(g, qshot=(Direction.RIGHT,)))
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD,}
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1  # bot took no damage
     assert g.board[(2, 1)].unit.hp == 5 # mech took 0 damage
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
-    assert g.board[(2, 1)].effects == {Effects.FIRE}
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
+    assert g.board[(2, 1)].effects == Effects.FIRE
     assert g.board[(8, 1)].unit == None
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(8, 1)].effects == 0
 
 def t_WeaponVk8RocketsMarkI():
     "Have an ArtilleryBot do his attack."
@@ -9528,7 +9529,7 @@ def t_WeaponBKRBeamMarkI():
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 2
     assert g.board[(5, 1)].unit.type == 'mountain'
-    assert g.board[(8, 1)].effects == set() # forest not on fire
+    assert g.board[(8, 1)].effects == 0 # forest not on fire
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1 # wielder untouched
@@ -9536,7 +9537,7 @@ def t_WeaponBKRBeamMarkI():
     assert g.board[(3, 1)].unit.hp == 4 # vek took 1 damage
     assert g.board[(4, 1)].unit.hp == 1 # friendly took 1 damage
     assert g.board[(5, 1)].unit.type == 'mountaindamaged' # mountain was damaged
-    assert g.board[(8, 1)].effects == set()  # forest still not on fire
+    assert g.board[(8, 1)].effects == 0  # forest still not on fire
 
 def t_WeaponBKRBeamMarkII():
     "Do the BurstBeam weapon demo with a LaserMech instead"
@@ -9553,7 +9554,7 @@ def t_WeaponBKRBeamMarkII():
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit.hp == 2
     assert g.board[(5, 1)].unit.type == 'mountain'
-    assert g.board[(8, 1)].effects == set() # forest not on fire
+    assert g.board[(8, 1)].effects == 0 # forest not on fire
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1 # wielder untouched
@@ -9561,7 +9562,7 @@ def t_WeaponBKRBeamMarkII():
     assert g.board[(3, 1)].unit.hp == 2 # vek took 3 damage
     assert g.board[(4, 1)].unit.type == 'mechcorpse' # friendly mech died from 2 damage
     assert g.board[(5, 1)].unit.type == 'mountaindamaged' # mountain was damaged
-    assert g.board[(8, 1)].effects == set()  # forest still not on fire
+    assert g.board[(8, 1)].effects == 0  # forest still not on fire
 
 def t_WeaponSelfRepair():
     "Have a BotLeader heal himself."
@@ -9570,13 +9571,13 @@ def t_WeaponSelfRepair():
     assert g.board[(1, 1)].unit.hp == 5
     g.board[(1, 1)].takeDamage(3)
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].unit.effects == set()  # no unit effects
-    assert g.board[(1, 1)].effects == set()  # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0  # no unit effects
+    assert g.board[(1, 1)].effects == 0  # no tile effects
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5 # BotLeader healed to full
-    assert g.board[(1, 1)].unit.effects == set() # no unit effects
-    assert g.board[(1, 1)].effects == set() # no tile effects
+    assert g.board[(1, 1)].unit.effects == 0 # no unit effects
+    assert g.board[(1, 1)].effects == 0 # no tile effects
 
 def t_WeaponSelfRepairIce():
     "Have a BotLeader try to heal himself but he gets frozen."
@@ -9586,13 +9587,13 @@ def t_WeaponSelfRepairIce():
     g.board[(1, 1)].takeDamage(3)
     g.board[(1, 1)].applyIce()
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE} # shit's cold
-    assert g.board[(1, 1)].effects == set()  # no tile effects
+    assert g.board[(1, 1)].unit.effects == Effects.ICE # shit's cold
+    assert g.board[(1, 1)].effects == 0  # no tile effects
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 2 # BotLeader didn't heal
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE} # still frozen
-    assert g.board[(1, 1)].effects == set() # no tile effects
+    assert g.board[(1, 1)].unit.effects == Effects.ICE # still frozen
+    assert g.board[(1, 1)].effects == 0 # no tile effects
 
 def t_WeaponSelfRepairFireTile():
     "Have a BotLeader heal himself but him and his tile is on fire."
@@ -9602,13 +9603,13 @@ def t_WeaponSelfRepairFireTile():
     g.board[(1, 1)].takeDamage(3)
     g.board[(1, 1)].applyFire() # apply fire to tile and unit
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE} # shit's hot
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # tile's on fire
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE # shit's hot
+    assert g.board[(1, 1)].effects == Effects.FIRE # tile's on fire
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5 # BotLeader healed
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE} # still on fire
-    assert g.board[(1, 1)].effects == {Effects.FIRE} # tile still on fire
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE # still on fire
+    assert g.board[(1, 1)].effects == Effects.FIRE # tile still on fire
 
 def t_WeaponSelfRepairFireNotTile():
     "Have a BotLeader heal himself but he's fire (but not his tile)."
@@ -9617,13 +9618,13 @@ def t_WeaponSelfRepairFireNotTile():
     assert g.board[(1, 1)].unit.hp == 5
     g.board[(1, 1)].takeDamage(3)
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(1, 1)].unit.effects == {Effects.FIRE} # shit's hot
-    assert g.board[(1, 1)].effects == set() # tile's not
+    assert g.board[(1, 1)].unit.effects == Effects.FIRE # shit's hot
+    assert g.board[(1, 1)].effects == 0 # tile's not
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5 # BotLeader healed
-    assert g.board[(1, 1)].unit.effects == set() # repair put out the fire
-    assert g.board[(1, 1)].effects == set() # tile still not on fire
+    assert g.board[(1, 1)].unit.effects == 0 # repair put out the fire
+    assert g.board[(1, 1)].effects == 0 # tile still not on fire
 
 def t_WeaponSelfRepairAcid():
     "Have a BotLeader heal himself but and he keeps acid."
@@ -9632,13 +9633,13 @@ def t_WeaponSelfRepairAcid():
     assert g.board[(1, 1)].unit.hp == 5
     g.board[(1, 1)].takeDamage(2)
     assert g.board[(1, 1)].unit.hp == 1 # 4 damage taken because of acid
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID} # shit's acidy
-    assert g.board[(1, 1)].effects == set() # tile's not
+    assert g.board[(1, 1)].unit.effects == Effects.ACID # shit's acidy
+    assert g.board[(1, 1)].effects == 0 # tile's not
     g.board[(1, 1)].unit.weapon1.shoot()
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 5 # BotLeader healed
-    assert g.board[(1, 1)].unit.effects == {Effects.ACID} # still has acid
-    assert g.board[(1, 1)].effects == set() # tile still normal
+    assert g.board[(1, 1)].unit.effects == Effects.ACID # still has acid
+    assert g.board[(1, 1)].effects == 0 # tile still normal
 
 def t_TrainPainGauntlet():
     "Have a train get hit with acid and attacked 3 times to ensure it progresses through its stages correctly."
@@ -9650,49 +9651,49 @@ def t_TrainPainGauntlet():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     g.board[(1, 1)].unit.applyAcid() # acid has no effect on the train in our sim
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     g.board[(1, 1)].takeDamage(2)
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traindamagedcaboose'
     assert g.board[(2, 1)].unit.type == 'traindamaged'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     g.board[(2, 1)].takeDamage(2)
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincorpse'
     assert g.board[(2, 1)].unit.type == 'traincorpse'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     g.board[(1, 1)].takeDamage(2) # damaging the corpse to make sure nothing weird happens
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincorpse'
     assert g.board[(2, 1)].unit.type == 'traincorpse'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
 
 def t_WeaponChooChoo1():
     "Use the train's Choo Choo weapon with no unit in the way."
@@ -9703,10 +9704,10 @@ def t_WeaponChooChoo1():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     g.board[(2, 1)].unit.weapon1.shoot()
     # The train no longer actually moves because it doesn't need to
     #assert g.board[(1, 1)].unit == None # caboose moved from here
@@ -9715,10 +9716,10 @@ def t_WeaponChooChoo1():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
 
 def t_WeaponChooChoo2():
     "Use the train's Choo Choo weapon with a unit directly in front of the train."
@@ -9731,10 +9732,10 @@ def t_WeaponChooChoo2():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(3, 1)].unit.hp == 3
     g.board[(2, 1)].unit.weapon1.shoot()
     #assert g.board[(1, 1)].unit == None # caboose moved from here
@@ -9743,10 +9744,10 @@ def t_WeaponChooChoo2():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traindamagedcaboose'
     assert g.board[(2, 1)].unit.type == 'traindamaged'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(3, 1)].unit == None # vek died
 
 def t_WeaponChooChoo3():
@@ -9760,10 +9761,10 @@ def t_WeaponChooChoo3():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(4, 1)].unit.hp == 3
     g.board[(2, 1)].unit.weapon1.shoot()
     # Train no longer moves
@@ -9773,10 +9774,10 @@ def t_WeaponChooChoo3():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traindamagedcaboose'
     assert g.board[(2, 1)].unit.type == 'traindamaged'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(4, 1)].unit == None # vek died
 
 def t_WeaponChooChoo4():
@@ -9789,10 +9790,10 @@ def t_WeaponChooChoo4():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 3
     g.board[(2, 1)].unit.weapon1.shoot()
     # Train no longer moves
@@ -9802,10 +9803,10 @@ def t_WeaponChooChoo4():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 3 # vek untouched
 
 def t_WeaponChooChooIce():
@@ -9822,20 +9823,20 @@ def t_WeaponChooChooIce():
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE}
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == Effects.ICE
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 3
     g.board[(2, 1)].unit.weapon1.shoot() # this should have done nothing
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(1, 1)].unit.type == 'traincaboose'
     assert g.board[(2, 1)].unit.type == 'train'
-    assert g.board[(1, 1)].unit.effects == {Effects.ICE} # still frozen
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(2, 1)].effects == set()
+    assert g.board[(1, 1)].unit.effects == Effects.ICE # still frozen
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(2, 1)].effects == 0
     assert g.board[(5, 1)].unit.hp == 3 # vek untouched
 
 def t_WeaponChooChooOffboard():
@@ -9848,10 +9849,10 @@ def t_WeaponChooChooOffboard():
     assert g.board[(8, 1)].unit.hp == 1
     assert g.board[(7, 1)].unit.type == 'traincaboose'
     assert g.board[(8, 1)].unit.type == 'train'
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(7, 1)].effects == set()
-    assert g.board[(8, 1)].effects == set()
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(7, 1)].effects == 0
+    assert g.board[(8, 1)].effects == 0
     try:
         g.board[(8, 1)].unit.weapon1.shoot()
     except CantHappenInGame:
@@ -9906,25 +9907,25 @@ def t_WeaponDisintegrator():
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     assert g.board[(1, 1)].unit.hp == 2
     assert g.board[(1, 1)].unit.type == 'acidlauncher'
-    assert g.board[(1, 6)].effects == set()
+    assert g.board[(1, 6)].effects == 0
     assert g.board[(1, 6)].unit.hp == 2
-    assert g.board[(1, 7)].effects == set()
+    assert g.board[(1, 7)].effects == 0
     assert g.board[(1, 7)].unit.hp == 1
-    assert g.board[(1, 8)].effects == set()
+    assert g.board[(1, 8)].effects == 0
     assert g.board[(1, 8)].unit.hp == 3
-    assert g.board[(2, 7)].effects == set()
+    assert g.board[(2, 7)].effects == 0
     gs = g.board[(1, 1)].unit.weapon1.genShots()
     for shot in range(7):
         shot = next(gs)
     g.board[(1, 1)].unit.weapon1.shoot(*shot)  # (1, 7)
     g.flushHurt()
-    assert g.board[(1, 6)].effects == {Effects.ACID}
+    assert g.board[(1, 6)].effects == Effects.ACID
     assert g.board[(1, 6)].unit == None # vek killed
-    assert g.board[(1, 7)].effects == {Effects.ACID}
+    assert g.board[(1, 7)].effects == Effects.ACID
     assert g.board[(1, 7)].unit == None # mountain is gone
-    assert g.board[(1, 8)].effects == set() # acid is on the mech corpse
+    assert g.board[(1, 8)].effects == 0 # acid is on the mech corpse
     assert g.board[(1, 8)].unit.type == 'mechcorpse'
-    assert g.board[(2, 7)].effects == {Effects.ACID}
+    assert g.board[(2, 7)].effects == Effects.ACID
     assert g.board[(2, 7)].unit == None # never was a unit here
 
 def t_WeaponTerraformer():
@@ -9941,13 +9942,13 @@ def t_WeaponTerraformer():
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     assert g.board[(4, 3)].unit.hp == 2
     assert g.board[(4, 3)].unit.type == 'terraformer'
-    assert g.board[(5, 3)].effects == set()
+    assert g.board[(5, 3)].effects == 0
     assert g.board[(5, 3)].unit.hp == 2
     assert g.board[(5, 3)].isGrassland()
-    assert g.board[(5, 4)].effects == set()
+    assert g.board[(5, 4)].effects == 0
     assert g.board[(5, 4)].unit.hp == 1
     assert g.board[(5, 4)].type == 'ground'
-    assert g.board[(6, 2)].effects == set()
+    assert g.board[(6, 2)].effects == 0
     assert g.board[(6, 2)].unit.hp == 3
     assert g.board[(6, 2)].isGrassland()
     assert not g.board[(7, 3)].isGrassland()
@@ -9956,13 +9957,13 @@ def t_WeaponTerraformer():
         shot = next(gs)
     g.board[(4, 3)].unit.weapon1.shoot(*shot)  # (RIGHT,)
     g.flushHurt()
-    assert g.board[(5, 3)].effects == set()
+    assert g.board[(5, 3)].effects == 0
     assert g.board[(5, 3)].unit == None # vek killed
     assert g.board[(5, 3)].type == "sand"
-    assert g.board[(5, 4)].effects == set()
+    assert g.board[(5, 4)].effects == 0
     assert g.board[(5, 4)].unit == None # mountain is gone
     assert g.board[(5, 4)].type == 'ground' # mountains leave ground tiles when destroyed, NOT sand
-    assert g.board[(6, 2)].effects == set()
+    assert g.board[(6, 2)].effects == 0
     assert g.board[(6, 2)].unit.type == 'mechcorpse'
     assert g.board[(6, 2)].type == "sand"
 
@@ -9980,13 +9981,13 @@ def t_WeaponTerraformer2():
     g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g))  # Dummy unit to prevent the game from ending.
     assert g.board[(4, 3)].unit.hp == 2
     assert g.board[(4, 3)].unit.type == 'terraformer'
-    assert g.board[(5, 3)].effects == set()
+    assert g.board[(5, 3)].effects == 0
     assert g.board[(5, 3)].unit.hp == 2
     assert g.board[(5, 3)].isGrassland()
-    assert g.board[(5, 4)].effects == set()
+    assert g.board[(5, 4)].effects == 0
     assert g.board[(5, 4)].unit.hp == 1
     assert g.board[(5, 4)].type == 'ground'
-    assert g.board[(6, 2)].effects == set()
+    assert g.board[(6, 2)].effects == 0
     assert g.board[(6, 2)].unit.hp == 3
     assert g.board[(6, 2)].isGrassland()
     assert not g.board[(7, 3)].isGrassland()
@@ -9995,14 +9996,14 @@ def t_WeaponTerraformer2():
         shot = next(gs)
     g.board[(4, 3)].unit.weapon1.shoot(*shot)  # (RIGHT,)
     g.flushHurt()
-    assert g.board[(5, 3)].effects == {Effects.SMOKE}
+    assert g.board[(5, 3)].effects == Effects.SMOKE
     assert g.board[(5, 3)].unit == None # vek killed
     assert g.board[(5, 3)].type == "sand"
     assert g.board[(5, 4)].unit == None # mountain is gone
-    assert g.board[(5, 4)].effects == set() # destroyed mountain doesn't leave smoke since there was never sand here.
+    assert g.board[(5, 4)].effects == 0 # destroyed mountain doesn't leave smoke since there was never sand here.
     assert g.board[(5, 4)].type == 'ground' # mountains leave ground tiles when destroyed
-    assert g.board[(5, 4)].effects == set() # no smoke here, never became a sand tile
-    assert g.board[(6, 2)].effects == set() # this sand tile wasn't hit by the explosion
+    assert g.board[(5, 4)].effects == 0 # no smoke here, never became a sand tile
+    assert g.board[(6, 2)].effects == 0 # this sand tile wasn't hit by the explosion
     assert g.board[(6, 2)].unit.type == 'mechcorpse'
     assert g.board[(6, 2)].type == "sand"
 
@@ -10016,21 +10017,21 @@ def t_WeaponTerraformer3():
     g.board[(4, 3)].createUnitHere(Unit_Terraformer(g))
     assert g.board[(4, 3)].unit.hp == 2
     assert g.board[(4, 3)].unit.type == 'terraformer'
-    assert g.board[(5, 3)].effects == set()
-    assert g.board[(5, 4)].effects == set()
+    assert g.board[(5, 3)].effects == 0
+    assert g.board[(5, 4)].effects == 0
     assert g.board[(5, 4)].type == 'sand'
-    assert g.board[(6, 2)].effects == set()
+    assert g.board[(6, 2)].effects == 0
     gs = g.board[(4, 3)].unit.weapon1.genShots()
     for shot in range(2):
         shot = next(gs)
     g.board[(4, 3)].unit.weapon1.shoot(*shot)  # (RIGHT,)
     g.flushHurt()
-    assert g.board[(5, 3)].effects == set()
+    assert g.board[(5, 3)].effects == 0
     assert g.board[(5, 3)].type == "sand"
-    assert g.board[(5, 4)].effects == set()
+    assert g.board[(5, 4)].effects == 0
     assert g.board[(5, 4)].type == 'sand'
-    assert g.board[(5, 4)].effects == set()
-    assert g.board[(6, 2)].effects == set()
+    assert g.board[(5, 4)].effects == 0
+    assert g.board[(6, 2)].effects == 0
     assert g.board[(6, 2)].type == "sand"
 
 def t_SoldierPsion1():
@@ -10045,79 +10046,79 @@ def t_SoldierPsion1():
     g.board[(7, 1)].createUnitHere(Unit_PrototypeRenfieldBomb(g)) # a naturally explosive Neutral unit
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 7
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
     g.board[(1, 1)].unit.weapon1.enable()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 7
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
 
 def t_SoldierPsion2():
@@ -10132,55 +10133,55 @@ def t_SoldierPsion2():
     g.board[(7, 1)].createUnitHere(Unit_PrototypeRenfieldBomb(g)) # a naturally explosive Neutral unit
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 7
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
     g.board[(1, 1)].unit.weapon1.enable()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 7
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
     g.board[(2, 1)].takeDamage(1) # Leaper takes a hit so now he's 1/2 HP
     g.flushHurt()
@@ -10189,23 +10190,23 @@ def t_SoldierPsion2():
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
     assert g.board[(2, 1)].unit == None # Leaper died because the psion died
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
 
 def t_SoldierPsion3():
@@ -10221,55 +10222,55 @@ def t_SoldierPsion3():
     g.board[(7, 1)].createUnitHere(Unit_PrototypeRenfieldBomb(g)) # a naturally explosive Neutral unit
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g, hp=4, maxhp=4)) # a naturally armored Allied unit
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 7
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 4
     g.board[(1, 1)].unit.weapon1.enable()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 7
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 4
     g.board[(2, 1)].takeDamage(1) # Leaper takes a hit so now he's 1/2 HP
     g.flushHurt()
@@ -10278,23 +10279,23 @@ def t_SoldierPsion3():
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
     assert g.board[(2, 1)].unit == None # Leaper died because the psion died
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
 
 def t_ShellPsion1():
@@ -10310,88 +10311,88 @@ def t_ShellPsion1():
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.ARMORED}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.ARMORED
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.ARMORED}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE | Attributes.ARMORED
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.ARMORED}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.ARMORED
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_ShellPsion2():
@@ -10408,88 +10409,88 @@ def t_ShellPsion2():
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.ARMORED}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.ARMORED
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.ARMORED}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE | Attributes.ARMORED
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.ARMORED}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.ARMORED
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING, Attributes.ARMORED} # mech DID get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING | Attributes.ARMORED # mech DID get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_BlastPsion1():
@@ -10505,88 +10506,88 @@ def t_BlastPsion1():
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_BlastPsionMechs():
@@ -10603,88 +10604,88 @@ def t_BlastPsionMechs():
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_BloodPsionUndamaged():
@@ -10700,89 +10701,89 @@ def t_BloodPsionUndamaged():
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     g.psionPassiveTurn() # run a healing turn
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_BloodPsionDamaged():
@@ -10800,62 +10801,62 @@ def t_BloodPsionDamaged():
     g.board[(3, 1)].takeDamage(2)
     g.board[(8, 1)].takeDamage(2)
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 4
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 2 # armor means it only took 1 damage
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     g.psionPassiveTurn() # run a healing turn
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 2
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
@@ -10866,29 +10867,29 @@ def t_BloodPsionDamaged():
     else:
         assert False
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 2
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_BloodPsionMechDamaged():
@@ -10907,62 +10908,62 @@ def t_BloodPsionMechDamaged():
     g.board[(3, 1)].takeDamage(2)
     g.board[(8, 1)].takeDamage(2)
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 4
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 2 # armor means it only took 1 damage
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     g.psionPassiveTurn() # run a healing turn
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3 # mech healed back up to full
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
@@ -10973,29 +10974,29 @@ def t_BloodPsionMechDamaged():
     else:
         assert False
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_PsionTyrant1():
@@ -11011,62 +11012,62 @@ def t_PsionTyrant1():
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 4
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     g.psionPassiveTurn() # run a tentacle turn
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 4
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3 # armor prevented this unit from taking damage
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 1
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
@@ -11077,29 +11078,29 @@ def t_PsionTyrant1():
     else:
         assert False
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 4
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 1
 
 def t_PsionTyrantMechs():
@@ -11115,55 +11116,55 @@ def t_PsionTyrantMechs():
     g.board[(8, 1)].createUnitHere(Unit_Hook_Mech(g)) # a naturally armored Allied unit
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 4
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1._enableMechs()
     g.board[(1, 1)].unit.weapon1.enable()
     g.psionPassiveTurn() # run a tentacle turn
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 1
     assert g.board[(2, 1)].unit == None # vek died
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit == None # spiderling died
     assert g.board[(5, 1)].unit == None # spider egg died. TODO: Not sure if this is what happens in game.
     assert g.board[(6, 1)].unit == None # I'm not sure if this would really happen, but there's never any bots on the volcano level anyway
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 4
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3 # armor blocked damage
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 1
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
@@ -11175,20 +11176,20 @@ def t_PsionTyrantMechs():
         assert False
     assert g.board[(1, 1)].unit == None
     assert g.board[(2, 1)].unit == None # vek died
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
     assert g.board[(4, 1)].unit == None # spiderling died
     assert g.board[(5, 1)].unit == None # spider egg died. TODO: Not sure if this is what happens in game.
     assert g.board[(6, 1)].unit == None # I'm not sure if this would really happen, but there's never any bots on the volcano level anyway
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 4
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3 # armor blocked damage
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech didn't get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech didn't get armor
     assert g.board[(1, 2)].unit.hp == 1
 
 def t_PsionAbomination():
@@ -11211,62 +11212,62 @@ def t_PsionAbomination():
     g.board[(3, 1)].takeDamage(2)
     g.board[(8, 1)].takeDamage(2)
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 2 # armor means it only took 1 damage
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable()
     g.psionPassiveTurn() # run a healing turn
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 2 # mech not touched
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
@@ -11277,29 +11278,29 @@ def t_PsionAbomination():
     else:
         assert False
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 2 # no change
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_PsionAbominationMechs():
@@ -11317,63 +11318,63 @@ def t_PsionAbominationMechs():
     g.board[(3, 1)].takeDamage(2)
     g.board[(8, 1)].takeDamage(2)
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3 # armor means it only took 1 damage
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1._enableMechs()
     g.board[(1, 1)].unit.weapon1.enable()
     g.psionPassiveTurn() # run a healing turn
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 5
-    assert g.board[(2, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(3, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 4 # mech healed 1 and hp boosted to 4/4
-    assert g.board[(1, 2)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 2 # has 2/2 hp
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
@@ -11384,29 +11385,29 @@ def t_PsionAbominationMechs():
     else:
         assert False
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 5
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3 # mech keeps the healed HP, but not the buffed. now at 3/3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(1, 2)].unit.hp == 1 # back to 1/1
 
 def t_PassiveFlameShielding():
@@ -11417,36 +11418,36 @@ def t_PassiveFlameShielding():
     g.board[(3, 1)].createUnitHere(Unit_Hook_Mech(g))
     g.board[(4, 1)].createUnitHere(Unit_Jet_Mech(g))
     g.board[(5, 1)].createUnitHere(Unit_ShieldTank(g))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
     g.board[(1, 1)].unit.weapon1.enable()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.IMMUNEFIRE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE | Attributes.IMMUNEFIRE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE, Attributes.IMMUNEFIRE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE | Attributes.IMMUNEFIRE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING, Attributes.IMMUNEFIRE}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING | Attributes.IMMUNEFIRE
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
 
 def t_PassiveStormGeneratorNoPower():
@@ -11462,54 +11463,66 @@ def t_PassiveStormGeneratorNoPower():
     g.board[(4, 1)].applySmoke()
     g.board[(5, 1)].createUnitHere(Unit_ShieldTank(g))
     g.board[(5, 1)].applySmoke()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
     g.board[(1, 1)].unit.weapon1.enable() # this itself doesn't change the units yet, make sure of that:
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
     g.stormGeneratorTurn() # this did though
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    g.board[(1, 1)].unit.weapon1.disable()
+
+def t_PassiveStormGeneratorSeparateGames():
+    "Smoke in a game without the StormGenerator shouldn't be tracked by another game that has it."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Flame_Mech(g, weapon1=Weapon_StormGenerator()))
+    g.start()
+    othergame = Game()
+    othergame.board[(2, 2)].applySmoke()
+    g.board[(3, 3)].applySmoke()
+    assert g.stormtiles == {(3, 3)}
+    assert othergame.stormtiles == None
+    g.board[(3, 3)].applyFire()
+    assert g.stormtiles == set()
 
 def t_PassiveStormGenerator1Power():
     "Make sure StormGenerator works on enemies and not your units with 1 power"
@@ -11524,54 +11537,53 @@ def t_PassiveStormGenerator1Power():
     g.board[(4, 1)].applySmoke()
     g.board[(5, 1)].createUnitHere(Unit_ShieldTank(g))
     g.board[(5, 1)].applySmoke()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
     g.board[(1, 1)].unit.weapon1.enable() # this itself doesn't change the units yet, make sure of that:
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 5
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
     g.stormGeneratorTurn() # this did though
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    g.board[(1, 1)].unit.weapon1.disable()
 
 def t_PassiveRepairField():
     "Test out the repair field passive."
@@ -11585,72 +11597,72 @@ def t_PassiveRepairField():
     g.board[(7, 1)].createUnitHere(Unit_Pulse_Mech(g)) # kill this to make sure its corpse reanimates
     g.board[(7, 1)].takeDamage(8)
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 2
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 2
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == {Attributes.STABLE}
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == Attributes.STABLE
     assert g.board[(6, 1)].unit.hp == 2
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(7, 1)].unit.hp == 1
     assert g.board[(7, 1)].unit.type == 'mechcorpse'
     g.board[(1, 1)].unit.weapon1.enable() # this itself doesn't change the units yet, make sure of that:
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 2
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 2
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == {Attributes.STABLE}
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == Attributes.STABLE
     assert g.board[(6, 1)].unit.hp == 2
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(7, 1)].unit.hp == 1
     assert g.board[(7, 1)].unit.type == 'mechcorpse'
     g.board[(3, 1)].unit.repweapon.shoot() # this did though
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3 # healed for 1
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 4 # no change
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 3
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 2 # no change because not mech
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == {Attributes.STABLE}
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == Attributes.STABLE
     assert g.board[(6, 1)].unit.hp == 2 # no change because not mech
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(7, 1)].unit.hp == 1 # repaired back to 1 hp
     assert g.board[(7, 1)].unit.type == 'pulse' # back alive
 
@@ -11666,72 +11678,72 @@ def t_PassiveRepairFieldMoreDamage():
     g.board[(7, 1)].createUnitHere(Unit_Pulse_Mech(g)) # kill this to make sure its corpse reanimates
     g.board[(7, 1)].takeDamage(8)
     g.flushHurt()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 2
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 2
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == {Attributes.STABLE}
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == Attributes.STABLE
     assert g.board[(6, 1)].unit.hp == 2
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(7, 1)].unit.hp == 1
     assert g.board[(7, 1)].unit.type == 'mechcorpse'
     g.board[(1, 1)].unit.weapon1.enable() # this itself doesn't change the units yet, make sure of that:
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 4
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 2
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 2
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 2
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == {Attributes.STABLE}
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == Attributes.STABLE
     assert g.board[(6, 1)].unit.hp == 2
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(7, 1)].unit.hp == 1
     assert g.board[(7, 1)].unit.type == 'mechcorpse'
     g.board[(3, 1)].unit.repweapon.shoot() # this did though
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.hp == 3 # healed for 1
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.FLYING, Attributes.MASSIVE}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.FLYING | Attributes.MASSIVE
     assert g.board[(2, 1)].unit.hp == 4 # no change
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 3
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
     assert g.board[(4, 1)].unit.hp == 3
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 2 # no change because not mech
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == {Attributes.STABLE}
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == Attributes.STABLE
     assert g.board[(6, 1)].unit.hp == 2 # no change because not mech
-    assert g.board[(7, 1)].unit.effects == set()
-    assert g.board[(7, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(7, 1)].unit.effects == 0
+    assert g.board[(7, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(7, 1)].unit.hp == 1 # repaired back to 1 hp
     assert g.board[(7, 1)].unit.type == 'pulse' # back alive
 
@@ -11746,57 +11758,57 @@ def t_PassiveAutoShields():
     g.board[(6, 1)].createUnitHere(Unit_Building(g, hp=2, maxhp=2)) # 2/2 hp building
     g.board[(7, 1)].createUnitHere(Unit_Building(g, hp=2, maxhp=2, effects={Effects.SHIELD})) # 2/2 hp shielded building
     assert g.board[(2, 1)].unit.isBuilding() # building is here
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(3, 1)].unit.isBuilding()  # building is here
-    assert g.board[(3, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(3, 1)].unit.effects == Effects.SHIELD
     assert g.board[(3, 1)].unit.hp == 1
     assert g.board[(4, 1)].unit.isBuilding()  # building is here
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 1
     assert g.board[(5, 1)].unit.isBuilding()  # building is here
-    assert g.board[(5, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(5, 1)].unit.effects == Effects.SHIELD
     assert g.board[(5, 1)].unit.hp == 1
     assert g.board[(6, 1)].unit.isBuilding()  # building is here
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(6, 1)].unit.hp == 2
     assert g.board[(7, 1)].unit.isBuilding()  # building is here
-    assert g.board[(7, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(7, 1)].unit.effects == Effects.SHIELD
     assert g.board[(7, 1)].unit.hp == 2
     g.board[(1, 1)].unit.weapon1.enable() # no effect takes place until after they take damage
     assert g.board[(2, 1)].unit.isBuilding()  # building is here
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(3, 1)].unit.isBuilding()  # building is here
-    assert g.board[(3, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(3, 1)].unit.effects == Effects.SHIELD
     assert g.board[(3, 1)].unit.hp == 1
     assert g.board[(4, 1)].unit.isBuilding()  # building is here
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 1
     assert g.board[(5, 1)].unit.isBuilding()  # building is here
-    assert g.board[(5, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(5, 1)].unit.effects == Effects.SHIELD
     assert g.board[(5, 1)].unit.hp == 1
     assert g.board[(6, 1)].unit.isBuilding()  # building is here
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(6, 1)].unit.hp == 2
     assert g.board[(7, 1)].unit.isBuilding()  # building is here
-    assert g.board[(7, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(7, 1)].unit.effects == Effects.SHIELD
     assert g.board[(7, 1)].unit.hp == 2
     for x in range(2, 8):
         g.board[(x, 1)].takeDamage(1)
     assert g.board[(2, 1)].unit == None  # building died
     assert g.board[(3, 1)].unit.isBuilding()  # building is here
-    assert g.board[(3, 1)].unit.effects == set() # shield is gone
+    assert g.board[(3, 1)].unit.effects == 0 # shield is gone
     assert g.board[(3, 1)].unit.hp == 1
     assert g.board[(4, 1)].unit == None # building died
     assert g.board[(5, 1)].unit.isBuilding()  # building is here
-    assert g.board[(5, 1)].unit.effects == set() # shield gone
+    assert g.board[(5, 1)].unit.effects == 0 # shield gone
     assert g.board[(5, 1)].unit.hp == 1
     assert g.board[(6, 1)].unit.isBuilding()  # building is here!
-    assert g.board[(6, 1)].unit.effects == {Effects.SHIELD} # this is the real result. Building took 1 damage and gained a shield.
+    assert g.board[(6, 1)].unit.effects == Effects.SHIELD # this is the real result. Building took 1 damage and gained a shield.
     assert g.board[(6, 1)].unit.hp == 1
     assert g.board[(7, 1)].unit.isBuilding()  # building is here
-    assert g.board[(7, 1)].unit.effects == set() # this one lost its shield and never took damage
+    assert g.board[(7, 1)].unit.effects == 0 # this one lost its shield and never took damage
     assert g.board[(7, 1)].unit.hp == 2
 
 def t_PassiveAutoShieldsControl():
@@ -11810,57 +11822,57 @@ def t_PassiveAutoShieldsControl():
     g.board[(6, 1)].createUnitHere(Unit_Building(g, hp=2, maxhp=2)) # 2/2 hp building
     g.board[(7, 1)].createUnitHere(Unit_Building(g, hp=2, maxhp=2, effects={Effects.SHIELD})) # 2/2 hp shielded building
     assert g.board[(2, 1)].unit.isBuilding() # building is here
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(3, 1)].unit.isBuilding()  # building is here
-    assert g.board[(3, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(3, 1)].unit.effects == Effects.SHIELD
     assert g.board[(3, 1)].unit.hp == 1
     assert g.board[(4, 1)].unit.isBuilding()  # building is here
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 1
     assert g.board[(5, 1)].unit.isBuilding()  # building is here
-    assert g.board[(5, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(5, 1)].unit.effects == Effects.SHIELD
     assert g.board[(5, 1)].unit.hp == 1
     assert g.board[(6, 1)].unit.isBuilding()  # building is here
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(6, 1)].unit.hp == 2
     assert g.board[(7, 1)].unit.isBuilding()  # building is here
-    assert g.board[(7, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(7, 1)].unit.effects == Effects.SHIELD
     assert g.board[(7, 1)].unit.hp == 2
     # g.board[(1, 1)].unit.weapon1.enable() # no effect takes place until after they take damage
     assert g.board[(2, 1)].unit.isBuilding()  # building is here
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(2, 1)].unit.hp == 1
     assert g.board[(3, 1)].unit.isBuilding()  # building is here
-    assert g.board[(3, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(3, 1)].unit.effects == Effects.SHIELD
     assert g.board[(3, 1)].unit.hp == 1
     assert g.board[(4, 1)].unit.isBuilding()  # building is here
-    assert g.board[(4, 1)].unit.effects == set()
+    assert g.board[(4, 1)].unit.effects == 0
     assert g.board[(4, 1)].unit.hp == 1
     assert g.board[(5, 1)].unit.isBuilding()  # building is here
-    assert g.board[(5, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(5, 1)].unit.effects == Effects.SHIELD
     assert g.board[(5, 1)].unit.hp == 1
     assert g.board[(6, 1)].unit.isBuilding()  # building is here
-    assert g.board[(6, 1)].unit.effects == set()
+    assert g.board[(6, 1)].unit.effects == 0
     assert g.board[(6, 1)].unit.hp == 2
     assert g.board[(7, 1)].unit.isBuilding()  # building is here
-    assert g.board[(7, 1)].unit.effects == {Effects.SHIELD}
+    assert g.board[(7, 1)].unit.effects == Effects.SHIELD
     assert g.board[(7, 1)].unit.hp == 2
     for x in range(2, 8):
         g.board[(x, 1)].takeDamage(1)
     assert g.board[(2, 1)].unit == None  # building died
     assert g.board[(3, 1)].unit.isBuilding()  # building is here
-    assert g.board[(3, 1)].unit.effects == set() # shield is gone
+    assert g.board[(3, 1)].unit.effects == 0 # shield is gone
     assert g.board[(3, 1)].unit.hp == 1
     assert g.board[(4, 1)].unit == None # building died
     assert g.board[(5, 1)].unit.isBuilding()  # building is here
-    assert g.board[(5, 1)].unit.effects == set() # shield gone
+    assert g.board[(5, 1)].unit.effects == 0 # shield gone
     assert g.board[(5, 1)].unit.hp == 1
     assert g.board[(6, 1)].unit.isBuilding()  # building is here!
-    assert g.board[(6, 1)].unit.effects == set() # this is the real result. Building took 1 damage and DIDN'T get a shield
+    assert g.board[(6, 1)].unit.effects == 0 # this is the real result. Building took 1 damage and DIDN'T get a shield
     assert g.board[(6, 1)].unit.hp == 1
     assert g.board[(7, 1)].unit.isBuilding()  # building is here
-    assert g.board[(7, 1)].unit.effects == set() # this one lost its shield and never took damage
+    assert g.board[(7, 1)].unit.effects == 0 # this one lost its shield and never took damage
     assert g.board[(7, 1)].unit.hp == 2
 
 def t_PassiveStabilizers():
@@ -11892,59 +11904,59 @@ def t_PassivePsionicReceiver():
     g.board[(1, 2)].createUnitHere(Unit_Jet_Mech(g))  # an unarmored mech
     g.start()
     assert g.board[(1, 1)].unit.isPsion()
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.FLYING
     assert g.board[(1, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == {Attributes.ARMORED}
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == Attributes.ARMORED
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.ARMORED}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE | Attributes.ARMORED
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == {Attributes.ARMORED}
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == Attributes.ARMORED
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING, Attributes.ARMORED} # mech DID get armor
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING | Attributes.ARMORED # mech DID get armor
     assert g.board[(1, 2)].unit.hp == 2
     g.board[(1, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(1, 1)].unit == None
-    assert g.board[(2, 1)].unit.effects == set()
-    assert g.board[(2, 1)].unit.attributes == set()
+    assert g.board[(2, 1)].unit.effects == 0
+    assert g.board[(2, 1)].unit.attributes == 0
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == set()
-    assert g.board[(3, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(3, 1)].unit.effects == 0
+    assert g.board[(3, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(3, 1)].unit.hp == 6
-    assert g.board[(4, 1)].unit.effects == set()
-    assert g.board[(4, 1)].unit.attributes == set()
+    assert g.board[(4, 1)].unit.effects == 0
+    assert g.board[(4, 1)].unit.attributes == 0
     assert g.board[(4, 1)].unit.hp == 1
-    assert g.board[(5, 1)].unit.effects == set()
-    assert g.board[(5, 1)].unit.attributes == set()
+    assert g.board[(5, 1)].unit.effects == 0
+    assert g.board[(5, 1)].unit.attributes == 0
     assert g.board[(5, 1)].unit.hp == 1
-    assert g.board[(6, 1)].unit.effects == set()
-    assert g.board[(6, 1)].unit.attributes == set()
+    assert g.board[(6, 1)].unit.effects == 0
+    assert g.board[(6, 1)].unit.attributes == 0
     assert g.board[(6, 1)].unit.hp == 1
-    assert g.board[(7, 1)].unit.effects == {Effects.EXPLOSIVE}
-    assert g.board[(7, 1)].unit.attributes == {Attributes.IMMUNEFIRE}
+    assert g.board[(7, 1)].unit.effects == Effects.EXPLOSIVE
+    assert g.board[(7, 1)].unit.attributes == Attributes.IMMUNEFIRE
     assert g.board[(7, 1)].unit.hp == 1
-    assert g.board[(8, 1)].unit.effects == set()
-    assert g.board[(8, 1)].unit.attributes == {Attributes.ARMORED, Attributes.MASSIVE}
+    assert g.board[(8, 1)].unit.effects == 0
+    assert g.board[(8, 1)].unit.attributes == Attributes.ARMORED | Attributes.MASSIVE
     assert g.board[(8, 1)].unit.hp == 3
-    assert g.board[(1, 2)].unit.effects == set()
-    assert g.board[(1, 2)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING} # mech lost armor when the psion died
+    assert g.board[(1, 2)].unit.effects == 0
+    assert g.board[(1, 2)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING # mech lost armor when the psion died
     assert g.board[(1, 2)].unit.hp == 2
 
 def t_PassiveVekHormonesNoPower():
@@ -12104,13 +12116,13 @@ def t_WeaponCriticalShields():
     g.start()
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 1
     g.board[(3, 1)].push(Direction.LEFT) # push the Leaper into the building
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change
     assert g.board[(2, 1)].unit.hp == 1  # Building took 1 damage
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD} # and now has shield
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD # and now has shield
     assert g.board[(3, 1)].unit == None  # Leaper died
 
 def t_WeaponCriticalShieldsBumpExplode():
@@ -12124,14 +12136,14 @@ def t_WeaponCriticalShieldsBumpExplode():
     g.start()
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(2, 1)].unit.hp == 2
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     assert g.board[(3, 1)].unit.hp == 1
-    assert g.board[(3, 1)].unit.effects == {Effects.EXPLOSIVE}
+    assert g.board[(3, 1)].unit.effects == Effects.EXPLOSIVE
     g.board[(3, 1)].push(Direction.LEFT) # push the Leaper into the building
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change
     assert g.board[(2, 1)].unit.hp == 1  # Building took 1 bump damage
-    assert g.board[(2, 1)].unit.effects == set() # shield took the explosion damage
+    assert g.board[(2, 1)].unit.effects == 0 # shield took the explosion damage
     assert g.board[(3, 1)].unit == None  # Leaper died
 
 def t_UnitBurrowerFlameEndTurn():
@@ -12142,16 +12154,16 @@ def t_UnitBurrowerFlameEndTurn():
     g.start()
     assert g.board[(1, 1)].unit.hp == 3
     assert g.board[(2, 1)].unit.hp == 3
-    assert g.board[(2, 1)].unit.effects == set()
+    assert g.board[(2, 1)].unit.effects == 0
     g.board[(1, 1)].unit.weapon1.shoot(Direction.RIGHT, 3) # have the flamethrower light him up
     g.flushHurt()
     assert g.board[(1, 1)].unit.hp == 3  # no change
     assert g.board[(2, 1)].unit.hp == 3  # burrower didn't take damage yet
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE} # burrower is now on fire
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE # burrower is now on fire
     g.endPlayerTurn()
     assert g.board[(1, 1)].unit.hp == 3  # no change
     assert g.board[(2, 1)].unit == None  # burrower burrowed and is no longer on this square
-    assert g.nonplayerunits[0].effects == set() # the burrower is still in nonplayer units, the only unit there. and it doesn't have fire
+    assert g.nonplayerunits[0].effects == 0 # the burrower is still in nonplayer units, the only unit there. and it doesn't have fire
 
 def t_WeaponRepairDrop1():
     "Do the repair drop with a hurt vek"
@@ -12160,12 +12172,12 @@ def t_WeaponRepairDrop1():
     g.board[(2, 1)].createUnitHere(Unit_Burrower(g, hp=1, maxhp=3))
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 1 # no change because this doesn't heal vek
-    assert g.board[(2, 1)].effects == set()  # no tile effects
-    assert g.board[(2, 1)].unit.effects == set()  # no unit effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0  # no unit effects
 
 def t_WeaponRepairDrop2():
     "Do the repair drop with a hurt mech"
@@ -12174,12 +12186,12 @@ def t_WeaponRepairDrop2():
     g.board[(2, 1)].createUnitHere(Unit_Pulse_Mech(g, hp=1, maxhp=3))
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == set()  # no tile effects
-    assert g.board[(2, 1)].unit.effects == set()  # no unit effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0  # no unit effects
 
 def t_WeaponRepairDrop3():
     "Do the repair drop with a hurt subunit"
@@ -12188,12 +12200,12 @@ def t_WeaponRepairDrop3():
     g.board[(2, 1)].createUnitHere(Unit_AcidTank(g, hp=1, maxhp=3))
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == set()  # no tile effects
-    assert g.board[(2, 1)].unit.effects == set()  # no unit effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0  # no unit effects
 
 def t_WeaponRepairDrop4():
     "Do the repair drop with a dead mech"
@@ -12204,12 +12216,12 @@ def t_WeaponRepairDrop4():
     g.board[(2, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 1 # now a corpse
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == set()  # no tile effects
-    assert g.board[(2, 1)].unit.effects == set()  # no unit effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0  # no unit effects
 
 def t_WeaponRepairDrop5():
     "Do the repair drop with an Earth Mover"
@@ -12218,12 +12230,12 @@ def t_WeaponRepairDrop5():
     g.board[(2, 1)].createUnitHere(Unit_EarthMover(g, hp=1, maxhp=3))
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == set()  # no tile effects
-    assert g.board[(2, 1)].unit.effects == set()  # no unit effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0  # no unit effects
 
 def t_WeaponRepairDrop6():
     "Do the repair drop with a unit on fire, not the tile"
@@ -12232,12 +12244,12 @@ def t_WeaponRepairDrop6():
     g.board[(2, 1)].createUnitHere(Unit_EarthMover(g, hp=1, maxhp=3, effects={Effects.FIRE}))
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE}
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == set()  # no tile effects
-    assert g.board[(2, 1)].unit.effects == set()  # no unit effects
+    assert g.board[(2, 1)].effects == 0  # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0  # no unit effects
 
 def t_WeaponRepairDrop7():
     "Do the repair drop with a unit and the tile on fire."
@@ -12247,12 +12259,12 @@ def t_WeaponRepairDrop7():
     g.board[(2, 1)].applyFire()
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile on fire
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE} # unit on fire
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile on fire
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE # unit on fire
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile still on fire
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE} # unit on fire because tile fire spread back after it was removed.
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile still on fire
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE # unit on fire because tile fire spread back after it was removed.
 
 def t_WeaponRepairDrop8():
     "Do the repair drop with a unit and the tile on fire, but the unit is also shielded."
@@ -12263,12 +12275,12 @@ def t_WeaponRepairDrop8():
     g.board[(2, 1)].applyShield()
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile on fire
-    assert g.board[(2, 1)].unit.effects == {Effects.FIRE, Effects.SHIELD} # unit on fire and shielded
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile on fire
+    assert g.board[(2, 1)].unit.effects == Effects.FIRE | Effects.SHIELD # unit on fire and shielded
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == {Effects.FIRE} # tile still on fire
-    assert g.board[(2, 1)].unit.effects == {Effects.SHIELD} # fire removed from unit, shield prevented fire from spreading from tile back to unit
+    assert g.board[(2, 1)].effects == Effects.FIRE # tile still on fire
+    assert g.board[(2, 1)].unit.effects == Effects.SHIELD # fire removed from unit, shield prevented fire from spreading from tile back to unit
 
 def t_WeaponRepairDrop9():
     "Do the repair drop with a unit that has acid"
@@ -12278,12 +12290,12 @@ def t_WeaponRepairDrop9():
     g.board[(2, 1)].applyAcid()
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID}
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == Effects.ACID
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == set() # still no tile effects
-    assert g.board[(2, 1)].unit.effects == {Effects.ACID} # This doesn't remove acid
+    assert g.board[(2, 1)].effects == 0 # still no tile effects
+    assert g.board[(2, 1)].unit.effects == Effects.ACID # This doesn't remove acid
 
 def t_WeaponRepairDrop10():
     "Do the repair drop with a unit that has ice"
@@ -12293,12 +12305,12 @@ def t_WeaponRepairDrop10():
     g.board[(2, 1)].applyIce()
     g.start()
     assert g.board[(2, 1)].unit.hp == 1
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == {Effects.ICE}
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == Effects.ICE
     g.board[(1, 1)].unit.weapon1.shoot() # heal up
     assert g.board[(2, 1)].unit.hp == 3 # healed
-    assert g.board[(2, 1)].effects == set() # still no tile effects
-    assert g.board[(2, 1)].unit.effects == set() # this does remove ice!
+    assert g.board[(2, 1)].effects == 0 # still no tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # this does remove ice!
 
 def t_WeaponRepairDrop11():
     "Do the repair drop with a mech that has fallen into a chasm."
@@ -12310,8 +12322,8 @@ def t_WeaponRepairDrop11():
     g.board[(2, 1)].takeDamage(5)
     g.flushHurt()
     assert g.board[(2, 1)].unit.hp == 1 # now a corpse
-    assert g.board[(2, 1)].effects == set() # no tile effects
-    assert g.board[(2, 1)].unit.effects == set() # no unit effects
+    assert g.board[(2, 1)].effects == 0 # no tile effects
+    assert g.board[(2, 1)].unit.effects == 0 # no unit effects
     assert len(g.playerunits) == 2 # we have 2 units
     g.board[(2, 1)].push(Direction.RIGHT) # push the corpse into the chasm
     g.flushHurt()
@@ -12341,7 +12353,7 @@ def t_WeaponOldEarthArtillery():
         for y in range(1, 9):
             allunits[(x, y)] = g.board[(x, y)].unit
     assert g.board[(1, 3)].unit.hp == 2  # wielder took no damage
-    assert g.board[(1, 3)].unit.effects == set() # no unit effects
+    assert g.board[(1, 3)].unit.effects == 0 # no unit effects
     del allunits[(1, 3)]  # delete the wielder from allunits
     assert g.board[(4, 3)].unit.hp == 3  # target took 2 damage
     del allunits[(4, 3)]  # delete the target unit from all
@@ -12427,6 +12439,27 @@ def t_MovementLarge4Kwan():
     moves = g.board[(1, 1)].unit.getMoves(g.board[(1, 1)].unit.moves)
     assert set(moves) == { (2, 1), (2, 2), (3, 1), (3, 2), (3, 3), (4, 1), (4, 2), (5, 1)}
 
+def t_MovementReusedAroundSameBlockers():
+    "Move a unit that's out of a mech's reach and make sure the mech's moves are reused, then block it in and make sure they're worked out again."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g))
+    g.board[(1, 2)].createUnitHere(Unit_Mountain(g))
+    g.board[(8, 8)].createUnitHere(Unit_Scorpion(g))
+    mech = g.board[(1, 1)].unit
+    moves = mech.getMoves(mech.moves)
+    g.board[(8, 8)].moveUnit((7, 8))
+    assert mech.getMoves(mech.moves) is moves
+    g.board[(2, 1)].createUnitHere(Unit_Mountain(g))
+    assert mech.getMoves(mech.moves) == set()
+
+def t_NonMechMovementBlocked():
+    "Make sure a player controlled unit that isn't a mech can't move through enemies and mountains like a mech with the Kwan pilot."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_OldArtillery(g, moves=2))
+    g.board[(1, 2)].createUnitHere(Unit_Scorpion(g))
+    g.board[(2, 1)].createUnitHere(Unit_Mountain(g))
+    assert g.board[(1, 1)].unit.getMoves(2) == set()
+
 def t_ScoreBuildingDamage():
     "Test out the scoring system on a damaged building."
     g = Game()
@@ -12436,7 +12469,7 @@ def t_ScoreBuildingDamage():
     g.board[(1, 1)].takeDamage(1)
     g.flushHurt()
     assert g.score.score == -50
-    assert g.score.log == ['1building_hurt', '-1building_hurt', '1building_die', '1powergrid_hurt']
+    assert g.score.getLog() == ['1building_hurt', '-1building_hurt', '1building_die', '1powergrid_hurt']
 
 def t_ScoreTimepodPickup():
     "Test out the scoring system on a timepod picked up by a friendly."
@@ -12447,7 +12480,7 @@ def t_ScoreTimepodPickup():
     assert g.score.score == 0
     g.board[(1, 2)].moveUnit((1, 1))
     assert g.score.score == 2
-    assert g.score.log == ['1timepod_pickup']
+    assert g.score.getLog() == ['1timepod_pickup']
 
 def t_ScoreTimepodKilled():
     "Test out the scoring system on a timepod destroyed up by a vek."
@@ -12458,7 +12491,7 @@ def t_ScoreTimepodKilled():
     assert g.score.score == 0
     g.board[(1, 2)].moveUnit((1, 1))
     assert g.score.score == -30
-    assert g.score.log == ['1timepod_die']
+    assert g.score.getLog() == ['1timepod_die']
 
 def t_MountainDie():
     "A mountain gets hit by an instakill weapon, removing it instantly"
@@ -12473,65 +12506,65 @@ def t_MountainCantBeSetOnFireScore():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Mountain(g))
     assert g.score.score == 0
-    assert g.board[(1, 1)].effects == set()
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
     g.board[(1, 1)].applyFire()
     g.flushHurt()
-    assert g.board[(1, 1)].effects == {Effects.FIRE}
-    assert g.board[(1, 1)].unit.effects == set()
+    assert g.board[(1, 1)].effects == Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == 0
     assert g.score.score == 0
-    assert g.score.log == [] # no score for the mountain being set on fire
+    assert g.score.getLog() == [] # no score for the mountain being set on fire
 
 def t_Pilot_AbeIsamu():
     "Make sure AbeIsamu works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_AbeIsamu()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.ARMORED}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE | Attributes.ARMORED
 
 def t_Pilot_Prospero():
     "Make sure Prospero works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_Prospero()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.FLYING}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE | Attributes.FLYING
 
 def t_Pilot_CamilaVera():
     "Make sure CamilaVera works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_CamilaVera()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.IMMUNESMOKE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE | Attributes.IMMUNESMOKE
 
 def t_Pilot_Ariadne():
     "Make sure Ariadne works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_Ariadne()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE, Attributes.IMMUNEFIRE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE | Attributes.IMMUNEFIRE
 
 def t_Pilot_ChenRong():
     "Make sure ChenRong works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_ChenRong()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.getSecondaryMoves() == 1 # mech gets one secondary move
 
 def t_Pilot_Archimedes():
     "Make sure Archimedes works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_Archimedes()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.getSecondaryMoves() == 3 # mech's default move is 3
 
 def t_Pilot_HenryKwan():
     "Make sure HenryKwan works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_HenryKwan()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.getSecondaryMoves() == 0
     assert g.board[(1, 1)].unit.getKwanMove()== True
 
@@ -12539,8 +12572,8 @@ def t_Pilot_Silica():
     "Make sure Silica works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_Silica()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.getSecondaryMoves() == 0
     assert g.board[(1, 1)].unit.getKwanMove()== False
     assert g.board[(1, 1)].unit.doubleshot == True
@@ -12549,8 +12582,8 @@ def t_Pilot_Mafan():
     "Make sure Mafan works properly"
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_Mafan()))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.getSecondaryMoves() == 0
     assert g.board[(1, 1)].unit.getKwanMove()== False
     assert g.board[(1, 1)].unit.canDoubleShot() == False
@@ -12561,8 +12594,8 @@ def t_Pilot_HaroldSchmidt():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_HaroldSchmidt()))
     g.board[(2, 1)].createUnitHere(Unit_Combat_Mech(g, ))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.getSecondaryMoves() == 0
     assert g.board[(1, 1)].unit.getKwanMove()== False
     assert g.board[(1, 1)].unit.canDoubleShot() == False
@@ -12576,8 +12609,8 @@ def t_Pilot_Kazaaakpleth():
     g = Game()
     g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, pilot=Pilot_Kazaaakpleth()))
     g.board[(2, 1)].createUnitHere(Unit_Combat_Mech(g, ))
-    assert g.board[(1, 1)].unit.effects == set()
-    assert g.board[(1, 1)].unit.attributes == {Attributes.MASSIVE}
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.board[(1, 1)].unit.attributes == Attributes.MASSIVE
     assert g.board[(1, 1)].unit.getSecondaryMoves() == 0
     assert g.board[(1, 1)].unit.getKwanMove()== False
     assert g.board[(1, 1)].unit.canDoubleShot() == False
@@ -12602,6 +12635,82 @@ def t_OrderGenerator_Move2():
                 ((bob, Actions.MOVE), (bob, Actions.SHOOT), (bob, Actions.MOVE2))
                 }
 
+def t_OrderGenerator_IndependentMoves():
+    "Moving 2 mechs that are too far apart to affect each other in either order is the same thing, so only one of those orders should be generated."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, moves=2))
+    g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g, moves=2))
+    bob = g.board[(1, 1)].unit
+    sue = g.board[(8, 8)].unit
+    gennedorders = set(OrderGenerator(g))
+    assert (((bob, Actions.MOVE), (sue, Actions.MOVE)) in gennedorders) != (((sue, Actions.MOVE), (bob, Actions.MOVE)) in gennedorders)
+
+def t_OrderGenerator_DependentMoves():
+    "Mechs that can move next to each other could block each other's paths, so both orders of their moves must be generated."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, moves=2))
+    g.board[(3, 3)].createUnitHere(Unit_Combat_Mech(g, moves=2))
+    bob = g.board[(1, 1)].unit
+    sue = g.board[(3, 3)].unit
+    gennedorders = set(OrderGenerator(g))
+    assert ((bob, Actions.MOVE), (sue, Actions.MOVE)) in gennedorders
+    assert ((sue, Actions.MOVE), (bob, Actions.MOVE)) in gennedorders
+
+def t_OrderGenerator_PushedUnitIndependent():
+    "A punch that could push the mech next to it only makes the punch and that mech's move depend on each other. A mech on the other side of the board can still move before or after them."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, moves=1, weapon1=Weapon_TitanFist()))
+    g.board[(1, 2)].createUnitHere(Unit_Combat_Mech(g, moves=1))
+    g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g, moves=1))
+    bob = g.board[(1, 1)].unit
+    sue = g.board[(1, 2)].unit
+    carl = g.board[(8, 8)].unit
+    gennedorders = set(OrderGenerator(g))
+    assert ((bob, Actions.SHOOT), (sue, Actions.MOVE)) in gennedorders
+    assert ((sue, Actions.MOVE), (bob, Actions.SHOOT)) in gennedorders
+    assert len([order for order in gennedorders if set(order) == {(bob, Actions.SHOOT), (sue, Actions.MOVE), (carl, Actions.MOVE)}]) == 2 # carl's move goes in the same place either way
+
+def t_OrderGenerator_BlockedMoves():
+    "A mech walled in by mountains can't get near a mech 3 squares away from it, so only one order of their moves should be generated."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, moves=3))
+    g.board[(1, 2)].createUnitHere(Unit_Mountain(g))
+    g.board[(2, 1)].createUnitHere(Unit_Mountain(g))
+    g.board[(4, 4)].createUnitHere(Unit_Combat_Mech(g, moves=2))
+    bob = g.board[(1, 1)].unit
+    sue = g.board[(4, 4)].unit
+    gennedorders = set(OrderGenerator(g))
+    assert (((bob, Actions.MOVE), (sue, Actions.MOVE)) in gennedorders) != (((sue, Actions.MOVE), (bob, Actions.MOVE)) in gennedorders)
+
+def t_OrderGenerator_CountIndependent():
+    "The number of orders counted without generating them should match the number generated when some of them are skipped as independent duplicates."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, moves=2, pilot=Pilot_Archimedes()))
+    g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g, moves=2))
+    g.board[(3, 3)].createUnitHere(Unit_Artillery_Mech(g, moves=3))
+    orders = OrderGenerator(g)
+    assert orders.getOrderCount() == len(list(orders))
+
+def t_OrderGenerator_CountGlobalEffects():
+    "With a soldier psion on the board, every order is different and the count should still match the number generated."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, moves=2, pilot=Pilot_Archimedes()))
+    g.board[(8, 8)].createUnitHere(Unit_Combat_Mech(g, moves=2))
+    g.board[(5, 5)].createUnitHere(Unit_SoldierPsion(g))
+    orders = OrderGenerator(g)
+    assert orders.getOrderCount() == len(list(orders)) == 65
+
+def t_OrderGenerator_EstimateSims():
+    "The estimated sims for an order should be the number of moves times the number of shots its unit can make."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, moves=1, weapon1=Weapon_TitanFist()))
+    bob = g.board[(1, 1)].unit
+    orders = OrderGenerator(g)
+    assert orders.estimateSims(()) == 0
+    assert orders.estimateSims(((bob, Actions.MOVE),)) == 2 # (2, 1) and (1, 2)
+    assert orders.estimateSims(((bob, Actions.SHOOT),)) == 3 # repair, or punch right or up. left and down are off the board
+    assert orders.estimateSims(((bob, Actions.MOVE), (bob, Actions.SHOOT))) == 6
+
 def t_KillingMechsGameOver():
     "The game ends when all your mechs die"
     g = Game()
@@ -12637,7 +12746,495 @@ def t_CopyBoard():
             if g.board[x, y].unit and newgame.board[x, y].unit:
                 for attr in 'type', 'hp', 'maxhp', 'effects', 'attributes', 'web':
                     assert getattr(g.board[x, y].unit, attr) == getattr(newgame.board[x, y].unit, attr)
-    
+
+def t_CopyBoardIndependent():
+    "Make a copy of a gameboard and make sure that changing the copy doesn't change the original."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Charge_Mech(g))
+    g.board[(1, 2)].createUnitHere(Unit_AlphaScorpion(g))
+    g.start()
+    newgame = g.getCopy()
+    assert newgame.board[(1, 1)].game is newgame
+    assert newgame.board[(1, 1)].unit.game is newgame
+    assert newgame.board[(1, 1)].unit is not g.board[(1, 1)].unit
+    assert newgame.board[(1, 2)].unit in newgame.nonplayerunits # units in the copy's unit lists are the same objects that are on the copy's board
+    assert newgame.board[(1, 1)].unit in newgame.playerunits
+    assert newgame.board[(1, 2)].unit.weapon1.game is newgame
+    newgame.board[(1, 2)].takeDamage(5)
+    newgame.flushHurt()
+    newgame.board[(1, 1)].applyFire()
+    assert newgame.board[(1, 2)].unit == None
+    assert newgame.board[(1, 1)].unit.effects == Effects.FIRE
+    assert newgame.score.score != 0
+    assert g.board[(1, 2)].unit.hp == 5
+    assert g.board[(1, 2)].unit in g.nonplayerunits
+    assert g.board[(1, 1)].effects == 0
+    assert g.board[(1, 1)].unit.effects == 0
+    assert g.score.score == 0
+    assert g.score.getLog() == []
+
+def t_CopyBoardPsionTurn():
+    "Make a copy of a gameboard with a regeneration psion and make sure the psion's turn is done to the copy and not the original."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Charge_Mech(g))
+    g.board[(1, 2)].createUnitHere(Unit_AlphaScorpion(g, hp=2))
+    g.board[(3, 1)].createUnitHere(Unit_BloodPsion(g))
+    g.start()
+    newgame = g.getCopy()
+    assert newgame.psionPassiveTurn.__self__.game is newgame
+    newgame.psionPassiveTurn()
+    assert newgame.board[(1, 2)].unit.hp == 3
+    assert g.board[(1, 2)].unit.hp == 2
+
+def t_RollbackBoard():
+    "Set a checkpoint, wreck the board and make sure rolling back restores everything."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Charge_Mech(g))
+    g.board[(1, 2)].createUnitHere(Unit_AlphaScorpion(g))
+    g.board[(1, 3)].replaceTile(Tile_Forest(g))
+    g.start()
+    mech = g.board[(1, 1)].unit
+    scorpion = g.board[(1, 2)].unit
+    checkpoint = g.checkpoint()
+    g.board[(1, 1)].moveUnit((2, 1))
+    g.board[(1, 2)].takeDamage(5)
+    g.flushHurt()
+    g.board[(1, 3)].applyFire()
+    g.board[(2, 1)].unit.applyAcid()
+    assert g.board[(1, 2)].unit == None
+    assert g.score.score != 0
+    g.rollback(checkpoint)
+    assert g.board[(1, 1)].unit is mech
+    assert g.board[(2, 1)].unit == None
+    assert mech.square == (1, 1)
+    assert mech.effects == 0
+    assert g.board[(1, 2)].unit is scorpion
+    assert scorpion.hp == 5
+    assert scorpion in g.nonplayerunits
+    assert g.board[(1, 3)].type == 'forest'
+    assert g.board[(1, 3)].effects == 0
+    assert g.score.score == 0
+    assert g.score.getLog() == []
+    assert g.journal == None
+
+def t_RollbackNested():
+    "Roll back an inner checkpoint and make sure changes made before it survive until the outer checkpoint is rolled back."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_AlphaScorpion(g))
+    g.start()
+    outer = g.checkpoint()
+    g.board[(1, 1)].takeDamage(1)
+    inner = g.checkpoint()
+    g.board[(1, 1)].takeDamage(2)
+    assert g.board[(1, 1)].unit.hp == 2
+    g.rollback(inner)
+    assert g.board[(1, 1)].unit.hp == 4
+    g.rollback(outer)
+    assert g.board[(1, 1)].unit.hp == 5
+
+def t_EffectsSharedWithCopy():
+    "Set a unit on fire in a copy of a game and make sure the effects it shared with the original unit weren't changed."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_AlphaScorpion(g, effects={Effects.ACID}))
+    newgame = g.getCopy()
+    assert newgame.board[(1, 1)].unit.effects == g.board[(1, 1)].unit.effects
+    newgame.board[(1, 1)].applyFire()
+    assert newgame.board[(1, 1)].unit.effects == Effects.ACID | Effects.FIRE
+    assert g.board[(1, 1)].unit.effects == Effects.ACID
+    assert g.board[(1, 1)].effects == 0
+    assert Effects.FIRE & Effects.ACID == 0
+
+def t_GetRelSquare():
+    "Look up squares in each direction with the precomputed tables and make sure going off the board gives False."
+    assert getRelSquare((1, 1), Direction.UP, 1) == (1, 2)
+    assert getRelSquare((1, 1), Direction.RIGHT, 7) == (8, 1)
+    assert getRelSquare((1, 1), Direction.RIGHT, 8) == False
+    assert getRelSquare((1, 1), Direction.DOWN, 1) == False
+    assert getRelSquare((5, 5), Direction.LEFT, 4) == (1, 5)
+    assert NEIGHBORS[(1, 1)] == ((Direction.UP, (1, 2)), (Direction.RIGHT, (2, 1)))
+    g = Game()
+    assert g.board[(3, 4)].getEdgeSquare(Direction.DOWN) == (3, 1)
+    assert g.board[(3, 4)].getEdgeSquare(Direction.RIGHT) == (8, 4)
+
+def t_FirstUnitFromOccupancy():
+    "Find the first unit in each direction from the occupancy bitboard and make sure it follows units that move and die and rollbacks."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g))
+    g.board[(1, 5)].createUnitHere(Unit_Hornet(g))
+    g.board[(5, 3)].createUnitHere(Unit_Scorpion(g))
+    assert g.getFirstUnitSquare((1, 1), Direction.UP) == (1, 5)
+    assert g.getFirstUnitSquare((1, 5), Direction.DOWN) == (1, 1)
+    assert g.getFirstUnitSquare((1, 2), Direction.RIGHT) == None
+    assert g.getFirstUnitSquare((8, 3), Direction.LEFT) == (5, 3)
+    checkpoint = g.checkpoint()
+    g.board[(5, 3)].moveUnit((5, 1))
+    assert g.getFirstUnitSquare((8, 3), Direction.LEFT) == None
+    assert g.getFirstUnitSquare((1, 1), Direction.RIGHT) == (5, 1)
+    g.board[(1, 5)].takeDamage(5)
+    g.flushHurt()
+    assert g.getFirstUnitSquare((1, 1), Direction.UP) == None
+    g.rollback(checkpoint)
+    assert g.getFirstUnitSquare((1, 1), Direction.UP) == (1, 5)
+    assert g.getFirstUnitSquare((8, 3), Direction.LEFT) == (5, 3)
+
+def t_GameHashTransposition():
+    "Move 2 mechs in a different order and make sure the game hashes the same both ways, and differently from where it started."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Charge_Mech(g))
+    g.board[(1, 2)].createUnitHere(Unit_Combat_Mech(g))
+    g.board[(5, 5)].createUnitHere(Unit_AlphaScorpion(g))
+    g.start()
+    starthash = g.getHash()
+    checkpoint = g.checkpoint()
+    g.board[(1, 1)].moveUnit((3, 1))
+    g.board[(1, 2)].moveUnit((3, 2))
+    firsthash = g.getHash()
+    g.rollback(checkpoint)
+    assert g.getHash() == starthash
+    checkpoint = g.checkpoint()
+    g.board[(1, 2)].moveUnit((3, 2))
+    g.board[(1, 1)].moveUnit((3, 1))
+    assert g.getHash() == firsthash
+    assert firsthash != starthash
+    g.board[(5, 5)].applyFire()
+    assert g.getHash() != firsthash
+    g.rollback(checkpoint)
+    assert g.getHash() == starthash
+
+def t_TranspositionTableShared():
+    "Simulate the same order twice with a shared transposition table and make sure the second run skips the simulations and gets the same high score."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist()))
+    g.board[(3, 3)].createUnitHere(Unit_Scorpion(g))
+    g.start()
+    order = ((g.board[(1, 1)].unit, Actions.MOVE), (g.board[(1, 1)].unit, Actions.SHOOT))
+    table = TranspositionTable()
+    firstsims, firstscore = OrderSimulator(g, order, table).run()
+    secondsims, secondscore = OrderSimulator(g, order, table).run()
+    assert firstscore.score > 0
+    assert secondscore.score == firstscore.score
+    assert secondscore.actionlog == firstscore.actionlog
+    assert secondsims < firstsims
+
+def t_OrderSimulatorLongOrder():
+    "Simulate an order that uses every action 2 mechs with Archimedes and Silica can take and make sure the best result used all of them."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2, pilot=Pilot_Archimedes()))
+    g.board[(8, 8)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(), moves=2, pilot=Pilot_Silica()))
+    g.board[(2, 3)].createUnitHere(Unit_Scorpion(g))
+    g.board[(7, 6)].createUnitHere(Unit_Firefly(g))
+    g.start()
+    combat = g.board[(1, 1)].unit
+    cannon = g.board[(8, 8)].unit
+    order = ((combat, Actions.MOVE), (combat, Actions.SHOOT), (combat, Actions.MOVE2), (cannon, Actions.MOVE), (cannon, Actions.SHOOT), (cannon, Actions.SHOOT2))
+    sims, highscore = OrderSimulator(g, order).run()
+    assert sims > 0
+    assert highscore.score > 0
+    assert len(highscore.actionlog) == 6
+
+def t_OrderSimulatorPrunesHopelessActions():
+    "Once the scorpion has been killed, the pulse mech's actions on the other side of the board can't beat that score and shouldn't be simulated."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(8, 8)].createUnitHere(Unit_Pulse_Mech(g, weapon1=Weapon_Repulse(), moves=1))
+    g.board[(2, 3)].createUnitHere(Unit_Scorpion(g, hp=2))
+    g.start()
+    combat = g.board[(1, 1)].unit
+    pulse = g.board[(8, 8)].unit
+    simulator = OrderSimulator(g, ((combat, Actions.MOVE), (combat, Actions.SHOOT), (pulse, Actions.MOVE), (pulse, Actions.SHOOT)))
+    sims, highscore = simulator.run()
+    assert simulator.prunes > 0
+    assert highscore.score == 33
+    assert highscore.actionlog == ['combat on (1, 1) moves to (2, 2)', 'combat on (2, 2) shoots weapon1 (1,)', 'pulse on (8, 8) moves to (8, 7)', 'pulse on (8, 7) shoots weapon1 ()']
+
+def t_MechScoreBound():
+    "A mech at full health can only score by getting a shield unless it repairs, then it could undo getting each bad effect too."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    assert g.board[(1, 1)].unit.getScoreBound(0) == 6
+    assert g.board[(1, 1)].unit.getScoreBound(1) == 24
+
+def t_TranspositionTableOff():
+    "A TranspositionTable with a size of 0 remembers nothing instead of failing to forget something."
+    table = TranspositionTable(size=0)
+    table.put(1, ((), None))
+    assert table.get(1) == None
+
+def t_EndTurnCacheEviction():
+    "Fill up an EndTurnCache and make sure the least recently used result is the one that's forgotten."
+    cache = EndTurnCache(size=2)
+    cache.put(1, None)
+    cache.put(2, (5, ['1scorpion_die']))
+    assert cache.get(1) == None
+    cache.put(3, (-50, ['1powergrid_hurt']))
+    assert cache.get(1) == None
+    assert cache.get(3) == (-50, ['1powergrid_hurt'])
+    try:
+        cache.get(2)
+    except KeyError:
+        pass
+    else:
+        assert False # The expected exception wasn't raised!
+
+def t_EndTurnCacheOff():
+    "An EndTurnCache with a size of 0 remembers nothing instead of failing to forget something."
+    cache = EndTurnCache(size=0)
+    cache.put(1, None)
+    try:
+        cache.get(1)
+    except KeyError:
+        pass
+    else:
+        assert False # The expected exception wasn't raised!
+
+def t_ScoreKeeperTieBreak():
+    "When 2 scorekeepers have the same score, the action log decides which one is better no matter which way they're compared."
+    first = ScoreKeeper()
+    first.score = 10
+    first.actionlog = ['combat on (1, 1) moves to (1, 2)']
+    second = ScoreKeeper()
+    second.score = 10
+    second.actionlog = ['combat on (1, 1) moves to (2, 1)']
+    assert second > first
+    assert first < second
+    assert not first > second
+    assert first > ScoreKeeper() # a result beats the blank scorekeeper with the same score
+
+def t_ScoreKeeperLogPickled():
+    "Pickle a scorekeeper with events and undone events in its log and make sure the copy reads back the same log."
+    import pickle
+    score = ScoreKeeper()
+    score.submit(10, 'hurt', 2, type='scorpion')
+    score.undo(10, 'hurt', 2, type='scorpion')
+    score.submit(2, 'timepod_pickup')
+    newscore = pickle.loads(pickle.dumps(score))
+    assert newscore.getLog() == ['2scorpion_hurt', '-2scorpion_hurt', '1timepod_pickup']
+    assert newscore.score == 2
+
+def t_TopKScoreKeeperKeepsBest():
+    "Offer more solutions than a TopKScoreKeeper keeps and make sure only the best distinct ones are kept, best first."
+    top = TopKScoreKeeper(2)
+    assert top.submit(10, [], ['a'])
+    assert top.submit(20, [], ['b'])
+    assert not top.submit(20, [], ['b']) # already kept
+    assert not top.submit(5, [], ['c']) # worse than both
+    assert top.submit(15, [], ['d'])
+    assert [solution.actionlog for solution in top.getSolutions()] == [['b'], ['d']]
+    assert top.getBest().score == 20
+    assert top.getWorst().score == 15
+    assert len(top) == 2
+
+def t_OrderSimulatorKeepsTopSolutions():
+    "Keep the 3 best solutions of an order and make sure the best one is the high score and they're all different."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(2, 3)].createUnitHere(Unit_Scorpion(g, hp=2))
+    g.start()
+    order = ((g.board[(1, 1)].unit, Actions.MOVE), (g.board[(1, 1)].unit, Actions.SHOOT))
+    simulator = OrderSimulator(g, order, keep=3)
+    sims, highscore = simulator.run()
+    solutions = simulator.solutions.getSolutions()
+    assert len(solutions) == 3
+    assert solutions[0] is highscore
+    assert solutions[0].score >= solutions[1].score >= solutions[2].score
+    assert len({tuple(solution.actionlog) for solution in solutions}) == 3
+
+def t_ParallelSolverMatchesSerial():
+    "Solve the same game with a pool of worker processes and in a single process and make sure the same best solutions are kept."
+    solutions = []
+    for processes in 1, 2:
+        g = Game()
+        g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+        g.board[(8, 8)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(), moves=2))
+        g.board[(2, 3)].createUnitHere(Unit_Scorpion(g))
+        g.board[(7, 6)].createUnitHere(Unit_Firefly(g))
+        solver = ParallelSolver(g, processes, keep=3)
+        sims, highscore = solver.run()
+        assert sims > 0
+        assert solver.solutions.getSolutions()[0] is highscore
+        solutions.append([(solution.score, solution.actionlog) for solution in solver.solutions.getSolutions()])
+    assert solutions[0][0][0] > 0
+    assert solutions[0] == solutions[1]
+
+def t_ProfilerTimesSolve():
+    "Profile solving a game in worker processes and make sure every phase was timed, the solution didn't change and the original methods are back afterward."
+    solutions = []
+    for profile in False, True:
+        g = Game()
+        g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+        g.board[(8, 8)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(), moves=2))
+        g.board[(2, 3)].createUnitHere(Unit_Scorpion(g))
+        solver = ParallelSolver(g, 2, profile=profile)
+        solutions.append(solver.run()[1].actionlog)
+    phases = {phase: calls for phase, calls, seconds in solver.profiler.getReport()}
+    for phase in 'order generation', 'getMoves', 'genShots', 'shoot Weapon_TitanFist', 'shoot Weapon_TaurusCannon', 'shoot Weapon_StingingSpinneret', 'flushHurt', 'end turn: fire', 'end turn: emerge':
+        assert phases[phase] > 0
+    assert solutions[0] == solutions[1]
+    assert Profiler.enabled is None
+    assert not hasattr(Game.flushHurt, '__wrapped__') # not the Profiler's timing function
+    assert g.board[(1, 1)].unit.weapon1.shoot.__func__ is Weapon_TitanFist.shoot_punch
+
+def t_ProfilerTimesPickedShoot():
+    "A weapon made before the Profiler was enabled that picked its shoot method when it was made is timed once its game is passed to enable()."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist()))
+    g.board[(1, 2)].createUnitHere(Unit_Scorpion(g))
+    profiler = Profiler()
+    profiler.enable(g)
+    try:
+        g.board[(1, 1)].unit.weapon1.shoot(Direction.UP)
+    finally:
+        profiler.disable()
+    assert dict((phase, calls) for phase, calls, seconds in profiler.getReport())['shoot Weapon_TitanFist'] == 1
+    assert g.board[(1, 3)].unit.hp == 1 # punched for 2 and pushed up
+    assert g.board[(1, 1)].unit.weapon1.shoot.__func__ is Weapon_TitanFist.shoot_punch
+
+def t_SolveMatchesParallelSolver():
+    "Solve a game with solve() without a deadline and make sure it finishes with the same best solution that ParallelSolver finds."
+    solutions = []
+    for solver in 'parallel', 'solve':
+        g = Game()
+        g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+        g.board[(8, 8)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(), moves=2))
+        g.board[(2, 3)].createUnitHere(Unit_Scorpion(g))
+        g.board[(7, 6)].createUnitHere(Unit_Firefly(g))
+        if solver == 'parallel':
+            highscore = ParallelSolver(g, 1).run()[1]
+        else:
+            sims, highscore, finished = solve(g)
+            assert sims > 0
+            assert finished
+        solutions.append((highscore.score, highscore.actionlog))
+    assert solutions[0][0] > 0
+    assert solutions[0] == solutions[1]
+
+def t_SolveStopsAtDeadline():
+    "Run an OrderSimulator and solve() with deadlines that have already passed and make sure they stop after 1 simulation with the game put back the way it was."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(2, 3)].createUnitHere(Unit_Scorpion(g, hp=2))
+    g.start()
+    gamehash = g.getHash()
+    order = ((g.board[(1, 1)].unit, Actions.MOVE), (g.board[(1, 1)].unit, Actions.SHOOT))
+    simulator = OrderSimulator(g, order)
+    sims, highscore = simulator.run(perf_counter())
+    assert simulator.interrupted
+    assert sims == 1
+    assert g.journal is None
+    assert g.getHash() == gamehash
+    assert g.board[(1, 1)].unit.type == 'combat'
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(2, 3)].createUnitHere(Unit_Scorpion(g, hp=2))
+    sims, highscore, finished = solve(g, 0)
+    assert not finished
+    assert sims == 0
+
+def t_ProgressReportsSolve():
+    "Report the progress of solve() after every order and make sure the last report counts every order and sim and has the best score."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(8, 8)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(), moves=2))
+    g.board[(2, 3)].createUnitHere(Unit_Scorpion(g))
+    reports = []
+    progress = Progress(interval=0)
+    progress.subscribe(reports.append)
+    sims, highscore, finished = solve(g, progress=progress)
+    assert finished
+    assert len(reports) == reports[-1]['total'] + 1 # one for each order and a final one
+    assert reports[0]['orders'] == 1
+    assert reports[-1]['orders'] == reports[-1]['total'] == OrderGenerator(g).getOrderCount() - 1 # the empty order isn't simulated
+    assert reports[-1]['sims'] == sims
+    assert reports[-1]['best_score'] == highscore.score
+    assert reports[-1]['eta'] == 0
+
+def t_ProgressReportsToQueue():
+    "Report the progress of a ParallelSolver to a queue only at the end and make sure the report has the best score."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(2, 3)].createUnitHere(Unit_Scorpion(g))
+    reports = Queue()
+    progress = Progress(interval=3600)
+    progress.subscribe(reports.put)
+    sims, highscore = ParallelSolver(g, 1, progress=progress).run()
+    report = reports.get_nowait()
+    assert reports.empty()
+    assert report['orders'] == report['total'] == 3
+    assert report['sims'] == sims
+    assert report['best_score'] == highscore.score
+
+def t_HeuristicOrdererTriesThreatsFirst():
+    "Make sure a HeuristicOrderer puts shots at an enemy with a queued attack and moves next to it first, then the action that led to a new best solution once it's rewarded."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(1, 2)].createUnitHere(Unit_Scorpion(g))
+    g.board[(2, 1)].createUnitHere(Unit_Firefly(g, qshot=(Direction.UP,)))
+    mech = g.board[(1, 1)].unit
+    orderer = HeuristicOrderer()
+    shots = list(Player_Action_Iter_Shoot(g, mech)._genNextShot())
+    assert orderer.orderShots(mech, shots)[0] == ('weapon1', (Direction.RIGHT,))
+    assert orderer.orderMoves(mech, [(1, 3), (3, 1)])[0] == (3, 1)
+    orderer.reward([(mech, Actions.SHOOT, ('weapon1', (Direction.UP,)))])
+    assert orderer.orderShots(mech, shots)[0] == ('weapon1', (Direction.UP,))
+
+def t_HeuristicOrdererCachesTargets():
+    "A HeuristicOrderer should only find the targets of a hashed game state once and find them again once the board changes."
+    g = Game()
+    g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+    g.board[(2, 1)].createUnitHere(Unit_Firefly(g, qshot=(Direction.UP,)))
+    orderer = HeuristicOrderer()
+    g.getHash()
+    targets = orderer._getTargets(g)
+    assert targets[0] == {(2, 1): 3}
+    assert orderer._getTargets(g) is targets
+    g.board[(2, 1)].push(Direction.UP)
+    assert orderer._getTargets(g)[0] == {(2, 2): 3}
+
+def t_HeuristicOrdererKeepsBestSolution():
+    "Solve the same game with and without ordering the actions and make sure the same best solution is found."
+    solutions = []
+    for orderer in ActionOrderer(), HeuristicOrderer():
+        g = Game()
+        g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=Weapon_TitanFist(), moves=2))
+        g.board[(8, 8)].createUnitHere(Unit_Cannon_Mech(g, weapon1=Weapon_TaurusCannon(), moves=2))
+        g.board[(2, 3)].createUnitHere(Unit_Scorpion(g, qshot=(Direction.DOWN,)))
+        g.board[(7, 6)].createUnitHere(Unit_Firefly(g, hp=1))
+        sims, highscore, finished = solve(g, orderer=orderer)
+        assert finished
+        solutions.append((highscore.score, highscore.actionlog))
+    assert solutions[0][0] > 0
+    assert solutions[0] == solutions[1]
+
+def t_CanShootOnlySkipsNullShots():
+    "Fire every weapon from the corner of a crowded board and make sure canShoot() only rejects shots that raise NullWeaponShot and doesn't change the game."
+    skipped = 0
+    for name, weaponclass in sorted(globals().items()):
+        if not name.startswith('Weapon_') or name.endswith('_Base') or not hasattr(weaponclass, 'genShots') or name == 'Weapon_Terraformer': # the Terraformer can't shoot off the board
+            continue
+        g = Game()
+        weapon = weaponclass()
+        g.board[(1, 1)].createUnitHere(Unit_Combat_Mech(g, weapon1=weapon, moves=3))
+        g.board[(1, 2)].createUnitHere(Unit_Mountain(g))
+        g.board[(3, 1)].createUnitHere(Unit_Scorpion(g, qshot=(Direction.LEFT,)))
+        g.board[(1, 5)].createUnitHere(Unit_Building(g))
+        g.start()
+        for shot in weapon.genShots():
+            gamehash = g.getHash()
+            if weapon.canShoot(*shot):
+                continue
+            assert g.getHash() == gamehash
+            skipped += 1
+            checkpoint = g.checkpoint()
+            weapon.wieldingunit._touch() # so rollback() gives back any ammo spent
+            try:
+                weapon.shoot(*shot)
+            except NullWeaponShot:
+                pass
+            else:
+                assert False, '{0} can shoot {1}'.format(name, shot)
+            g.rollback(checkpoint)
+    assert skipped > 50
+
 ########### write tests for these:
 # If a vek with 1 hp gets frozen and then the +1hp psion died, the vek with 1 hp dies and the ice is gone.
 # The Psion Tyrant volcano level psion that damages your mechs for 1 is an attack and blocked by armor!